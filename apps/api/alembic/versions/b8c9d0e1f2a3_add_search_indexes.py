@@ -0,0 +1,52 @@
+"""add trigram search indexes
+
+Revision ID: b8c9d0e1f2a3
+Revises: a7b8c9d0e1f2
+Create Date: 2024-03-15 12:00:00.000000
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "b8c9d0e1f2a3"
+down_revision = "a7b8c9d0e1f2"
+branch_labels = None
+depends_on = None
+
+# (table, column) matched by GET /super-admin/search, see app.core.models.search
+COLUMNS = [
+    ("organizations", "name"),
+    ("organizations", "contact_email"),
+    ("organizations", "city"),
+    ("stores", "name"),
+    ("stores", "street_address"),
+    ("stores", "city"),
+    ("stores", "state"),
+    ("stores", "postal_code"),
+    ("users", "email"),
+    ("users", "phone"),
+    ("users", "first_name"),
+    ("users", "last_name"),
+    ("iot_controllers", "mac_address"),
+    ("iot_controllers", "serial_number"),
+    ("iot_controllers", "machine_label"),
+]
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    for table, column in COLUMNS:
+        op.create_index(
+            f"ix_{table}_{column}_trgm",
+            table,
+            [column],
+            unique=False,
+            postgresql_using="gin",
+            postgresql_ops={column: "gin_trgm_ops"},
+        )
+
+
+def downgrade() -> None:
+    # The pg_trgm extension is left installed
+    for table, column in reversed(COLUMNS):
+        op.drop_index(f"ix_{table}_{column}_trgm", table_name=table)
@@ -0,0 +1,43 @@
+"""add keyset pagination indexes
+
+Revision ID: c3d4e5f6a7b8
+Revises: b2c3d4e5f6a7
+Create Date: 2024-02-01 12:00:00.000000
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "c3d4e5f6a7b8"
+down_revision = "b2c3d4e5f6a7"
+branch_labels = None
+depends_on = None
+
+# (index name, table, columns) backing ORDER BY created_at, id list queries
+INDEXES = [
+    ("ix_users_created_at_id", "users", ["created_at", "id"]),
+    ("ix_organizations_created_at_id", "organizations", ["created_at", "id"]),
+    ("ix_stores_created_at_id", "stores", ["created_at", "id"]),
+    (
+        "ix_stores_org_created_at_id",
+        "stores",
+        ["organization_id", "created_at", "id"],
+    ),
+    (
+        "ix_iot_store_created_at_id",
+        "iot_controllers",
+        ["store_id", "created_at", "id"],
+    ),
+    ("ix_orders_created_at_id", "orders", ["created_at", "id"]),
+    ("ix_customers_created_at_id", "customers", ["created_at", "id"]),
+]
+
+
+def upgrade() -> None:
+    for name, table, columns in INDEXES:
+        op.create_index(name, table, columns, unique=False)
+
+
+def downgrade() -> None:
+    for name, table, _ in reversed(INDEXES):
+        op.drop_index(name, table_name=table)
@@ -0,0 +1,41 @@
+"""add invitation email_sent_at
+
+Revision ID: d4e5f6a7b8c9
+Revises: c3d4e5f6a7b8
+Create Date: 2024-02-15 12:00:00.000000
+
+"""
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "d4e5f6a7b8c9"
+down_revision = "c3d4e5f6a7b8"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "invitations",
+        sa.Column("email_sent_at", sa.DateTime(timezone=True), nullable=True),
+    )
+    # Invitations created before the outbound queue were emailed inline
+    op.execute(
+        "UPDATE invitations SET email_sent_at = created_at "
+        "WHERE email_sent_at IS NULL"
+    )
+    # Backs the recovery scan for pending invitations whose email is unsent
+    op.create_index(
+        "ix_invitations_email_unsent",
+        "invitations",
+        ["created_at"],
+        unique=False,
+        postgresql_where=sa.text("email_sent_at IS NULL"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_invitations_email_unsent", table_name="invitations")
+    op.drop_column("invitations", "email_sent_at")
@@ -0,0 +1,28 @@
+"""add invitation organization/email index
+
+Revision ID: e5f6a7b8c9d0
+Revises: d4e5f6a7b8c9
+Create Date: 2024-02-20 12:00:00.000000
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "e5f6a7b8c9d0"
+down_revision = "d4e5f6a7b8c9"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Backs duplicate checks for single and bulk invitations
+    op.create_index(
+        "ix_invitations_organization_email",
+        "invitations",
+        ["organization_id", "email"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_invitations_organization_email", table_name="invitations")
@@ -0,0 +1,83 @@
+"""add verification_codes table and indexes
+
+Revision ID: f6a7b8c9d0e1
+Revises: e5f6a7b8c9d0
+Create Date: 2024-02-22 12:00:00.000000
+
+"""
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "f6a7b8c9d0e1"
+down_revision = "e5f6a7b8c9d0"
+branch_labels = None
+depends_on = None
+
+# Marks a table created here, so downgrade drops only what upgrade created
+CREATED_BY_THIS_REVISION = "created by revision f6a7b8c9d0e1"
+
+
+def upgrade() -> None:
+    inspector = sa.inspect(op.get_bind())
+    # Earlier revisions never created this table; databases built with
+    # create_all already have it, with a single-column phone index
+    if not inspector.has_table("verification_codes"):
+        op.create_table(
+            "verification_codes",
+            sa.Column("id", sa.Integer(), nullable=False),
+            sa.Column("phone", sa.String(), nullable=False),
+            sa.Column("code", sa.String(), nullable=False),
+            sa.Column("expires_at", sa.DateTime(timezone=True), nullable=False),
+            sa.Column("is_used", sa.Boolean(), nullable=True),
+            sa.Column(
+                "created_at",
+                sa.DateTime(timezone=True),
+                server_default=sa.text("now()"),
+                nullable=False,
+            ),
+            sa.PrimaryKeyConstraint("id"),
+            comment=CREATED_BY_THIS_REVISION,
+        )
+        op.create_index(
+            "ix_verification_codes_id", "verification_codes", ["id"], unique=False
+        )
+    elif any(
+        index["name"] == "ix_verification_codes_phone"
+        for index in inspector.get_indexes("verification_codes")
+    ):
+        op.drop_index("ix_verification_codes_phone", table_name="verification_codes")
+
+    # Serves OTP verify and the invalidation in OTP request
+    op.create_index(
+        "ix_verification_codes_active",
+        "verification_codes",
+        ["phone", "code", "expires_at"],
+        unique=False,
+        postgresql_where=sa.text("is_used = false"),
+    )
+    # Serves the retention sweep
+    op.create_index(
+        "ix_verification_codes_expires_at",
+        "verification_codes",
+        ["expires_at"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    inspector = sa.inspect(op.get_bind())
+    op.drop_index("ix_verification_codes_expires_at", table_name="verification_codes")
+    op.drop_index("ix_verification_codes_active", table_name="verification_codes")
+    comment = inspector.get_table_comment("verification_codes")["text"]
+    if comment == CREATED_BY_THIS_REVISION:
+        op.drop_index("ix_verification_codes_id", table_name="verification_codes")
+        op.drop_table("verification_codes")
+    else:
+        op.create_index(
+            "ix_verification_codes_phone",
+            "verification_codes",
+            ["phone"],
+            unique=False,
+        )
@@ -3,11 +3,11 @@ from typing import Any, List
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.orm import Session
 
-from app.auth.security import get_current_user
+from app.auth.principal_cache import Principal
+from app.auth.security import get_current_principal
 from app.core.database.session import get_db
 from app.core.models.address import Address
 from app.core.models.customer import Customer
-from app.core.models.user import User
 from app.core.schemas.address import AddressCreate, AddressRead, AddressUpdate
 
 router = APIRouter()
@@ -17,7 +17,7 @@ router = APIRouter()
 async def list_customer_addresses(
     customer_id: int,
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_principal),
 ) -> Any:
     """List all addresses for a specific customer"""
     # Check if user can access this customer's addresses
@@ -43,7 +43,7 @@ async def list_customer_addresses(
 async def get_address(
     address_id: int,
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_principal),
 ) -> AddressRead:
     """Get a specific address by ID"""
     address = db.query(Address).filter(Address.id == address_id).first()
@@ -73,7 +73,7 @@ async def get_address(
 async def create_address(
     address_data: AddressCreate,
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_principal),
 ) -> AddressRead:
     """Create a new address for a customer"""
     # Check if user can create addresses for this customer
@@ -110,7 +110,7 @@ async def update_address(
     address_id: int,
     address_data: AddressUpdate,
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_principal),
 ) -> AddressRead:
     """Update an address"""
     address = db.query(Address).filter(Address.id == address_id).first()
@@ -152,7 +152,7 @@ async def update_address(
 async def delete_address(
     address_id: int,
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_principal),
 ) -> None:
     """Delete an address"""
     address = db.query(Address).filter(Address.id == address_id).first()
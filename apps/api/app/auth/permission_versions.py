@@ -0,0 +1,118 @@
+"""Revocation of stateless access tokens by permissions version.
+
+Stateless access tokens carry the user's role bitmask and the value of
+``users.permissions_version`` at the time they were issued. Changing a user's
+role flags or active state bumps that column, which makes every token issued
+before the change stale.
+
+Each worker keeps the current version of every user whose version is above
+zero. Only users whose permissions ever changed appear there, so the map
+stays small. The map is reloaded from the database every resync interval. A
+bump made by this worker is recorded locally at once, and other workers pick
+it up at their next resync. Until the first load finishes, the worker cannot
+tell which tokens are stale. :attr:`PermissionVersions.synced_at` is None
+until then, and callers authorize from the database instead.
+"""
+
+import asyncio
+import threading
+import time
+from typing import Any, Callable, Optional
+from uuid import UUID
+
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.models.user import User
+
+SessionFactory = Callable[[], AsyncSession]
+
+
+class PermissionVersions:
+    """Per-worker map of user id to current permissions version."""
+
+    def __init__(self) -> None:
+        self._versions: dict[UUID, int] = {}
+        self._lock = threading.Lock()
+        self.synced_at: Optional[float] = None
+        self.revoked = 0
+
+    def current(self, user_id: UUID) -> int:
+        """Lowest permissions version a token for this user may carry."""
+        return self._versions.get(user_id, 0)
+
+    def record(self, user_id: UUID, version: int) -> None:
+        """Remember a user's new version; versions only ever increase."""
+        with self._lock:
+            if version > self._versions.get(user_id, 0):
+                self._versions[user_id] = version
+
+    def is_stale(self, user_id: UUID, version: int) -> bool:
+        """Whether a token carrying ``version`` has been revoked."""
+        if version < self.current(user_id):
+            self.revoked += 1
+            return True
+        return False
+
+    async def bump(self, db: AsyncSession, user_id: UUID) -> int:
+        """
+        Increment a user's permissions version in the current transaction.
+
+        Pass the returned version to :meth:`record` after the caller commits.
+
+        Returns:
+            The new version
+        """
+        version = await db.scalar(
+            update(User)
+            .where(User.id == user_id)
+            .values(permissions_version=User.permissions_version + 1)
+            .returning(User.permissions_version)
+        )
+        return int(version or 0)
+
+    async def sync(self, session_factory: SessionFactory) -> None:
+        """Reload the versions of every user with a version above zero."""
+        async with session_factory() as session:
+            rows = (
+                await session.execute(
+                    select(User.id, User.permissions_version).where(
+                        User.permissions_version > 0
+                    )
+                )
+            ).tuples()
+            for user_id, version in rows:
+                self.record(user_id, version)
+        self.synced_at = time.time()
+
+    async def run(self, session_factory: SessionFactory, interval: float) -> None:
+        """Sync now and every ``interval`` seconds until cancelled."""
+        while True:
+            try:
+                await self.sync(session_factory)
+            except Exception as e:
+                print(f"Permissions version sync failed: {e}")
+            await asyncio.sleep(interval)
+
+    def clear(self) -> None:
+        """Forget every version and the sync state."""
+        with self._lock:
+            self._versions.clear()
+            self.synced_at = None
+            self.revoked = 0
+
+    def stats(self) -> dict[str, Any]:
+        """Report how many users have bumped versions and the sync state."""
+        return {
+            "users": len(self._versions),
+            "revoked": self.revoked,
+            "synced_at": self.synced_at,
+        }
+
+
+permission_versions = PermissionVersions()
+
+
+def get_permission_versions() -> PermissionVersions:
+    """Dependency returning the process-wide permissions versions."""
+    return permission_versions
@@ -0,0 +1,145 @@
+"""In-process TTL cache of authenticated principals.
+
+``get_current_user`` resolves every bearer token to a user row. The fields
+authorization actually needs (id, role flags, ``is_active``) change rarely, so
+they are cached here as an immutable :class:`Principal` keyed by user id.
+
+Entries expire after ``ttl_seconds`` and the cache holds at most ``max_size``
+entries (least recently used are evicted first). Code that changes a user's
+role flags or active state must call :meth:`PrincipalCache.invalidate`. The
+cache is per process, so with several workers the TTL bounds how long another
+worker may serve a stale principal.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, Optional
+from uuid import UUID
+
+from app.core.config.settings import settings
+
+# Bits of the ``rol`` claim carried by stateless access tokens
+ROLE_ACTIVE = 1
+ROLE_ADMIN = 2
+ROLE_SUPER_ADMIN = 4
+ROLE_SUPPORT_AGENT = 8
+ROLE_PROVISIONING_SPECIALIST = 16
+
+
+@dataclass(frozen=True, slots=True)
+class Principal:
+    """Immutable snapshot of the user fields used for authorization."""
+
+    id: UUID
+    is_active: bool
+    is_admin: bool
+    is_super_admin: bool
+    is_support_agent: bool
+    is_provisioning_specialist: bool
+
+    @classmethod
+    def from_user(cls, user: Any) -> "Principal":
+        """Build a principal from a ``User`` model instance."""
+        return cls(
+            id=user.id,
+            is_active=bool(user.is_active),
+            is_admin=bool(user.is_admin),
+            is_super_admin=bool(user.is_super_admin),
+            is_support_agent=bool(user.is_support_agent),
+            is_provisioning_specialist=bool(user.is_provisioning_specialist),
+        )
+
+    @classmethod
+    def from_role_mask(cls, user_id: UUID, mask: int) -> "Principal":
+        """Build a principal from the ``rol`` claim of an access token."""
+        return cls(
+            id=user_id,
+            is_active=bool(mask & ROLE_ACTIVE),
+            is_admin=bool(mask & ROLE_ADMIN),
+            is_super_admin=bool(mask & ROLE_SUPER_ADMIN),
+            is_support_agent=bool(mask & ROLE_SUPPORT_AGENT),
+            is_provisioning_specialist=bool(mask & ROLE_PROVISIONING_SPECIALIST),
+        )
+
+    def role_mask(self) -> int:
+        """Encode the authorization flags as a bitmask."""
+        return (
+            (ROLE_ACTIVE if self.is_active else 0)
+            | (ROLE_ADMIN if self.is_admin else 0)
+            | (ROLE_SUPER_ADMIN if self.is_super_admin else 0)
+            | (ROLE_SUPPORT_AGENT if self.is_support_agent else 0)
+            | (ROLE_PROVISIONING_SPECIALIST if self.is_provisioning_specialist else 0)
+        )
+
+
+class PrincipalCache:
+    """Bounded LRU cache of principals with a per-entry TTL."""
+
+    def __init__(
+        self,
+        ttl_seconds: float,
+        max_size: int,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.ttl_seconds = ttl_seconds
+        self.max_size = max_size
+        self._clock = clock
+        self._entries: "OrderedDict[UUID, tuple[float, Principal]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, user_id: UUID) -> Optional[Principal]:
+        """Return the cached principal, or None if missing or expired."""
+        with self._lock:
+            entry = self._entries.get(user_id)
+            if entry is None or entry[0] <= self._clock():
+                if entry is not None:
+                    del self._entries[user_id]
+                self.misses += 1
+                return None
+            self._entries.move_to_end(user_id)
+            self.hits += 1
+            return entry[1]
+
+    def set(self, principal: Principal) -> None:
+        """Cache a principal, evicting the least recently used if full."""
+        if self.max_size <= 0:
+            return
+        expires_at = self._clock() + self.ttl_seconds
+        with self._lock:
+            self._entries[principal.id] = (expires_at, principal)
+            self._entries.move_to_end(principal.id)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, user_id: UUID) -> None:
+        """Drop the cached principal for a user, if any."""
+        with self._lock:
+            self._entries.pop(user_id, None)
+
+    def clear(self) -> None:
+        """Drop all entries and reset the counters."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self) -> dict:
+        """Return hit/miss counters and current size."""
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "size": len(self._entries),
+                "max_size": self.max_size,
+                "ttl_seconds": self.ttl_seconds,
+            }
+
+
+principal_cache = PrincipalCache(
+    ttl_seconds=settings.PRINCIPAL_CACHE_TTL_SECONDS,
+    max_size=settings.PRINCIPAL_CACHE_MAX_SIZE,
+)
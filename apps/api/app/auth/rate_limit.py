@@ -0,0 +1,375 @@
+"""Token-bucket rate limiting for unauthenticated auth endpoints.
+
+The OTP endpoints and invitation validation take no credentials, and each
+request costs at least one database round trip. :class:`RateLimitMiddleware`
+sits in front of the routers and checks every matching request against two
+token buckets before any dependency (and so any database session) runs. One
+bucket is per client IP and shared by all limited endpoints. The other is per
+subject: the phone number in the OTP request body or the invitation token in
+the path. An exhausted bucket gets a 429 with ``Retry-After``.
+
+Buckets live in a backend. :class:`MemoryRateLimitBackend` keeps them in
+process, so each worker limits on its own. :class:`RedisRateLimitBackend`
+keeps them in Redis and updates them with one Lua script per request, so all
+workers share one limit. A request takes a token from every bucket it touches
+or from none. If the backend fails, requests are let through, so an outage of
+the limiter cannot lock users out of login.
+
+Subjects are hashed before they become bucket keys, so invitation tokens and
+phone numbers are never stored in the backend. The client IP is the ASGI
+``client`` address. Behind a proxy, run uvicorn with ``--proxy-headers`` so
+that address is the real client.
+"""
+
+import hashlib
+import json
+import math
+import re
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, Optional, Protocol, Sequence
+
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.config.settings import settings
+
+# (bucket key, capacity, tokens added per second)
+Bucket = tuple[str, int, float]
+
+
+class RateLimitBackend(Protocol):
+    """Storage for token buckets."""
+
+    async def acquire(self, buckets: Sequence[Bucket]) -> float:
+        """Take one token from every bucket, or from none of them.
+
+        Returns:
+            0.0 if the tokens were taken, otherwise seconds until they
+            would all be available
+        """
+        ...
+
+    def clear(self) -> None:
+        """Forget every bucket this process can forget."""
+        ...
+
+    async def close(self) -> None:
+        """Release connections held by the backend."""
+        ...
+
+
+class MemoryRateLimitBackend:
+    """Per-process buckets in a bounded LRU map."""
+
+    def __init__(
+        self, max_keys: int = 100_000, clock: Callable[[], float] = time.monotonic
+    ) -> None:
+        self.max_keys = max_keys
+        self._clock = clock
+        # key -> (tokens, last refill time)
+        self._buckets: "OrderedDict[str, tuple[float, float]]" = OrderedDict()
+
+    async def acquire(self, buckets: Sequence[Bucket]) -> float:
+        now = self._clock()
+        levels = []
+        wait = 0.0
+        for key, capacity, rate in buckets:
+            tokens, updated = self._buckets.get(key, (capacity, now))
+            tokens = min(capacity, tokens + (now - updated) * rate)
+            levels.append(tokens)
+            if tokens < 1:
+                wait = max(wait, (1 - tokens) / rate)
+        for (key, _, _), tokens in zip(buckets, levels):
+            self._buckets[key] = (tokens if wait else tokens - 1, now)
+            self._buckets.move_to_end(key)
+        while len(self._buckets) > self.max_keys:
+            self._buckets.popitem(last=False)
+        return wait
+
+    def clear(self) -> None:
+        self._buckets.clear()
+
+    async def close(self) -> None:
+        return None
+
+    def __len__(self) -> int:
+        return len(self._buckets)
+
+
+# KEYS: bucket keys. ARGV: capacity and rate for each key, in key order.
+# Uses the Redis clock so every worker refills buckets the same way.
+TOKEN_BUCKET_SCRIPT = """
+local time = redis.call('TIME')
+local now = tonumber(time[1]) + tonumber(time[2]) / 1000000
+local levels = {}
+local wait = 0
+for i, key in ipairs(KEYS) do
+  local capacity = tonumber(ARGV[2 * i - 1])
+  local rate = tonumber(ARGV[2 * i])
+  local state = redis.call('HMGET', key, 'tokens', 'updated')
+  local tokens = tonumber(state[1]) or capacity
+  local updated = tonumber(state[2]) or now
+  tokens = math.min(capacity, tokens + math.max(0, now - updated) * rate)
+  levels[i] = tokens
+  if tokens < 1 then
+    wait = math.max(wait, (1 - tokens) / rate)
+  end
+end
+for i, key in ipairs(KEYS) do
+  local capacity = tonumber(ARGV[2 * i - 1])
+  local rate = tonumber(ARGV[2 * i])
+  local tokens = levels[i]
+  if wait == 0 then
+    tokens = tokens - 1
+  end
+  redis.call('HSET', key, 'tokens', tostring(tokens), 'updated', tostring(now))
+  redis.call('PEXPIRE', key, math.ceil((capacity - tokens) / rate * 1000) + 1000)
+end
+return tostring(wait)
+"""
+
+
+class RedisRateLimitBackend:
+    """Buckets shared by all workers, stored as Redis hashes."""
+
+    def __init__(self, client: Any, prefix: str = "ratelimit:") -> None:
+        self.client = client
+        self.prefix = prefix
+        self._script = client.register_script(TOKEN_BUCKET_SCRIPT)
+
+    @classmethod
+    def from_url(cls, url: str) -> "RedisRateLimitBackend":
+        from redis.asyncio import Redis
+
+        return cls(Redis.from_url(url))
+
+    async def acquire(self, buckets: Sequence[Bucket]) -> float:
+        keys = [self.prefix + key for key, _, _ in buckets]
+        args: list[float] = []
+        for _, capacity, rate in buckets:
+            args += [capacity, rate]
+        return float(await self._script(keys=keys, args=args))
+
+    def clear(self) -> None:
+        # Buckets expire in Redis once they have refilled
+        return None
+
+    async def close(self) -> None:
+        await self.client.aclose()
+
+
+@dataclass(frozen=True)
+class RateLimitRule:
+    """An endpoint whose requests are limited per IP and per subject.
+
+    ``subject`` names the group in ``path`` or the JSON body field that
+    identifies who or what the request is about.
+    """
+
+    name: str
+    method: str
+    path: "re.Pattern[str]"
+    subject: str
+    subject_in_body: bool
+    capacity: int
+    per_minute: float
+
+
+class RateLimiter:
+    """Matches requests to rules and takes tokens from their buckets."""
+
+    def __init__(
+        self,
+        backend: RateLimitBackend,
+        rules: Sequence[RateLimitRule],
+        ip_capacity: int,
+        ip_per_minute: float,
+        enabled: bool = True,
+    ) -> None:
+        self.backend = backend
+        self.rules = list(rules)
+        self.ip_capacity = ip_capacity
+        self.ip_per_minute = ip_per_minute
+        self.enabled = enabled
+        self.allowed = 0
+        self.rejected = 0
+        self.backend_errors = 0
+
+    def match(self, method: str, path: str) -> Optional[tuple[RateLimitRule, dict]]:
+        """Return the rule for a request and its path parameters, if any."""
+        if not self.enabled:
+            return None
+        for rule in self.rules:
+            if rule.method == method:
+                found = rule.path.fullmatch(path)
+                if found:
+                    return rule, found.groupdict()
+        return None
+
+    def buckets(
+        self, rule: RateLimitRule, client_ip: str, subject: Optional[str]
+    ) -> list[Bucket]:
+        """Buckets a request takes a token from."""
+        buckets = [(f"ip:{client_ip}", self.ip_capacity, self.ip_per_minute / 60)]
+        if subject:
+            digest = hashlib.sha256(subject.encode()).hexdigest()[:32]
+            buckets.append(
+                (f"{rule.name}:{digest}", rule.capacity, rule.per_minute / 60)
+            )
+        return buckets
+
+    async def check(
+        self, rule: RateLimitRule, client_ip: str, subject: Optional[str]
+    ) -> float:
+        """Take tokens for a request; return seconds to wait if limited."""
+        try:
+            wait = await self.backend.acquire(self.buckets(rule, client_ip, subject))
+        except Exception as e:
+            # Fail open: a limiter outage must not take login down with it
+            self.backend_errors += 1
+            print(f"Rate limit backend failed: {e}")
+            return 0.0
+        if wait > 0:
+            self.rejected += 1
+        else:
+            self.allowed += 1
+        return wait
+
+    def clear(self) -> None:
+        """Reset the buckets and counters."""
+        self.backend.clear()
+        self.allowed = 0
+        self.rejected = 0
+        self.backend_errors = 0
+
+    def stats(self) -> dict[str, Any]:
+        """Report the backend and how many requests were allowed or rejected."""
+        return {
+            "enabled": self.enabled,
+            "backend": type(self.backend).__name__,
+            "allowed": self.allowed,
+            "rejected": self.rejected,
+            "backend_errors": self.backend_errors,
+        }
+
+
+class RateLimitMiddleware:
+    """ASGI middleware rejecting requests over their rate limit with 429."""
+
+    def __init__(self, app: ASGIApp, limiter: "RateLimiter") -> None:
+        self.app = app
+        self.limiter = limiter
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        matched = self.limiter.match(scope["method"], scope["path"])
+        if matched is None:
+            await self.app(scope, receive, send)
+            return
+
+        rule, path_params = matched
+        if rule.subject_in_body:
+            messages = await _read_body(receive)
+            subject = _body_field(messages, rule.subject)
+            receive = _replay(messages, receive)
+        else:
+            subject = path_params.get(rule.subject)
+
+        client = scope.get("client")
+        wait = await self.limiter.check(
+            rule, client[0] if client else "unknown", subject
+        )
+        if wait > 0:
+            response = JSONResponse(
+                status_code=429,
+                content={"detail": "Too many requests"},
+                headers={"Retry-After": str(math.ceil(wait))},
+            )
+            await response(scope, receive, send)
+            return
+        await self.app(scope, receive, send)
+
+
+async def _read_body(receive: Receive) -> list[Message]:
+    messages = []
+    while True:
+        message = await receive()
+        messages.append(message)
+        if message["type"] != "http.request" or not message.get("more_body"):
+            return messages
+
+
+def _body_field(messages: list[Message], field: str) -> Optional[str]:
+    body = b"".join(m.get("body", b"") for m in messages)
+    try:
+        value = json.loads(body).get(field)
+    except (ValueError, AttributeError):
+        return None
+    return value.strip() if isinstance(value, str) else None
+
+
+def _replay(messages: list[Message], receive: Receive) -> Receive:
+    """Receive that hands the already-read body to the app first."""
+    pending = list(messages)
+
+    async def replay() -> Message:
+        if pending:
+            return pending.pop(0)
+        return await receive()
+
+    return replay
+
+
+RATE_LIMIT_RULES = [
+    RateLimitRule(
+        name="otp-request",
+        method="POST",
+        path=re.compile(r"/auth/otp/request"),
+        subject="phone",
+        subject_in_body=True,
+        capacity=settings.RATE_LIMIT_PHONE_BURST,
+        per_minute=settings.RATE_LIMIT_PHONE_PER_MINUTE,
+    ),
+    RateLimitRule(
+        name="otp-verify",
+        method="POST",
+        path=re.compile(r"/auth/otp/verify"),
+        subject="phone",
+        subject_in_body=True,
+        capacity=settings.RATE_LIMIT_PHONE_BURST,
+        per_minute=settings.RATE_LIMIT_PHONE_PER_MINUTE,
+    ),
+    RateLimitRule(
+        name="invitation-validate",
+        method="GET",
+        path=re.compile(r"/auth/invitations/(?P<token>[^/]+)/validate"),
+        subject="token",
+        subject_in_body=False,
+        capacity=settings.RATE_LIMIT_TOKEN_BURST,
+        per_minute=settings.RATE_LIMIT_TOKEN_PER_MINUTE,
+    ),
+]
+
+
+def _backend() -> RateLimitBackend:
+    if settings.RATE_LIMIT_BACKEND == "redis":
+        return RedisRateLimitBackend.from_url(settings.REDIS_URL)
+    return MemoryRateLimitBackend(max_keys=settings.RATE_LIMIT_MAX_KEYS)
+
+
+rate_limiter = RateLimiter(
+    backend=_backend(),
+    rules=RATE_LIMIT_RULES,
+    ip_capacity=settings.RATE_LIMIT_IP_BURST,
+    ip_per_minute=settings.RATE_LIMIT_IP_PER_MINUTE,
+    enabled=settings.RATE_LIMIT_ENABLED,
+)
+
+
+def get_rate_limiter() -> RateLimiter:
+    """Dependency returning the process-wide rate limiter."""
+    return rate_limiter
@@ -4,7 +4,14 @@ from typing import Any
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.orm import Session
 
-from app.auth.security import create_access_token, generate_otp, get_current_user
+from app.auth.principal_cache import Principal
+from app.auth.security import (
+    create_access_token,
+    generate_otp,
+    get_current_principal,
+    principal_claims,
+)
+from app.auth.verification_codes import verify_code
 from app.core.database.session import get_db
 from app.core.dependencies import get_invitation_service
 from app.core.models.user import User
@@ -55,43 +62,32 @@ def verify_otp(payload: OTPVerify, db: Session = Depends(get_db)) -> Any:
     Verify the OTP and return an access token.
     Creates a new user if one doesn't exist.
     """
-    # 1. Find valid OTP
-    otp_record = (
-        db.query(VerificationCode)
-        .filter(
-            VerificationCode.phone == payload.phone,
-            VerificationCode.code == payload.code,
-            VerificationCode.is_used == False,  # noqa: E712
-            VerificationCode.expires_at > datetime.now(timezone.utc),
-        )
-        .first()
-    )
-
-    if not otp_record:
+    # 1. Consume the code and find or create the user in one transaction
+    user = verify_code(db, payload.phone, payload.code)
+    if user is None:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid or expired OTP"
         )
 
-    # 2. Mark as used
-    otp_record.is_used = True  # type: ignore
-    db.commit()
-
-    # 3. Find or Create User
-    user = db.query(User).filter(User.phone == payload.phone).first()
-    if not user:
-        user = User(phone=payload.phone)
-        db.add(user)
-        db.commit()
-        db.refresh(user)
-
-    # 4. Generate Token
-    access_token = create_access_token(subject=str(user.id))
+    # 2. Generate Token
+    access_token = create_access_token(
+        subject=str(user.id), claims=principal_claims(user)
+    )
     return {"access_token": access_token, "token_type": "bearer", "user": user}
 
 
 @router.get("/me", response_model=UserRead)
-def read_me(current_user: User = Depends(get_current_user)) -> UserRead:
-    return current_user
+def read_me(
+    current_user: Principal = Depends(get_current_principal),
+    db: Session = Depends(get_db),
+) -> UserRead:
+    # The cached principal only carries auth fields; load the full profile
+    user = db.get(User, current_user.id)
+    if not user:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="User not found"
+        )
+    return user
 
 
 @router.get("/invitations/{token}/validate", response_model=InvitationValidateResponse)
@@ -8,10 +8,13 @@ from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 from jose import JWTError, jwt
 from passlib.context import CryptContext
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.auth.permission_versions import permission_versions
+from app.auth.principal_cache import Principal, principal_cache
+from app.auth.token_cache import token_cache
 from app.core.config.settings import settings
-from app.core.database.session import get_db
+from app.core.database.session import get_async_db
 from app.core.models.user import User
 
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
@@ -22,10 +25,14 @@ def generate_otp(length: int = 6) -> str:
     return "".join(secrets.choice(string.digits) for _ in range(length))
 
 
-def create_access_token(subject: str, expires_minutes: Optional[int] = None) -> str:
+def create_access_token(
+    subject: str,
+    expires_minutes: Optional[int] = None,
+    claims: Optional[dict] = None,
+) -> str:
     expire_minutes = expires_minutes or settings.ACCESS_TOKEN_EXPIRE_MINUTES
     expire = datetime.now(timezone.utc) + timedelta(minutes=expire_minutes)
-    to_encode = {"sub": subject, "exp": expire}
+    to_encode = {**(claims or {}), "sub": subject, "exp": expire}
     token = jwt.encode(
         to_encode,
         settings.SECRET_KEY,
@@ -34,31 +41,50 @@ def create_access_token(subject: str, expires_minutes: Optional[int] = None) ->
     return str(token)
 
 
+def principal_claims(user: User) -> dict:
+    """
+    Claims that let a token be authorized without loading the user.
+
+    Returns:
+        ``rol`` (role bitmask) and ``pv`` (permissions version), or an empty
+        dict when stateless tokens are disabled
+    """
+    if not settings.AUTH_STATELESS_TOKENS:
+        return {}
+    return {
+        "rol": Principal.from_user(user).role_mask(),
+        "pv": int(user.permissions_version or 0),
+    }
+
+
 def decode_access_token(token: str) -> dict:
-    return dict(
-        jwt.decode(
-            token,
-            settings.SECRET_KEY,
-            algorithms=[settings.ALGORITHM],
+    """Verify a token and return its claims, from ``token_cache`` if possible."""
+    payload = token_cache.get(token)
+    if payload is None:
+        payload = dict(
+            jwt.decode(
+                token,
+                settings.SECRET_KEY,
+                algorithms=[settings.ALGORITHM],
+            )
         )
-    )
+        token_cache.set(token, payload)
+    return payload
 
 
 # OAuth2 scheme for token authentication
 oauth2_scheme = HTTPBearer()
 
+credentials_exception = HTTPException(
+    status_code=status.HTTP_401_UNAUTHORIZED,
+    detail="Could not validate credentials",
+    headers={"WWW-Authenticate": "Bearer"},
+)
 
-async def get_current_user(
-    credentials: HTTPAuthorizationCredentials = Depends(oauth2_scheme),
-    db: Session = Depends(get_db),
-) -> User:
-    """Get the current authenticated user from JWT token"""
-    credentials_exception = HTTPException(
-        status_code=status.HTTP_401_UNAUTHORIZED,
-        detail="Could not validate credentials",
-        headers={"WWW-Authenticate": "Bearer"},
-    )
 
+def _decode_credentials(
+    credentials: HTTPAuthorizationCredentials,
+) -> tuple[UUIDType, dict]:
     try:
         # Decode the JWT token
         payload = decode_access_token(credentials.credentials)
@@ -66,34 +92,92 @@ async def get_current_user(
         if subject is None:
             raise credentials_exception
         # Treat subject as user ID (UUID)
-        user_id = UUIDType(str(subject))
+        return UUIDType(str(subject)), payload
     except (JWTError, ValueError) as exc:
         raise credentials_exception from exc
 
-    # Get user from database by ID
-    user = db.query(User).filter(User.id == user_id).first()
-    if user is None:
-        raise credentials_exception
 
-    return user
+async def _load_principal(user_id: UUIDType, db: AsyncSession) -> Principal:
+    principal = principal_cache.get(user_id)
+    if principal is None:
+        # Get user from database by ID
+        user = await db.get(User, user_id)
+        if user is None:
+            raise credentials_exception
+        principal = Principal.from_user(user)
+        principal_cache.set(principal)
+    return principal
+
+
+def _require_active(principal: Principal) -> Principal:
+    if not principal.is_active:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Inactive user",
+        )
+    return principal
+
+
+async def get_current_user(
+    credentials: HTTPAuthorizationCredentials = Depends(oauth2_scheme),
+    db: AsyncSession = Depends(get_async_db),
+) -> Principal:
+    """Get the current authenticated principal from JWT token.
+
+    The principal is served from ``principal_cache`` when possible, so the
+    hot path costs no database round trip.
+    """
+    user_id, _ = _decode_credentials(credentials)
+    return _require_active(await _load_principal(user_id, db))
+
+
+async def get_current_principal(
+    credentials: HTTPAuthorizationCredentials = Depends(oauth2_scheme),
+    db: AsyncSession = Depends(get_async_db),
+) -> Principal:
+    """Get the current principal, from the token's claims when possible.
+
+    With ``AUTH_STATELESS_TOKENS`` enabled, a token carrying ``rol`` and
+    ``pv`` claims is authorized from those claims alone. The request is
+    rejected if ``pv`` is below the user's current permissions version.
+    Tokens without the claims are resolved like :func:`get_current_user`.
+    So are all tokens until this worker has loaded the permissions versions.
+    """
+    user_id, payload = _decode_credentials(credentials)
+    mask, version = payload.get("rol"), payload.get("pv")
+    if (
+        not settings.AUTH_STATELESS_TOKENS
+        or permission_versions.synced_at is None
+        or not isinstance(mask, int)
+        or not isinstance(version, int)
+    ):
+        return _require_active(await _load_principal(user_id, db))
+
+    if permission_versions.is_stale(user_id, version):
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Token has been revoked",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+    return _require_active(Principal.from_role_mask(user_id, mask))
 
 
-def is_super_admin(user: User) -> bool:
+def is_super_admin(user: User | Principal) -> bool:
     """Check if user is a super admin."""
     return bool(user.is_super_admin)
 
 
-def is_admin_or_super_admin(user: User) -> bool:
+def is_admin_or_super_admin(user: User | Principal) -> bool:
     """Check if user is an admin or super admin."""
     return bool(user.is_admin or user.is_super_admin)
 
 
-def is_support_agent(user: User) -> bool:
+def is_support_agent(user: User | Principal) -> bool:
     """Check if user is a support agent or super admin."""
     return bool(user.is_super_admin or user.is_support_agent)
 
 
-def is_provisioning_specialist(user: User) -> bool:
+def is_provisioning_specialist(user: User | Principal) -> bool:
     """Check if user is a provisioning specialist or super admin."""
     return bool(user.is_super_admin or user.is_provisioning_specialist)
 
@@ -0,0 +1,84 @@
+"""In-process LRU cache of verified access token payloads.
+
+Clients send the same bearer token on every request until it expires, and
+``decode_access_token`` would otherwise verify the HS256 signature and parse
+the claims each time. A verified payload is cached here until the token's
+``exp`` claim passes, keyed by a SHA-256 digest of the token so the tokens
+themselves are not kept in memory.
+
+Tokens without ``exp`` are never cached, and neither are tokens that fail
+verification. The cache holds at most ``max_size`` entries (least recently
+used are evicted first). Revoking a token before it expires is not a concern
+here: signature verification never could, and revocation is handled by
+:mod:`app.auth.permission_versions` after decoding.
+"""
+
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Optional
+
+from app.core.config.settings import settings
+
+
+class TokenCache:
+    """Bounded LRU cache of verified token payloads, expiring at ``exp``."""
+
+    def __init__(self, max_size: int, clock: Callable[[], float] = time.time) -> None:
+        self.max_size = max_size
+        self._clock = clock
+        self._entries: "OrderedDict[bytes, tuple[float, dict]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def _key(token: str) -> bytes:
+        return hashlib.sha256(token.encode()).digest()
+
+    def get(self, token: str) -> Optional[dict]:
+        """Return a copy of the cached payload, or None if missing or expired."""
+        key = self._key(token)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] <= self._clock():
+                if entry is not None:
+                    del self._entries[key]
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return dict(entry[1])
+
+    def set(self, token: str, payload: dict[str, Any]) -> None:
+        """Cache a verified payload until its ``exp`` claim."""
+        expires_at = payload.get("exp")
+        if self.max_size <= 0 or not isinstance(expires_at, (int, float)):
+            return
+        key = self._key(token)
+        with self._lock:
+            self._entries[key] = (float(expires_at), dict(payload))
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop all entries and reset the counters."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self) -> dict:
+        """Return hit/miss counters and current size."""
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "size": len(self._entries),
+                "max_size": self.max_size,
+            }
+
+
+token_cache = TokenCache(max_size=settings.TOKEN_CACHE_MAX_SIZE)
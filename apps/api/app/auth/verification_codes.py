@@ -0,0 +1,136 @@
+"""Verification and retention of one-time login codes.
+
+:func:`verify_code` logs a phone number in. It makes two statements in one
+transaction. An ``UPDATE ... RETURNING`` marks the code used only if it is
+still unused and unexpired. The row lock makes that a compare-and-set, so of
+two concurrent verifies of one code only the first gets a row back. An
+``INSERT ... ON CONFLICT (phone) DO UPDATE ... RETURNING`` then creates the
+user or returns the existing one. A no-op ``DO UPDATE`` is used instead of
+``DO NOTHING`` because ``DO NOTHING`` returns no row for an existing user.
+
+Every OTP request inserts a ``verification_codes`` row and nothing reads a
+code after it expires, so without cleanup the table only grows. Every code
+expires ten minutes after it is issued, and used codes expire on the same
+schedule. Retention therefore deletes by ``expires_at``, which removes both
+expired and used codes.
+
+The sweep deletes in batches of primary keys picked through the
+``expires_at`` index. Each batch is its own short transaction, so the sweep
+never holds long locks or builds a large undo log on a table that login
+traffic is writing to.
+"""
+
+import asyncio
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, Optional
+
+from sqlalchemy import delete, select, update
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.core.models.user import User
+from app.core.models.verification_code import VerificationCode
+
+SessionFactory = Callable[[], AsyncSession]
+
+
+def upsert_user_statement(dialect_name: str, phone: str) -> Any:
+    """``INSERT ... ON CONFLICT (phone) DO UPDATE ... RETURNING`` for a user."""
+    dialect = sqlite if dialect_name == "sqlite" else postgresql
+    statement = dialect.insert(User).values(phone=phone)
+    return statement.on_conflict_do_update(
+        index_elements=[User.phone], set_={"phone": statement.excluded.phone}
+    ).returning(User)
+
+
+def verify_code(db: Session, phone: str, code: str) -> Optional[User]:
+    """
+    Consume a code and return the user for its phone, creating the user.
+
+    Args:
+        db: Database session; committed if the code is valid
+        phone: Phone number the code was sent to
+        code: Code entered by the user
+
+    Returns:
+        The user, or None if the code is wrong, used or expired
+    """
+    consumed = db.execute(
+        update(VerificationCode)
+        .where(
+            VerificationCode.phone == phone,
+            VerificationCode.code == code,
+            VerificationCode.is_used == False,  # noqa: E712
+            VerificationCode.expires_at > datetime.now(timezone.utc),
+        )
+        .values(is_used=True)
+        .returning(VerificationCode.id)
+    ).first()
+    if consumed is None:
+        db.rollback()
+        return None
+
+    user: User = db.scalars(
+        upsert_user_statement(db.get_bind().dialect.name, phone),
+        execution_options={"populate_existing": True},
+    ).one()
+    db.commit()
+    return user
+
+
+async def purge_expired_codes(
+    session_factory: SessionFactory,
+    retention_seconds: float,
+    batch_size: int,
+) -> int:
+    """
+    Delete codes that expired more than ``retention_seconds`` ago.
+
+    Args:
+        session_factory: Callable returning a new AsyncSession
+        retention_seconds: How long expired codes are kept
+        batch_size: Rows deleted per transaction
+
+    Returns:
+        Number of codes deleted
+    """
+    cutoff = datetime.now(timezone.utc) - timedelta(seconds=retention_seconds)
+    batch = (
+        select(VerificationCode.id)
+        .where(VerificationCode.expires_at < cutoff)
+        .limit(batch_size)
+    )
+    deleted = 0
+    while True:
+        async with session_factory() as session:
+            result = await session.execute(
+                delete(VerificationCode).where(
+                    VerificationCode.id.in_(batch.scalar_subquery())
+                )
+            )
+            await session.commit()
+        deleted += result.rowcount
+        if result.rowcount < batch_size:
+            return deleted
+        # Let request handlers run between batches
+        await asyncio.sleep(0)
+
+
+async def run_retention(
+    session_factory: SessionFactory,
+    interval: float,
+    retention_seconds: float,
+    batch_size: int,
+) -> None:
+    """Purge expired codes now and every ``interval`` seconds until cancelled."""
+    while True:
+        try:
+            deleted = await purge_expired_codes(
+                session_factory, retention_seconds, batch_size
+            )
+            if deleted:
+                print(f"Deleted {deleted} expired verification codes")
+        except Exception as e:
+            print(f"Verification code retention failed: {e}")
+        await asyncio.sleep(interval)
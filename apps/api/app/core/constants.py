@@ -5,3 +5,19 @@ DEFAULT_SKIP = 0
 DEFAULT_LIMIT = 50
 MIN_LIMIT = 1
 MAX_LIMIT = 100
+
+# Maximum orders accepted by POST /orders/bulk
+MAX_BULK_ORDERS = 500
+
+# Maximum invitees accepted by POST /organizations/{id}/invite-members
+MAX_BULK_INVITATIONS = 500
+
+# Maximum heartbeats accepted per POST /iot/heartbeats request
+MAX_HEARTBEAT_BATCH = 1000
+
+# Keyset pagination: list endpoints return the next page's cursor in this header
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+CURSOR_DESCRIPTION = (
+    f"Opaque cursor from the {NEXT_CURSOR_HEADER} response header; "
+    "cannot be combined with skip"
+)
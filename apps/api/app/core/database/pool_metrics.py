@@ -0,0 +1,154 @@
+"""Connection pool telemetry.
+
+``PoolMetrics`` counts checkouts, checkins, new connections, invalidations and
+checkout timeouts via SQLAlchemy pool events. Checkout wait time is measured
+by the instrumented pool classes below, which time ``Pool.connect()`` (queue
+wait, overflow connects and pre-ping included) and survive ``recreate()``.
+"""
+
+import os
+import threading
+import time
+from typing import Any, Optional
+
+from sqlalchemy import event
+from sqlalchemy import exc as sa_exc
+from sqlalchemy.engine import Engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+
+
+class PoolMetrics:
+    """Thread-safe counters describing one engine's connection pool."""
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self._lock = threading.Lock()
+        self._engine: Optional[Engine] = None
+        self.reset()
+
+    def reset(self) -> None:
+        """Zero all counters."""
+        with self._lock:
+            self.checkouts = 0
+            self.checkins = 0
+            self.connects = 0
+            self.invalidations = 0
+            self.timeouts = 0
+            self.wait_time_total = 0.0
+            self.wait_time_max = 0.0
+            self.peak_checked_out = 0
+            self.peak_overflow = 0
+
+    def instrument(self, engine: Engine) -> None:
+        """Attach event listeners to ``engine`` and bind instrumented pools."""
+        self._engine = engine
+        if isinstance(engine.pool, InstrumentedPoolMixin):
+            engine.pool.metrics = self
+        event.listen(engine, "checkout", self._on_checkout)
+        event.listen(engine, "checkin", self._on_checkin)
+        event.listen(engine, "connect", self._on_connect)
+        event.listen(engine, "invalidate", self._on_invalidate)
+
+    def record_wait(self, seconds: float, timed_out: bool = False) -> None:
+        """Record how long one ``Pool.connect()`` call waited."""
+        with self._lock:
+            self.wait_time_total += seconds
+            self.wait_time_max = max(self.wait_time_max, seconds)
+            if timed_out:
+                self.timeouts += 1
+
+    def _on_checkout(self, *args: Any) -> None:
+        pool = self._engine.pool if self._engine is not None else None
+        with self._lock:
+            self.checkouts += 1
+            if isinstance(pool, QueuePool):
+                self.peak_checked_out = max(self.peak_checked_out, pool.checkedout())
+                self.peak_overflow = max(self.peak_overflow, pool.overflow())
+
+    def _on_checkin(self, *args: Any) -> None:
+        with self._lock:
+            self.checkins += 1
+
+    def _on_connect(self, *args: Any) -> None:
+        with self._lock:
+            self.connects += 1
+
+    def _on_invalidate(self, *args: Any) -> None:
+        with self._lock:
+            self.invalidations += 1
+
+    def snapshot(self) -> dict:
+        """Return current pool state plus cumulative counters."""
+        pool = self._engine.pool if self._engine is not None else None
+        state: dict[str, Any] = {
+            "name": self.name,
+            "pool_class": type(pool).__name__ if pool is not None else None,
+        }
+        if isinstance(pool, QueuePool):
+            state.update(
+                size=pool.size(),
+                checked_in=pool.checkedin(),
+                checked_out=pool.checkedout(),
+                overflow=pool.overflow(),
+                max_overflow=pool._max_overflow,
+                timeout=pool.timeout(),
+            )
+        with self._lock:
+            state.update(
+                checkouts=self.checkouts,
+                checkins=self.checkins,
+                connects=self.connects,
+                invalidations=self.invalidations,
+                timeouts=self.timeouts,
+                peak_checked_out=self.peak_checked_out,
+                peak_overflow=self.peak_overflow,
+                wait_time_total_ms=self.wait_time_total * 1000,
+                wait_time_max_ms=self.wait_time_max * 1000,
+                wait_time_avg_ms=(
+                    self.wait_time_total * 1000 / self.checkouts
+                    if self.checkouts
+                    else 0.0
+                ),
+            )
+        return state
+
+
+class InstrumentedPoolMixin:
+    """Times ``connect()`` and reports it to the bound ``PoolMetrics``."""
+
+    metrics: Optional[PoolMetrics] = None
+
+    def connect(self) -> Any:
+        started = time.perf_counter()
+        try:
+            connection = super().connect()  # type: ignore[misc]
+        except sa_exc.TimeoutError:
+            if self.metrics is not None:
+                self.metrics.record_wait(time.perf_counter() - started, True)
+            raise
+        if self.metrics is not None:
+            self.metrics.record_wait(time.perf_counter() - started)
+        return connection
+
+    def recreate(self) -> Any:
+        # engine.dispose() swaps in a fresh pool; keep reporting to the same
+        # metrics object.
+        pool = super().recreate()  # type: ignore[misc]
+        pool.metrics = self.metrics
+        return pool
+
+
+class InstrumentedQueuePool(InstrumentedPoolMixin, QueuePool):
+    """``QueuePool`` with checkout wait-time telemetry."""
+
+
+class InstrumentedAsyncQueuePool(InstrumentedPoolMixin, AsyncAdaptedQueuePool):
+    """``AsyncAdaptedQueuePool`` with checkout wait-time telemetry."""
+
+
+def get_pool_report(*metrics: PoolMetrics) -> dict:
+    """Build the telemetry payload for the given pools.
+
+    The worker pid is included because each uvicorn worker owns its own pools.
+    """
+    return {"pid": os.getpid(), "pools": [m.snapshot() for m in metrics]}
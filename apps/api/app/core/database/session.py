@@ -1,13 +1,81 @@
-from typing import Generator
+from typing import Any, AsyncGenerator, Generator
 
 from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import Session, sessionmaker
 
 from app.core.config.settings import settings
+from app.core.database.pool_metrics import (
+    InstrumentedAsyncQueuePool,
+    InstrumentedQueuePool,
+    PoolMetrics,
+)
 
-engine = create_engine(settings.DATABASE_URL, pool_pre_ping=True)
+# Sync drivers mapped to the asyncio driver used by the async engine
+ASYNC_DRIVERS = {
+    "postgresql": "postgresql+asyncpg",
+    "postgresql+psycopg2": "postgresql+asyncpg",
+    "sqlite": "sqlite+aiosqlite",
+}
+
+
+def get_async_database_url(database_url: str) -> str:
+    """Translate a sync DATABASE_URL into its asyncio driver equivalent.
+
+    Args:
+        database_url: SQLAlchemy URL using a sync driver (e.g. psycopg2)
+
+    Returns:
+        The same URL with an asyncio driver (asyncpg/aiosqlite); URLs that
+        already name an async driver are returned unchanged
+    """
+    scheme, sep, rest = database_url.partition("://")
+    return f"{ASYNC_DRIVERS.get(scheme, scheme)}{sep}{rest}"
+
+
+def get_pool_options(database_url: str, is_async: bool = False) -> dict[str, Any]:
+    """Build engine pool keyword arguments from settings.
+
+    Args:
+        database_url: SQLAlchemy URL the engine will connect to
+        is_async: Whether the options are for an AsyncEngine
+
+    Returns:
+        Keyword arguments for create_engine/create_async_engine. SQLite keeps
+        SQLAlchemy's default pool, which does not accept sizing options.
+    """
+    options: dict[str, Any] = {"pool_pre_ping": settings.DB_POOL_PRE_PING}
+    if database_url.startswith("sqlite"):
+        return options
+    options.update(
+        poolclass=InstrumentedAsyncQueuePool if is_async else InstrumentedQueuePool,
+        pool_size=settings.DB_POOL_SIZE,
+        max_overflow=settings.DB_MAX_OVERFLOW,
+        pool_timeout=settings.DB_POOL_TIMEOUT,
+        pool_recycle=settings.DB_POOL_RECYCLE,
+        pool_use_lifo=settings.DB_POOL_USE_LIFO,
+    )
+    return options
+
+
+engine = create_engine(settings.DATABASE_URL, **get_pool_options(settings.DATABASE_URL))
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+async_engine = create_async_engine(
+    get_async_database_url(settings.DATABASE_URL),
+    **get_pool_options(settings.DATABASE_URL, is_async=True),
+)
+# expire_on_commit=False keeps committed objects readable without an implicit
+# (and in asyncio, illegal) lazy refresh during response serialization.
+AsyncSessionLocal = async_sessionmaker(
+    bind=async_engine, autoflush=False, expire_on_commit=False
+)
+
+sync_pool_metrics = PoolMetrics("sync")
+sync_pool_metrics.instrument(engine)
+async_pool_metrics = PoolMetrics("async")
+async_pool_metrics.instrument(async_engine.sync_engine)
+
 
 def get_db() -> Generator[Session, None, None]:
     db = SessionLocal()
@@ -15,3 +83,9 @@ def get_db() -> Generator[Session, None, None]:
         yield db
     finally:
         db.close()
+
+
+async def get_async_db() -> AsyncGenerator[AsyncSession, None]:
+    """Yield an AsyncSession that does not block the event loop on I/O."""
+    async with AsyncSessionLocal() as db:
+        yield db
@@ -9,11 +9,13 @@ from app.core.database.session import get_db
 from app.core.emails.invitation_templates import InvitationTemplateRenderer
 from app.core.repositories.invitation_repository import InvitationRepository
 from app.core.repositories.organization_repository import OrganizationRepository
+from app.core.repositories.unit_of_work import UnitOfWork
 from app.core.repositories.user_organization_repository import (
     UserOrganizationRepository,
 )
 from app.core.repositories.user_repository import UserRepository
 from app.core.repositories.user_store_repository import UserStoreRepository
+from app.core.services.email_queue import EmailQueue, get_email_queue
 from app.core.services.email_service import EmailService
 from app.core.services.invitation_service import InvitationService
 
@@ -51,6 +53,11 @@ def get_organization_repository(
     return OrganizationRepository(db)
 
 
+def get_unit_of_work(db: Session = Depends(get_db)) -> UnitOfWork:
+    """Dependency factory for a UnitOfWork on the request's session."""
+    return UnitOfWork(db)
+
+
 def get_invitation_service(
     invitation_repo: InvitationRepository = Depends(get_invitation_repository),
     user_repo: UserRepository = Depends(get_user_repository),
@@ -59,10 +66,16 @@ def get_invitation_service(
     ),
     user_store_repo: UserStoreRepository = Depends(get_user_store_repository),
     org_repo: OrganizationRepository = Depends(get_organization_repository),
+    unit_of_work: UnitOfWork = Depends(get_unit_of_work),
 ) -> InvitationService:
     """Dependency factory for InvitationService."""
     return InvitationService(
-        invitation_repo, user_repo, user_org_repo, user_store_repo, org_repo
+        invitation_repo,
+        user_repo,
+        user_org_repo,
+        user_store_repo,
+        org_repo,
+        unit_of_work,
     )
 
 
@@ -75,6 +88,7 @@ def get_email_service(
     template_renderer: InvitationTemplateRenderer = Depends(
         get_invitation_template_renderer
     ),
+    queue: EmailQueue = Depends(get_email_queue),
 ) -> EmailService:
     """Dependency factory for EmailService."""
     email_config = EmailConfig(
@@ -82,4 +96,4 @@ def get_email_service(
         from_email=settings.FROM_EMAIL,
         frontend_url=settings.FRONTEND_URL,
     )
-    return EmailService(email_config, template_renderer)
+    return EmailService(email_config, template_renderer, queue)
@@ -1,6 +1,17 @@
-"""Email templates for invitation emails."""
+"""Email templates for invitation emails.
+
+Templates use ``str.format`` syntax. Each file is parsed once into a
+:class:`CompiledTemplate` (literal chunks plus placeholder slots) and cached
+per path. The cache entry is reused until the file's mtime changes; the
+mtime is checked at most once per ``reload_check_interval`` seconds. Rendering
+then fills the slots and joins the chunks, without touching the disk or
+rescanning the template text.
+"""
+import os
+import string
+import time
 from pathlib import Path
-from typing import NamedTuple, Protocol
+from typing import Any, Iterable, NamedTuple, Protocol
 
 # Template file names
 INVITATION_EMAIL_HTML_TEMPLATE = "invitation_email.html"
@@ -15,6 +26,62 @@ class InvitationEmailContent(NamedTuple):
     subject: str
 
 
+class InvitationEmailContext(NamedTuple):
+    """Per-recipient values for rendering an invitation email."""
+
+    store_name: str
+    organization_name: str
+    invitation_url: str
+    expiration_days: int = 7
+
+
+class CompiledTemplate(NamedTuple):
+    """A parsed template ready to render."""
+
+    mtime_ns: int
+    checked_at: float
+    chunks: tuple[str, ...]
+    slots: tuple[tuple[int, str], ...]
+
+    @classmethod
+    def compile(
+        cls, source: str, mtime_ns: int = 0, checked_at: float = 0.0
+    ) -> "CompiledTemplate":
+        """
+        Parse ``str.format`` template text.
+
+        Only plain named placeholders such as ``{store_name}`` are supported.
+        Escaped braces (``{{`` and ``}}``) become literal text.
+
+        Raises:
+            ValueError: If the template is malformed or a placeholder uses
+                indexing, a conversion or a format spec
+        """
+        chunks: list[str] = []
+        slots: list[tuple[int, str]] = []
+        for literal, field, spec, conversion in string.Formatter().parse(source):
+            if literal:
+                chunks.append(literal)
+            if field is None:
+                continue
+            if not field.isidentifier() or spec or conversion:
+                raise ValueError(f"Unsupported template placeholder: {{{field}}}")
+            slots.append((len(chunks), field))
+            chunks.append("")
+        return cls(mtime_ns, checked_at, tuple(chunks), tuple(slots))
+
+    def render(self, values: dict[str, Any]) -> str:
+        """Fill placeholders from ``values``; raises KeyError if one is missing."""
+        out = list(self.chunks)
+        for index, field in self.slots:
+            out[index] = str(values[field])
+        return "".join(out)
+
+
+# Compiled templates by path, shared by all renderer instances
+_template_cache: dict[Path, CompiledTemplate] = {}
+
+
 class InvitationTemplateRendererProtocol(Protocol):
     """Protocol for invitation template renderer operations used by EmailService."""
 
@@ -28,22 +95,33 @@ class InvitationTemplateRendererProtocol(Protocol):
         """Render invitation email templates with provided data."""
         ...
 
+    def render_invitation_emails(
+        self, recipients: Iterable[InvitationEmailContext]
+    ) -> list[InvitationEmailContent]:
+        """Render invitation emails for several recipients."""
+        ...
+
 
 class InvitationTemplateRenderer:
     """Renderer for invitation email templates."""
 
-    def __init__(self, template_dir: Path | None = None) -> None:
+    def __init__(
+        self, template_dir: Path | None = None, reload_check_interval: float = 1.0
+    ) -> None:
         """
         Initialize template renderer.
 
         Args:
             template_dir: Directory containing template files.
                 If None, uses default location.
+            reload_check_interval: Minimum seconds between checks of a
+                template file's mtime
         """
         if template_dir is None:
             # Default to app/core/templates relative to this file
             template_dir = Path(__file__).parent.parent / "templates"
         self.template_dir = template_dir
+        self.reload_check_interval = reload_check_interval
 
     def render_invitation_email(
         self,
@@ -64,50 +142,82 @@ class InvitationTemplateRenderer:
         Returns:
             InvitationEmailContent with rendered HTML, text, and subject
         """
+        return self.render_invitation_emails(
+            [
+                InvitationEmailContext(
+                    store_name=store_name,
+                    organization_name=organization_name,
+                    invitation_url=invitation_url,
+                    expiration_days=expiration_days,
+                )
+            ]
+        )[0]
+
+    def render_invitation_emails(
+        self, recipients: Iterable[InvitationEmailContext]
+    ) -> list[InvitationEmailContent]:
+        """
+        Render invitation emails for several recipients in one call.
+
+        Template freshness is checked once per call rather than per
+        recipient, which keeps bulk invites cheap.
+
+        Args:
+            recipients: Values to render for each recipient
+
+        Returns:
+            Rendered content, in the same order as ``recipients``
+        """
         html_template = self._load_template(INVITATION_EMAIL_HTML_TEMPLATE)
         text_template = self._load_template(INVITATION_EMAIL_TEXT_TEMPLATE)
 
-        html_content = html_template.format(
-            store_name=store_name,
-            organization_name=organization_name,
-            invitation_url=invitation_url,
-            expiration_days=expiration_days,
-        )
-        text_content = text_template.format(
-            store_name=store_name,
-            organization_name=organization_name,
-            invitation_url=invitation_url,
-            expiration_days=expiration_days,
-        )
-        subject = f"You've been invited to manage {organization_name} on LaundroMate"
-
-        return InvitationEmailContent(
-            html_content=html_content,
-            text_content=text_content,
-            subject=subject,
-        )
-
-    def _load_template(self, template_name: str) -> str:
+        rendered = []
+        for recipient in recipients:
+            values = recipient._asdict()
+            rendered.append(
+                InvitationEmailContent(
+                    html_content=html_template.render(values),
+                    text_content=text_template.render(values),
+                    subject=(
+                        "You've been invited to manage "
+                        f"{recipient.organization_name} on LaundroMate"
+                    ),
+                )
+            )
+        return rendered
+
+    def _load_template(self, template_name: str) -> CompiledTemplate:
         """
-        Load email template from filesystem.
+        Return the compiled template, recompiling if the file has changed.
 
         Args:
             template_name: Name of the template file
 
         Returns:
-            str: Template content
+            CompiledTemplate: Parsed template
 
         Raises:
             FileNotFoundError: If template file does not exist
         """
         template_path = self.template_dir / template_name
-
-        if not template_path.exists():
+        now = time.monotonic()
+        cached = _template_cache.get(template_path)
+        if cached is not None and now - cached.checked_at < self.reload_check_interval:
+            return cached
+
+        try:
+            mtime_ns = os.stat(template_path).st_mtime_ns
+        except FileNotFoundError:
             raise FileNotFoundError(
                 f"Template file not found: {template_path}. "
                 f"Expected template files: {INVITATION_EMAIL_HTML_TEMPLATE}, "
                 f"{INVITATION_EMAIL_TEXT_TEMPLATE}"
-            )
-
-        with open(template_path, "r", encoding="utf-8") as f:
-            return f.read()
+            ) from None
+
+        if cached is not None and cached.mtime_ns == mtime_ns:
+            compiled = cached._replace(checked_at=now)
+        else:
+            with open(template_path, "r", encoding="utf-8") as f:
+                compiled = CompiledTemplate.compile(f.read(), mtime_ns, now)
+        _template_cache[template_path] = compiled
+        return compiled
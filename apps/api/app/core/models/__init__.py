@@ -20,6 +20,7 @@ from app.core.models.order_item import OrderItem  # noqa: E402
 
 # Super-Admin Dashboard models
 from app.core.models.organization import Organization, OrganizationStatus  # noqa: E402
+from app.core.models.search import SearchType  # noqa: E402
 from app.core.models.service import Service  # noqa: E402
 from app.core.models.store import Store, StoreStatus  # noqa: E402
 from app.core.models.user import User  # noqa: E402
@@ -56,4 +57,5 @@ __all__ = [
     "UserStoreRole",
     "UserOrganization",
     "UserOrganizationRole",
+    "SearchType",
 ]
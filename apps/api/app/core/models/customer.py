@@ -3,6 +3,7 @@ from sqlalchemy import (
     Column,
     DateTime,
     ForeignKey,
+    Index,
     Integer,
     String,
     Text,
@@ -42,3 +43,9 @@ class Customer(Base):
     addresses = relationship("Address", back_populates="customer")
     orders = relationship("Order", back_populates="customer")
     notifications = relationship("Notification", back_populates="customer")
+
+    # Indexes
+    __table_args__ = (
+        # Keyset pagination order
+        Index("ix_customers_created_at_id", "created_at", "id"),
+    )
@@ -3,7 +3,7 @@
 import enum
 import uuid
 
-from sqlalchemy import Column, DateTime, Enum, ForeignKey, String, Uuid
+from sqlalchemy import Column, DateTime, Enum, ForeignKey, Index, String, Uuid
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 
@@ -52,6 +52,8 @@ class Invitation(Base):
     )
     expires_at = Column(DateTime(timezone=True), nullable=False, index=True)
     accepted_at = Column(DateTime(timezone=True), nullable=True)
+    # Set once SendGrid accepts the invitation email; NULL means not yet sent
+    email_sent_at = Column(DateTime(timezone=True), nullable=True)
     created_at = Column(
         DateTime(timezone=True), server_default=func.now(), nullable=False
     )
@@ -59,3 +61,8 @@ class Invitation(Base):
     # Relationships
     organization = relationship("Organization")
     inviter = relationship("User", foreign_keys=[invited_by])
+
+    __table_args__ = (
+        # Duplicate checks look up pending invitations by organization and email
+        Index("ix_invitations_organization_email", "organization_id", "email"),
+    )
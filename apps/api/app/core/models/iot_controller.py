@@ -83,4 +83,6 @@ class IoTController(Base):
             unique=True,
             postgresql_where=text("serial_number IS NOT NULL"),
         ),
+        # Keyset pagination order per store
+        Index("ix_iot_store_created_at_id", "store_id", "created_at", "id"),
     )
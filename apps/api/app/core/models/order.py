@@ -7,6 +7,7 @@ from sqlalchemy import (
     Enum,
     Float,
     ForeignKey,
+    Index,
     Integer,
     String,
     Text,
@@ -78,3 +79,9 @@ class Order(Base):
     )
     items = relationship("OrderItem", back_populates="order")
     notifications = relationship("Notification", back_populates="order")
+
+    # Indexes
+    __table_args__ = (
+        # Keyset pagination order
+        Index("ix_orders_created_at_id", "created_at", "id"),
+    )
@@ -65,4 +65,6 @@ class Organization(Base):
             postgresql_where=text("status = 'active'"),
             unique=True,
         ),
+        # Keyset pagination order
+        Index("ix_organizations_created_at_id", "created_at", "id"),
     )
@@ -0,0 +1,212 @@
+"""
+Search indexes over organizations, stores, users and IoT controllers.
+
+Each searchable type lists the fields a query is matched against, with a
+weight used in ranking. The indexes are built from that list:
+
+* on PostgreSQL, every field gets a ``pg_trgm`` GIN index, which serves
+  ``ILIKE '%term%'`` and ``similarity()`` without scanning the table
+* on SQLite (local runs and tests), every searched table gets an FTS5 table
+  with the ``trigram`` tokenizer. Its rows share the table's rowid and are
+  kept in sync by triggers, so bulk inserts and raw SQL are indexed too
+
+Both are created with the tables by ``Base.metadata.create_all``. Existing
+PostgreSQL databases get them from the ``add_search_indexes`` migration.
+"""
+
+import enum
+from dataclasses import dataclass
+from typing import Any
+
+from sqlalchemy import DDL, Column, ForeignKey, Index, event
+
+from app.core.models import Base
+from app.core.models.iot_controller import IoTController
+from app.core.models.organization import Organization
+from app.core.models.store import Store
+from app.core.models.user import User
+
+# Shortest term the trigram indexes can match
+MIN_SEARCH_LENGTH = 3
+
+
+class SearchType(str, enum.Enum):
+    """Kind of entity a search result refers to."""
+
+    ORGANIZATION = "organization"
+    STORE = "store"
+    USER = "user"
+    CONTROLLER = "controller"
+
+
+@dataclass(frozen=True)
+class SearchField:
+    """
+    A column a search term is matched against.
+
+    ``column`` may belong to a related table, e.g. a store is found by its
+    organization's name. ``name`` is the column of the SQLite FTS5 table.
+    """
+
+    name: str
+    column: Column
+    weight: float = 1.0
+
+
+@dataclass(frozen=True)
+class SearchTarget:
+    """A searchable model and the fields its rows are found by."""
+
+    model: Any
+    fields: tuple[SearchField, ...]
+
+    @property
+    def fts_table(self) -> str:
+        """Name of the SQLite FTS5 table."""
+        return f"{self.model.__tablename__}_search"
+
+
+_organizations = Organization.__table__.c
+_stores = Store.__table__.c
+_users = User.__table__.c
+_controllers = IoTController.__table__.c
+
+SEARCH_TARGETS = {
+    SearchType.ORGANIZATION: SearchTarget(
+        Organization,
+        (
+            SearchField("name", _organizations.name),
+            SearchField("contact_email", _organizations.contact_email, 0.5),
+            SearchField("city", _organizations.city, 0.5),
+        ),
+    ),
+    SearchType.STORE: SearchTarget(
+        Store,
+        (
+            SearchField("name", _stores.name),
+            SearchField("organization_name", _organizations.name, 0.5),
+            SearchField("street_address", _stores.street_address, 0.5),
+            SearchField("city", _stores.city, 0.5),
+            SearchField("state", _stores.state, 0.5),
+            SearchField("postal_code", _stores.postal_code, 0.5),
+        ),
+    ),
+    SearchType.USER: SearchTarget(
+        User,
+        (
+            SearchField("email", _users.email),
+            SearchField("phone", _users.phone),
+            SearchField("first_name", _users.first_name, 0.5),
+            SearchField("last_name", _users.last_name, 0.5),
+        ),
+    ),
+    SearchType.CONTROLLER: SearchTarget(
+        IoTController,
+        (
+            SearchField("mac_address", _controllers.mac_address),
+            SearchField("serial_number", _controllers.serial_number),
+            SearchField("machine_label", _controllers.machine_label, 0.5),
+        ),
+    ),
+}
+
+
+def _trigram_indexes() -> None:
+    """Add a PostgreSQL trigram index for every searched column."""
+    columns = {
+        field.column for target in SEARCH_TARGETS.values() for field in target.fields
+    }
+    for column in sorted(columns, key=lambda c: (c.table.name, c.name)):
+        Index(
+            f"ix_{column.table.name}_{column.name}_trgm",
+            column,
+            postgresql_using="gin",
+            postgresql_ops={column.name: "gin_trgm_ops"},
+        ).ddl_if(dialect="postgresql")
+
+
+def _foreign_key(target: SearchTarget, column: Column) -> ForeignKey:
+    """Foreign key from ``target``'s table to the table of ``column``."""
+    foreign_keys: list[ForeignKey] = [
+        fk
+        for fk in target.model.__table__.foreign_keys
+        if fk.column.table is column.table
+    ]
+    (foreign_key,) = foreign_keys
+    return foreign_key
+
+
+def _fts_source(target: SearchTarget, field: SearchField) -> str:
+    """SQL filling an FTS5 column from the trigger's ``new`` row."""
+    column = field.column
+    if column.table is target.model.__table__:
+        return f"new.{column.name}"
+    foreign_key = _foreign_key(target, column)
+    return (
+        f"(SELECT {column.name} FROM {column.table.name} "
+        f"WHERE {foreign_key.column.name} = new.{foreign_key.parent.name})"
+    )
+
+
+def _fts_statements(target: SearchTarget) -> list[str]:
+    """FTS5 table and triggers keeping it in sync with ``target``'s table."""
+    table = target.model.__tablename__
+    fts = target.fts_table
+    names = ", ".join(field.name for field in target.fields)
+    sources = ", ".join(_fts_source(target, field) for field in target.fields)
+    insert = f"INSERT INTO {fts} (rowid, {names}) VALUES (new.rowid, {sources});"
+    delete = f"DELETE FROM {fts} WHERE rowid = old.rowid;"
+    statements = [
+        f"CREATE VIRTUAL TABLE IF NOT EXISTS {fts} "
+        f"USING fts5({names}, tokenize='trigram')",
+        # Index rows of a table created before its FTS5 table
+        f"INSERT INTO {fts} (rowid, {names}) "
+        f"SELECT new.rowid, {sources} FROM {table} AS new "
+        f"WHERE new.rowid NOT IN (SELECT rowid FROM {fts})",
+        f"CREATE TRIGGER IF NOT EXISTS {table}_search_insert AFTER INSERT ON {table} "
+        f"BEGIN {insert} END",
+        f"CREATE TRIGGER IF NOT EXISTS {table}_search_update AFTER UPDATE ON {table} "
+        f"BEGIN {delete} {insert} END",
+        f"CREATE TRIGGER IF NOT EXISTS {table}_search_delete AFTER DELETE ON {table} "
+        f"BEGIN {delete} END",
+    ]
+    # Rows copying a related model's column follow changes to it
+    for field in target.fields:
+        column = field.column
+        if column.table is target.model.__table__:
+            continue
+        foreign_key = _foreign_key(target, column)
+        statements.append(
+            f"CREATE TRIGGER IF NOT EXISTS {table}_search_{field.name} "
+            f"AFTER UPDATE OF {column.name} ON {column.table.name} "
+            f"BEGIN UPDATE {fts} SET {field.name} = new.{column.name} "
+            f"WHERE rowid IN (SELECT rowid FROM {table} "
+            f"WHERE {foreign_key.parent.name} = new.{foreign_key.column.name}); END"
+        )
+    return statements
+
+
+def _register_ddl() -> None:
+    event.listen(
+        Base.metadata,
+        "before_create",
+        DDL("CREATE EXTENSION IF NOT EXISTS pg_trgm").execute_if(dialect="postgresql"),
+    )
+    for target in SEARCH_TARGETS.values():
+        for statement in _fts_statements(target):
+            event.listen(
+                Base.metadata,
+                "after_create",
+                DDL(statement).execute_if(dialect="sqlite"),
+            )
+        event.listen(
+            Base.metadata,
+            "before_drop",
+            DDL(f"DROP TABLE IF EXISTS {target.fts_table}").execute_if(
+                dialect="sqlite"
+            ),
+        )
+
+
+_trigram_indexes()
+_register_ddl()
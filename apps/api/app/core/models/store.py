@@ -8,6 +8,7 @@ from sqlalchemy import (
     DateTime,
     Enum,
     ForeignKey,
+    Index,
     String,
     UniqueConstraint,
     Uuid,
@@ -72,4 +73,7 @@ class Store(Base):
     # Constraints
     __table_args__ = (
         UniqueConstraint("organization_id", "name", name="uq_store_org_name"),
+        # Keyset pagination order, overall and per organization
+        Index("ix_stores_created_at_id", "created_at", "id"),
+        Index("ix_stores_org_created_at_id", "organization_id", "created_at", "id"),
     )
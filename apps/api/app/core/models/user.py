@@ -1,6 +1,6 @@
 import uuid
 
-from sqlalchemy import Boolean, Column, DateTime, String, Uuid
+from sqlalchemy import Boolean, Column, DateTime, Index, Integer, String, Uuid
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 
@@ -20,6 +20,9 @@ class User(Base):
     is_super_admin = Column(Boolean, default=False, nullable=False)
     is_support_agent = Column(Boolean, default=False, nullable=False)
     is_provisioning_specialist = Column(Boolean, default=False, nullable=False)
+    # Bumped when role flags or is_active change; stateless access tokens
+    # issued with a lower version are rejected
+    permissions_version = Column(Integer, default=0, server_default="0", nullable=False)
 
     created_at = Column(
         DateTime(timezone=True), server_default=func.now(), nullable=False
@@ -33,3 +36,9 @@ class User(Base):
 
     # Relationships
     customer = relationship("Customer", back_populates="user", uselist=False)
+
+    # Indexes
+    __table_args__ = (
+        # Keyset pagination order
+        Index("ix_users_created_at_id", "created_at", "id"),
+    )
@@ -1,4 +1,4 @@
-from sqlalchemy import Boolean, Column, DateTime, Integer, String
+from sqlalchemy import Boolean, Column, DateTime, Index, Integer, String, text
 from sqlalchemy.sql import func
 
 from app.core.models import Base
@@ -8,10 +8,24 @@ class VerificationCode(Base):
     __tablename__ = "verification_codes"
 
     id = Column(Integer, primary_key=True, index=True)
-    phone = Column(String, index=True, nullable=False)
+    phone = Column(String, nullable=False)
     code = Column(String, nullable=False)
-    expires_at = Column(DateTime(timezone=True), nullable=False)
+    # Retention deletes codes in expires_at order
+    expires_at = Column(DateTime(timezone=True), nullable=False, index=True)
     is_used = Column(Boolean, default=False)
     created_at = Column(
         DateTime(timezone=True), server_default=func.now(), nullable=False
     )
+
+    __table_args__ = (
+        # OTP request and verify only touch unused codes; used ones stay out
+        # of the index until retention deletes them
+        Index(
+            "ix_verification_codes_active",
+            "phone",
+            "code",
+            "expires_at",
+            postgresql_where=text("is_used = false"),
+            sqlite_where=text("is_used = 0"),
+        ),
+    )
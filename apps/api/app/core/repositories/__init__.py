@@ -14,23 +14,47 @@ Standard repository methods:
     - update(entity_id: UUID | str | int, entity: UpdateSchema) -> ReadSchema
     - delete(entity_id: UUID | str | int) -> bool
 
+Bulk operations use one set-based statement each and are inherited from the
+base classes:
+    - create_many(entities: Sequence[CreateSchema]) -> list[ReadSchema]
+    - get_many(entity_ids: Sequence[UUID | str | int]) -> list[ReadSchema]
+    - update_many(entity_ids, entity: UpdateSchema) -> list[ReadSchema]
+    - update_each(changes: Sequence[tuple[id, UpdateSchema]]) -> list[ReadSchema]
+    - delete_many(entity_ids: Sequence[UUID | str | int]) -> int
+
+AsyncBaseRepository defines the same contract as coroutines over an AsyncSession.
+
+create and create_many build their rows with ``_row_for_create``; a repository
+that derives columns from the create schema overrides it, so single and bulk
+inserts write the same rows.
+
+Repositories that set ``model`` and ``read_schema`` also inherit keyset pagination:
+    - list_page(cursor: str | None = None, limit: int = 100) -> CursorPage[ReadSchema]
+
 Repositories may also include entity-specific query methods (e.g., list_by_store,
 list_by_organization) as needed.
+
+Write methods commit on their own, except inside a UnitOfWork (or
+AsyncUnitOfWork) on the same session, where they only flush and the unit
+commits once on exit.
 """
 
-from app.core.repositories.base import BaseRepository, Repository
+from app.core.repositories.base import AsyncBaseRepository, BaseRepository, Repository
 from app.core.repositories.exceptions import (
     DuplicateResourceError,
+    InvalidCursorError,
     RepositoryError,
     ResourceNotFoundError,
 )
 from app.core.repositories.invitation_repository import InvitationRepository
+from app.core.repositories.pagination import CursorPage
 from app.core.repositories.protocols import (
     InvitationRepositoryProtocol,
     UserOrganizationRepositoryProtocol,
     UserRepositoryProtocol,
     UserStoreRepositoryProtocol,
 )
+from app.core.repositories.unit_of_work import AsyncUnitOfWork, UnitOfWork
 from app.core.repositories.user_organization_repository import (
     UserOrganizationRepository,
 )
@@ -40,9 +64,14 @@ from app.core.repositories.user_store_repository import UserStoreRepository
 __all__ = [
     "Repository",
     "BaseRepository",
+    "AsyncBaseRepository",
     "RepositoryError",
     "ResourceNotFoundError",
     "DuplicateResourceError",
+    "InvalidCursorError",
+    "CursorPage",
+    "UnitOfWork",
+    "AsyncUnitOfWork",
     "InvitationRepository",
     "UserRepository",
     "UserStoreRepository",
@@ -2,17 +2,94 @@
 Repository Protocol and Base Class
 
 Defines the repository interface that accepts a database session dependency
-and specifies CRUD operations to be implemented.
+and specifies CRUD operations to be implemented. AsyncBaseRepository mirrors
+the same contract on top of an AsyncSession for use from async route handlers.
+Both base classes provide keyset pagination (list_page) on top of the
+``model`` and ``read_schema`` every concrete repository must declare.
 """
 
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from typing import Protocol
+from typing import Any, Generic, List, Protocol, Sequence, TypeVar
 from uuid import UUID
 
 from pydantic import BaseModel
-from sqlalchemy.orm import Session
+from sqlalchemy import case, delete, insert, literal, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Query, Session
+from sqlalchemy.sql import Select
+
+from app.core.repositories.pagination import CursorPage, build_page, paginate
+from app.core.repositories.rows import validate_objects, validate_rows
+from app.core.repositories.unit_of_work import in_unit_of_work
+
+CreateSchemaT = TypeVar("CreateSchemaT", bound=BaseModel)
+ReadSchemaT = TypeVar("ReadSchemaT", bound=BaseModel)
+UpdateSchemaT = TypeVar("UpdateSchemaT", bound=BaseModel)
+
+
+def _require_model(cls: type) -> None:
+    """Fail at class definition if a repository omits model or read_schema."""
+    missing = [
+        name for name in ("model", "read_schema") if getattr(cls, name, None) is None
+    ]
+    if missing:
+        raise TypeError(f"{cls.__name__} must set {' and '.join(missing)}")
+
+
+def _insert_many(model: Any) -> Any:
+    """Multi-row INSERT returning the new rows in parameter order."""
+    return insert(model).returning(model, sort_by_parameter_order=True)
+
+
+def _update_many(model: Any, entity_ids: Sequence[Any], values: dict) -> Any:
+    """One UPDATE of every row in ``entity_ids``, returning the rows."""
+    return (
+        update(model).where(model.id.in_(entity_ids)).values(**values).returning(model)
+    )
+
+
+def _changed_values(changes: Sequence[tuple[Any, BaseModel]]) -> list[tuple[Any, dict]]:
+    """``(id, values)`` of the entries of ``changes`` that set any field."""
+    values = [
+        (entity_id, entity.model_dump(exclude_unset=True))
+        for entity_id, entity in changes
+    ]
+    return [(entity_id, row) for entity_id, row in values if row]
+
+
+def _update_each(model: Any, changes: Sequence[tuple[Any, dict]]) -> Any:
+    """
+    One UPDATE writing each row's own values, returning the rows.
+
+    Every changed column is set to a ``CASE`` on the id, and rows that leave
+    the column out keep their value.
+    """
+    assignments: dict[str, list[tuple[Any, Any]]] = {}
+    for entity_id, values in changes:
+        for name, value in values.items():
+            assignments.setdefault(name, []).append((entity_id, value))
+    columns = {
+        name: case(
+            *(
+                (model.id == entity_id, literal(value, getattr(model, name).type))
+                for entity_id, value in rows
+            ),
+            else_=getattr(model, name),
+        )
+        for name, rows in assignments.items()
+    }
+    entity_ids = [entity_id for entity_id, _ in changes]
+    return (
+        update(model).where(model.id.in_(entity_ids)).values(**columns).returning(model)
+    )
+
+
+def _in_order(rows: Sequence[Any], entity_ids: Sequence[Any]) -> list[Any]:
+    """Order ``rows`` as their ids appear in ``entity_ids``."""
+    position = {str(entity_id): index for index, entity_id in enumerate(entity_ids)}
+    return sorted(rows, key=lambda row: position[str(row.id)])
 
 
 class Repository(Protocol):
@@ -32,6 +109,11 @@ class Repository(Protocol):
         - list(skip: int = 0, limit: int = 100) -> list[ReadSchema]
         - update(entity_id: UUID | str | int, entity: UpdateSchema) -> ReadSchema
         - delete(entity_id: UUID | str | int) -> bool
+        - create_many(entities: Sequence[CreateSchema]) -> list[ReadSchema]
+        - get_many(entity_ids: Sequence[UUID | str | int]) -> list[ReadSchema]
+        - update_many(entity_ids, entity: UpdateSchema) -> list[ReadSchema]
+        - update_each(changes: Sequence[tuple[id, UpdateSchema]]) -> list[ReadSchema]
+        - delete_many(entity_ids: Sequence[UUID | str | int]) -> int
 
     Where CreateSchema, ReadSchema, and UpdateSchema are Pydantic BaseModel subclasses.
     """
@@ -107,6 +189,30 @@ class Repository(Protocol):
         """
         ...
 
+    def create_many(self, entities: Sequence[BaseModel]) -> List[BaseModel]:
+        """Create several entities; see BaseRepository.create_many."""
+        ...
+
+    def get_many(self, entity_ids: Sequence[UUID | str | int]) -> List[BaseModel]:
+        """Retrieve several entities; see BaseRepository.get_many."""
+        ...
+
+    def update_many(
+        self, entity_ids: Sequence[UUID | str | int], entity: BaseModel
+    ) -> List[BaseModel]:
+        """Update several entities; see BaseRepository.update_many."""
+        ...
+
+    def update_each(
+        self, changes: Sequence[tuple[UUID | str | int, BaseModel]]
+    ) -> List[BaseModel]:
+        """Update several entities differently; see BaseRepository.update_each."""
+        ...
+
+    def delete_many(self, entity_ids: Sequence[UUID | str | int]) -> int:
+        """Delete several entities; see BaseRepository.delete_many."""
+        ...
+
 
 class BaseRepository(ABC):
     """
@@ -117,9 +223,19 @@ class BaseRepository(ABC):
     the Repository Protocol by providing explicit inheritance.
 
     Subclasses must implement all abstract methods with the appropriate
-    schema types (CreateSchema, ReadSchema, UpdateSchema).
+    schema types (CreateSchema, ReadSchema, UpdateSchema) and set ``model`` and
+    ``read_schema``, which back keyset pagination via list_page. Intermediate
+    base classes opt out of the check with ``abstract=True``.
     """
 
+    model: Any
+    read_schema: type[BaseModel]
+
+    def __init_subclass__(cls, abstract: bool = False, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        if not abstract:
+            _require_model(cls)
+
     def __init__(self, session: Session) -> None:
         """
         Initialize the repository with a database session.
@@ -129,6 +245,52 @@ class BaseRepository(ABC):
         """
         self.session = session
 
+    def list_page(self, cursor: str | None = None, limit: int = 100) -> CursorPage[Any]:
+        """
+        Retrieve entities ordered by (created_at, id) using keyset pagination.
+
+        Args:
+            cursor: Cursor returned with the previous page, or None for the first
+            limit: Maximum number of records to return
+
+        Returns:
+            Page of entities (as read schemas) and the cursor for the next page
+        """
+        return self._page(self.session.query(self.model), cursor=cursor, limit=limit)
+
+    def _page(
+        self, query: Query, cursor: str | None = None, limit: int = 100, skip: int = 0
+    ) -> CursorPage[Any]:
+        """Paginate a query over ``model`` and convert rows to read schemas."""
+        rows = paginate(query, self.model, limit, cursor=cursor, skip=skip).all()
+        page = build_page(rows, limit)
+        page.items = validate_objects(self.read_schema, page.items)
+        return page
+
+    def _commit(self, *instances: Any) -> None:
+        """
+        Commit and refresh ``instances``, or only flush inside a unit of work.
+
+        Inside a :class:`~app.core.repositories.unit_of_work.UnitOfWork` the
+        commit is left to the unit, and columns set by the database load on
+        first access.
+        """
+        if in_unit_of_work(self.session):
+            self.session.flush()
+            return
+        self.session.commit()
+        for instance in instances:
+            self.session.refresh(instance)
+
+    def _row_for_create(self, entity: BaseModel) -> dict[str, Any]:
+        """
+        Column values of the row ``entity`` creates.
+
+        Used by create and create_many. Repositories that derive columns from
+        the create schema override this, so both paths write the same row.
+        """
+        return entity.model_dump()
+
     @abstractmethod
     def create(self, entity: BaseModel) -> BaseModel:
         """
@@ -195,3 +357,389 @@ class BaseRepository(ABC):
             True if entity was deleted, False if not found
         """
         ...
+
+    def create_many(self, entities: Sequence[BaseModel]) -> List[BaseModel]:
+        """
+        Create several entities with one multi-row INSERT.
+
+        Rows come from ``_row_for_create``, as in create. ORM events and
+        relationship cascades do not run.
+
+        Args:
+            entities: Create schema instances
+
+        Returns:
+            The created entities as read schemas, in input order
+        """
+        if not entities:
+            return []
+        rows = [self._row_for_create(entity) for entity in entities]
+        created = self.session.scalars(_insert_many(self.model), rows).all()
+        items = validate_objects(self.read_schema, created)
+        self._commit()
+        return items
+
+    def get_many(self, entity_ids: Sequence[UUID | str | int]) -> List[BaseModel]:
+        """
+        Retrieve several entities with one ``WHERE id IN`` query.
+
+        Args:
+            entity_ids: Primary key values
+
+        Returns:
+            The entities found, as read schemas in the order of ``entity_ids``;
+            ids with no row are skipped
+        """
+        if not entity_ids:
+            return []
+        found = self.session.scalars(
+            select(self.model).where(self.model.id.in_(entity_ids))
+        ).all()
+        return validate_objects(self.read_schema, _in_order(found, entity_ids))
+
+    def update_many(
+        self, entity_ids: Sequence[UUID | str | int], entity: BaseModel
+    ) -> List[BaseModel]:
+        """
+        Apply the same changes to several entities with one UPDATE.
+
+        Args:
+            entity_ids: Primary key values
+            entity: Update schema; only fields that were set are written
+
+        Returns:
+            The updated entities as read schemas, in the order of
+            ``entity_ids``; ids with no row are skipped
+        """
+        values = entity.model_dump(exclude_unset=True)
+        if not entity_ids or not values:
+            return self.get_many(entity_ids)
+        updated = self.session.scalars(
+            _update_many(self.model, entity_ids, values)
+        ).all()
+        items = validate_objects(self.read_schema, _in_order(updated, entity_ids))
+        self._commit()
+        return items
+
+    def update_each(
+        self, changes: Sequence[tuple[UUID | str | int, BaseModel]]
+    ) -> List[BaseModel]:
+        """
+        Apply each entity its own changes with one UPDATE.
+
+        Args:
+            changes: ``(entity_id, update schema)`` pairs; only fields that
+                were set are written
+
+        Returns:
+            The updated entities as read schemas, in the order of ``changes``;
+            ids with no row or no set fields are skipped
+        """
+        values = _changed_values(changes)
+        if not values:
+            return []
+        updated = self.session.scalars(_update_each(self.model, values)).all()
+        entity_ids = [entity_id for entity_id, _ in values]
+        items = validate_objects(self.read_schema, _in_order(updated, entity_ids))
+        self._commit()
+        return items
+
+    def delete_many(self, entity_ids: Sequence[UUID | str | int]) -> int:
+        """
+        Delete several entities with one ``DELETE ... WHERE id IN``.
+
+        Dependent rows are removed by the foreign keys' ``ON DELETE`` rules;
+        ORM relationship cascades do not run.
+
+        Args:
+            entity_ids: Primary key values
+
+        Returns:
+            Number of entities deleted
+        """
+        if not entity_ids:
+            return 0
+        result = self.session.execute(
+            delete(self.model).where(self.model.id.in_(entity_ids))
+        )
+        self._commit()
+        return int(result.rowcount)  # type: ignore[attr-defined]
+
+
+class AsyncBaseRepository(ABC, Generic[CreateSchemaT, ReadSchemaT, UpdateSchemaT]):
+    """
+    Abstract base class for asyncio repository implementations.
+
+    Mirrors the BaseRepository CRUD contract, but every operation is a
+    coroutine backed by an AsyncSession so database I/O never blocks the
+    event loop. Subclasses must return fully loaded read schemas, since lazy
+    loading is not available on async sessions. Like BaseRepository, concrete
+    subclasses must set ``model`` and ``read_schema``, and they parametrize
+    the base with their create, read and update schemas, e.g.
+    ``AsyncBaseRepository[StoreCreate, StoreRead, StoreUpdate]``.
+    """
+
+    model: Any
+    read_schema: type[BaseModel]
+
+    def __init_subclass__(cls, abstract: bool = False, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        if not abstract:
+            _require_model(cls)
+
+    def __init__(self, session: AsyncSession) -> None:
+        """
+        Initialize the repository with an async database session.
+
+        Args:
+            session: SQLAlchemy async database session
+        """
+        self.session = session
+
+    async def list_page(
+        self, cursor: str | None = None, limit: int = 100
+    ) -> CursorPage[Any]:
+        """
+        Retrieve entities ordered by (created_at, id) using keyset pagination.
+
+        Args:
+            cursor: Cursor returned with the previous page, or None for the first
+            limit: Maximum number of records to return
+
+        Returns:
+            Page of entities (as read schemas) and the cursor for the next page
+        """
+        return await self._page(select(self.model), cursor=cursor, limit=limit)
+
+    async def _page(
+        self,
+        statement: Select,
+        cursor: str | None = None,
+        limit: int = 100,
+        skip: int = 0,
+    ) -> CursorPage[Any]:
+        """Paginate a select over ``model`` and convert rows to read schemas."""
+        statement = paginate(statement, self.model, limit, cursor=cursor, skip=skip)
+        rows = (await self.session.scalars(statement)).all()
+        page = build_page(rows, limit)
+        page.items = validate_objects(self.read_schema, page.items)
+        return page
+
+    async def _row_page(
+        self,
+        statement: Select,
+        cursor: str | None = None,
+        limit: int = 100,
+        skip: int = 0,
+    ) -> CursorPage[Any]:
+        """
+        Paginate a :func:`~app.core.repositories.rows.select_rows` statement.
+
+        Rows are validated straight into read schemas without loading ORM
+        objects, so the read schema must be flat.
+        """
+        statement = paginate(statement, self.model, limit, cursor=cursor, skip=skip)
+        rows = (await self.session.execute(statement)).all()
+        page = build_page(rows, limit)
+        page.items = validate_rows(self.read_schema, page.items)
+        return page
+
+    async def _commit(self, *instances: Any) -> None:
+        """
+        Commit and refresh ``instances``, or only flush inside a unit of work.
+
+        Inside an :class:`~app.core.repositories.unit_of_work.AsyncUnitOfWork`
+        the instances are still refreshed after the flush, since async
+        sessions cannot lazy load the columns the database set.
+        """
+        if in_unit_of_work(self.session):
+            await self.session.flush()
+        else:
+            await self.session.commit()
+        for instance in instances:
+            await self.session.refresh(instance)
+
+    def _row_for_create(self, entity: CreateSchemaT) -> dict[str, Any]:
+        """
+        Column values of the row ``entity`` creates.
+
+        Used by create and create_many. Repositories that derive columns from
+        the create schema override this, so both paths write the same row.
+        """
+        return entity.model_dump()
+
+    @abstractmethod
+    async def create(self, entity: CreateSchemaT) -> ReadSchemaT:
+        """
+        Create a new entity in the database.
+
+        Args:
+            entity: The create schema instance
+
+        Returns:
+            The created entity as a read schema
+        """
+        ...
+
+    @abstractmethod
+    async def get_by_id(self, entity_id: UUID | str) -> ReadSchemaT | None:
+        """
+        Retrieve an entity by its primary key.
+
+        Args:
+            entity_id: The primary key value (UUID or string)
+
+        Returns:
+            The entity if found, None otherwise (as a read schema)
+        """
+        ...
+
+    @abstractmethod
+    async def list(self, skip: int = 0, limit: int = 100) -> list[ReadSchemaT]:
+        """
+        Retrieve all entities with pagination.
+
+        Args:
+            skip: Number of records to skip
+            limit: Maximum number of records to return
+
+        Returns:
+            List of entities (as read schemas)
+        """
+        ...
+
+    @abstractmethod
+    async def update(self, entity_id: UUID | str, entity: UpdateSchemaT) -> ReadSchemaT:
+        """
+        Update an existing entity in the database.
+
+        Args:
+            entity_id: The primary key value (UUID or string)
+            entity: The update schema with new values
+
+        Returns:
+            The updated entity as a read schema
+        """
+        ...
+
+    @abstractmethod
+    async def delete(self, entity_id: UUID | str) -> bool:
+        """
+        Delete an entity by its primary key.
+
+        Args:
+            entity_id: The primary key value (UUID or string)
+
+        Returns:
+            True if entity was deleted, False if not found
+        """
+        ...
+
+    async def create_many(self, entities: Sequence[CreateSchemaT]) -> List[ReadSchemaT]:
+        """
+        Create several entities with one multi-row INSERT.
+
+        Rows come from ``_row_for_create``, as in create. ORM events and
+        relationship cascades do not run.
+
+        Args:
+            entities: Create schema instances
+
+        Returns:
+            The created entities as read schemas, in input order
+        """
+        if not entities:
+            return []
+        rows = [self._row_for_create(entity) for entity in entities]
+        created = (await self.session.scalars(_insert_many(self.model), rows)).all()
+        items = validate_objects(self.read_schema, created)
+        await self._commit()
+        return items
+
+    async def get_many(self, entity_ids: Sequence[UUID | str]) -> List[ReadSchemaT]:
+        """
+        Retrieve several entities with one ``WHERE id IN`` query.
+
+        Args:
+            entity_ids: Primary key values
+
+        Returns:
+            The entities found, as read schemas in the order of ``entity_ids``;
+            ids with no row are skipped
+        """
+        if not entity_ids:
+            return []
+        found = (
+            await self.session.scalars(
+                select(self.model).where(self.model.id.in_(entity_ids))
+            )
+        ).all()
+        return validate_objects(self.read_schema, _in_order(found, entity_ids))
+
+    async def update_many(
+        self, entity_ids: Sequence[UUID | str], entity: UpdateSchemaT
+    ) -> List[ReadSchemaT]:
+        """
+        Apply the same changes to several entities with one UPDATE.
+
+        Args:
+            entity_ids: Primary key values
+            entity: Update schema; only fields that were set are written
+
+        Returns:
+            The updated entities as read schemas, in the order of
+            ``entity_ids``; ids with no row are skipped
+        """
+        values = entity.model_dump(exclude_unset=True)
+        if not entity_ids or not values:
+            return await self.get_many(entity_ids)
+        updated = (
+            await self.session.scalars(_update_many(self.model, entity_ids, values))
+        ).all()
+        items = validate_objects(self.read_schema, _in_order(updated, entity_ids))
+        await self._commit()
+        return items
+
+    async def update_each(
+        self, changes: Sequence[tuple[UUID | str, UpdateSchemaT]]
+    ) -> List[ReadSchemaT]:
+        """
+        Apply each entity its own changes with one UPDATE.
+
+        Args:
+            changes: ``(entity_id, update schema)`` pairs; only fields that
+                were set are written
+
+        Returns:
+            The updated entities as read schemas, in the order of ``changes``;
+            ids with no row or no set fields are skipped
+        """
+        values = _changed_values(changes)
+        if not values:
+            return []
+        updated = (await self.session.scalars(_update_each(self.model, values))).all()
+        entity_ids = [entity_id for entity_id, _ in values]
+        items = validate_objects(self.read_schema, _in_order(updated, entity_ids))
+        await self._commit()
+        return items
+
+    async def delete_many(self, entity_ids: Sequence[UUID | str]) -> int:
+        """
+        Delete several entities with one ``DELETE ... WHERE id IN``.
+
+        Dependent rows are removed by the foreign keys' ``ON DELETE`` rules;
+        ORM relationship cascades do not run.
+
+        Args:
+            entity_ids: Primary key values
+
+        Returns:
+            Number of entities deleted
+        """
+        if not entity_ids:
+            return 0
+        result = await self.session.execute(
+            delete(self.model).where(self.model.id.in_(entity_ids))
+        )
+        await self._commit()
+        return int(result.rowcount)  # type: ignore[attr-defined]
@@ -2,6 +2,8 @@
 Repository-specific exceptions for error handling.
 """
 
+from uuid import UUID
+
 
 class RepositoryError(Exception):
     """Base exception for repository operations."""
@@ -12,7 +14,7 @@ class RepositoryError(Exception):
 class ResourceNotFoundError(RepositoryError):
     """Raised when an entity is not found."""
 
-    def __init__(self, entity_type: str, entity_id: int | str):
+    def __init__(self, entity_type: str, entity_id: UUID | int | str):
         self.entity_type = entity_type
         self.entity_id = entity_id
         super().__init__(f"{entity_type} with id {entity_id} not found")
@@ -26,3 +28,12 @@ class DuplicateResourceError(RepositoryError):
         self.field = field
         self.value = value
         super().__init__(f"{entity_type} with {field} '{value}' already exists")
+
+
+class InvalidCursorError(RepositoryError):
+    """Raised when a pagination cursor cannot be decoded."""
+
+    def __init__(self, cursor: str, reason: str = "invalid pagination cursor"):
+        self.cursor = cursor
+        self.reason = reason
+        super().__init__(reason)
@@ -22,16 +22,18 @@ class InvitationRepository(BaseRepository):
     Implements the Repository protocol for CRUD operations on invitations.
     """
 
+    model = Invitation
+    read_schema = InvitationRead
+
     def __init__(self, session: Session) -> None:
         """Initialize repository with database session."""
         super().__init__(session)
 
     def create(self, entity: InvitationCreate) -> InvitationRead:
         """Create a new invitation."""
-        db_invitation = Invitation(**entity.model_dump())
+        db_invitation = Invitation(**self._row_for_create(entity))
         self.session.add(db_invitation)
-        self.session.commit()
-        self.session.refresh(db_invitation)
+        self._commit(db_invitation)
         return InvitationRead.model_validate(db_invitation)
 
     def get_by_id(self, entity_id: UUID | str) -> InvitationRead | None:
@@ -49,14 +51,14 @@ class InvitationRepository(BaseRepository):
         return InvitationRead.model_validate(invitation) if invitation else None
 
     def find_pending_by_email_and_organization(
-        self, email: str, store_id: UUID
+        self, email: str, organization_id: UUID
     ) -> InvitationRead | None:
-        """Find pending invitation by email and store ID."""
+        """Find pending invitation by email and organization ID."""
         invitation = (
             self.session.query(Invitation)
             .filter(
                 Invitation.email == email,
-                Invitation.store_id == store_id,
+                Invitation.organization_id == organization_id,
                 Invitation.status == InvitationStatus.PENDING,
             )
             .first()
@@ -65,8 +67,7 @@ class InvitationRepository(BaseRepository):
 
     def list(self, skip: int = 0, limit: int = 50) -> list[InvitationRead]:
         """List all invitations."""
-        invitations = self.session.query(Invitation).offset(skip).limit(limit).all()
-        return [InvitationRead.model_validate(invitation) for invitation in invitations]
+        return self._page(self.session.query(Invitation), skip=skip, limit=limit).items
 
     def update(self, entity_id: UUID | str, entity: InvitationUpdate) -> InvitationRead:
         """Update an invitation."""
@@ -80,8 +81,7 @@ class InvitationRepository(BaseRepository):
         for key, value in update_data.items():
             setattr(db_invitation, key, value)
 
-        self.session.commit()
-        self.session.refresh(db_invitation)
+        self._commit(db_invitation)
         return InvitationRead.model_validate(db_invitation)
 
     def mark_as_expired(self, invitation_id: UUID | str) -> InvitationRead:
@@ -109,5 +109,5 @@ class InvitationRepository(BaseRepository):
             return False
 
         self.session.delete(db_invitation)
-        self.session.commit()
+        self._commit()
         return True
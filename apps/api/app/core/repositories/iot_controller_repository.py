@@ -7,6 +7,7 @@ from sqlalchemy.orm import Session
 from app.core.models.iot_controller import IoTController
 from app.core.repositories.base import BaseRepository
 from app.core.repositories.exceptions import ResourceNotFoundError
+from app.core.repositories.pagination import CursorPage
 from app.core.schemas.iot_controller import (
     IoTControllerCreate,
     IoTControllerRead,
@@ -23,16 +24,18 @@ class IoTControllerRepository(BaseRepository):
     in addition to the standard CRUD operations.
     """
 
+    model = IoTController
+    read_schema = IoTControllerRead
+
     def __init__(self, session: Session) -> None:
         """Initialize repository with database session."""
         super().__init__(session)
 
     def create(self, entity: IoTControllerCreate) -> IoTControllerRead:
         """Create a new IoT controller."""
-        db_controller = IoTController(**entity.model_dump())
+        db_controller = IoTController(**self._row_for_create(entity))
         self.session.add(db_controller)
-        self.session.commit()
-        self.session.refresh(db_controller)
+        self._commit(db_controller)
         return IoTControllerRead.model_validate(db_controller)
 
     def get_by_id(self, entity_id: UUID | str) -> IoTControllerRead | None:
@@ -48,16 +51,19 @@ class IoTControllerRepository(BaseRepository):
         self, store_id: UUID | str, skip: int = 0, limit: int = 100
     ) -> list[IoTControllerRead]:
         """List IoT controllers for a store."""
-        controllers = (
-            self.session.query(IoTController)
-            .filter(IoTController.store_id == store_id)
-            .offset(skip)
-            .limit(limit)
-            .all()
+        query = self.session.query(IoTController).filter(
+            IoTController.store_id == store_id
+        )
+        return self._page(query, skip=skip, limit=limit).items
+
+    def list_by_store_page(
+        self, store_id: UUID | str, cursor: str | None = None, limit: int = 100
+    ) -> CursorPage[IoTControllerRead]:
+        """List IoT controllers for a store using keyset pagination."""
+        query = self.session.query(IoTController).filter(
+            IoTController.store_id == store_id
         )
-        return [
-            IoTControllerRead.model_validate(controller) for controller in controllers
-        ]
+        return self._page(query, cursor=cursor, limit=limit)
 
     def update(
         self, entity_id: UUID | str, entity: IoTControllerUpdate
@@ -75,8 +81,7 @@ class IoTControllerRepository(BaseRepository):
         for key, value in update_data.items():
             setattr(db_controller, key, value)
 
-        self.session.commit()
-        self.session.refresh(db_controller)
+        self._commit(db_controller)
         return IoTControllerRead.model_validate(db_controller)
 
     def delete(self, entity_id: UUID | str) -> bool:
@@ -90,5 +95,5 @@ class IoTControllerRepository(BaseRepository):
             return False
 
         self.session.delete(db_controller)
-        self.session.commit()
+        self._commit()
         return True
@@ -0,0 +1,93 @@
+"""
+Eager-loading plans for nested response schemas.
+
+Response schemas that embed relationships (``OrderWithDetails.items``,
+``CustomerWithAddresses.addresses``) need those relationships loaded before
+serialization: async sessions cannot lazy load at all, and on sync sessions
+every attribute access is another query per row. Each nested schema registers
+the loader options that fetch its graph in a fixed number of queries, and
+queries apply them with :func:`with_loader_options`.
+
+Options are inherited along the schema's class hierarchy, so a schema only
+registers the relationships it adds over its base. Many-to-one relationships
+use ``joinedload``; collections use ``selectinload`` so rows are not
+multiplied by the join.
+"""
+
+from typing import TypeVar, cast
+
+from pydantic import BaseModel
+from sqlalchemy.orm import joinedload, selectinload
+from sqlalchemy.sql.base import ExecutableOption
+
+from app.core.models.customer import Customer
+from app.core.models.order import Order
+from app.core.models.order_item import OrderItem
+from app.core.schemas.customer import CustomerRead, CustomerWithAddresses
+from app.core.schemas.order import OrderWithDetails
+from app.core.schemas.order_item import OrderItemWithService
+
+StatementT = TypeVar("StatementT")
+
+_LOADER_OPTIONS: dict[type[BaseModel], tuple[ExecutableOption, ...]] = {}
+
+
+def register_loader_options(
+    schema: type[BaseModel], *options: ExecutableOption
+) -> None:
+    """
+    Register the loader options a response schema needs.
+
+    Args:
+        schema: Response schema with nested relationship fields
+        options: Loader options for the relationships ``schema`` adds over
+            its base classes
+    """
+    _LOADER_OPTIONS[schema] = options
+
+
+def loader_options(schema: type[BaseModel]) -> tuple[ExecutableOption, ...]:
+    """
+    Return the loader options for a schema, including inherited ones.
+
+    Args:
+        schema: Response schema
+
+    Returns:
+        Loader options, base classes first; empty for flat schemas
+    """
+    options: tuple[ExecutableOption, ...] = ()
+    for cls in reversed(schema.__mro__):
+        options += _LOADER_OPTIONS.get(cls, ())
+    return options
+
+
+def with_loader_options(statement: StatementT, schema: type[BaseModel]) -> StatementT:
+    """
+    Apply a schema's loader options to a ``select()`` or ``Query``.
+
+    Args:
+        statement: Statement selecting the schema's ORM model
+        schema: Response schema the rows will be serialized into
+
+    Returns:
+        The statement with eager-loading options applied
+    """
+    options = loader_options(schema)
+    if not options:
+        return statement
+    return cast(StatementT, statement.options(*options))  # type: ignore[attr-defined]
+
+
+register_loader_options(CustomerRead, joinedload(Customer.user))
+register_loader_options(CustomerWithAddresses, selectinload(Customer.addresses))
+register_loader_options(OrderItemWithService, joinedload(OrderItem.service))
+register_loader_options(
+    OrderWithDetails,
+    joinedload(Order.customer).options(
+        *loader_options(CustomerRead)  # type: ignore[arg-type]
+    ),
+    joinedload(Order.pickup_address),
+    joinedload(Order.delivery_address),
+    selectinload(Order.items),
+)
@@ -2,11 +2,14 @@
 
 from uuid import UUID
 
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
-from app.core.models.organization import Organization
-from app.core.repositories.base import BaseRepository
+from app.core.models.organization import Organization, OrganizationStatus
+from app.core.repositories.base import AsyncBaseRepository, BaseRepository
 from app.core.repositories.exceptions import ResourceNotFoundError
+from app.core.repositories.pagination import CursorPage
 from app.core.schemas.organization import (
     OrganizationCreate,
     OrganizationRead,
@@ -21,16 +24,18 @@ class OrganizationRepository(BaseRepository):
     Implements the Repository protocol for CRUD operations on organizations.
     """
 
+    model = Organization
+    read_schema = OrganizationRead
+
     def __init__(self, session: Session) -> None:
         """Initialize repository with database session."""
         super().__init__(session)
 
     def create(self, entity: OrganizationCreate) -> OrganizationRead:
         """Create a new organization."""
-        db_org = Organization(**entity.model_dump())
+        db_org = Organization(**self._row_for_create(entity))
         self.session.add(db_org)
-        self.session.commit()
-        self.session.refresh(db_org)
+        self._commit(db_org)
         return OrganizationRead.model_validate(db_org)
 
     def get_by_id(self, entity_id: UUID | str) -> OrganizationRead | None:
@@ -48,11 +53,8 @@ class OrganizationRepository(BaseRepository):
         """List organizations with optional filtering."""
         query = self.session.query(Organization)
         if status:
-            from app.core.models.organization import OrganizationStatus
-
             query = query.filter(Organization.status == OrganizationStatus(status))
-        orgs = query.offset(skip).limit(limit).all()
-        return [OrganizationRead.model_validate(org) for org in orgs]
+        return self._page(query, skip=skip, limit=limit).items
 
     def update(
         self, entity_id: UUID | str, entity: OrganizationUpdate
@@ -70,8 +72,7 @@ class OrganizationRepository(BaseRepository):
         for key, value in update_data.items():
             setattr(db_org, key, value)
 
-        self.session.commit()
-        self.session.refresh(db_org)
+        self._commit(db_org)
         return OrganizationRead.model_validate(db_org)
 
     def delete(self, entity_id: UUID | str) -> bool:
@@ -85,5 +86,79 @@ class OrganizationRepository(BaseRepository):
             return False
 
         self.session.delete(db_org)
-        self.session.commit()
+        self._commit()
+        return True
+
+
+class AsyncOrganizationRepository(
+    AsyncBaseRepository[OrganizationCreate, OrganizationRead, OrganizationUpdate]
+):
+    """
+    Async repository for Organization entities.
+
+    Implements the AsyncBaseRepository contract for use from async routes.
+    """
+
+    model = Organization
+    read_schema = OrganizationRead
+
+    def __init__(self, session: AsyncSession) -> None:
+        """Initialize repository with async database session."""
+        super().__init__(session)
+
+    async def create(self, entity: OrganizationCreate) -> OrganizationRead:
+        """Create a new organization."""
+        db_org = Organization(**self._row_for_create(entity))
+        self.session.add(db_org)
+        await self._commit(db_org)
+        return OrganizationRead.model_validate(db_org)
+
+    async def get_by_id(self, entity_id: UUID | str) -> OrganizationRead | None:
+        """Get organization by ID."""
+        org = await self.session.get(Organization, entity_id)
+        return OrganizationRead.model_validate(org) if org else None
+
+    async def list(
+        self, skip: int = 0, limit: int = 50, status: str | None = None
+    ) -> list[OrganizationRead]:
+        """List organizations with optional filtering."""
+        page = await self.list_page(skip=skip, limit=limit, status=status)
+        return page.items
+
+    async def list_page(
+        self,
+        cursor: str | None = None,
+        limit: int = 50,
+        status: str | None = None,
+        skip: int = 0,
+    ) -> CursorPage[OrganizationRead]:
+        """List organizations with cursor or offset pagination."""
+        query = select(Organization)
+        if status:
+            query = query.where(Organization.status == OrganizationStatus(status))
+        return await self._page(query, cursor=cursor, limit=limit, skip=skip)
+
+    async def update(
+        self, entity_id: UUID | str, entity: OrganizationUpdate
+    ) -> OrganizationRead:
+        """Update an organization."""
+        db_org = await self.session.get(Organization, entity_id)
+        if not db_org:
+            raise ResourceNotFoundError("Organization", entity_id)
+
+        update_data = entity.model_dump(exclude_unset=True)
+        for key, value in update_data.items():
+            setattr(db_org, key, value)
+
+        await self._commit(db_org)
+        return OrganizationRead.model_validate(db_org)
+
+    async def delete(self, entity_id: UUID | str) -> bool:
+        """Delete an organization."""
+        db_org = await self.session.get(Organization, entity_id)
+        if not db_org:
+            return False
+
+        await self.session.delete(db_org)
+        await self._commit()
         return True
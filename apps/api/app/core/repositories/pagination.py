@@ -0,0 +1,164 @@
+"""
+Keyset (cursor) pagination helpers.
+
+Rows are ordered by ``(created_at, id)`` and a page continues strictly after
+the last row of the previous page, so fetching page N costs the same index
+range scan as page 1. Cursors are opaque URL-safe strings encoding that last
+``(created_at, id)`` pair. Offset pagination (``skip``) uses the same order,
+so a cursor taken from an offset page is a valid continuation.
+"""
+
+from __future__ import annotations
+
+import base64
+import json
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Generic, Sequence, TypeVar, cast
+
+from sqlalchemy import DateTime, String, literal, tuple_
+from sqlalchemy.engine import Dialect
+from sqlalchemy.types import TypeDecorator, TypeEngine
+
+from app.core.repositories.exceptions import InvalidCursorError
+
+T = TypeVar("T")
+StatementT = TypeVar("StatementT")
+
+
+@dataclass
+class CursorPage(Generic[T]):
+    """One page of results plus the cursor for the next page, if any."""
+
+    items: list[T] = field(default_factory=list)
+    next_cursor: str | None = None
+
+
+class CursorTimestamp(TypeDecorator):
+    """
+    Bind type for the cursor's ``created_at`` value.
+
+    SQLite stores ``server_default=func.now()`` timestamps as text without
+    fractional seconds, while SQLAlchemy binds datetimes with microseconds,
+    so equal timestamps would not compare equal. On SQLite the value is bound
+    in the stored format; other dialects use a regular timestamp.
+    """
+
+    impl = DateTime(timezone=True)
+    cache_ok = True
+
+    def load_dialect_impl(self, dialect: Dialect) -> TypeEngine[Any]:
+        if dialect.name == "sqlite":
+            return dialect.type_descriptor(String())
+        return dialect.type_descriptor(DateTime(timezone=True))
+
+    def process_bind_param(self, value: Any, dialect: Dialect) -> Any:
+        if dialect.name != "sqlite" or value is None:
+            return value
+        if value.microsecond:
+            return value.strftime("%Y-%m-%d %H:%M:%S.%f")
+        return value.strftime("%Y-%m-%d %H:%M:%S")
+
+
+def encode_cursor(created_at: datetime, entity_id: Any) -> str:
+    """
+    Encode a ``(created_at, id)`` position as an opaque cursor.
+
+    Args:
+        created_at: Creation timestamp of the last row on the page
+        entity_id: Primary key of the last row on the page
+
+    Returns:
+        URL-safe cursor string
+    """
+    raw = json.dumps([created_at.isoformat(), str(entity_id)])
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, model: Any) -> tuple[datetime, Any]:
+    """
+    Decode a cursor produced by :func:`encode_cursor`.
+
+    Args:
+        cursor: Opaque cursor string
+        model: ORM model whose ``id`` type the cursor id is converted to
+
+    Returns:
+        Tuple of (created_at, id)
+
+    Raises:
+        InvalidCursorError: If the cursor is malformed
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        created_at, entity_id = json.loads(base64.urlsafe_b64decode(padded))
+        return (
+            datetime.fromisoformat(created_at),
+            model.id.type.python_type(entity_id),
+        )
+    except (ValueError, TypeError) as exc:
+        raise InvalidCursorError(cursor) from exc
+
+
+def paginate(
+    statement: StatementT,
+    model: Any,
+    limit: int,
+    cursor: str | None = None,
+    skip: int = 0,
+) -> StatementT:
+    """
+    Order a query by ``(created_at, id)`` and restrict it to one page.
+
+    Works on both ``select()`` statements and legacy ``Query`` objects. One
+    extra row is fetched so :func:`build_page` can tell whether more follow.
+
+    Args:
+        statement: Select or Query over ``model``
+        model: ORM model with ``created_at`` and ``id`` columns
+        limit: Page size
+        cursor: Keyset cursor to continue after (takes the place of skip)
+        skip: Legacy offset, only used when no cursor is given
+
+    Returns:
+        The paginated statement
+
+    Raises:
+        InvalidCursorError: If the cursor is malformed or combined with skip
+    """
+    statement = statement.order_by(  # type: ignore[attr-defined]
+        model.created_at, model.id
+    )
+    if cursor:
+        if skip:
+            raise InvalidCursorError(cursor, "cursor cannot be combined with skip")
+        created_at, entity_id = decode_cursor(cursor, model)
+        statement = statement.where(  # type: ignore[attr-defined]
+            tuple_(model.created_at, model.id)
+            > tuple_(
+                literal(created_at, CursorTimestamp()),
+                literal(entity_id, model.id.type),
+            )
+        )
+    elif skip:
+        statement = statement.offset(skip)  # type: ignore[attr-defined]
+    return cast(StatementT, statement.limit(limit + 1))  # type: ignore[attr-defined]
+
+
+def build_page(rows: Sequence[Any], limit: int) -> CursorPage[Any]:
+    """
+    Trim rows fetched by :func:`paginate` into a page.
+
+    Args:
+        rows: ORM rows, up to ``limit + 1``
+        limit: Page size passed to :func:`paginate`
+
+    Returns:
+        CursorPage of at most ``limit`` rows with ``next_cursor`` set when
+        more rows follow
+    """
+    items = list(rows[:limit])
+    next_cursor = None
+    if len(rows) > limit and items:
+        next_cursor = encode_cursor(items[-1].created_at, items[-1].id)
+    return CursorPage(items=items, next_cursor=next_cursor)
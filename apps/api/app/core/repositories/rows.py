@@ -0,0 +1,58 @@
+"""
+Page-at-a-time validation of query results into read schemas.
+
+Converting rows one ``model_validate`` call at a time pays the Python to
+pydantic-core crossing once per row. A cached ``TypeAdapter(list[schema])``
+validates the whole page in one call instead.
+
+For flat read schemas, :func:`select_rows` also skips ORM hydration. It
+selects just the columns the schema reads, so the result is plain row tuples
+with no identity map or instance state, and :func:`validate_rows` validates
+them.
+"""
+
+from functools import lru_cache
+from typing import Any, Sequence
+
+from pydantic import BaseModel, TypeAdapter
+from sqlalchemy import Row, Select, select
+
+
+@lru_cache(maxsize=None)
+def list_adapter(schema: type[BaseModel]) -> TypeAdapter[list[Any]]:
+    """Return the shared ``TypeAdapter(list[schema])``."""
+    return TypeAdapter(list[schema])  # type: ignore[valid-type]
+
+
+def select_rows(model: Any, schema: type[BaseModel]) -> Select:
+    """
+    Select the columns of ``model`` that ``schema`` reads.
+
+    Args:
+        model: ORM model
+        schema: Flat read schema whose fields are all columns of ``model``
+
+    Returns:
+        A ``select()`` of those columns, in schema field order
+
+    Raises:
+        TypeError: If a schema field is not a column, e.g. a nested relation
+    """
+    columns = model.__table__.columns
+    missing = [name for name in schema.model_fields if name not in columns]
+    if missing:
+        raise TypeError(
+            f"{schema.__name__} fields {missing} are not columns of "
+            f"{model.__name__}; validate ORM objects for nested schemas"
+        )
+    return select(*(columns[name] for name in schema.model_fields))
+
+
+def validate_rows(schema: type[BaseModel], rows: Sequence[Row]) -> list[Any]:
+    """Validate a page of rows from :func:`select_rows` in one call."""
+    return list_adapter(schema).validate_python([row._asdict() for row in rows])
+
+
+def validate_objects(schema: type[BaseModel], objects: Sequence[Any]) -> list[Any]:
+    """Validate a page of ORM objects in one call."""
+    return list_adapter(schema).validate_python(objects, from_attributes=True)
@@ -0,0 +1,362 @@
+"""
+Ranked search across organizations, stores, users and IoT controllers.
+
+Matches come from the indexes defined in :mod:`app.core.models.search`. On
+PostgreSQL every field is matched with ``ILIKE '%term%'`` and ranked by
+trigram ``similarity()``, one index scan per field. On SQLite every type's
+FTS5 table is matched with ``MATCH`` and ranked by ``bm25()``. A row's rank is
+that of its best field, scaled by the field's weight.
+
+The best :data:`MAX_SEARCH_MATCHES` matches of each index are ranked in one
+statement, best first, and paged with a keyset on ``(rank, type, id)``. The
+rows of a page are then loaded once per type.
+"""
+
+from __future__ import annotations
+
+import base64
+import json
+from typing import Any, Awaitable, Callable, Sequence
+from uuid import UUID
+
+from sqlalchemy import (
+    ColumnElement,
+    Float,
+    Select,
+    Subquery,
+    Uuid,
+    and_,
+    cast,
+    func,
+    literal,
+    literal_column,
+    or_,
+    select,
+    table,
+    tuple_,
+    union_all,
+)
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql.elements import ColumnClause
+
+from app.core.models.iot_controller import IoTController
+from app.core.models.organization import Organization
+from app.core.models.search import (
+    MIN_SEARCH_LENGTH,
+    SEARCH_TARGETS,
+    SearchField,
+    SearchTarget,
+    SearchType,
+)
+from app.core.models.store import Store, StoreStatus
+from app.core.models.user import User
+from app.core.repositories.exceptions import InvalidCursorError
+from app.core.repositories.pagination import CursorPage
+from app.core.schemas.search import SearchResult
+
+# Matches kept per index. Deeper results need a more specific term
+MAX_SEARCH_MATCHES = 1000
+
+# Title, subtitle, status and parent id of a result, by entity id
+Details = dict[UUID, dict[str, Any]]
+
+
+def encode_search_cursor(rank: float, search_type: SearchType, entity_id: Any) -> str:
+    """Encode the position of the last result on a page as an opaque cursor."""
+    raw = json.dumps([rank, search_type.value, str(entity_id)])
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_search_cursor(cursor: str) -> tuple[float, SearchType, UUID]:
+    """
+    Decode a cursor produced by :func:`encode_search_cursor`.
+
+    Raises:
+        InvalidCursorError: If the cursor is malformed
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        rank, search_type, entity_id = json.loads(base64.urlsafe_b64decode(padded))
+        return float(rank), SearchType(search_type), UUID(entity_id)
+    except (ValueError, TypeError) as exc:
+        raise InvalidCursorError(cursor) from exc
+
+
+def _contains_pattern(term: str) -> str:
+    """``LIKE`` pattern matching ``term`` anywhere, with wildcards escaped."""
+    escaped = term.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    return f"%{escaped}%"
+
+
+def _fts_phrase(term: str) -> str:
+    """FTS5 query matching ``term`` as a phrase, i.e. as a substring."""
+    return '"' + term.replace('"', '""') + '"'
+
+
+def _trigram_matches(
+    search_type: SearchType,
+    target: SearchTarget,
+    field: SearchField,
+    term: str,
+    filters: Sequence[ColumnElement[bool]],
+) -> Select:
+    """Best rows of ``target`` whose ``field`` contains ``term`` (PostgreSQL)."""
+    model = target.model
+    rank = (cast(func.similarity(field.column, term), Float) * field.weight).label(
+        "rank"
+    )
+    statement = (
+        select(literal(search_type.value).label("type"), model.id.label("id"), rank)
+        .select_from(model)
+        .where(field.column.ilike(_contains_pattern(term), escape="\\"), *filters)
+    )
+    if field.column.table is not model.__table__:
+        statement = statement.join(field.column.table)
+    best = statement.order_by(rank.desc()).limit(MAX_SEARCH_MATCHES).subquery()
+    return select(best)
+
+
+def _fts_matches(
+    search_type: SearchType,
+    target: SearchTarget,
+    term: str,
+    filters: Sequence[ColumnElement[bool]],
+) -> Select:
+    """Best rows of ``target`` with a field containing ``term`` (SQLite FTS5)."""
+    model = target.model
+    fts: ColumnClause[Any] = literal_column(target.fts_table)
+    fts_rowid: ColumnClause[Any] = literal_column(f"{target.fts_table}.rowid")
+    model_rowid: ColumnClause[Any] = literal_column(f"{model.__tablename__}.rowid")
+    rank = (
+        -func.bm25(fts, *(field.weight for field in target.fields), type_=Float)
+    ).label("rank")
+    statement = (
+        select(fts_rowid.label("rowid"), rank)
+        .select_from(table(target.fts_table))
+        .where(fts.op("MATCH")(_fts_phrase(term)))
+    )
+    if filters:
+        statement = statement.where(
+            fts_rowid.in_(select(model_rowid).select_from(model).where(*filters))
+        )
+    # Rank on the FTS5 table alone, then join only the best rows
+    best = statement.order_by(rank.desc()).limit(MAX_SEARCH_MATCHES).subquery()
+    return select(
+        literal(search_type.value).label("type"), model.id.label("id"), best.c.rank
+    ).join_from(best, model, model_rowid == best.c.rowid)
+
+
+async def _organization_details(session: AsyncSession, ids: list[UUID]) -> Details:
+    rows = await session.execute(
+        select(
+            Organization.id,
+            Organization.name,
+            Organization.city,
+            Organization.state,
+            Organization.status,
+        ).where(Organization.id.in_(ids))
+    )
+    return {
+        row.id: {
+            "title": row.name,
+            "subtitle": f"{row.city}, {row.state}",
+            "status": row.status.value,
+        }
+        for row in rows
+    }
+
+
+async def _store_details(session: AsyncSession, ids: list[UUID]) -> Details:
+    rows = await session.execute(
+        select(
+            Store.id,
+            Store.name,
+            Store.city,
+            Store.state,
+            Store.status,
+            Store.organization_id,
+            Organization.name.label("organization_name"),
+        )
+        .join(Store.organization)
+        .where(Store.id.in_(ids))
+    )
+    return {
+        row.id: {
+            "title": row.name,
+            "subtitle": f"{row.organization_name}, {row.city}, {row.state}",
+            "status": row.status.value,
+            "parent_id": row.organization_id,
+        }
+        for row in rows
+    }
+
+
+async def _user_details(session: AsyncSession, ids: list[UUID]) -> Details:
+    rows = await session.execute(
+        select(
+            User.id,
+            User.email,
+            User.phone,
+            User.first_name,
+            User.last_name,
+            User.is_active,
+        ).where(User.id.in_(ids))
+    )
+    details: Details = {}
+    for row in rows:
+        name = " ".join(part for part in (row.first_name, row.last_name) if part)
+        details[row.id] = {
+            "title": name or row.email or row.phone,
+            "subtitle": ", ".join(part for part in (row.email, row.phone) if part),
+            "status": "active" if row.is_active else "inactive",
+        }
+    return details
+
+
+async def _controller_details(session: AsyncSession, ids: list[UUID]) -> Details:
+    rows = await session.execute(
+        select(
+            IoTController.id,
+            IoTController.machine_label,
+            IoTController.mac_address,
+            IoTController.serial_number,
+            IoTController.connectivity_status,
+            IoTController.store_id,
+        ).where(IoTController.id.in_(ids))
+    )
+    return {
+        row.id: {
+            "title": row.machine_label,
+            "subtitle": ", ".join(
+                part for part in (row.mac_address, row.serial_number) if part
+            ),
+            "status": row.connectivity_status.value,
+            "parent_id": row.store_id,
+        }
+        for row in rows
+    }
+
+
+_DETAILS: dict[SearchType, Callable[[AsyncSession, list[UUID]], Awaitable[Details]]] = {
+    SearchType.ORGANIZATION: _organization_details,
+    SearchType.STORE: _store_details,
+    SearchType.USER: _user_details,
+    SearchType.CONTROLLER: _controller_details,
+}
+
+
+class AsyncSearchRepository:
+    """Read-only, ranked search over the super-admin entities."""
+
+    def __init__(self, session: AsyncSession) -> None:
+        """Initialize repository with an async database session."""
+        self.session = session
+
+    def _ranked(
+        self,
+        term: str,
+        types: Sequence[SearchType],
+        store_status: StoreStatus | None,
+    ) -> Subquery:
+        """``(type, id, rank)`` of the best matches of ``term``."""
+        sqlite = self.session.get_bind().dialect.name == "sqlite"
+        statements: list[Select] = []
+        for search_type in types:
+            target = SEARCH_TARGETS[search_type]
+            filters: list[ColumnElement[bool]] = []
+            if search_type is SearchType.STORE and store_status is not None:
+                filters.append(Store.status == store_status)
+            if sqlite:
+                statements.append(_fts_matches(search_type, target, term, filters))
+            else:
+                statements.extend(
+                    _trigram_matches(search_type, target, field, term, filters)
+                    for field in target.fields
+                )
+
+        matches = union_all(*statements).subquery("matches")
+        # An entity matching on several fields ranks by its best one
+        return (
+            select(
+                matches.c.type,
+                matches.c.id,
+                func.max(matches.c.rank).label("rank"),
+            )
+            .group_by(matches.c.type, matches.c.id)
+            .subquery("ranked")
+        )
+
+    async def search(
+        self,
+        term: str,
+        types: Sequence[SearchType] | None = None,
+        store_status: StoreStatus | None = None,
+        cursor: str | None = None,
+        limit: int = 50,
+    ) -> CursorPage[SearchResult]:
+        """
+        Find entities with a field containing ``term``, best match first.
+
+        Args:
+            term: Text to find, at least three characters; case is ignored
+            types: Entity types to search, all by default
+            store_status: Only return stores with this status
+            cursor: Cursor from the previous page
+            limit: Page size
+
+        Returns:
+            CursorPage of results with ``next_cursor`` set when more follow
+
+        Raises:
+            InvalidCursorError: If the cursor is malformed
+        """
+        term = term.strip()
+        after = decode_search_cursor(cursor) if cursor else None
+        if len(term) < MIN_SEARCH_LENGTH:
+            return CursorPage()
+
+        ranked = self._ranked(term, types or list(SearchType), store_status)
+        statement = select(ranked.c.type, ranked.c.id, ranked.c.rank).order_by(
+            ranked.c.rank.desc(), ranked.c.type, ranked.c.id
+        )
+        if after is not None:
+            rank, search_type, entity_id = after
+            statement = statement.where(
+                or_(
+                    ranked.c.rank < rank,
+                    and_(
+                        ranked.c.rank == rank,
+                        tuple_(ranked.c.type, ranked.c.id)
+                        > tuple_(
+                            literal(search_type.value), literal(entity_id, Uuid())
+                        ),
+                    ),
+                )
+            )
+        rows = (await self.session.execute(statement.limit(limit + 1))).all()
+
+        page = rows[:limit]
+        ids: dict[SearchType, list[UUID]] = {}
+        for row in page:
+            ids.setdefault(SearchType(row.type), []).append(row.id)
+        details = {
+            search_type: await _DETAILS[search_type](self.session, type_ids)
+            for search_type, type_ids in ids.items()
+        }
+
+        items = []
+        for row in page:
+            search_type = SearchType(row.type)
+            # Rows deleted since they matched are left out
+            found = details[search_type].get(row.id)
+            if found is not None:
+                items.append(
+                    SearchResult(type=search_type, id=row.id, rank=row.rank, **found)
+                )
+        next_cursor = None
+        if len(rows) > limit and page:
+            last = page[-1]
+            next_cursor = encode_search_cursor(
+                last.rank, SearchType(last.type), last.id
+            )
+        return CursorPage(items=items, next_cursor=next_cursor)
@@ -2,11 +2,15 @@
 
 from uuid import UUID
 
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 from app.core.models.store import Store
-from app.core.repositories.base import BaseRepository
+from app.core.repositories.base import AsyncBaseRepository, BaseRepository
 from app.core.repositories.exceptions import ResourceNotFoundError
+from app.core.repositories.pagination import CursorPage
+from app.core.repositories.rows import select_rows
 from app.core.schemas.store import StoreCreate, StoreRead, StoreUpdate
 
 
@@ -17,16 +21,18 @@ class StoreRepository(BaseRepository):
     Implements the Repository protocol for CRUD operations on stores.
     """
 
+    model = Store
+    read_schema = StoreRead
+
     def __init__(self, session: Session) -> None:
         """Initialize repository with database session."""
         super().__init__(session)
 
     def create(self, entity: StoreCreate) -> StoreRead:
         """Create a new store."""
-        db_store = Store(**entity.model_dump())
+        db_store = Store(**self._row_for_create(entity))
         self.session.add(db_store)
-        self.session.commit()
-        self.session.refresh(db_store)
+        self._commit(db_store)
         return StoreRead.model_validate(db_store)
 
     def get_by_id(self, entity_id: UUID | str) -> StoreRead | None:
@@ -38,19 +44,23 @@ class StoreRepository(BaseRepository):
         self, organization_id: UUID | str, skip: int = 0, limit: int = 50
     ) -> list[StoreRead]:
         """List stores for an organization."""
-        stores = (
-            self.session.query(Store)
-            .filter(Store.organization_id == organization_id)
-            .offset(skip)
-            .limit(limit)
-            .all()
+        query = self.session.query(Store).filter(
+            Store.organization_id == organization_id
+        )
+        return self._page(query, skip=skip, limit=limit).items
+
+    def list_by_organization_page(
+        self, organization_id: UUID | str, cursor: str | None = None, limit: int = 50
+    ) -> CursorPage[StoreRead]:
+        """List stores for an organization using keyset pagination."""
+        query = self.session.query(Store).filter(
+            Store.organization_id == organization_id
         )
-        return [StoreRead.model_validate(store) for store in stores]
+        return self._page(query, cursor=cursor, limit=limit)
 
     def list(self, skip: int = 0, limit: int = 50) -> list[StoreRead]:
         """List all stores."""
-        stores = self.session.query(Store).offset(skip).limit(limit).all()
-        return [StoreRead.model_validate(store) for store in stores]
+        return self._page(self.session.query(Store), skip=skip, limit=limit).items
 
     def update(self, entity_id: UUID | str, entity: StoreUpdate) -> StoreRead:
         """Update a store."""
@@ -62,8 +72,7 @@ class StoreRepository(BaseRepository):
         for key, value in update_data.items():
             setattr(db_store, key, value)
 
-        self.session.commit()
-        self.session.refresh(db_store)
+        self._commit(db_store)
         return StoreRead.model_validate(db_store)
 
     def delete(self, entity_id: UUID | str) -> bool:
@@ -73,5 +82,82 @@ class StoreRepository(BaseRepository):
             return False
 
         self.session.delete(db_store)
-        self.session.commit()
+        self._commit()
+        return True
+
+
+class AsyncStoreRepository(AsyncBaseRepository[StoreCreate, StoreRead, StoreUpdate]):
+    """
+    Async repository for Store entities.
+
+    Implements the AsyncBaseRepository contract for use from async routes.
+    """
+
+    model = Store
+    read_schema = StoreRead
+
+    def __init__(self, session: AsyncSession) -> None:
+        """Initialize repository with async database session."""
+        super().__init__(session)
+
+    async def create(self, entity: StoreCreate) -> StoreRead:
+        """Create a new store."""
+        db_store = Store(**self._row_for_create(entity))
+        self.session.add(db_store)
+        await self._commit(db_store)
+        return StoreRead.model_validate(db_store)
+
+    async def get_by_id(self, entity_id: UUID | str) -> StoreRead | None:
+        """Get store by ID."""
+        store = await self.session.get(Store, entity_id)
+        return StoreRead.model_validate(store) if store else None
+
+    async def list_by_organization(
+        self, organization_id: UUID | str, skip: int = 0, limit: int = 50
+    ) -> list[StoreRead]:
+        """List stores for an organization."""
+        page = await self.list_by_organization_page(
+            organization_id, limit=limit, skip=skip
+        )
+        return page.items
+
+    async def list_by_organization_page(
+        self,
+        organization_id: UUID | str,
+        cursor: str | None = None,
+        limit: int = 50,
+        skip: int = 0,
+    ) -> CursorPage[StoreRead]:
+        """List stores for an organization with cursor or offset pagination."""
+        statement = select_rows(Store, StoreRead).where(
+            Store.organization_id == organization_id
+        )
+        return await self._row_page(statement, cursor=cursor, limit=limit, skip=skip)
+
+    async def list(self, skip: int = 0, limit: int = 50) -> list[StoreRead]:
+        """List all stores."""
+        page = await self._page(select(Store), skip=skip, limit=limit)
+        return page.items
+
+    async def update(self, entity_id: UUID | str, entity: StoreUpdate) -> StoreRead:
+        """Update a store."""
+        db_store = await self.session.get(Store, entity_id)
+        if not db_store:
+            raise ResourceNotFoundError("Store", entity_id)
+
+        update_data = entity.model_dump(exclude_unset=True)
+        for key, value in update_data.items():
+            setattr(db_store, key, value)
+
+        await self._commit(db_store)
+        return StoreRead.model_validate(db_store)
+
+    async def delete(self, entity_id: UUID | str) -> bool:
+        """Delete a store."""
+        db_store = await self.session.get(Store, entity_id)
+        if not db_store:
+            return False
+
+        await self.session.delete(db_store)
+        await self._commit()
         return True
@@ -0,0 +1,101 @@
+"""
+Units of work spanning several repositories.
+
+Outside a unit of work, each repository write method commits on its own.
+Inside a :class:`UnitOfWork` (or :class:`AsyncUnitOfWork`) on the same
+session, repositories only flush. A service that calls several repositories
+then commits once, when the outermost unit exits, or rolls everything back
+if any step raises.
+
+Units nest: an inner unit joins the outer one and leaves the commit or
+rollback to it. The same unit may also be entered again while it is open.
+"""
+
+from types import TracebackType
+from typing import Optional
+
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+_DEPTH_KEY = "unit_of_work_depth"
+
+
+def in_unit_of_work(session: Session | AsyncSession) -> bool:
+    """Whether repository writes on ``session`` should defer their commit."""
+    depth: int = session.info.get(_DEPTH_KEY, 0)
+    return depth > 0
+
+
+def _enter(session: Session | AsyncSession) -> bool:
+    """Open a unit on ``session``; return whether it is the outermost."""
+    depth: int = session.info.get(_DEPTH_KEY, 0)
+    session.info[_DEPTH_KEY] = depth + 1
+    return depth == 0
+
+
+def _exit(session: Session | AsyncSession) -> None:
+    session.info[_DEPTH_KEY] -= 1
+
+
+class UnitOfWork:
+    """Commit all repository writes on a session once, or none of them."""
+
+    def __init__(self, session: Session) -> None:
+        """Initialize unit of work with database session."""
+        self.session = session
+        # Whether each open entry of this unit is the outermost on the session
+        self._outermost: list[bool] = []
+
+    def __enter__(self) -> "UnitOfWork":
+        self._outermost.append(_enter(self.session))
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[type[BaseException]],
+        exc: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        _exit(self.session)
+        if not self._outermost.pop():
+            return
+        if exc_type is not None:
+            self.session.rollback()
+            return
+        try:
+            self.session.commit()
+        except Exception:
+            self.session.rollback()
+            raise
+
+
+class AsyncUnitOfWork:
+    """Commit all repository writes on an async session once, or none."""
+
+    def __init__(self, session: AsyncSession) -> None:
+        """Initialize unit of work with async database session."""
+        self.session = session
+        # Whether each open entry of this unit is the outermost on the session
+        self._outermost: list[bool] = []
+
+    async def __aenter__(self) -> "AsyncUnitOfWork":
+        self._outermost.append(_enter(self.session))
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: Optional[type[BaseException]],
+        exc: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        _exit(self.session)
+        if not self._outermost.pop():
+            return
+        if exc_type is not None:
+            await self.session.rollback()
+            return
+        try:
+            await self.session.commit()
+        except Exception:
+            await self.session.rollback()
+            raise
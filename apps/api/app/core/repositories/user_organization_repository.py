@@ -21,16 +21,18 @@ class UserOrganizationRepository(BaseRepository):
     on user-organization associations.
     """
 
+    model = UserOrganization
+    read_schema = UserOrganizationRead
+
     def __init__(self, session: Session) -> None:
         """Initialize repository with database session."""
         super().__init__(session)
 
     def create(self, entity: UserOrganizationCreate) -> UserOrganizationRead:
         """Create a new user-organization association."""
-        db_user_org = UserOrganization(**entity.model_dump())
+        db_user_org = UserOrganization(**self._row_for_create(entity))
         self.session.add(db_user_org)
-        self.session.commit()
-        self.session.refresh(db_user_org)
+        self._commit(db_user_org)
         return UserOrganizationRead.model_validate(db_user_org)
 
     def get_by_id(self, entity_id: UUID | str) -> UserOrganizationRead | None:
@@ -58,8 +60,9 @@ class UserOrganizationRepository(BaseRepository):
 
     def list(self, skip: int = 0, limit: int = 100) -> list[UserOrganizationRead]:
         """List all user-organization associations."""
-        user_orgs = self.session.query(UserOrganization).offset(skip).limit(limit).all()
-        return [UserOrganizationRead.model_validate(user_org) for user_org in user_orgs]
+        return self._page(
+            self.session.query(UserOrganization), skip=skip, limit=limit
+        ).items
 
     def update(
         self, entity_id: UUID | str, entity: UserOrganizationCreate
@@ -77,8 +80,7 @@ class UserOrganizationRepository(BaseRepository):
         for key, value in update_data.items():
             setattr(db_user_org, key, value)
 
-        self.session.commit()
-        self.session.refresh(db_user_org)
+        self._commit(db_user_org)
         return UserOrganizationRead.model_validate(db_user_org)
 
     def delete(self, entity_id: UUID | str) -> bool:
@@ -92,5 +94,5 @@ class UserOrganizationRepository(BaseRepository):
             return False
 
         self.session.delete(db_user_org)
-        self.session.commit()
+        self._commit()
         return True
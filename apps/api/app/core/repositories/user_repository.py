@@ -17,16 +17,18 @@ class UserRepository(BaseRepository):
     Implements the Repository protocol for CRUD operations on users.
     """
 
+    model = User
+    read_schema = UserRead
+
     def __init__(self, session: Session) -> None:
         """Initialize repository with database session."""
         super().__init__(session)
 
     def create(self, entity: UserCreate) -> UserRead:
         """Create a new user."""
-        db_user = User(**entity.model_dump())
+        db_user = User(**self._row_for_create(entity))
         self.session.add(db_user)
-        self.session.commit()
-        self.session.refresh(db_user)
+        self._commit(db_user)
         return UserRead.model_validate(db_user)
 
     def get_by_id(self, entity_id: UUID | str | int) -> UserRead | None:
@@ -41,8 +43,7 @@ class UserRepository(BaseRepository):
 
     def list(self, skip: int = 0, limit: int = 100) -> list[UserRead]:
         """List all users."""
-        users = self.session.query(User).offset(skip).limit(limit).all()
-        return [UserRead.model_validate(user) for user in users]
+        return self._page(self.session.query(User), skip=skip, limit=limit).items
 
     def update(self, entity_id: UUID | str | int, entity: UserUpdate) -> UserRead:
         """Update a user."""
@@ -54,8 +55,7 @@ class UserRepository(BaseRepository):
         for key, value in update_data.items():
             setattr(db_user, key, value)
 
-        self.session.commit()
-        self.session.refresh(db_user)
+        self._commit(db_user)
         return UserRead.model_validate(db_user)
 
     def delete(self, entity_id: UUID | str | int) -> bool:
@@ -65,5 +65,5 @@ class UserRepository(BaseRepository):
             return False
 
         self.session.delete(db_user)
-        self.session.commit()
+        self._commit()
         return True
@@ -17,16 +17,18 @@ class UserStoreRepository(BaseRepository):
     Implements the Repository protocol for CRUD operations on user-store associations.
     """
 
+    model = UserStore
+    read_schema = UserStoreRead
+
     def __init__(self, session: Session) -> None:
         """Initialize repository with database session."""
         super().__init__(session)
 
     def create(self, entity: UserStoreCreate) -> UserStoreRead:
         """Create a new user-store association."""
-        db_user_store = UserStore(**entity.model_dump())
+        db_user_store = UserStore(**self._row_for_create(entity))
         self.session.add(db_user_store)
-        self.session.commit()
-        self.session.refresh(db_user_store)
+        self._commit(db_user_store)
         return UserStoreRead.model_validate(db_user_store)
 
     def get_by_id(self, entity_id: UUID | str) -> UserStoreRead | None:
@@ -69,8 +71,7 @@ class UserStoreRepository(BaseRepository):
 
     def list(self, skip: int = 0, limit: int = 100) -> list[UserStoreRead]:
         """List all user-store associations."""
-        user_stores = self.session.query(UserStore).offset(skip).limit(limit).all()
-        return [UserStoreRead.model_validate(user_store) for user_store in user_stores]
+        return self._page(self.session.query(UserStore), skip=skip, limit=limit).items
 
     def update(self, entity_id: UUID | str, entity: UserStoreRead) -> UserStoreRead:
         """Update a user-store association."""
@@ -84,8 +85,7 @@ class UserStoreRepository(BaseRepository):
         for key, value in update_data.items():
             setattr(db_user_store, key, value)
 
-        self.session.commit()
-        self.session.refresh(db_user_store)
+        self._commit(db_user_store)
         return UserStoreRead.model_validate(db_user_store)
 
     def delete(self, entity_id: UUID | str) -> bool:
@@ -97,5 +97,5 @@ class UserStoreRepository(BaseRepository):
             return False
 
         self.session.delete(db_user_store)
-        self.session.commit()
+        self._commit()
         return True
@@ -0,0 +1,358 @@
+"""Per-route request timing and SQL statement counts.
+
+:class:`RequestTimingMiddleware` opens a :class:`RequestTiming` for every
+HTTP request and makes it current for the code that serves the request. Code
+run in the threadpool and in SQLAlchemy's async greenlets sees it too. While
+a request is current:
+
+* the ``before_cursor_execute`` and ``after_cursor_execute`` hooks installed
+  by :func:`track_queries` add the time and count of every SQL statement
+* endpoints wrapped by :func:`time_endpoints` record when they return. From
+  then until the response headers go out, the time counts as serialization:
+  FastAPI validates and encodes the return value in that window
+* :func:`record_serialization` adds encoding done inside an endpoint, such as
+  :func:`app.core.serialization.page_response`
+
+When the response starts, the timings go into a ``Server-Timing`` header. When
+it ends, they go into histograms labelled by method and route template.
+``GET /internal/metrics`` (super admin only) exposes the histograms in the
+Prometheus text format.
+
+Each worker process has its own histograms, so Prometheus should scrape every
+worker (or sum them).
+"""
+
+import asyncio
+import functools
+import threading
+import time
+from bisect import bisect_left
+from contextvars import ContextVar
+from typing import Any, Callable, Iterable, Optional, Sequence
+
+from fastapi.routing import APIRoute
+from sqlalchemy import event
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+# Seconds
+TIME_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+STATEMENT_BUCKETS = (0, 1, 2, 3, 5, 10, 20, 50, 100)
+# Route label of requests that matched no route, or were answered before
+# routing (e.g. rate limited)
+UNMATCHED_ROUTE = "unmatched"
+_QUERY_STARTED_KEY = "request_metrics_query_started"
+
+
+class RequestTiming:
+    """Time spent on one request, by phase."""
+
+    __slots__ = (
+        "name",
+        "started",
+        "db_seconds",
+        "statements",
+        "serialization_seconds",
+        "endpoint_finished",
+    )
+
+    def __init__(self, started: float, name: str = "") -> None:
+        # Method and path, for diagnostics
+        self.name = name
+        self.started = started
+        self.db_seconds = 0.0
+        self.statements = 0
+        self.serialization_seconds = 0.0
+        self.endpoint_finished: Optional[float] = None
+
+    def response_started(self, now: float) -> None:
+        """Count the time since the endpoint returned as serialization."""
+        if self.endpoint_finished is not None:
+            self.serialization_seconds += now - self.endpoint_finished
+            self.endpoint_finished = None
+
+    def server_timing(self, now: float) -> str:
+        """``Server-Timing`` header value for the request so far."""
+        total = now - self.started
+        app = max(0.0, total - self.db_seconds - self.serialization_seconds)
+        return (
+            f'db;dur={self.db_seconds * 1000:.1f};desc="{self.statements} queries", '
+            f"serialize;dur={self.serialization_seconds * 1000:.1f}, "
+            f"app;dur={app * 1000:.1f}, "
+            f"total;dur={total * 1000:.1f}"
+        )
+
+
+_current_timing: ContextVar[Optional[RequestTiming]] = ContextVar(
+    "request_timing", default=None
+)
+
+
+def current_timing() -> Optional[RequestTiming]:
+    """Timing of the request being served, if any."""
+    return _current_timing.get()
+
+
+def record_serialization(seconds: float) -> None:
+    """Add encoding time spent inside an endpoint to the current request."""
+    timing = _current_timing.get()
+    if timing is not None:
+        timing.serialization_seconds += seconds
+
+
+def _before_cursor_execute(conn: Any, *args: Any) -> None:
+    if _current_timing.get() is not None:
+        conn.info[_QUERY_STARTED_KEY] = time.perf_counter()
+
+
+def _after_cursor_execute(conn: Any, *args: Any) -> None:
+    started = conn.info.pop(_QUERY_STARTED_KEY, None)
+    timing = _current_timing.get()
+    if timing is not None and started is not None:
+        timing.db_seconds += time.perf_counter() - started
+        timing.statements += 1
+
+
+def track_queries(target: Any) -> None:
+    """
+    Attribute SQL statements run through ``target`` to the current request.
+
+    Args:
+        target: An Engine, or the Engine class for every engine
+    """
+    for name, listener in (
+        ("before_cursor_execute", _before_cursor_execute),
+        ("after_cursor_execute", _after_cursor_execute),
+    ):
+        if not event.contains(target, name, listener):
+            event.listen(target, name, listener)
+
+
+def _mark_endpoint_finished() -> None:
+    timing = _current_timing.get()
+    if timing is not None:
+        timing.endpoint_finished = time.perf_counter()
+
+
+def _timed(call: Callable[..., Any]) -> Callable[..., Any]:
+    if asyncio.iscoroutinefunction(call):
+
+        @functools.wraps(call)
+        async def timed_async(**values: Any) -> Any:
+            result = await call(**values)
+            _mark_endpoint_finished()
+            return result
+
+        return timed_async
+
+    @functools.wraps(call)
+    def timed(**values: Any) -> Any:
+        result = call(**values)
+        _mark_endpoint_finished()
+        return result
+
+    return timed
+
+
+def time_endpoints(routes: Iterable[Any]) -> None:
+    """Record when the endpoint of each API route returns.
+
+    FastAPI builds a route's request handler when the route is created, and
+    the handler calls ``route.dependant.call`` for every request. So the
+    routes must already be included when this runs.
+    """
+    for route in routes:
+        if not isinstance(route, APIRoute):
+            continue
+        call = route.dependant.call
+        if call is None or getattr(call, "__timed__", False):
+            continue
+        timed = _timed(call)
+        timed.__timed__ = True  # type: ignore[attr-defined]
+        route.dependant.call = timed
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+class Histogram:
+    """Prometheus histogram with one series per combination of label values."""
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        label_names: Sequence[str],
+        buckets: Sequence[float],
+    ) -> None:
+        self.name = name
+        self.documentation = documentation
+        self.label_names = tuple(label_names)
+        self.buckets = tuple(buckets)
+        # Per series: count per bucket (the last one is +Inf), then sum
+        self._series: dict[tuple[str, ...], list[float]] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, labels: tuple[str, ...], value: float) -> None:
+        """Record one observation for the series with these label values."""
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(labels)
+            if series is None:
+                series = self._series[labels] = [0.0] * (len(self.buckets) + 2)
+            series[index] += 1
+            series[-1] += value
+
+    def clear(self) -> None:
+        """Drop every series."""
+        with self._lock:
+            self._series.clear()
+
+    def render(self) -> list[str]:
+        """Exposition lines: HELP, TYPE, then buckets, sum and count per series."""
+        lines = [
+            f"# HELP {self.name} {self.documentation}",
+            f"# TYPE {self.name} histogram",
+        ]
+        with self._lock:
+            series = sorted((k, list(v)) for k, v in self._series.items())
+        for labels, values in series:
+            label_text = ",".join(
+                f'{name}="{_escape(value)}"'
+                for name, value in zip(self.label_names, labels)
+            )
+            cumulative = 0.0
+            for bound, count in zip((*self.buckets, "+Inf"), values[:-1]):
+                cumulative += count
+                lines.append(
+                    f'{self.name}_bucket{{{label_text},le="{bound}"}} {int(cumulative)}'
+                )
+            lines.append(f"{self.name}_sum{{{label_text}}} {values[-1]!r}")
+            lines.append(f"{self.name}_count{{{label_text}}} {int(cumulative)}")
+        return lines
+
+
+class RequestMetrics:
+    """Per-route histograms of request, database and serialization time."""
+
+    def __init__(self) -> None:
+        self.duration = Histogram(
+            "http_request_duration_seconds",
+            "Time from receiving a request to the end of its response.",
+            ("method", "route", "status"),
+            TIME_BUCKETS,
+        )
+        self.db_time = Histogram(
+            "http_request_db_seconds",
+            "Time spent executing SQL statements per request.",
+            ("method", "route"),
+            TIME_BUCKETS,
+        )
+        self.statements = Histogram(
+            "http_request_db_statements",
+            "SQL statements executed per request.",
+            ("method", "route"),
+            STATEMENT_BUCKETS,
+        )
+        self.serialization = Histogram(
+            "http_request_serialization_seconds",
+            "Time spent validating and encoding response bodies per request.",
+            ("method", "route"),
+            TIME_BUCKETS,
+        )
+
+    def observe(
+        self,
+        method: str,
+        route: str,
+        status: int,
+        timing: RequestTiming,
+        duration: float,
+    ) -> None:
+        """Record one finished request."""
+        self.duration.observe((method, route, str(status)), duration)
+        self.db_time.observe((method, route), timing.db_seconds)
+        self.statements.observe((method, route), timing.statements)
+        self.serialization.observe((method, route), timing.serialization_seconds)
+
+    def render(self) -> str:
+        """All histograms in the Prometheus text exposition format."""
+        lines: list[str] = []
+        for histogram in (
+            self.duration,
+            self.db_time,
+            self.statements,
+            self.serialization,
+        ):
+            lines.extend(histogram.render())
+        return "\n".join(lines) + "\n"
+
+    def clear(self) -> None:
+        """Drop every recorded request."""
+        for histogram in (
+            self.duration,
+            self.db_time,
+            self.statements,
+            self.serialization,
+        ):
+            histogram.clear()
+
+
+def _route_template(scope: Scope) -> str:
+    route = scope.get("route")
+    return getattr(route, "path", None) or UNMATCHED_ROUTE
+
+
+class RequestTimingMiddleware:
+    """ASGI middleware timing each request and recording it in the metrics."""
+
+    def __init__(
+        self, app: ASGIApp, metrics: "RequestMetrics", server_timing: bool = True
+    ) -> None:
+        self.app = app
+        self.metrics = metrics
+        self.server_timing = server_timing
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        timing = RequestTiming(
+            time.perf_counter(), f"{scope['method']} {scope['path']}"
+        )
+        status = 500
+
+        async def send_timed(message: Message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+                now = time.perf_counter()
+                timing.response_started(now)
+                if self.server_timing:
+                    headers = MutableHeaders(scope=message)
+                    headers.append("Server-Timing", timing.server_timing(now))
+            await send(message)
+
+        token = _current_timing.set(timing)
+        try:
+            await self.app(scope, receive, send_timed)
+        finally:
+            _current_timing.reset(token)
+            self.metrics.observe(
+                scope["method"],
+                _route_template(scope),
+                status,
+                timing,
+                time.perf_counter() - timing.started,
+            )
+
+
+request_metrics = RequestMetrics()
+
+
+def get_request_metrics() -> RequestMetrics:
+    """Dependency returning the process-wide request metrics."""
+    return request_metrics
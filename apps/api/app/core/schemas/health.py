@@ -0,0 +1,45 @@
+"""System health Pydantic schemas for the Super-Admin Control Room."""
+
+import enum
+from datetime import datetime
+from uuid import UUID
+
+from pydantic import BaseModel
+
+from app.core.models.store import StoreStatus
+
+
+class StoreConnectivityStatus(str, enum.Enum):
+    """Overall connectivity of a store's controllers."""
+
+    ONLINE = "online"
+    OFFLINE = "offline"
+    PARTIAL = "partial"
+    UNKNOWN = "unknown"
+
+
+class SystemHealthStatus(BaseModel):
+    """Health of one store's IoT infrastructure."""
+
+    store_id: UUID
+    store_name: str
+    organization_id: UUID
+    organization_name: str
+    city: str
+    state: str
+    store_status: StoreStatus
+    connectivity_status: StoreConnectivityStatus
+    online_controllers: int
+    offline_controllers: int
+    unknown_controllers: int
+    total_controllers: int
+    last_heartbeat: datetime | None = None
+    alert_count: int
+    critical_alerts: int
+
+
+class SystemHealthPage(BaseModel):
+    """A page of store health entries, most severe first."""
+
+    items: list[SystemHealthStatus]
+    total: int
@@ -3,8 +3,9 @@
 from datetime import datetime
 from uuid import UUID
 
-from pydantic import BaseModel, EmailStr
+from pydantic import BaseModel, EmailStr, Field
 
+from app.core.constants import MAX_BULK_INVITATIONS
 from app.core.models.invitation import InvitationStatus
 from app.core.models.user_organization import UserOrganizationRole
 
@@ -71,3 +72,30 @@ class InviteMemberRequest(BaseModel):
 
     email: EmailStr
     organization_role: UserOrganizationRole = UserOrganizationRole.OWNER
+
+
+class InviteMembersBulkRequest(BaseModel):
+    """Schema for inviting many organization members at once."""
+
+    invitations: list[InviteMemberRequest] = Field(
+        ..., min_length=1, max_length=MAX_BULK_INVITATIONS
+    )
+
+
+class InvitationBulkResult(BaseModel):
+    """Outcome of one invitee in a bulk invitation request."""
+
+    index: int
+    email: EmailStr
+    success: bool
+    invitation_id: UUID | None = None
+    email_queued: bool = False
+    error: str | None = None
+
+
+class InvitationBulkResponse(BaseModel):
+    """Schema for bulk invitation response."""
+
+    invited: int
+    skipped: int
+    results: list[InvitationBulkResult]
@@ -3,8 +3,9 @@
 from datetime import datetime
 from uuid import UUID
 
-from pydantic import BaseModel, field_validator
+from pydantic import BaseModel, Field, field_validator
 
+from app.core.constants import MAX_HEARTBEAT_BATCH
 from app.core.models.iot_controller import ConnectivityStatus, DeviceType
 
 
@@ -68,3 +69,26 @@ class IoTControllerRead(IoTControllerBase):
 
     class Config:
         from_attributes = True
+
+
+class HeartbeatCreate(BaseModel):
+    """A single controller check-in."""
+
+    controller_id: UUID
+    connectivity_status: ConnectivityStatus = ConnectivityStatus.ONLINE
+
+
+class HeartbeatBatch(BaseModel):
+    """Heartbeats submitted together, typically by one store gateway."""
+
+    heartbeats: list[HeartbeatCreate] = Field(
+        ..., min_length=1, max_length=MAX_HEARTBEAT_BATCH
+    )
+
+
+class HeartbeatAck(BaseModel):
+    """How many heartbeats of a batch were buffered, shed or not recognized."""
+
+    accepted: int
+    rejected: int
+    unknown: int = 0
@@ -1,7 +1,9 @@
 from datetime import datetime
 from typing import List, Optional
 
-from pydantic import BaseModel, validator
+from pydantic import BaseModel, Field, validator
+
+from app.core.constants import MAX_BULK_ORDERS
 
 from .address import AddressRead
 from .customer import CustomerRead
@@ -39,6 +41,24 @@ class OrderCreate(OrderBase):
     items: List[OrderItemCreate]
 
 
+class OrderBulkCreate(BaseModel):
+    orders: List[OrderCreate] = Field(..., min_length=1, max_length=MAX_BULK_ORDERS)
+
+
+class OrderBulkResult(BaseModel):
+    index: int
+    success: bool
+    order_id: Optional[int] = None
+    order_number: Optional[str] = None
+    error: Optional[str] = None
+
+
+class OrderBulkResponse(BaseModel):
+    created: int
+    failed: int
+    results: List[OrderBulkResult]
+
+
 class OrderUpdate(BaseModel):
     pickup_date: Optional[datetime] = None
     pickup_time_slot: Optional[str] = None
@@ -0,0 +1,20 @@
+"""Search Pydantic schemas for the Super-Admin Dashboard."""
+
+from uuid import UUID
+
+from pydantic import BaseModel
+
+from app.core.models.search import SearchType
+
+
+class SearchResult(BaseModel):
+    """One entity matching a search, with what identifies it to an agent."""
+
+    type: SearchType
+    id: UUID
+    title: str
+    subtitle: str | None = None
+    status: str | None = None
+    # Links a store to its organization and a controller to its store
+    parent_id: UUID | None = None
+    rank: float
@@ -48,3 +48,13 @@ class StoreRead(StoreBase):
 
     class Config:
         from_attributes = True
+
+
+class StoreConnectivity(BaseModel):
+    """Live IoT controller connectivity counts for a store."""
+
+    store_id: UUID
+    online: int
+    offline: int
+    unknown: int
+    total: int
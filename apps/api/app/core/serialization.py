@@ -0,0 +1,48 @@
+"""
+JSON responses for list endpoints.
+
+Returning a list from a route makes FastAPI validate it against
+``response_model`` and then encode it, even when the items are already
+validated read schemas. :func:`page_response` instead dumps a validated page
+once, encodes it with orjson and returns a ready :class:`~fastapi.Response`,
+which FastAPI sends as is. Routes keep ``response_model`` for the OpenAPI
+schema.
+
+UTC datetimes are written with a ``Z`` suffix, as pydantic writes them. The
+encoding time is reported to the request metrics as serialization.
+"""
+
+import time
+from typing import Any
+
+import orjson
+from fastapi import Response
+from pydantic import BaseModel
+
+from app.core.constants import NEXT_CURSOR_HEADER
+from app.core.repositories.pagination import CursorPage
+from app.core.repositories.rows import list_adapter
+from app.core.request_metrics import record_serialization
+
+
+def page_response(schema: type[BaseModel], page: CursorPage[Any]) -> Response:
+    """
+    Encode a page of validated items as a JSON response.
+
+    Args:
+        schema: Read schema the items were validated as
+        page: Page of schema instances
+
+    Returns:
+        Response with the JSON body and, if more rows follow, the next
+        cursor header
+    """
+    started = time.perf_counter()
+    body = orjson.dumps(
+        list_adapter(schema).dump_python(page.items), option=orjson.OPT_UTC_Z
+    )
+    record_serialization(time.perf_counter() - started)
+    response = Response(content=body, media_type="application/json")
+    if page.next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = page.next_cursor
+    return response
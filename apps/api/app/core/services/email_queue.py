@@ -0,0 +1,299 @@
+"""Outbound email queue delivered by background workers.
+
+Request handlers render a message and :meth:`EmailQueue.enqueue` it, which
+returns immediately. A pool of asyncio workers started from the app lifespan
+posts queued messages to the SendGrid v3 API through one shared
+``httpx.AsyncClient``, so connections are reused across sends and a slow
+SendGrid response never holds up a request.
+
+Failed sends are retried with exponential backoff (honouring ``Retry-After``)
+when the failure is transient: connection errors, timeouts, 429 and 5xx
+responses. Other 4xx responses are permanent and the message is dropped.
+
+The in-memory queue is bounded and per process. Durability comes from the
+database. An invitation email is enqueued with its invitation ids (one per
+personalization of a batch send), and ``invitations.email_sent_at`` is set
+only after SendGrid accepts the message.
+:meth:`EmailService.run_recovery
+<app.core.services.email_service.EmailService.run_recovery>` periodically
+re-enqueues pending invitations that still have no ``email_sent_at``. That
+covers messages lost to a crash or redeploy, and messages refused because
+the queue was full. Delivery is therefore at least once: a crash between the
+send and the ``email_sent_at`` update re-sends the email. On a clean
+shutdown, queued messages and any message waiting between retries get one
+final delivery attempt.
+"""
+
+import asyncio
+import time
+from contextlib import suppress
+from typing import Any, Callable, Optional, Sequence
+from uuid import UUID
+
+import httpx
+from sendgrid.helpers.mail import Mail  # type: ignore[import-untyped]
+from sqlalchemy import func, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config.settings import settings
+from app.core.models.invitation import Invitation
+
+SENDGRID_SEND_PATH = "/v3/mail/send"
+
+SessionFactory = Callable[[], AsyncSession]
+# (SendGrid request body, invitations the email belongs to)
+QueuedEmail = tuple[dict[str, Any], tuple[UUID, ...]]
+
+
+class PermanentDeliveryError(RuntimeError):
+    """SendGrid rejected a message in a way retrying will not fix."""
+
+
+class EmailQueue:
+    """Bounded in-process queue of SendGrid messages with a worker pool."""
+
+    def __init__(
+        self,
+        api_key: str,
+        host: str = "https://api.sendgrid.com",
+        workers: int = 4,
+        max_size: int = 10_000,
+        max_attempts: int = 5,
+        retry_base_delay: float = 1.0,
+        max_retry_delay: float = 60.0,
+        timeout: float = 10.0,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+    ) -> None:
+        self.api_key = api_key
+        self.host = host
+        self.workers = workers
+        self.max_size = max_size
+        self.max_attempts = max_attempts
+        self.retry_base_delay = retry_base_delay
+        self.max_retry_delay = max_retry_delay
+        self.timeout = timeout
+        self._transport = transport
+        self._queue: asyncio.Queue[QueuedEmail] = asyncio.Queue(max_size)
+        self._interrupted: list[QueuedEmail] = []
+        self._session_factory: Optional[SessionFactory] = None
+        # Invitations queued or in flight here, and ones SendGrid refused
+        self._queued_invitations: set[UUID] = set()
+        self._failed_invitations: set[UUID] = set()
+        self.enqueued = 0
+        self.dropped = 0
+        self.sent = 0
+        self.retries = 0
+        self.failed = 0
+        self.last_send_ms = 0.0
+        self.max_send_ms = 0.0
+
+    def __len__(self) -> int:
+        return self._queue.qsize()
+
+    def enqueue(self, message: Mail, invitation_ids: Sequence[UUID] = ()) -> bool:
+        """
+        Queue a message for delivery.
+
+        Args:
+            message: Rendered SendGrid message
+            invitation_ids: Invitations to mark as emailed once the send
+                succeeds
+
+        Returns:
+            bool: False if the queue is full and the message was dropped
+
+        Raises:
+            RuntimeError: If SendGrid API key is missing
+        """
+        if not self.api_key:
+            raise RuntimeError("SENDGRID_API_KEY is not configured")
+        try:
+            self._queue.put_nowait((message.get(), tuple(invitation_ids)))
+        except asyncio.QueueFull:
+            self.dropped += 1
+            return False
+        self._queued_invitations.update(invitation_ids)
+        self.enqueued += 1
+        return True
+
+    def free_slots(self) -> int:
+        """Number of messages that can be queued right now."""
+        return self.max_size - self._queue.qsize()
+
+    def tracks(self, invitation_id: UUID) -> bool:
+        """Whether this process is sending, or has given up on, an invitation."""
+        return (
+            invitation_id in self._queued_invitations
+            or invitation_id in self._failed_invitations
+        )
+
+    async def join(self) -> None:
+        """Wait until every queued message has been sent or given up on."""
+        await self._queue.join()
+
+    def _client(self) -> httpx.AsyncClient:
+        return httpx.AsyncClient(
+            base_url=self.host,
+            headers={"Authorization": f"Bearer {self.api_key}"},
+            timeout=self.timeout,
+            transport=self._transport,
+        )
+
+    async def run(self, session_factory: Optional[SessionFactory] = None) -> None:
+        """
+        Run the worker pool until cancelled, then flush what is left.
+
+        Args:
+            session_factory: Callable returning a new AsyncSession, used to
+                record sent invitation emails; without it nothing is recorded
+        """
+        self._session_factory = session_factory
+        # Bind a fresh queue to this event loop, keeping anything already queued
+        queued, self._queue = self._queue, asyncio.Queue(self.max_size)
+        while not queued.empty():
+            self._queue.put_nowait(queued.get_nowait())
+            queued.task_done()
+
+        async with self._client() as client:
+            tasks = [
+                asyncio.create_task(self._worker(client)) for _ in range(self.workers)
+            ]
+            try:
+                await asyncio.gather(*tasks)
+            finally:
+                for task in tasks:
+                    task.cancel()
+                    with suppress(asyncio.CancelledError):
+                        await task
+                await self._drain(client)
+
+    async def _worker(self, client: httpx.AsyncClient) -> None:
+        while True:
+            item = await self._queue.get()
+            try:
+                await self._send(client, item)
+            except asyncio.CancelledError:
+                self._interrupted.append(item)
+                raise
+            finally:
+                self._queue.task_done()
+
+    async def _drain(self, client: httpx.AsyncClient) -> None:
+        # Shutdown: one attempt per remaining message, no backoff
+        pending, self._interrupted = self._interrupted, []
+        while not self._queue.empty():
+            pending.append(self._queue.get_nowait())
+            self._queue.task_done()
+        for item in pending:
+            await self._send(client, item, max_attempts=1)
+
+    async def _send(
+        self,
+        client: httpx.AsyncClient,
+        item: QueuedEmail,
+        max_attempts: Optional[int] = None,
+    ) -> None:
+        payload, invitation_ids = item
+        try:
+            await self._deliver(client, payload, max_attempts)
+        except PermanentDeliveryError as e:
+            self.failed += 1
+            self._failed_invitations.update(invitation_ids)
+            print(f"Email delivery failed: {e}")
+        except Exception as e:
+            # Unsent invitations are picked up again by recovery
+            self.failed += 1
+            print(f"Email delivery failed: {e}")
+        else:
+            if invitation_ids:
+                await self._mark_sent(invitation_ids)
+        finally:
+            self._queued_invitations.difference_update(invitation_ids)
+
+    async def _mark_sent(self, invitation_ids: tuple[UUID, ...]) -> None:
+        if self._session_factory is None:
+            return
+        try:
+            async with self._session_factory() as session:
+                await session.execute(
+                    update(Invitation)
+                    .where(Invitation.id.in_(invitation_ids))
+                    .values(email_sent_at=func.now())
+                )
+                await session.commit()
+        except Exception as e:
+            # The email may be sent again by recovery
+            print(f"Failed to record sent invitation email: {e}")
+
+    async def _deliver(
+        self,
+        client: httpx.AsyncClient,
+        payload: dict[str, Any],
+        max_attempts: Optional[int] = None,
+    ) -> None:
+        """Send one message, retrying transient failures with backoff."""
+        max_attempts = max_attempts or self.max_attempts
+        for attempt in range(1, max_attempts + 1):
+            started = time.perf_counter()
+            retry_after: Optional[float] = None
+            try:
+                response = await client.post(SENDGRID_SEND_PATH, json=payload)
+            except httpx.TransportError as e:
+                error = f"{type(e).__name__}: {e}"
+            else:
+                elapsed_ms = (time.perf_counter() - started) * 1000
+                self.last_send_ms = elapsed_ms
+                self.max_send_ms = max(self.max_send_ms, elapsed_ms)
+                if response.status_code in (200, 202):
+                    self.sent += 1
+                    return
+                error = f"SendGrid API returned status code {response.status_code}"
+                if response.status_code != 429 and response.status_code < 500:
+                    raise PermanentDeliveryError(error)
+                retry_after = _retry_after_seconds(response)
+
+            if attempt == max_attempts:
+                raise RuntimeError(f"{error} after {attempt} attempts")
+            self.retries += 1
+            delay = self.retry_base_delay * 2 ** (attempt - 1)
+            if retry_after is not None:
+                delay = max(delay, retry_after)
+            await asyncio.sleep(min(delay, self.max_retry_delay))
+
+    def stats(self) -> dict[str, Any]:
+        """Report queue depth and delivery outcomes."""
+        return {
+            "queued": self._queue.qsize(),
+            "queued_invitations": len(self._queued_invitations),
+            "max_size": self.max_size,
+            "workers": self.workers,
+            "enqueued": self.enqueued,
+            "dropped": self.dropped,
+            "sent": self.sent,
+            "retries": self.retries,
+            "failed": self.failed,
+            "last_send_ms": round(self.last_send_ms, 3),
+            "max_send_ms": round(self.max_send_ms, 3),
+        }
+
+
+def _retry_after_seconds(response: httpx.Response) -> Optional[float]:
+    try:
+        return float(response.headers["Retry-After"])
+    except (KeyError, ValueError):
+        return None
+
+
+email_queue = EmailQueue(
+    api_key=settings.SENDGRID_API_KEY,
+    host=settings.SENDGRID_API_HOST,
+    workers=settings.EMAIL_QUEUE_WORKERS,
+    max_size=settings.EMAIL_QUEUE_MAX_SIZE,
+    max_attempts=settings.EMAIL_MAX_ATTEMPTS,
+    retry_base_delay=settings.EMAIL_RETRY_BASE_DELAY_SECONDS,
+)
+
+
+def get_email_queue() -> EmailQueue:
+    """Dependency returning the process-wide outbound email queue."""
+    return email_queue
@@ -1,9 +1,25 @@
 """Email service for sending emails via SendGrid."""
-from sendgrid import SendGridAPIClient
-from sendgrid.helpers.mail import Mail
+import asyncio
+from datetime import datetime, timedelta, timezone
+from typing import Callable, Sequence
+from uuid import UUID
+
+from sendgrid.helpers.mail import Mail, Personalization, Substitution, To
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.config.email_config import EmailConfig
 from app.core.emails.invitation_templates import InvitationTemplateRendererProtocol
+from app.core.models.invitation import Invitation, InvitationStatus
+from app.core.models.organization import Organization
+from app.core.services.email_queue import EmailQueue
+
+SessionFactory = Callable[[], AsyncSession]
+
+# SendGrid accepts at most 1000 personalizations per v3 mail/send request
+MAX_PERSONALIZATIONS = 1000
+# Placeholder replaced per recipient by SendGrid in batch sends
+INVITATION_URL_TAG = "-invitation_url-"
 
 
 class EmailService:
@@ -13,6 +29,7 @@ class EmailService:
         self,
         config: EmailConfig,
         template_renderer: InvitationTemplateRendererProtocol,
+        queue: EmailQueue,
     ) -> None:
         """
         Initialize email service with email configuration and template renderer.
@@ -21,20 +38,22 @@ class EmailService:
             config: Email configuration containing SendGrid API key,
                 from email, and frontend URL
             template_renderer: Template renderer for generating email content
+            queue: Outbound queue whose workers deliver the emails
         """
         self.config = config
         self.template_renderer = template_renderer
+        self.queue = queue
 
-    def send_invitation_email(
+    def build_invitation_message(
         self,
         to_email: str,
         store_name: str,
         organization_name: str,
         invitation_token: str,
         expiration_days: int = 7,
-    ) -> bool:
+    ) -> Mail:
         """
-        Send an invitation email to a store owner.
+        Render an invitation email into a SendGrid message without sending it.
 
         Args:
             to_email: Recipient email address
@@ -44,46 +63,241 @@ class EmailService:
             expiration_days: Number of days until invitation expires
 
         Returns:
-            bool: True if email was sent successfully
-
-        Raises:
-            RuntimeError: If SendGrid API key is missing or email sending fails
+            Mail: Message ready for SendGrid
         """
-        if not self.config.sendgrid_api_key:
-            raise RuntimeError("SENDGRID_API_KEY is not configured")
+        invitation_url = self.invitation_url(invitation_token)
 
-        # Build invitation URL
-        invitation_url = (
+        # Render email templates
+        email_content = self.template_renderer.render_invitation_email(
+            store_name=store_name,
+            organization_name=organization_name,
+            invitation_url=invitation_url,
+            expiration_days=expiration_days,
+        )
+
+        return Mail(
+            from_email=self.config.from_email,
+            to_emails=to_email,
+            subject=email_content.subject,
+            html_content=email_content.html_content,
+            plain_text_content=email_content.text_content,
+        )
+
+    def invitation_url(self, invitation_token: str) -> str:
+        """Build the acceptance link for an invitation token."""
+        return (
             f"{self.config.frontend_url}/auth/accept-invitation?"
             f"token={invitation_token}"
         )
 
-        # Render email templates
+    def build_invitation_batch(
+        self,
+        recipients: Sequence[tuple[str, str]],
+        store_name: str,
+        organization_name: str,
+        expiration_days: int = 7,
+    ) -> Mail:
+        """
+        Render one SendGrid message addressed to many invitees.
+
+        The template is rendered once with a placeholder link. Each recipient
+        gets its own personalization, and SendGrid substitutes that
+        recipient's link, so nobody sees another invitee's address or token.
+
+        Args:
+            recipients: (email, invitation token) pairs, at most
+                MAX_PERSONALIZATIONS
+            store_name: Name of the store
+            organization_name: Name of the organization
+            expiration_days: Number of days until invitation expires
+
+        Returns:
+            Mail: Message with one personalization per recipient
+        """
         email_content = self.template_renderer.render_invitation_email(
             store_name=store_name,
             organization_name=organization_name,
-            invitation_url=invitation_url,
+            invitation_url=INVITATION_URL_TAG,
             expiration_days=expiration_days,
         )
-
-        # Create email message
         message = Mail(
             from_email=self.config.from_email,
-            to_emails=to_email,
             subject=email_content.subject,
             html_content=email_content.html_content,
             plain_text_content=email_content.text_content,
         )
+        for index, (to_email, invitation_token) in enumerate(recipients):
+            personalization = Personalization()
+            personalization.add_to(To(to_email))
+            personalization.add_substitution(
+                Substitution(INVITATION_URL_TAG, self.invitation_url(invitation_token))
+            )
+            message.add_personalization(personalization, index=index)
+        return message
 
-        # Send email via SendGrid
-        try:
-            sg = SendGridAPIClient(self.config.sendgrid_api_key)
-            response = sg.send(message)
-            if response.status_code in [200, 202]:
-                return True
-            else:
-                raise RuntimeError(
-                    f"SendGrid API returned status code {response.status_code}"
+    def send_invitation_email(
+        self,
+        to_email: str,
+        store_name: str,
+        organization_name: str,
+        invitation_token: str,
+        expiration_days: int = 7,
+        invitation_id: UUID | None = None,
+    ) -> bool:
+        """
+        Queue an invitation email to a store owner.
+
+        The email is delivered by the queue's workers. When ``invitation_id``
+        is given, the invitation is marked as emailed once SendGrid accepts
+        the message. Until then :meth:`run_recovery` re-queues it.
+
+        Args:
+            to_email: Recipient email address
+            store_name: Name of the store
+            organization_name: Name of the organization
+            invitation_token: Invitation token for the acceptance link
+            expiration_days: Number of days until invitation expires
+            invitation_id: Invitation the email belongs to
+
+        Returns:
+            bool: True if the email was queued, False if the queue is full
+
+        Raises:
+            RuntimeError: If SendGrid API key is missing
+        """
+        if not self.config.sendgrid_api_key:
+            raise RuntimeError("SENDGRID_API_KEY is not configured")
+
+        message = self.build_invitation_message(
+            to_email=to_email,
+            store_name=store_name,
+            organization_name=organization_name,
+            invitation_token=invitation_token,
+            expiration_days=expiration_days,
+        )
+        invitation_ids = (invitation_id,) if invitation_id is not None else ()
+        return self.queue.enqueue(message, invitation_ids=invitation_ids)
+
+    def send_invitation_batch(
+        self,
+        invitations: Sequence[tuple[str, str, UUID]],
+        store_name: str,
+        organization_name: str,
+        expiration_days: int = 7,
+    ) -> list[bool]:
+        """
+        Queue invitation emails as SendGrid multi-personalization sends.
+
+        Invitations are grouped into messages of up to MAX_PERSONALIZATIONS
+        recipients, so a whole bulk invite usually costs one API call.
+
+        Args:
+            invitations: (email, invitation token, invitation id) triples
+            store_name: Name of the store
+            organization_name: Name of the organization
+            expiration_days: Number of days until invitation expires
+
+        Returns:
+            list[bool]: Per invitation, whether its email was queued; False
+            entries are left to :meth:`run_recovery`
+
+        Raises:
+            RuntimeError: If SendGrid API key is missing
+        """
+        if not self.config.sendgrid_api_key:
+            raise RuntimeError("SENDGRID_API_KEY is not configured")
+
+        queued: list[bool] = []
+        for start in range(0, len(invitations), MAX_PERSONALIZATIONS):
+            chunk = invitations[start : start + MAX_PERSONALIZATIONS]
+            message = self.build_invitation_batch(
+                [(email, token) for email, token, _ in chunk],
+                store_name=store_name,
+                organization_name=organization_name,
+                expiration_days=expiration_days,
+            )
+            accepted = self.queue.enqueue(
+                message, invitation_ids=[invitation_id for _, _, invitation_id in chunk]
+            )
+            queued.extend([accepted] * len(chunk))
+        return queued
+
+    async def requeue_unsent_invitations(
+        self,
+        session_factory: SessionFactory,
+        older_than_seconds: float,
+        expiration_days: int,
+    ) -> int:
+        """
+        Queue emails for pending invitations that were never sent.
+
+        Invitations younger than ``older_than_seconds`` are skipped, since
+        another worker may still be sending them. The same applies to
+        invitations this process already has queued or SendGrid refused.
+
+        Args:
+            session_factory: Callable returning a new AsyncSession
+            older_than_seconds: Minimum invitation age to re-queue
+            expiration_days: Expiration shown in the email
+
+        Returns:
+            Number of emails queued
+        """
+        free = self.queue.free_slots()
+        if free <= 0 or not self.config.sendgrid_api_key:
+            return 0
+
+        now = datetime.now(timezone.utc)
+        async with session_factory() as session:
+            rows = await session.execute(
+                select(
+                    Invitation.id,
+                    Invitation.email,
+                    Invitation.token,
+                    Organization.name,
+                )
+                .join(Organization, Invitation.organization_id == Organization.id)
+                .where(
+                    Invitation.email_sent_at.is_(None),
+                    Invitation.status == InvitationStatus.PENDING,
+                    Invitation.expires_at > now,
+                    Invitation.created_at < now - timedelta(seconds=older_than_seconds),
+                )
+                .order_by(Invitation.created_at)
+                .limit(free)
+            )
+
+        queued = 0
+        for invitation_id, email, token, organization_name in rows.tuples():
+            if self.queue.tracks(invitation_id):
+                continue
+            if not self.send_invitation_email(
+                to_email=email,
+                store_name=organization_name,
+                organization_name=organization_name,
+                invitation_token=token,
+                expiration_days=expiration_days,
+                invitation_id=invitation_id,
+            ):
+                break
+            queued += 1
+        return queued
+
+    async def run_recovery(
+        self,
+        session_factory: SessionFactory,
+        interval: float,
+        older_than_seconds: float,
+        expiration_days: int,
+    ) -> None:
+        """Re-queue unsent invitation emails now and every ``interval`` seconds."""
+        while True:
+            try:
+                queued = await self.requeue_unsent_invitations(
+                    session_factory, older_than_seconds, expiration_days
                 )
-        except Exception as e:
-            raise RuntimeError(f"Failed to send invitation email: {str(e)}") from e
+                if queued:
+                    print(f"Re-queued {queued} unsent invitation emails")
+            except Exception as e:
+                print(f"Invitation email recovery failed: {e}")
+            await asyncio.sleep(interval)
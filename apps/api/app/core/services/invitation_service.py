@@ -17,6 +17,7 @@ from app.core.repositories.protocols import (
     UserRepositoryProtocol,
     UserStoreRepositoryProtocol,
 )
+from app.core.repositories.unit_of_work import UnitOfWork
 from app.core.schemas.invitation import (
     InvitationCreate,
     InvitationRead,
@@ -42,6 +43,7 @@ class InvitationService:
         user_org_repo: UserOrganizationRepositoryProtocol,
         user_store_repo: UserStoreRepositoryProtocol,
         org_repo: OrganizationRepositoryProtocol,
+        unit_of_work: UnitOfWork,
     ) -> None:
         """
         Initialize invitation service with repositories.
@@ -52,12 +54,15 @@ class InvitationService:
             user_org_repo: Repository for user-organization association operations
             user_store_repo: Repository for user-store association operations
             org_repo: Repository for organization operations
+            unit_of_work: Unit of work on the repositories' session, used to
+                commit multi-step workflows once
         """
         self.invitation_repo = invitation_repo
         self.user_repo = user_repo
         self.user_org_repo = user_org_repo
         self.user_store_repo = user_store_repo
         self.org_repo = org_repo
+        self.unit_of_work = unit_of_work
 
     def _validate_token_format(self, token: str) -> None:
         """
@@ -93,6 +98,18 @@ class InvitationService:
         """
         return secrets.token_urlsafe(32)
 
+    @staticmethod
+    def _expires_at(invitation: InvitationRead) -> datetime:
+        """
+        Return the invitation's expiry as an aware UTC datetime.
+
+        SQLite returns ``expires_at`` without its UTC offset.
+        """
+        expires_at = invitation.expires_at
+        if expires_at.tzinfo is None:
+            return expires_at.replace(tzinfo=timezone.utc)
+        return expires_at
+
     def is_valid(self, invitation: InvitationRead) -> bool:
         """
         Check if an invitation is valid for acceptance.
@@ -107,10 +124,9 @@ class InvitationService:
         Returns:
             bool: True if invitation is valid, False otherwise
         """
-        return (
-            invitation.status == InvitationStatus.PENDING
-            and invitation.expires_at >= datetime.now(timezone.utc)
-        )
+        return invitation.status == InvitationStatus.PENDING and self._expires_at(
+            invitation
+        ) >= datetime.now(timezone.utc)
 
     def get_expiration_days(self) -> int:
         """
@@ -233,7 +249,7 @@ class InvitationService:
                 reason = "This invitation has already been accepted"
             elif invitation.status == InvitationStatus.REVOKED:
                 reason = "This invitation has been revoked"
-            elif invitation.expires_at < datetime.now(timezone.utc):
+            elif self._expires_at(invitation) < datetime.now(timezone.utc):
                 reason = "This invitation has expired"
                 # Mark as expired if not already marked
                 if invitation.status == InvitationStatus.PENDING:
@@ -263,7 +279,8 @@ class InvitationService:
 
         Creates a new user if one doesn't exist with the invitation email,
         and creates a UserOrganization association. For EMPLOYEE/ADMIN roles,
-        UserStore entries may be created separately by admins.
+        UserStore entries may be created separately by admins. These writes
+        and marking the invitation accepted commit in one transaction.
 
         Args:
             token: The invitation token
@@ -300,51 +317,55 @@ class InvitationService:
                     status_code=status.HTTP_400_BAD_REQUEST,
                     detail="This invitation has been revoked",
                 )
-            elif invitation.expires_at < datetime.now(timezone.utc):
+            elif self._expires_at(invitation) < datetime.now(timezone.utc):
                 self.mark_as_expired(invitation.id)
                 raise HTTPException(
                     status_code=status.HTTP_400_BAD_REQUEST,
                     detail="This invitation has expired",
                 )
 
-        # Find or create user
-        user = self.user_repo.get_by_email(invitation.email)
-
-        if not user:
-            # Create new user with email
-            # Note: User model needs password_hash field - will be added via migration
-            # For now, we'll create user without password (phone is required)
-            # TODO: Add password_hash field to User model via migration
-            # Generate a temporary phone number (required field)
-            temp_phone = f"+1{secrets.randbelow(10**9):09d}"
-            user_create = UserCreate(
-                email=invitation.email,
-                phone=temp_phone,
+        # The user, the membership and the accepted invitation commit together
+        with self.unit_of_work:
+            # Find or create user
+            user = self.user_repo.get_by_email(invitation.email)
+
+            if not user:
+                # Create new user with email
+                # Note: User model needs password_hash field - to be added via migration
+                # For now, we'll create user without password (phone is required)
+                # TODO: Add password_hash field to User model via migration
+                # Generate a temporary phone number (required field)
+                temp_phone = f"+1{secrets.randbelow(10**9):09d}"
+                user_create = UserCreate(
+                    email=invitation.email,
+                    phone=temp_phone,
+                )
+                user = self.user_repo.create(user_create)
+                # Set password hash when password_hash field is available
+                # user.password_hash = get_password_hash(password)
+            else:
+                # Update existing user password if password_hash field exists
+                # user.password_hash = get_password_hash(password)
+                # For now, we skip password update as password_hash field doesn't exist
+                pass
+
+            # Create user-organization association if it doesn't exist
+            existing_user_org = self.user_org_repo.find_by_user_and_organization(
+                user.id, invitation.organization_id
             )
-            user = self.user_repo.create(user_create)
-            # Set password hash when password_hash field is available
-            # user.password_hash = get_password_hash(password)
-        else:
-            # Update existing user password if password_hash field exists
-            # user.password_hash = get_password_hash(password)
-            # For now, we skip password update as password_hash field doesn't exist
-            pass
-
-        # Create user-organization association if it doesn't exist
-        existing_user_org = self.user_org_repo.find_by_user_and_organization(
-            user.id, invitation.organization_id
-        )
 
-        if not existing_user_org:
-            user_org_create = UserOrganizationCreate(
-                user_id=user.id,
-                organization_id=invitation.organization_id,
-                role=invitation.organization_role,
-            )
-            self.user_org_repo.create(user_org_create)
+            if not existing_user_org:
+                user_org_create = UserOrganizationCreate(
+                    user_id=user.id,
+                    organization_id=invitation.organization_id,
+                    role=invitation.organization_role,
+                )
+                self.user_org_repo.create(user_org_create)
 
-        # Mark invitation as accepted using repository
-        self.invitation_repo.mark_as_accepted(invitation.id, datetime.now(timezone.utc))
+            # Mark invitation as accepted using repository
+            self.invitation_repo.mark_as_accepted(
+                invitation.id, datetime.now(timezone.utc)
+            )
 
         # Generate access token - user is already a UserRead schema
         access_token = create_access_token(subject=str(user.id))
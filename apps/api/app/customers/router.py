@@ -1,13 +1,24 @@
 from typing import Any, List
 
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.auth.decorators import require_admin, require_auth, require_owner_or_admin
-from app.auth.security import get_current_user
-from app.core.database.session import get_db
+from app.auth.principal_cache import Principal
+from app.auth.security import get_current_principal
+from app.core.constants import (
+    CURSOR_DESCRIPTION,
+    DEFAULT_SKIP,
+    MAX_LIMIT,
+    MIN_LIMIT,
+    NEXT_CURSOR_HEADER,
+)
+from app.core.database.session import get_async_db
 from app.core.models.customer import Customer
 from app.core.models.user import User
+from app.core.repositories.loaders import with_loader_options
+from app.core.repositories.pagination import build_page, paginate
 from app.core.schemas.customer import (
     CustomerCreate,
     CustomerRead,
@@ -22,24 +33,40 @@ router = APIRouter()
 @require_auth
 @require_admin
 async def list_customers(
-    skip: int = 0,
-    limit: int = 100,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    response: Response,
+    skip: int = Query(DEFAULT_SKIP, ge=DEFAULT_SKIP),
+    limit: int = Query(MAX_LIMIT, ge=MIN_LIMIT, le=MAX_LIMIT),
+    cursor: str | None = Query(None, description=CURSOR_DESCRIPTION),
+    db: AsyncSession = Depends(get_async_db),
+    current_user: Principal = Depends(get_current_principal),
 ) -> Any:
-    """List all customers with pagination"""
-
-    customers = db.query(Customer).offset(skip).limit(limit).all()
-    return customers
+    """List all customers with offset or cursor pagination"""
+    statement = paginate(
+        with_loader_options(select(Customer), CustomerRead),
+        Customer,
+        limit,
+        cursor=cursor,
+        skip=skip,
+    )
+    page = build_page((await db.scalars(statement)).all(), limit)
+    if page.next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = page.next_cursor
+    return page.items
 
 
 @router.get("/me", response_model=CustomerWithAddresses)
 @require_auth
 async def get_current_customer(
-    db: Session = Depends(get_db), current_user: User = Depends(get_current_user)
+    db: AsyncSession = Depends(get_async_db),
+    current_user: Principal = Depends(get_current_principal),
 ) -> CustomerWithAddresses:
     """Get current user's customer profile"""
-    customer = db.query(Customer).filter(Customer.user_id == current_user.id).first()
+    customer = await db.scalar(
+        with_loader_options(
+            select(Customer).where(Customer.user_id == current_user.id),
+            CustomerWithAddresses,
+        )
+    )
     if not customer:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="Customer profile not found"
@@ -52,12 +79,16 @@ async def get_current_customer(
 @require_owner_or_admin
 async def get_customer(
     customer_id: int,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_async_db),
+    current_user: Principal = Depends(get_current_principal),
 ) -> CustomerRead:
     """Get a specific customer by ID"""
 
-    customer = db.query(Customer).filter(Customer.id == customer_id).first()
+    customer = await db.scalar(
+        with_loader_options(
+            select(Customer).where(Customer.id == customer_id), CustomerRead
+        )
+    )
     if not customer:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="Customer not found"
@@ -70,13 +101,13 @@ async def get_customer(
 @require_owner_or_admin
 async def create_customer(
     customer_data: CustomerCreate,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_async_db),
+    current_user: Principal = Depends(get_current_principal),
 ) -> CustomerRead:
     """Create a new customer profile"""
     # Check if customer already exists for this user
-    existing_customer = (
-        db.query(Customer).filter(Customer.user_id == customer_data.user_id).first()
+    existing_customer = await db.scalar(
+        select(Customer).where(Customer.user_id == customer_data.user_id)
     )
     if existing_customer:
         raise HTTPException(
@@ -85,7 +116,7 @@ async def create_customer(
         )
 
     # Verify user exists
-    user = db.query(User).filter(User.id == customer_data.user_id).first()
+    user = await db.get(User, customer_data.user_id)
     if not user:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="User not found"
@@ -94,8 +125,9 @@ async def create_customer(
     # Create customer
     customer = Customer(**customer_data.model_dump())
     db.add(customer)
-    db.commit()
-    db.refresh(customer)
+    await db.commit()
+    await db.refresh(customer)
+    await db.refresh(customer, ["user"])
 
     return customer
 
@@ -106,11 +138,11 @@ async def create_customer(
 async def update_customer(
     customer_id: int,
     customer_data: CustomerUpdate,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_async_db),
+    current_user: Principal = Depends(get_current_principal),
 ) -> CustomerRead:
     """Update a customer profile"""
-    customer = db.query(Customer).filter(Customer.id == customer_id).first()
+    customer = await db.get(Customer, customer_id)
     if not customer:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="Customer not found"
@@ -121,8 +153,9 @@ async def update_customer(
     for field, value in update_data.items():
         setattr(customer, field, value)
 
-    db.commit()
-    db.refresh(customer)
+    await db.commit()
+    await db.refresh(customer)
+    await db.refresh(customer, ["user"])
     return customer
 
 
@@ -131,17 +164,17 @@ async def update_customer(
 @require_admin
 async def delete_customer(
     customer_id: int,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_async_db),
+    current_user: Principal = Depends(get_current_principal),
 ) -> None:
     """Delete a customer profile (admin only)"""
 
-    customer = db.query(Customer).filter(Customer.id == customer_id).first()
+    customer = await db.get(Customer, customer_id)
     if not customer:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="Customer not found"
         )
 
-    db.delete(customer)
-    db.commit()
+    await db.delete(customer)
+    await db.commit()
     return None
@@ -0,0 +1 @@
+"""Development and capacity-testing tools. Not imported by the application."""
@@ -0,0 +1,885 @@
+"""
+Synthetic fleet data for capacity testing.
+
+:func:`generate_fleet` loads a deterministic universe sized by a
+:class:`FleetSpec` into the database:
+
+* organizations, each with an owner and ``stores_per_organization`` stores
+* ``controllers_per_store`` IoT controllers and ``staff_per_store`` operators
+  per store, linked through ``user_organizations`` and ``user_stores``
+* ``customers`` customers, each with a user and ``addresses_per_customer``
+  addresses
+* ``orders`` orders spread evenly over the ``days`` before ``until``, each
+  with ``items_per_order`` items and ``notifications_per_order``
+  notifications
+
+Rows are generated in batches of about ``batch_size`` rows, and each batch is
+committed on its own. On PostgreSQL with psycopg2 every table in a batch is
+streamed with ``COPY ... FROM STDIN``. Other databases get one executemany
+INSERT per table. Primary keys are assigned here, so children reference their
+parents without reading them back. UUIDs come from the seeded generator, and
+integer ids continue from the current maximum. PostgreSQL sequences are
+advanced past them at the end. Each batch of orders has its own seed, so order
+batches can be written by several processes at once (``workers``).
+
+The same spec (including the seed) and ``until`` on an empty database produce
+the same rows. Generated users are numbered after the existing ones, so a
+fleet can also be added to a database that already holds data.
+"""
+
+import enum
+import io
+import random
+import uuid
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Any, Callable, Optional, Sequence
+
+from sqlalchemy import Table, create_engine, func, insert, select
+from sqlalchemy.engine import Connection, Engine
+
+from app.core.models.address import Address
+from app.core.models.customer import Customer
+from app.core.models.iot_controller import ConnectivityStatus, DeviceType, IoTController
+from app.core.models.notification import (
+    Notification,
+    NotificationStatus,
+    NotificationType,
+)
+from app.core.models.order import Order, OrderStatus
+from app.core.models.order_item import OrderItem
+from app.core.models.organization import Organization, OrganizationStatus
+from app.core.models.service import Service, ServiceCategory
+from app.core.models.store import Store, StoreStatus
+from app.core.models.user import User
+from app.core.models.user_organization import UserOrganization, UserOrganizationRole
+from app.core.models.user_store import UserStore, UserStoreRole
+
+Row = tuple[Any, ...]
+# Called after each committed batch with the phase, entities done and total
+ProgressCallback = Callable[[str, int, int], None]
+
+USER_COLUMNS = (
+    "id",
+    "email",
+    "first_name",
+    "last_name",
+    "phone",
+    "is_active",
+    "is_admin",
+    "is_super_admin",
+    "is_support_agent",
+    "is_provisioning_specialist",
+    "permissions_version",
+    "created_at",
+    "updated_at",
+)
+ORGANIZATION_COLUMNS = (
+    "id",
+    "name",
+    "billing_address",
+    "city",
+    "state",
+    "postal_code",
+    "country",
+    "contact_email",
+    "contact_phone",
+    "status",
+    "created_at",
+    "updated_at",
+)
+STORE_COLUMNS = (
+    "id",
+    "organization_id",
+    "name",
+    "street_address",
+    "city",
+    "state",
+    "postal_code",
+    "country",
+    "status",
+    "created_at",
+    "updated_at",
+)
+CONTROLLER_COLUMNS = (
+    "id",
+    "store_id",
+    "mac_address",
+    "serial_number",
+    "machine_label",
+    "device_type",
+    "connectivity_status",
+    "last_heartbeat",
+    "provisioned_at",
+    "created_at",
+    "updated_at",
+)
+USER_ORGANIZATION_COLUMNS = ("id", "user_id", "organization_id", "role", "created_at")
+USER_STORE_COLUMNS = ("id", "user_id", "store_id", "role", "created_at")
+CUSTOMER_COLUMNS = (
+    "id",
+    "user_id",
+    "preferred_pickup_time",
+    "loyalty_points",
+    "is_vip",
+    "email_notifications",
+    "sms_notifications",
+    "created_at",
+)
+ADDRESS_COLUMNS = (
+    "id",
+    "customer_id",
+    "address_line_1",
+    "city",
+    "state",
+    "zip_code",
+    "country",
+    "address_type",
+    "is_default",
+    "is_active",
+    "created_at",
+)
+ORDER_COLUMNS = (
+    "id",
+    "order_number",
+    "customer_id",
+    "status",
+    "total_amount",
+    "tax_amount",
+    "tip_amount",
+    "final_amount",
+    "pickup_address_id",
+    "pickup_date",
+    "pickup_time_slot",
+    "delivery_address_id",
+    "delivery_date",
+    "delivery_time_slot",
+    "is_rush_order",
+    "rush_fee",
+    "created_at",
+    "picked_up_at",
+    "delivered_at",
+)
+ORDER_ITEM_COLUMNS = (
+    "id",
+    "order_id",
+    "service_id",
+    "item_name",
+    "item_type",
+    "quantity",
+    "unit_price",
+    "total_price",
+    "is_completed",
+    "created_at",
+)
+NOTIFICATION_COLUMNS = (
+    "id",
+    "customer_id",
+    "order_id",
+    "type",
+    "title",
+    "message",
+    "status",
+    "delivery_method",
+    "sent_at",
+    "retry_count",
+    "created_at",
+)
+
+# Inserted only when the services table is empty
+SERVICE_CATALOG = (
+    ("Wash & Fold", ServiceCategory.WASH_FOLD, 12.0, 48),
+    ("Dry Cleaning", ServiceCategory.DRY_CLEAN, 8.5, 72),
+    ("Press Only", ServiceCategory.PRESS_ONLY, 4.0, 24),
+    ("Starch & Press", ServiceCategory.STARCH, 5.5, 48),
+)
+FIRST_NAMES = ("Ava", "Ben", "Chloe", "Diego", "Emma", "Farah", "Gus", "Hana")
+LAST_NAMES = ("Garcia", "Kim", "Lopez", "Nguyen", "Patel", "Smith", "Wong", "Young")
+CITIES = (
+    ("Austin", "TX", "78701"),
+    ("Chicago", "IL", "60601"),
+    ("Denver", "CO", "80202"),
+    ("Portland", "OR", "97201"),
+    ("Seattle", "WA", "98101"),
+)
+STREETS = ("Main St", "Oak Ave", "Pine St", "Maple Dr", "Cedar Ln", "Elm St")
+ADDRESS_TYPES = ("home", "work", "pickup", "delivery")
+TIME_SLOTS = ("9:00 AM - 11:00 AM", "1:00 PM - 3:00 PM", "5:00 PM - 7:00 PM")
+PICKUP_TIMES = ("morning", "afternoon", "evening")
+ITEMS = (
+    ("Shirt", "shirt"),
+    ("Pants", "pants"),
+    ("Dress", "dress"),
+    ("Bedding", "bedding"),
+    ("Towels", "towels"),
+)
+# Orders still in flight; older orders are delivered or cancelled
+OPEN_STATUSES = (
+    OrderStatus.PENDING,
+    OrderStatus.CONFIRMED,
+    OrderStatus.PICKED_UP,
+    OrderStatus.IN_PROGRESS,
+    OrderStatus.READY,
+    OrderStatus.OUT_FOR_DELIVERY,
+)
+OPEN_ORDER_AGE = timedelta(days=3)
+NOTIFICATION_TYPES = (
+    NotificationType.ORDER_CONFIRMATION,
+    NotificationType.PICKUP_REMINDER,
+    NotificationType.ORDER_READY,
+    NotificationType.OUT_FOR_DELIVERY,
+    NotificationType.DELIVERY_CONFIRMATION,
+)
+DELIVERY_METHODS = ("email", "sms", "push")
+TAX_RATE = 0.08
+
+
+@dataclass(frozen=True)
+class FleetSpec:
+    """Size of a generated fleet and the seed it is generated from."""
+
+    organizations: int = 100
+    stores_per_organization: int = 10
+    controllers_per_store: int = 8
+    staff_per_store: int = 2
+    customers: int = 100_000
+    addresses_per_customer: int = 2
+    orders: int = 1_000_000
+    items_per_order: int = 2
+    notifications_per_order: int = 1
+    days: int = 365
+    seed: int = 0
+    batch_size: int = 50_000
+
+    def row_counts(self) -> dict[str, int]:
+        """Number of rows the spec generates per table."""
+        stores = self.organizations * self.stores_per_organization
+        staff = stores * self.staff_per_store
+        return {
+            "users": self.organizations + staff + self.customers,
+            "organizations": self.organizations,
+            "stores": stores,
+            "iot_controllers": stores * self.controllers_per_store,
+            "user_organizations": self.organizations + staff,
+            "user_stores": stores + staff,
+            "customers": self.customers,
+            "addresses": self.customers * self.addresses_per_customer,
+            "orders": self.orders,
+            "order_items": self.orders * self.items_per_order,
+            "notifications": self.orders * self.notifications_per_order,
+        }
+
+
+_COPY_ESCAPES = str.maketrans({"\\": "\\\\", "\t": "\\t", "\n": "\\n", "\r": "\\r"})
+
+
+def _copy_text(value: str) -> str:
+    if "\\" in value or "\t" in value or "\n" in value or "\r" in value:
+        return value.translate(_COPY_ESCAPES)
+    return value
+
+
+# Formatters for PostgreSQL's COPY text format, by exact type; this runs for
+# every generated value, so it avoids a chain of isinstance checks
+_COPY_FORMATTERS: dict[type, Callable[[Any], str]] = {
+    type(None): lambda value: "\\N",
+    bool: lambda value: "t" if value else "f",
+    int: str,
+    float: repr,
+    str: _copy_text,
+    uuid.UUID: str,
+    datetime: datetime.isoformat,
+}
+
+
+def _copy_value(value: Any) -> str:
+    """Render one value in PostgreSQL's COPY text format."""
+    formatter = _COPY_FORMATTERS.get(type(value))
+    if formatter is not None:
+        return formatter(value)
+    if isinstance(value, enum.Enum):
+        # SQLAlchemy Enum columns store member names
+        return value.name
+    return _copy_text(str(value))
+
+
+class BulkWriter:
+    """Write generated rows with COPY on psycopg2 and executemany elsewhere."""
+
+    def __init__(self, connection: Connection) -> None:
+        self.connection = connection
+        self.use_copy = (
+            connection.dialect.name == "postgresql"
+            and connection.dialect.driver == "psycopg2"
+        )
+        self.counts: dict[str, int] = {}
+
+    def write(self, table: Table, columns: Sequence[str], rows: Sequence[Row]) -> None:
+        """Write rows whose values follow ``columns``."""
+        if not rows:
+            return
+        if self.use_copy:
+            self._copy(table, columns, rows)
+        else:
+            self.connection.execute(
+                insert(table), [dict(zip(columns, row)) for row in rows]
+            )
+        self.counts[table.name] = self.counts.get(table.name, 0) + len(rows)
+
+    def _copy(self, table: Table, columns: Sequence[str], rows: Sequence[Row]) -> None:
+        buffer = io.StringIO()
+        for row in rows:
+            buffer.write("\t".join(map(_copy_value, row)))
+            buffer.write("\n")
+        buffer.seek(0)
+        preparer = self.connection.dialect.identifier_preparer
+        statement = "COPY {} ({}) FROM STDIN".format(
+            preparer.format_table(table),
+            ", ".join(preparer.quote(column) for column in columns),
+        )
+        # COPY runs on the raw DBAPI connection, so make sure the SQLAlchemy
+        # transaction it belongs to is open and gets committed
+        if not self.connection.in_transaction():
+            self.connection.begin()
+        cursor = self.connection.connection.cursor()
+        try:
+            cursor.copy_expert(statement, buffer)
+        finally:
+            cursor.close()
+
+
+def _table(model: Any) -> Table:
+    table: Table = model.__table__
+    return table
+
+
+def _next_id(connection: Connection, model: Any) -> int:
+    table = _table(model)
+    current = connection.scalar(select(func.coalesce(func.max(table.c.id), 0)))
+    return int(current or 0) + 1
+
+
+def _services(connection: Connection) -> list[tuple[int, float]]:
+    """Ids and base prices of the service catalog, seeding it when empty."""
+    table = _table(Service)
+    query = select(table.c.id, table.c.base_price).order_by(table.c.id)
+    services = [(row.id, row.base_price) for row in connection.execute(query)]
+    if services:
+        return services
+    connection.execute(
+        insert(table),
+        [
+            {
+                "name": name,
+                "category": category,
+                "base_price": base_price,
+                "turnaround_hours": turnaround_hours,
+                "is_active": True,
+            }
+            for name, category, base_price, turnaround_hours in SERVICE_CATALOG
+        ],
+    )
+    connection.commit()
+    return [(row.id, row.base_price) for row in connection.execute(query)]
+
+
+def _chunks(total: int, rows_per_entity: int, batch_size: int) -> list[range]:
+    """Split ``range(total)`` into batches of about ``batch_size`` rows."""
+    size = max(1, batch_size // max(1, rows_per_entity))
+    return [range(start, min(start + size, total)) for start in range(0, total, size)]
+
+
+def _advance_sequences(connection: Connection, tables: Sequence[Table]) -> None:
+    """Move PostgreSQL id sequences past explicitly inserted ids."""
+    for table in tables:
+        connection.execute(
+            select(
+                func.setval(
+                    func.pg_get_serial_sequence(table.name, "id"),
+                    select(func.max(table.c.id)).scalar_subquery(),
+                )
+            )
+        )
+    connection.commit()
+
+
+class FleetGenerator:
+    """Generate and write the rows of one fleet, phase by phase."""
+
+    def __init__(
+        self,
+        connection: Connection,
+        spec: FleetSpec,
+        until: datetime,
+        progress: Optional[ProgressCallback] = None,
+    ) -> None:
+        self.connection = connection
+        self.spec = spec
+        self.writer = BulkWriter(connection)
+        self.progress = progress
+        self.rng = random.Random(spec.seed)
+        self.until = until
+        self.start = until - timedelta(days=spec.days)
+        self.span_seconds = max(1, spec.days * 86_400)
+        self.user_number = int(
+            connection.scalar(select(func.count()).select_from(_table(User))) or 0
+        )
+        self.controller_number = int(
+            connection.scalar(select(func.count()).select_from(_table(IoTController)))
+            or 0
+        )
+
+    def _uuid(self) -> uuid.UUID:
+        return uuid.UUID(int=self.rng.getrandbits(128), version=4)
+
+    def _moment(self) -> datetime:
+        """Random point in the generated time window."""
+        return self.start + timedelta(seconds=self.rng.randrange(self.span_seconds))
+
+    def _user(self, created_at: datetime) -> Row:
+        number = self.user_number
+        self.user_number += 1
+        return (
+            self._uuid(),
+            f"user{number}@fleet.example.com",
+            FIRST_NAMES[number % len(FIRST_NAMES)],
+            LAST_NAMES[number // len(FIRST_NAMES) % len(LAST_NAMES)],
+            f"+1{2_000_000_000 + number}",
+            True,
+            False,
+            False,
+            False,
+            False,
+            0,
+            created_at,
+            created_at,
+        )
+
+    def _commit(self, phase: str, done: int, total: int) -> None:
+        self.connection.commit()
+        if self.progress is not None:
+            self.progress(phase, done, total)
+
+    def organizations(self) -> None:
+        """Organizations with their stores, controllers, staff and links."""
+        spec = self.spec
+        rows_per_organization = 3 + spec.stores_per_organization * (
+            2 + spec.controllers_per_store + 3 * spec.staff_per_store
+        )
+        for chunk in _chunks(
+            spec.organizations, rows_per_organization, spec.batch_size
+        ):
+            users: list[Row] = []
+            organizations: list[Row] = []
+            stores: list[Row] = []
+            controllers: list[Row] = []
+            user_organizations: list[Row] = []
+            user_stores: list[Row] = []
+            for _ in chunk:
+                created_at = self._moment()
+                city, state, postal_code = CITIES[self.rng.randrange(len(CITIES))]
+                organization_id = self._uuid()
+                owner = self._user(created_at)
+                users.append(owner)
+                organizations.append(
+                    (
+                        organization_id,
+                        f"Fleet Laundry {organization_id.hex[:8]}",
+                        f"{self.rng.randrange(1, 10_000)} Market St",
+                        city,
+                        state,
+                        postal_code,
+                        "US",
+                        owner[1],
+                        owner[4],
+                        OrganizationStatus.ACTIVE,
+                        created_at,
+                        created_at,
+                    )
+                )
+                user_organizations.append(
+                    (
+                        self._uuid(),
+                        owner[0],
+                        organization_id,
+                        UserOrganizationRole.OWNER,
+                        created_at,
+                    )
+                )
+                for store_index in range(spec.stores_per_organization):
+                    store_id = self._uuid()
+                    stores.append(
+                        (
+                            store_id,
+                            organization_id,
+                            f"Store {store_index + 1}",
+                            f"{self.rng.randrange(1, 10_000)} "
+                            f"{STREETS[self.rng.randrange(len(STREETS))]}",
+                            city,
+                            state,
+                            postal_code,
+                            "US",
+                            StoreStatus.ACTIVE,
+                            created_at,
+                            created_at,
+                        )
+                    )
+                    user_stores.append(
+                        (
+                            self._uuid(),
+                            owner[0],
+                            store_id,
+                            UserStoreRole.OWNER,
+                            created_at,
+                        )
+                    )
+                    controllers.extend(self._controllers(store_id, created_at))
+                    for _ in range(spec.staff_per_store):
+                        staff = self._user(created_at)
+                        users.append(staff)
+                        user_organizations.append(
+                            (
+                                self._uuid(),
+                                staff[0],
+                                organization_id,
+                                UserOrganizationRole.EMPLOYEE,
+                                created_at,
+                            )
+                        )
+                        user_stores.append(
+                            (
+                                self._uuid(),
+                                staff[0],
+                                store_id,
+                                UserStoreRole.OPERATOR,
+                                created_at,
+                            )
+                        )
+            self.writer.write(_table(User), USER_COLUMNS, users)
+            self.writer.write(_table(Organization), ORGANIZATION_COLUMNS, organizations)
+            self.writer.write(_table(Store), STORE_COLUMNS, stores)
+            self.writer.write(_table(IoTController), CONTROLLER_COLUMNS, controllers)
+            self.writer.write(
+                _table(UserOrganization), USER_ORGANIZATION_COLUMNS, user_organizations
+            )
+            self.writer.write(_table(UserStore), USER_STORE_COLUMNS, user_stores)
+            self._commit("organizations", chunk.stop, spec.organizations)
+
+    def _controllers(self, store_id: uuid.UUID, created_at: datetime) -> list[Row]:
+        rows = []
+        for index in range(self.spec.controllers_per_store):
+            number = self.controller_number
+            self.controller_number += 1
+            device_type = DeviceType.WASHER if index % 2 == 0 else DeviceType.DRYER
+            online = self.rng.random() < 0.9
+            # Locally administered MACs, unique across generated controllers
+            octets = number.to_bytes(5, "big")
+            rows.append(
+                (
+                    self._uuid(),
+                    store_id,
+                    "02:" + ":".join(f"{octet:02X}" for octet in octets),
+                    f"FLT{number:010d}",
+                    f"{device_type.value.title()} {index // 2 + 1}",
+                    device_type,
+                    ConnectivityStatus.ONLINE if online else ConnectivityStatus.OFFLINE,
+                    self.until
+                    - timedelta(seconds=self.rng.randrange(60 if online else 86_400)),
+                    created_at,
+                    created_at,
+                    created_at,
+                )
+            )
+        return rows
+
+    def customers(self, customer_base: int, address_base: int) -> None:
+        """Customers with their users and addresses."""
+        spec = self.spec
+        per_customer = spec.addresses_per_customer
+        for chunk in _chunks(spec.customers, 2 + per_customer, spec.batch_size):
+            users: list[Row] = []
+            customers: list[Row] = []
+            addresses: list[Row] = []
+            for index in chunk:
+                created_at = self._moment()
+                user = self._user(created_at)
+                users.append(user)
+                customer_id = customer_base + index
+                customers.append(
+                    (
+                        customer_id,
+                        user[0],
+                        PICKUP_TIMES[self.rng.randrange(len(PICKUP_TIMES))],
+                        self.rng.randrange(500),
+                        self.rng.randrange(20) == 0,
+                        True,
+                        True,
+                        created_at,
+                    )
+                )
+                city, state, zip_code = CITIES[self.rng.randrange(len(CITIES))]
+                for offset in range(per_customer):
+                    addresses.append(
+                        (
+                            address_base + index * per_customer + offset,
+                            customer_id,
+                            f"{self.rng.randrange(1, 10_000)} "
+                            f"{STREETS[self.rng.randrange(len(STREETS))]}",
+                            city,
+                            state,
+                            zip_code,
+                            "USA",
+                            ADDRESS_TYPES[offset % len(ADDRESS_TYPES)],
+                            offset == 0,
+                            True,
+                            created_at,
+                        )
+                    )
+            self.writer.write(_table(User), USER_COLUMNS, users)
+            self.writer.write(_table(Customer), CUSTOMER_COLUMNS, customers)
+            self.writer.write(_table(Address), ADDRESS_COLUMNS, addresses)
+            self._commit("customers", chunk.stop, spec.customers)
+
+
+@dataclass(frozen=True)
+class OrderBatch:
+    """Everything needed to generate one batch of orders on its own."""
+
+    spec: FleetSpec
+    until: datetime
+    customer_base: int
+    address_base: int
+    order_base: int
+    item_base: int
+    notification_base: int
+    services: tuple[tuple[int, float], ...]
+    indexes: range
+
+    def rows(self) -> tuple[list[Row], list[Row], list[Row]]:
+        """Order, item and notification rows of the batch, oldest first."""
+        spec = self.spec
+        # Seeded per batch, so batches can be generated in any order or process
+        rng = random.Random(f"{spec.seed}:orders:{self.indexes.start}")
+        # random() is several times cheaper than randrange() in this loop
+        random_ = rng.random
+        services = self.services
+        per_customer = spec.addresses_per_customer
+        items_per_order = spec.items_per_order
+        notifications_per_order = spec.notifications_per_order
+        start = self.until - timedelta(days=spec.days)
+        step = max(1, spec.days * 86_400) / max(1, spec.orders)
+        open_after = self.until - OPEN_ORDER_AGE
+        orders: list[Row] = []
+        items: list[Row] = []
+        notifications: list[Row] = []
+        for index in self.indexes:
+            order_id = self.order_base + index
+            order_number = f"FLT-{order_id:010d}"
+            customer_index = int(random_() * spec.customers)
+            customer_id = self.customer_base + customer_index
+            first_address = self.address_base + customer_index * per_customer
+            created_at = start + timedelta(seconds=index * step)
+            pickup_date = created_at + timedelta(hours=2 + int(random_() * 46))
+            delivery_date = pickup_date + timedelta(hours=48)
+            if created_at >= open_after:
+                status = OPEN_STATUSES[int(random_() * len(OPEN_STATUSES))]
+            elif int(random_() * 20) == 0:
+                status = OrderStatus.CANCELLED
+            else:
+                status = OrderStatus.DELIVERED
+            delivered = status == OrderStatus.DELIVERED
+            total = 0.0
+            for offset in range(items_per_order):
+                service_id, unit_price = services[int(random_() * len(services))]
+                item_name, item_type = ITEMS[int(random_() * len(ITEMS))]
+                quantity = 1 + int(random_() * 5)
+                total_price = round(quantity * unit_price, 2)
+                total += total_price
+                items.append(
+                    (
+                        self.item_base + index * items_per_order + offset,
+                        order_id,
+                        service_id,
+                        item_name,
+                        item_type,
+                        quantity,
+                        unit_price,
+                        total_price,
+                        delivered,
+                        created_at,
+                    )
+                )
+            total = round(total, 2)
+            tax = round(total * TAX_RATE, 2)
+            tip = float(int(random_() * 6))
+            orders.append(
+                (
+                    order_id,
+                    order_number,
+                    customer_id,
+                    status,
+                    total,
+                    tax,
+                    tip,
+                    round(total + tax + tip, 2),
+                    first_address + int(random_() * per_customer),
+                    pickup_date,
+                    TIME_SLOTS[int(random_() * len(TIME_SLOTS))],
+                    first_address + int(random_() * per_customer),
+                    delivery_date,
+                    TIME_SLOTS[int(random_() * len(TIME_SLOTS))],
+                    False,
+                    0.0,
+                    created_at,
+                    pickup_date if delivered else None,
+                    delivery_date if delivered else None,
+                )
+            )
+            for offset in range(notifications_per_order):
+                notification_type = NOTIFICATION_TYPES[offset % len(NOTIFICATION_TYPES)]
+                sent_at = created_at + timedelta(minutes=offset)
+                notifications.append(
+                    (
+                        self.notification_base
+                        + index * notifications_per_order
+                        + offset,
+                        customer_id,
+                        order_id,
+                        notification_type,
+                        f"Order {order_number}",
+                        f"Update on order {order_number}: "
+                        f"{notification_type.value.replace('_', ' ')}",
+                        NotificationStatus.SENT,
+                        DELIVERY_METHODS[int(random_() * len(DELIVERY_METHODS))],
+                        sent_at,
+                        0,
+                        sent_at,
+                    )
+                )
+        return orders, items, notifications
+
+    def write(self, connection: Connection) -> dict[str, int]:
+        """Generate the batch, write it and commit."""
+        orders, items, notifications = self.rows()
+        writer = BulkWriter(connection)
+        writer.write(_table(Order), ORDER_COLUMNS, orders)
+        writer.write(_table(OrderItem), ORDER_ITEM_COLUMNS, items)
+        writer.write(_table(Notification), NOTIFICATION_COLUMNS, notifications)
+        connection.commit()
+        return writer.counts
+
+
+# Engine of a worker process, created once by _init_order_worker
+_worker_engine: Optional[Engine] = None
+
+
+def _init_order_worker(database_url: str) -> None:
+    global _worker_engine
+    _worker_engine = create_engine(database_url)
+
+
+def _write_order_batch(batch: OrderBatch) -> dict[str, int]:
+    assert _worker_engine is not None
+    with _worker_engine.connect() as connection:
+        return batch.write(connection)
+
+
+def generate_fleet(
+    engine: Engine,
+    spec: FleetSpec,
+    until: datetime,
+    progress: Optional[ProgressCallback] = None,
+    workers: int = 1,
+) -> dict[str, int]:
+    """
+    Generate a synthetic fleet into the database behind ``engine``.
+
+    Organizations and customers are written by this process. Order batches
+    are independent of each other, so with ``workers`` above one they are
+    generated and written by a pool of processes, each with its own
+    connection. The rows are the same for any number of workers. SQLite
+    allows a single writer, so it always uses one.
+
+    Args:
+        engine: Engine for a database with the current schema
+        spec: What to generate and the seed to generate it from
+        until: Timezone-aware end of the generated time window
+        progress: Called after each committed batch
+        workers: Processes writing order batches
+
+    Returns:
+        Number of rows written per table
+    """
+    if engine.dialect.name == "sqlite":
+        workers = 1
+    counts: dict[str, int] = {}
+
+    def add(batch_counts: dict[str, int]) -> None:
+        for table, count in batch_counts.items():
+            counts[table] = counts.get(table, 0) + count
+
+    with engine.connect() as connection:
+        services = tuple(_services(connection))
+        customer_base = _next_id(connection, Customer)
+        address_base = _next_id(connection, Address)
+        order_base = _next_id(connection, Order)
+        item_base = _next_id(connection, OrderItem)
+        notification_base = _next_id(connection, Notification)
+
+        generator = FleetGenerator(connection, spec, until, progress)
+        generator.organizations()
+        generator.customers(customer_base, address_base)
+        add(generator.writer.counts)
+
+        batches = [
+            OrderBatch(
+                spec=spec,
+                until=until,
+                customer_base=customer_base,
+                address_base=address_base,
+                order_base=order_base,
+                item_base=item_base,
+                notification_base=notification_base,
+                services=services,
+                indexes=indexes,
+            )
+            for indexes in _chunks(
+                spec.orders if spec.customers else 0,
+                1 + spec.items_per_order + spec.notifications_per_order,
+                spec.batch_size,
+            )
+        ]
+        done = 0
+        if workers > 1:
+            with ProcessPoolExecutor(
+                max_workers=workers,
+                initializer=_init_order_worker,
+                initargs=(engine.url.render_as_string(hide_password=False),),
+            ) as executor:
+                futures = {
+                    executor.submit(_write_order_batch, batch): len(batch.indexes)
+                    for batch in batches
+                }
+                for future in as_completed(futures):
+                    add(future.result())
+                    done += futures[future]
+                    if progress is not None:
+                        progress("orders", done, spec.orders)
+        else:
+            for batch in batches:
+                add(batch.write(connection))
+                done += len(batch.indexes)
+                if progress is not None:
+                    progress("orders", done, spec.orders)
+
+        if connection.dialect.name == "postgresql":
+            _advance_sequences(
+                connection,
+                [
+                    _table(model)
+                    for model in (Customer, Address, Order, OrderItem, Notification)
+                    if counts.get(_table(model).name)
+                ],
+            )
+    return counts
@@ -0,0 +1 @@
+"""System health monitoring for the Super-Admin Control Room."""
@@ -0,0 +1,43 @@
+"""System health router for Super-Admin Dashboard."""
+from uuid import UUID
+
+from fastapi import APIRouter, Depends, Query
+
+from app.auth.decorators import require_auth, require_super_admin
+from app.auth.principal_cache import Principal
+from app.auth.security import get_current_principal
+from app.core.constants import DEFAULT_LIMIT, DEFAULT_SKIP, MAX_LIMIT, MIN_LIMIT
+from app.core.schemas.health import StoreConnectivityStatus, SystemHealthPage
+from app.health.summary import HealthSummary, get_health_summary
+
+router = APIRouter()
+
+
+@router.get("", response_model=SystemHealthPage)
+@require_auth
+@require_super_admin
+async def get_system_health(
+    skip: int = Query(DEFAULT_SKIP, ge=DEFAULT_SKIP),
+    limit: int = Query(DEFAULT_LIMIT, ge=MIN_LIMIT, le=MAX_LIMIT),
+    status: StoreConnectivityStatus | None = None,
+    organization_id: UUID | None = None,
+    city: str | None = None,
+    state: str | None = None,
+    q: str | None = Query(None, description="Store or organization name contains"),
+    summary: HealthSummary = Depends(get_health_summary),
+    current_user: Principal = Depends(get_current_principal),
+) -> SystemHealthPage:
+    """List store health, offline and alerting stores first.
+
+    Served from the in-memory health summary without querying the database.
+    """
+    items, total = summary.query(
+        organization_id=organization_id,
+        status=status,
+        city=city,
+        state=state,
+        search=q,
+        skip=skip,
+        limit=limit,
+    )
+    return SystemHealthPage(items=items, total=total)
@@ -0,0 +1,299 @@
+"""Maintained per-store system health summary for the Control Room.
+
+The health view combines store metadata (name, organization, location) with
+live controller connectivity. Joining ``stores`` with ``iot_controllers`` and
+grouping on every request does not scale to a large fleet, so the summary is
+kept in memory and updated incrementally:
+
+* connectivity counts, alert counts and last heartbeats come from
+  :class:`~app.iot.fleet.FleetState`, which heartbeats and deadline expiry
+  keep current;
+* store metadata lives in a directory keyed by store id. Store and
+  organization provisioning routes update it directly, and it is reloaded
+  from the database every resync interval.
+
+Views are cached per filter combination. The name-ordered list of stores
+matching the metadata filters is reused until the directory changes. The
+severity-sorted list is reused until the fleet's counts change, and
+rebuilding it costs one array lookup per store plus a stable sort. A
+request then only materializes the page it returns.
+"""
+
+import asyncio
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, Iterable, Optional
+from uuid import UUID
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.models.organization import Organization
+from app.core.models.store import Store, StoreStatus
+from app.core.schemas.health import StoreConnectivityStatus, SystemHealthStatus
+from app.iot.fleet import (
+    CONNECTIVITY_RANK,
+    FleetState,
+    fleet_state,
+    severity_rank,
+    store_connectivity_status,
+)
+
+SessionFactory = Callable[[], AsyncSession]
+
+
+@dataclass(slots=True)
+class StoreEntry:
+    """Store metadata needed to filter and label a health entry."""
+
+    store_id: UUID
+    store_name: str
+    organization_id: UUID
+    organization_name: str
+    city: str
+    state: str
+    status: StoreStatus
+
+    @property
+    def search_text(self) -> str:
+        return f"{self.store_name}\n{self.organization_name}".lower()
+
+
+def connectivity_status(counts: dict[str, int]) -> StoreConnectivityStatus:
+    """Derive a store's overall connectivity from ``store_counts`` output."""
+    return store_connectivity_status(
+        counts["online"], counts["offline"], counts["total"]
+    )
+
+
+class HealthSummary:
+    """Store directory plus cached, severity-sorted health views."""
+
+    def __init__(self, fleet: FleetState, cache_size: int = 64) -> None:
+        self._fleet = fleet
+        self._stores: dict[UUID, StoreEntry] = {}
+        self._cache: "OrderedDict[tuple, tuple[tuple, list[UUID]]]" = OrderedDict()
+        self.cache_size = cache_size
+        self.version = 0
+        self.cache_hits = 0
+        self.cache_misses = 0
+
+    def __len__(self) -> int:
+        return len(self._stores)
+
+    def load(self, entries: Iterable[StoreEntry]) -> None:
+        """Replace the store directory."""
+        self._stores = {entry.store_id: entry for entry in entries}
+        self.version += 1
+
+    def upsert_store(self, store: Any, organization_name: Optional[str] = None) -> None:
+        """
+        Add or update a store after it is created or edited.
+
+        Args:
+            store: Store model or read schema
+            organization_name: Owning organization's name; kept from the
+                existing entry when omitted
+        """
+        existing = self._stores.get(store.id)
+        if organization_name is None:
+            organization_name = existing.organization_name if existing else ""
+        self._stores[store.id] = StoreEntry(
+            store_id=store.id,
+            store_name=store.name,
+            organization_id=store.organization_id,
+            organization_name=organization_name,
+            city=store.city,
+            state=store.state,
+            status=store.status,
+        )
+        self.version += 1
+
+    def remove_store(self, store_id: UUID) -> None:
+        """Drop a deleted store."""
+        if self._stores.pop(store_id, None) is not None:
+            self.version += 1
+
+    def rename_organization(self, organization_id: UUID, name: str) -> None:
+        """Apply an organization rename to its stores."""
+        for entry in self._stores.values():
+            if entry.organization_id == organization_id:
+                entry.organization_name = name
+        self.version += 1
+
+    def remove_organization(self, organization_id: UUID) -> None:
+        """Drop every store of a deleted organization."""
+        self._stores = {
+            store_id: entry
+            for store_id, entry in self._stores.items()
+            if entry.organization_id != organization_id
+        }
+        self.version += 1
+
+    def _directory_view(
+        self,
+        organization_id: Optional[UUID],
+        city: Optional[str],
+        state: Optional[str],
+        search: Optional[str],
+    ) -> list[UUID]:
+        """Store ids matching the metadata filters, in name order."""
+        key = ("directory", organization_id, city, state, search)
+        cached = self._cache_get(key, (self.version,))
+        if cached is not None:
+            return cached
+        entries = sorted(
+            (
+                entry
+                for entry in self._stores.values()
+                if (organization_id is None or entry.organization_id == organization_id)
+                and (city is None or entry.city.lower() == city)
+                and (state is None or entry.state.lower() == state)
+                and (search is None or search in entry.search_text)
+            ),
+            key=lambda entry: (entry.store_name.lower(), str(entry.store_id)),
+        )
+        return self._cache_put(key, (self.version,), [e.store_id for e in entries])
+
+    def _matching_ids(
+        self,
+        organization_id: Optional[UUID],
+        status: Optional[StoreConnectivityStatus],
+        city: Optional[str],
+        state: Optional[str],
+        search: Optional[str],
+    ) -> list[UUID]:
+        city = city.lower() if city else None
+        state = state.lower() if state else None
+        search = search.lower() if search else None
+        key = ("health", organization_id, status, city, state, search)
+        versions = (self.version, self._fleet.version)
+        cached = self._cache_get(key, versions)
+        if cached is not None:
+            self.cache_hits += 1
+            return cached
+
+        self.cache_misses += 1
+        # Name order is kept within each severity because the sort is stable
+        store_ids = self._directory_view(organization_id, city, state, search)
+        severities = self._fleet.store_severities(store_ids)
+        order = sorted(range(len(store_ids)), key=severities.__getitem__)
+        if status is not None:
+            rank = CONNECTIVITY_RANK[status]
+            order = [i for i in order if severity_rank(severities[i]) == rank]
+        return self._cache_put(key, versions, [store_ids[i] for i in order])
+
+    def _cache_get(self, key: tuple, versions: tuple) -> Optional[list[UUID]]:
+        cached = self._cache.get(key)
+        if cached is None or cached[0] != versions:
+            return None
+        self._cache.move_to_end(key)
+        return cached[1]
+
+    def _cache_put(
+        self, key: tuple, versions: tuple, store_ids: list[UUID]
+    ) -> list[UUID]:
+        self._cache[key] = (versions, store_ids)
+        self._cache.move_to_end(key)
+        while len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+        return store_ids
+
+    def entry(self, store_id: UUID) -> Optional[SystemHealthStatus]:
+        """Build the current health entry for one store."""
+        store = self._stores.get(store_id)
+        if store is None:
+            return None
+        counts = self._fleet.store_counts(store_id)
+        alerts, critical, last_heartbeat = self._fleet.store_alerts(store_id)
+        return SystemHealthStatus(
+            store_id=store.store_id,
+            store_name=store.store_name,
+            organization_id=store.organization_id,
+            organization_name=store.organization_name,
+            city=store.city,
+            state=store.state,
+            store_status=store.status,
+            connectivity_status=connectivity_status(counts),
+            online_controllers=counts["online"],
+            offline_controllers=counts["offline"],
+            unknown_controllers=counts["unknown"],
+            total_controllers=counts["total"],
+            last_heartbeat=last_heartbeat,
+            alert_count=alerts,
+            critical_alerts=critical,
+        )
+
+    def query(
+        self,
+        organization_id: Optional[UUID] = None,
+        status: Optional[StoreConnectivityStatus] = None,
+        city: Optional[str] = None,
+        state: Optional[str] = None,
+        search: Optional[str] = None,
+        skip: int = 0,
+        limit: int = 50,
+    ) -> tuple[list[SystemHealthStatus], int]:
+        """
+        Return one page of store health, most severe first.
+
+        Offline stores come first, then partial, unknown and online. Within a
+        status, stores with more critical alerts and then more alerts lead.
+
+        Args:
+            organization_id: Only stores of this organization
+            status: Only stores with this connectivity status
+            city: Only stores in this city (case-insensitive)
+            state: Only stores in this state (case-insensitive)
+            search: Substring of the store or organization name
+            skip: Number of entries to skip
+            limit: Maximum number of entries to return
+
+        Returns:
+            Tuple of (page entries, total matching stores)
+        """
+        store_ids = self._matching_ids(organization_id, status, city, state, search)
+        items = [self.entry(store_id) for store_id in store_ids[skip : skip + limit]]
+        return [item for item in items if item is not None], len(store_ids)
+
+    async def rebuild(self, session_factory: SessionFactory) -> None:
+        """Reload the store directory from ``stores`` and ``organizations``."""
+        async with session_factory() as session:
+            rows = await session.execute(
+                select(
+                    Store.id,
+                    Store.name,
+                    Store.organization_id,
+                    Organization.name,
+                    Store.city,
+                    Store.state,
+                    Store.status,
+                ).join(Organization, Store.organization_id == Organization.id)
+            )
+            self.load(StoreEntry(*row) for row in rows.tuples())
+
+    async def run(self, session_factory: SessionFactory, interval: float) -> None:
+        """Reload the store directory now and every ``interval`` seconds."""
+        while True:
+            try:
+                await self.rebuild(session_factory)
+            except Exception as e:
+                print(f"Health summary resync failed: {e}")
+            await asyncio.sleep(interval)
+
+    def stats(self) -> dict[str, Any]:
+        """Report directory size and view cache effectiveness."""
+        return {
+            "stores": len(self._stores),
+            "cached_views": len(self._cache),
+            "cache_hits": self.cache_hits,
+            "cache_misses": self.cache_misses,
+        }
+
+
+health_summary = HealthSummary(fleet_state)
+
+
+def get_health_summary() -> HealthSummary:
+    """Dependency returning the process-wide health summary."""
+    return health_summary
@@ -0,0 +1 @@
+"""Internal diagnostics endpoints for operators."""
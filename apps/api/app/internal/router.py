@@ -0,0 +1,99 @@
+"""Internal diagnostics router (super admin only)."""
+from fastapi import APIRouter, Depends, Response
+
+from app.auth.decorators import require_auth, require_super_admin
+from app.auth.permission_versions import PermissionVersions, get_permission_versions
+from app.auth.principal_cache import Principal
+from app.auth.rate_limit import RateLimiter, get_rate_limiter
+from app.auth.security import get_current_principal
+from app.core.database.pool_metrics import get_pool_report
+from app.core.database.session import async_pool_metrics, sync_pool_metrics
+from app.core.request_metrics import (
+    PROMETHEUS_CONTENT_TYPE,
+    RequestMetrics,
+    get_request_metrics,
+)
+from app.core.services.email_queue import EmailQueue, get_email_queue
+from app.iot.fleet import FleetState, get_fleet_state
+from app.iot.heartbeats import HeartbeatBuffer, get_heartbeat_buffer
+
+router = APIRouter()
+
+
+@router.get("/db-pool")
+@require_auth
+@require_super_admin
+async def get_db_pool_metrics(
+    current_user: Principal = Depends(get_current_principal),
+) -> dict:
+    """Report connection pool state and checkout telemetry for this worker."""
+    return get_pool_report(sync_pool_metrics, async_pool_metrics)
+
+
+@router.get("/heartbeats")
+@require_auth
+@require_super_admin
+async def get_heartbeat_metrics(
+    buffer: HeartbeatBuffer = Depends(get_heartbeat_buffer),
+    current_user: Principal = Depends(get_current_principal),
+) -> dict:
+    """Report heartbeat buffer occupancy, backpressure and flush latency."""
+    return buffer.stats()
+
+
+@router.get("/fleet")
+@require_auth
+@require_super_admin
+async def get_fleet_metrics(
+    fleet: FleetState = Depends(get_fleet_state),
+    current_user: Principal = Depends(get_current_principal),
+) -> dict:
+    """Report the size and sync state of this worker's fleet table."""
+    return fleet.stats()
+
+
+@router.get("/email-queue")
+@require_auth
+@require_super_admin
+async def get_email_queue_metrics(
+    queue: EmailQueue = Depends(get_email_queue),
+    current_user: Principal = Depends(get_current_principal),
+) -> dict:
+    """Report outbound email queue depth, retries and failures."""
+    return queue.stats()
+
+
+@router.get("/rate-limits")
+@require_auth
+@require_super_admin
+async def get_rate_limit_metrics(
+    limiter: RateLimiter = Depends(get_rate_limiter),
+    current_user: Principal = Depends(get_current_principal),
+) -> dict:
+    """Report the rate limit backend and allowed/rejected request counts."""
+    return limiter.stats()
+
+
+@router.get("/permission-versions")
+@require_auth
+@require_super_admin
+async def get_permission_version_metrics(
+    versions: PermissionVersions = Depends(get_permission_versions),
+    current_user: Principal = Depends(get_current_principal),
+) -> dict:
+    """Report revoked stateless tokens and the permissions version sync state."""
+    return versions.stats()
+
+
+@router.get("/metrics")
+@require_auth
+@require_super_admin
+async def get_request_metrics_report(
+    metrics: RequestMetrics = Depends(get_request_metrics),
+    current_user: Principal = Depends(get_current_principal),
+) -> Response:
+    """Per-route request, database and serialization time for this worker.
+
+    Prometheus text format; scrape with a super admin bearer token.
+    """
+    return Response(metrics.render(), media_type=PROMETHEUS_CONTENT_TYPE)
@@ -0,0 +1 @@
+"""IoT device ingestion endpoints."""
@@ -0,0 +1,497 @@
+"""In-memory fleet connectivity state with deadline-driven offline detection.
+
+Dashboards need per-store online/offline counts for the whole fleet. Scanning
+``iot_controllers`` for lapsed ``last_heartbeat`` values on every load does not
+scale, so each worker keeps a compact state table instead:
+
+* controllers are assigned dense slots, and per-slot store, status and
+  deadline live in flat arrays;
+* per-store status counts are kept in one array (three counters per store)
+  and updated incrementally, so :meth:`FleetState.store_counts` is O(1);
+* every heartbeat pushes the controller's new deadline onto a min-heap.
+  :meth:`FleetState.expire` pops lapsed deadlines and flips those
+  controllers to offline in O(log n) each. Entries made stale by a later
+  heartbeat are skipped when popped (lazy deletion), and the heap is
+  rebuilt once stale entries dominate;
+* going offline schedules two more heap entries that escalate the
+  controller to an alert and then a critical alert if it stays offline.
+  Per-store alert counters are kept next to the status counters.
+
+The table is rebuilt from the database at startup and every resync interval.
+Resyncing picks up controllers that were added or removed, and heartbeats
+that were handled by other workers. Offline flips are written back with a
+guarded UPDATE that skips rows whose stored heartbeat is still fresh.
+"""
+
+import asyncio
+import heapq
+import math
+import threading
+import time
+from array import array
+from datetime import datetime, timezone
+from typing import Any, Callable, Iterable, Optional
+from uuid import UUID
+
+from sqlalchemy import or_, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config.settings import settings
+from app.core.models.iot_controller import ConnectivityStatus, IoTController
+from app.core.schemas.health import StoreConnectivityStatus
+
+SessionFactory = Callable[[], AsyncSession]
+
+# Status codes stored per slot; also the offset of each counter per store
+UNKNOWN, ONLINE, OFFLINE = 0, 1, 2
+_STATUSES = (
+    ConnectivityStatus.UNKNOWN,
+    ConnectivityStatus.ONLINE,
+    ConnectivityStatus.OFFLINE,
+)
+_STATUS_CODES = {status: code for code, status in enumerate(_STATUSES)}
+# Heap entry kinds: an online deadline, or escalation to an alert level
+_GO_OFFLINE, ALERT, CRITICAL = 0, 1, 2
+_NO_DEADLINE = math.inf
+
+# Store connectivity ranks, most severe first. A store's severity packs its
+# rank, critical alerts and alerts into one int that sorts most severe first.
+CONNECTIVITY_RANK = {
+    StoreConnectivityStatus.OFFLINE: 0,
+    StoreConnectivityStatus.PARTIAL: 1,
+    StoreConnectivityStatus.UNKNOWN: 2,
+    StoreConnectivityStatus.ONLINE: 3,
+}
+_COUNT_BITS = 20
+_COUNT_MAX = (1 << _COUNT_BITS) - 1
+
+
+def store_connectivity_status(
+    online: int, offline: int, total: int
+) -> StoreConnectivityStatus:
+    """
+    Derive a store's overall connectivity from its controller counts.
+
+    All online is ``online``; some online is ``partial``; none online is
+    ``offline`` if any controller is offline, and ``unknown`` if the store
+    has no controllers or none have checked in.
+    """
+    if online:
+        if online == total:
+            return StoreConnectivityStatus.ONLINE
+        return StoreConnectivityStatus.PARTIAL
+    if offline:
+        return StoreConnectivityStatus.OFFLINE
+    return StoreConnectivityStatus.UNKNOWN
+
+
+def store_severity(status: StoreConnectivityStatus, alerts: int, critical: int) -> int:
+    """Pack a store's sort key; smaller values are more severe."""
+    return (
+        (CONNECTIVITY_RANK[status] << 2 * _COUNT_BITS)
+        | ((_COUNT_MAX - min(critical, _COUNT_MAX)) << _COUNT_BITS)
+        | (_COUNT_MAX - min(alerts, _COUNT_MAX))
+    )
+
+
+def severity_rank(severity: int) -> int:
+    """Return the connectivity rank packed into a severity."""
+    return severity >> 2 * _COUNT_BITS
+
+
+EMPTY_STORE_SEVERITY = store_severity(StoreConnectivityStatus.UNKNOWN, 0, 0)
+
+
+def _epoch(moment: datetime) -> float:
+    """Convert a datetime to epoch seconds, reading naive values as UTC."""
+    if moment.tzinfo is None:
+        moment = moment.replace(tzinfo=timezone.utc)
+    return moment.timestamp()
+
+
+class FleetState:
+    """Array-backed controller state table with a deadline heap."""
+
+    def __init__(
+        self,
+        offline_after_seconds: float,
+        alert_after_seconds: float = 120.0,
+        critical_after_seconds: float = 300.0,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self.offline_after_seconds = offline_after_seconds
+        # Indexed by alert level: how long offline before reaching it
+        self._escalate_after = (0.0, alert_after_seconds, critical_after_seconds)
+        self._clock = clock
+        self._lock = threading.Lock()
+        self.synced_at: Optional[float] = None
+        self.expired = 0
+        # Bumped whenever any store's counts or alert levels change
+        self.version = 0
+        self._reset()
+
+    def _reset(self) -> None:
+        self._slots: dict[UUID, int] = {}
+        self._controller_ids: list[UUID] = []
+        self._store_of = array("l")
+        self._status = bytearray()
+        self._deadline = array("d")
+        self._offline_since = array("d")
+        self._alert_level = bytearray()
+        self._stores: dict[UUID, int] = {}
+        self._counts = array("l")
+        self._alerts = array("l")
+        self._store_heartbeat = array("d")
+        self._severity = array("q")
+        self._heap: list[tuple[float, int, int]] = []
+
+    def __len__(self) -> int:
+        return len(self._controller_ids)
+
+    def load(
+        self,
+        rows: Iterable[
+            tuple[UUID, UUID, Optional[ConnectivityStatus], Optional[datetime]]
+        ],
+    ) -> None:
+        """
+        Replace the table with controller rows from the database.
+
+        A controller is online until ``last_heartbeat`` plus the offline
+        timeout. Controllers whose heartbeat has already lapsed load as
+        offline since that moment, and controllers that have never checked
+        in load as unknown.
+
+        Args:
+            rows: (controller id, store id, connectivity status,
+                last heartbeat) tuples
+        """
+        now = self._clock()
+        with self._lock:
+            self._reset()
+            for controller_id, store_id, status, last_heartbeat in rows:
+                slot = self._add(controller_id, store_id)
+                if last_heartbeat is None:
+                    continue
+                at = _epoch(last_heartbeat)
+                self._touch_store(slot, at)
+                deadline = at + self.offline_after_seconds
+                if deadline <= now:
+                    self._go_offline(slot, deadline, now)
+                else:
+                    self._apply(slot, status or ConnectivityStatus.ONLINE, at)
+            self.synced_at = now
+            self.version += 1
+
+    def _add(self, controller_id: UUID, store_id: UUID) -> int:
+        store_slot = self._stores.get(store_id)
+        if store_slot is None:
+            store_slot = self._stores[store_id] = len(self._stores)
+            self._counts.extend((0, 0, 0))
+            self._alerts.extend((0, 0))
+            self._store_heartbeat.append(0.0)
+            self._severity.append(EMPTY_STORE_SEVERITY)
+        slot = self._slots[controller_id] = len(self._controller_ids)
+        self._controller_ids.append(controller_id)
+        self._store_of.append(store_slot)
+        self._status.append(UNKNOWN)
+        self._deadline.append(_NO_DEADLINE)
+        self._offline_since.append(_NO_DEADLINE)
+        self._alert_level.append(0)
+        self._counts[store_slot * 3 + UNKNOWN] += 1
+        self._refresh_severity(store_slot)
+        return slot
+
+    def _refresh_severity(self, store_slot: int) -> None:
+        unknown, online, offline = self._counts[store_slot * 3 : store_slot * 3 + 3]
+        status = store_connectivity_status(online, offline, online + offline + unknown)
+        self._severity[store_slot] = store_severity(
+            status, self._alerts[store_slot * 2], self._alerts[store_slot * 2 + 1]
+        )
+
+    def _touch_store(self, slot: int, at: float) -> None:
+        store_slot = self._store_of[slot]
+        if at > self._store_heartbeat[store_slot]:
+            self._store_heartbeat[store_slot] = at
+
+    def _set_status(self, slot: int, code: int) -> None:
+        previous = self._status[slot]
+        if previous != code:
+            store_slot = self._store_of[slot]
+            self._counts[store_slot * 3 + previous] -= 1
+            self._counts[store_slot * 3 + code] += 1
+            self._status[slot] = code
+            self._refresh_severity(store_slot)
+            self.version += 1
+
+    def _set_alert_level(self, slot: int, level: int) -> None:
+        previous = self._alert_level[slot]
+        if previous != level:
+            store_slot = self._store_of[slot]
+            for offset in range(2):
+                self._alerts[store_slot * 2 + offset] += (level > offset) - (
+                    previous > offset
+                )
+            self._alert_level[slot] = level
+            self._refresh_severity(store_slot)
+            self.version += 1
+
+    def _go_offline(self, slot: int, since: float, now: float) -> None:
+        """Mark a controller offline since ``since`` and schedule escalations."""
+        self._set_status(slot, OFFLINE)
+        self._deadline[slot] = _NO_DEADLINE
+        self._offline_since[slot] = since
+        level = 0
+        for candidate in (ALERT, CRITICAL):
+            due = since + self._escalate_after[candidate]
+            if due <= now:
+                level = candidate
+            else:
+                heapq.heappush(self._heap, (due, slot, candidate))
+        self._set_alert_level(slot, level)
+
+    def _apply(self, slot: int, status: ConnectivityStatus, at: float) -> None:
+        """Apply one heartbeat received at ``at``."""
+        code = _STATUS_CODES[status]
+        if code == OFFLINE:
+            if self._status[slot] != OFFLINE:
+                self._go_offline(slot, at, at)
+            return
+        self._offline_since[slot] = _NO_DEADLINE
+        self._set_alert_level(slot, 0)
+        self._set_status(slot, code)
+        if code == ONLINE:
+            deadline = at + self.offline_after_seconds
+            self._deadline[slot] = deadline
+            heapq.heappush(self._heap, (deadline, slot, _GO_OFFLINE))
+        else:
+            self._deadline[slot] = _NO_DEADLINE
+
+    def record(
+        self,
+        heartbeats: Iterable[tuple[UUID, ConnectivityStatus]],
+        received_at: Optional[datetime] = None,
+    ) -> int:
+        """
+        Apply heartbeats and push each controller's new offline deadline.
+
+        Controllers not in the table are ignored until the next resync.
+
+        Args:
+            heartbeats: (controller id, connectivity status) pairs
+            received_at: Heartbeat time; defaults to now
+
+        Returns:
+            Number of heartbeats applied
+        """
+        at = _epoch(received_at) if received_at else self._clock()
+        applied = 0
+        with self._lock:
+            for controller_id, status in heartbeats:
+                slot = self._slots.get(controller_id)
+                if slot is None:
+                    continue
+                self._touch_store(slot, at)
+                self._apply(slot, status, at)
+                applied += 1
+            if len(self._heap) > 2 * len(self._controller_ids) + 1024:
+                self._compact()
+        return applied
+
+    def _compact(self) -> None:
+        heap = []
+        for slot, code in enumerate(self._status):
+            if code == ONLINE and self._deadline[slot] != _NO_DEADLINE:
+                heap.append((self._deadline[slot], slot, _GO_OFFLINE))
+            elif code == OFFLINE:
+                since = self._offline_since[slot]
+                for level in range(self._alert_level[slot] + 1, CRITICAL + 1):
+                    heap.append((since + self._escalate_after[level], slot, level))
+        heapq.heapify(heap)
+        self._heap = heap
+
+    def expire(self, now: Optional[float] = None) -> list[UUID]:
+        """
+        Process every deadline that has passed.
+
+        Online controllers whose heartbeat lapsed flip to offline, and
+        controllers that stayed offline long enough escalate to an alert or
+        critical alert.
+
+        Args:
+            now: Epoch seconds; defaults to the clock
+
+        Returns:
+            Ids of the controllers that went offline
+        """
+        now = self._clock() if now is None else now
+        flipped = []
+        with self._lock:
+            heap = self._heap
+            while heap and heap[0][0] <= now:
+                due, slot, kind = heapq.heappop(heap)
+                if kind == _GO_OFFLINE:
+                    if self._deadline[slot] != due:
+                        continue  # superseded by a later heartbeat
+                    self._go_offline(slot, due, now)
+                    flipped.append(self._controller_ids[slot])
+                elif (
+                    self._status[slot] == OFFLINE
+                    and self._alert_level[slot] < kind
+                    and self._offline_since[slot] + self._escalate_after[kind] == due
+                ):
+                    self._set_alert_level(slot, kind)
+            self.expired += len(flipped)
+        return flipped
+
+    def next_deadline(self) -> Optional[float]:
+        """Return the earliest pending deadline (may be a stale entry)."""
+        with self._lock:
+            return self._heap[0][0] if self._heap else None
+
+    def knows(self, controller_id: UUID) -> bool:
+        """Whether a controller is in the table."""
+        return controller_id in self._slots
+
+    def status_of(self, controller_id: UUID) -> Optional[ConnectivityStatus]:
+        """Return a controller's current status, or None if not tracked."""
+        slot = self._slots.get(controller_id)
+        if slot is None:
+            return None
+        return _STATUSES[self._status[slot]]
+
+    def store_counts(self, store_id: UUID) -> dict[str, int]:
+        """
+        Return online, offline and unknown controller counts for a store.
+
+        Stores without tracked controllers report zeros.
+        """
+        store_slot = self._stores.get(store_id)
+        if store_slot is None:
+            online = offline = unknown = 0
+        else:
+            base = store_slot * 3
+            unknown, online, offline = self._counts[base : base + 3]
+        return {
+            "online": online,
+            "offline": offline,
+            "unknown": unknown,
+            "total": online + offline + unknown,
+        }
+
+    def store_severities(self, store_ids: list[UUID]) -> list[int]:
+        """
+        Return the packed severity of each store, in order.
+
+        Sorting stores by these values puts offline stores first, then
+        partial, unknown and online, with more critical alerts and then more
+        alerts first within each status.
+        """
+        stores = self._stores
+        severity = self._severity
+        return [
+            EMPTY_STORE_SEVERITY if slot is None else severity[slot]
+            for slot in map(stores.get, store_ids)
+        ]
+
+    def store_alerts(self, store_id: UUID) -> tuple[int, int, Optional[datetime]]:
+        """
+        Return a store's alert counts and most recent heartbeat.
+
+        Returns:
+            Tuple of (controllers offline past the alert threshold,
+            controllers offline past the critical threshold, last heartbeat)
+        """
+        store_slot = self._stores.get(store_id)
+        if store_slot is None:
+            return 0, 0, None
+        last = self._store_heartbeat[store_slot]
+        return (
+            self._alerts[store_slot * 2],
+            self._alerts[store_slot * 2 + 1],
+            datetime.fromtimestamp(last, tz=timezone.utc) if last else None,
+        )
+
+    async def rebuild(self, session_factory: SessionFactory) -> None:
+        """Reload the table from ``iot_controllers``."""
+        async with session_factory() as session:
+            rows = await session.execute(
+                select(
+                    IoTController.id,
+                    IoTController.store_id,
+                    IoTController.connectivity_status,
+                    IoTController.last_heartbeat,
+                )
+            )
+            self.load(rows.tuples())
+
+    async def persist_offline(
+        self, session_factory: SessionFactory, controller_ids: list[UUID]
+    ) -> None:
+        """
+        Store offline flips, skipping rows with a fresh heartbeat.
+
+        Another worker may have received a newer heartbeat, so only rows
+        whose stored heartbeat is older than the offline timeout are changed.
+        """
+        if not controller_ids:
+            return
+        cutoff = datetime.fromtimestamp(
+            self._clock() - self.offline_after_seconds, tz=timezone.utc
+        )
+        async with session_factory() as session:
+            await session.execute(
+                update(IoTController)
+                .where(
+                    IoTController.id.in_(controller_ids),
+                    or_(
+                        IoTController.last_heartbeat.is_(None),
+                        IoTController.last_heartbeat < cutoff,
+                    ),
+                )
+                .values(connectivity_status=ConnectivityStatus.OFFLINE)
+                .execution_options(synchronize_session=False)
+            )
+            await session.commit()
+
+    async def run(
+        self,
+        session_factory: SessionFactory,
+        sweep_interval: float,
+        resync_interval: float,
+    ) -> None:
+        """Expire lapsed controllers every sweep and resync on schedule."""
+        next_sync = self._clock()
+        while True:
+            try:
+                if self._clock() >= next_sync:
+                    # Scheduled before the attempt so a failing database is
+                    # retried once per resync interval, not once per sweep
+                    next_sync = self._clock() + resync_interval
+                    await self.rebuild(session_factory)
+                await self.persist_offline(session_factory, self.expire())
+            except Exception as e:
+                print(f"Fleet connectivity sweep failed: {e}")
+            await asyncio.sleep(sweep_interval)
+
+    def stats(self) -> dict[str, Any]:
+        """Report table size, heap size and sync state."""
+        return {
+            "controllers": len(self._controller_ids),
+            "stores": len(self._stores),
+            "heap_entries": len(self._heap),
+            "expired": self.expired,
+            "synced_at": self.synced_at,
+        }
+
+
+fleet_state = FleetState(
+    offline_after_seconds=settings.HEARTBEAT_OFFLINE_AFTER_SECONDS,
+    alert_after_seconds=settings.HEALTH_ALERT_AFTER_SECONDS,
+    critical_after_seconds=settings.HEALTH_CRITICAL_AFTER_SECONDS,
+)
+
+
+def get_fleet_state() -> FleetState:
+    """Dependency returning the process-wide fleet state."""
+    return fleet_state
@@ -0,0 +1,225 @@
+"""In-memory heartbeat buffer with coalesced, batched writes.
+
+Controllers check in every few seconds, but only the latest check-in per
+controller matters for ``last_heartbeat`` and ``connectivity_status``. The
+ingestion endpoint therefore never touches the database: heartbeats land in
+:class:`HeartbeatBuffer`, which keeps one pending entry per controller
+(repeats overwrite the earlier entry), and a background task flushes all
+pending entries as a single batched UPDATE every flush interval.
+
+The buffer is bounded by the number of distinct controllers it holds.
+Heartbeats for controllers that are already pending are always accepted,
+since they do not grow the buffer. New controllers are rejected once the
+bound is reached, and the endpoint turns that into a 503 with
+``Retry-After``. Heartbeats are idempotent, so clients can simply resend.
+
+The buffer is per process. With several workers each flushes its own
+controllers, and a crash loses at most one interval of heartbeats.
+"""
+
+import asyncio
+import threading
+import time
+from datetime import datetime, timezone
+from typing import Any, Callable, Iterable, Optional
+from uuid import UUID
+
+from sqlalchemy import bindparam, func, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config.settings import settings
+from app.core.models.iot_controller import ConnectivityStatus, IoTController
+
+SessionFactory = Callable[[], AsyncSession]
+
+
+class HeartbeatBuffer:
+    """Per-controller coalescing buffer flushed as one batched UPDATE."""
+
+    def __init__(
+        self,
+        max_controllers: int,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.max_controllers = max_controllers
+        self._clock = clock
+        self._pending: dict[UUID, tuple[datetime, ConnectivityStatus]] = {}
+        self._oldest_pending: Optional[float] = None
+        self._lock = threading.Lock()
+        self.reset_metrics()
+
+    def reset_metrics(self) -> None:
+        """Zero the counters and latency statistics."""
+        self.received = 0
+        self.coalesced = 0
+        self.rejected = 0
+        self.flushes = 0
+        self.flush_failures = 0
+        self.flushed_rows = 0
+        self.last_flush_ms = 0.0
+        self.max_flush_ms = 0.0
+        self._total_flush_ms = 0.0
+        self.max_staleness_ms = 0.0
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    def submit(
+        self,
+        heartbeats: Iterable[tuple[UUID, ConnectivityStatus]],
+        received_at: Optional[datetime] = None,
+    ) -> tuple[list[tuple[UUID, ConnectivityStatus]], int]:
+        """
+        Buffer heartbeats, coalescing repeats per controller.
+
+        Args:
+            heartbeats: (controller id, connectivity status) pairs
+            received_at: Heartbeat time; defaults to now (UTC)
+
+        Returns:
+            Tuple of (accepted heartbeats, rejected count)
+        """
+        received_at = received_at or datetime.now(timezone.utc)
+        accepted: list[tuple[UUID, ConnectivityStatus]] = []
+        rejected = 0
+        with self._lock:
+            for controller_id, status in heartbeats:
+                self.received += 1
+                if controller_id in self._pending:
+                    self.coalesced += 1
+                elif len(self._pending) >= self.max_controllers:
+                    self.rejected += 1
+                    rejected += 1
+                    continue
+                elif self._oldest_pending is None:
+                    self._oldest_pending = self._clock()
+                self._pending[controller_id] = (received_at, status)
+                accepted.append((controller_id, status))
+        return accepted, rejected
+
+    def drain(self) -> tuple[dict[UUID, tuple[datetime, ConnectivityStatus]], float]:
+        """
+        Take every pending entry, leaving the buffer empty.
+
+        Returns:
+            Tuple of (pending entries, age in ms of the oldest entry)
+        """
+        with self._lock:
+            pending, self._pending = self._pending, {}
+            oldest, self._oldest_pending = self._oldest_pending, None
+        age_ms = (self._clock() - oldest) * 1000 if oldest is not None else 0.0
+        return pending, age_ms
+
+    def restore(self, pending: dict[UUID, tuple[datetime, ConnectivityStatus]]) -> None:
+        """Put back entries from a failed flush without overwriting newer ones."""
+        with self._lock:
+            for controller_id, entry in pending.items():
+                self._pending.setdefault(controller_id, entry)
+            if self._pending and self._oldest_pending is None:
+                self._oldest_pending = self._clock()
+
+    async def flush(self, session_factory: SessionFactory) -> int:
+        """
+        Write all pending heartbeats in one batched UPDATE.
+
+        Rows are sorted by controller id so concurrent flushes from several
+        workers lock rows in the same order. On failure the entries are put
+        back for the next flush and the error is re-raised.
+
+        Args:
+            session_factory: Callable returning a new AsyncSession
+
+        Returns:
+            Number of controllers written
+        """
+        pending, age_ms = self.drain()
+        if not pending:
+            return 0
+
+        table = IoTController.__table__
+        statement = (
+            update(table)
+            .where(table.c.id == bindparam("controller_id"))
+            .values(
+                last_heartbeat=bindparam("heartbeat_at"),
+                connectivity_status=bindparam("status"),
+                updated_at=func.now(),
+            )
+        )
+        rows = [
+            {"controller_id": controller_id, "heartbeat_at": at, "status": status}
+            for controller_id, (at, status) in sorted(pending.items())
+        ]
+
+        started = self._clock()
+        try:
+            async with session_factory() as session:
+                await session.execute(statement, rows)
+                await session.commit()
+        except Exception:
+            self.flush_failures += 1
+            self.restore(pending)
+            raise
+
+        elapsed_ms = (self._clock() - started) * 1000
+        self.flushes += 1
+        self.flushed_rows += len(rows)
+        self.last_flush_ms = elapsed_ms
+        self.max_flush_ms = max(self.max_flush_ms, elapsed_ms)
+        self._total_flush_ms += elapsed_ms
+        self.max_staleness_ms = max(self.max_staleness_ms, age_ms + elapsed_ms)
+        return len(rows)
+
+    async def run(self, session_factory: SessionFactory, interval: float) -> None:
+        """Flush every ``interval`` seconds until cancelled, then flush once more."""
+        try:
+            while True:
+                await asyncio.sleep(interval)
+                await self._flush_logged(session_factory)
+        finally:
+            await self._flush_logged(session_factory)
+
+    async def _flush_logged(self, session_factory: SessionFactory) -> None:
+        # Failed entries are already restored; keep the flusher alive
+        try:
+            await self.flush(session_factory)
+        except Exception as e:
+            print(f"Heartbeat flush failed: {e}")
+
+    def stats(self) -> dict[str, Any]:
+        """Report buffer occupancy, backpressure and flush latency."""
+        with self._lock:
+            pending = len(self._pending)
+            oldest = self._oldest_pending
+        return {
+            "pending": pending,
+            "max_controllers": self.max_controllers,
+            "utilization": (
+                pending / self.max_controllers if self.max_controllers else 0.0
+            ),
+            "oldest_pending_ms": (
+                round((self._clock() - oldest) * 1000, 3) if oldest is not None else 0.0
+            ),
+            "received": self.received,
+            "coalesced": self.coalesced,
+            "rejected": self.rejected,
+            "flushes": self.flushes,
+            "flush_failures": self.flush_failures,
+            "flushed_rows": self.flushed_rows,
+            "last_flush_ms": round(self.last_flush_ms, 3),
+            "max_flush_ms": round(self.max_flush_ms, 3),
+            "avg_flush_ms": (
+                round(self._total_flush_ms / self.flushes, 3) if self.flushes else 0.0
+            ),
+            "max_staleness_ms": round(self.max_staleness_ms, 3),
+        }
+
+
+heartbeat_buffer = HeartbeatBuffer(
+    max_controllers=settings.HEARTBEAT_BUFFER_MAX_CONTROLLERS
+)
+
+
+def get_heartbeat_buffer() -> HeartbeatBuffer:
+    """Dependency returning the process-wide heartbeat buffer."""
+    return heartbeat_buffer
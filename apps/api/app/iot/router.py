@@ -0,0 +1,57 @@
+"""IoT heartbeat ingestion router."""
+import math
+
+from fastapi import APIRouter, Depends, Response, status
+
+from app.auth.decorators import require_auth, require_provisioning_specialist
+from app.auth.principal_cache import Principal
+from app.auth.security import get_current_principal
+from app.core.config.settings import settings
+from app.core.schemas.iot_controller import HeartbeatAck, HeartbeatBatch
+from app.iot.fleet import FleetState, get_fleet_state
+from app.iot.heartbeats import HeartbeatBuffer, get_heartbeat_buffer
+
+router = APIRouter()
+
+
+@router.post(
+    "/heartbeats",
+    response_model=HeartbeatAck,
+    status_code=status.HTTP_202_ACCEPTED,
+    responses={503: {"model": HeartbeatAck, "description": "Buffer is full"}},
+)
+@require_auth
+@require_provisioning_specialist
+async def ingest_heartbeats(
+    payload: HeartbeatBatch,
+    response: Response,
+    buffer: HeartbeatBuffer = Depends(get_heartbeat_buffer),
+    fleet: FleetState = Depends(get_fleet_state),
+    current_user: Principal = Depends(get_current_principal),
+) -> HeartbeatAck:
+    """
+    Buffer controller heartbeats for the next batched write.
+
+    Requires provisioning specialist (device) credentials. Heartbeats for
+    controllers the fleet table does not know are counted as ``unknown`` and
+    dropped before they reach the buffer; new controllers are picked up by
+    the next fleet resync.
+
+    Returns 202 once buffered. When the buffer is full, heartbeats for new
+    controllers are shed and the response is 503 with ``Retry-After``;
+    resending the whole batch is safe.
+    """
+    heartbeats = [
+        (heartbeat.controller_id, heartbeat.connectivity_status)
+        for heartbeat in payload.heartbeats
+        if fleet.knows(heartbeat.controller_id)
+    ]
+    unknown = len(payload.heartbeats) - len(heartbeats)
+    accepted, rejected = buffer.submit(heartbeats)
+    fleet.record(accepted)
+    if rejected:
+        response.status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+        response.headers["Retry-After"] = str(
+            math.ceil(settings.HEARTBEAT_FLUSH_INTERVAL_SECONDS)
+        )
+    return HeartbeatAck(accepted=len(accepted), rejected=rejected, unknown=unknown)
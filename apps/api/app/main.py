@@ -1,16 +1,41 @@
-from contextlib import asynccontextmanager
+import asyncio
+from contextlib import asynccontextmanager, suppress
 from typing import Any
 
-from fastapi import FastAPI
+from fastapi import FastAPI, Request, status
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse
+from sqlalchemy.engine import Engine
 
 from app.addresses.router import router as addresses_router
+from app.auth.permission_versions import permission_versions
+from app.auth.rate_limit import RateLimitMiddleware, rate_limiter
 from app.auth.router import router as auth_router
+from app.auth.verification_codes import run_retention
 from app.core.config.settings import settings
+from app.core.constants import NEXT_CURSOR_HEADER
+from app.core.database.session import AsyncSessionLocal
+from app.core.dependencies import get_email_service
+from app.core.emails.invitation_templates import InvitationTemplateRenderer
+from app.core.repositories.exceptions import InvalidCursorError
+from app.core.request_metrics import (
+    RequestTimingMiddleware,
+    request_metrics,
+    time_endpoints,
+    track_queries,
+)
+from app.core.services.email_queue import email_queue
 from app.customers.router import router as customers_router
+from app.health.router import router as health_router
+from app.health.summary import health_summary
+from app.internal.router import router as internal_router
+from app.iot.fleet import fleet_state
+from app.iot.heartbeats import heartbeat_buffer
+from app.iot.router import router as iot_router
 from app.notifications.router import router as notifications_router
 from app.orders.router import router as orders_router
 from app.organizations.router import router as organizations_router
+from app.search.router import router as search_router
 from app.services.router import router as services_router
 from app.stores.router import router as stores_router
 from app.users.router import router as users_router
@@ -22,11 +47,63 @@ async def lifespan(app: FastAPI) -> Any:
     print("🚀 Starting LaundroMate API...")
     print("🔒 Database tables must be created via Alembic migrations")
     print("📚 Run 'alembic upgrade head' to apply pending migrations")
+    heartbeat_flusher = asyncio.create_task(
+        heartbeat_buffer.run(
+            AsyncSessionLocal, settings.HEARTBEAT_FLUSH_INTERVAL_SECONDS
+        )
+    )
+    fleet_monitor = asyncio.create_task(
+        fleet_state.run(
+            AsyncSessionLocal,
+            settings.FLEET_SWEEP_INTERVAL_SECONDS,
+            settings.FLEET_RESYNC_INTERVAL_SECONDS,
+        )
+    )
+    health_resync = asyncio.create_task(
+        health_summary.run(AsyncSessionLocal, settings.FLEET_RESYNC_INTERVAL_SECONDS)
+    )
+    email_sender = asyncio.create_task(email_queue.run(AsyncSessionLocal))
+    email_service = get_email_service(InvitationTemplateRenderer(), email_queue)
+    email_recovery = asyncio.create_task(
+        email_service.run_recovery(
+            AsyncSessionLocal,
+            settings.EMAIL_RECOVERY_INTERVAL_SECONDS,
+            settings.EMAIL_RECOVERY_GRACE_SECONDS,
+            settings.INVITATION_EXPIRATION_DAYS,
+        )
+    )
+
+    permissions_sync = asyncio.create_task(
+        permission_versions.run(
+            AsyncSessionLocal, settings.PERMISSIONS_RESYNC_INTERVAL_SECONDS
+        )
+    )
+    otp_retention = asyncio.create_task(
+        run_retention(
+            AsyncSessionLocal,
+            settings.OTP_RETENTION_INTERVAL_SECONDS,
+            settings.OTP_RETENTION_SECONDS,
+            settings.OTP_RETENTION_BATCH_SIZE,
+        )
+    )
 
     yield
 
     # Shutdown
     print("🛑 Shutting down LaundroMate API...")
+    for task in (
+        otp_retention,
+        permissions_sync,
+        email_recovery,
+        email_sender,
+        health_resync,
+        fleet_monitor,
+        heartbeat_flusher,
+    ):
+        task.cancel()
+        with suppress(asyncio.CancelledError):
+            await task
+    await rate_limiter.backend.close()
 
 
 app = FastAPI(
@@ -36,6 +113,9 @@ app = FastAPI(
     lifespan=lifespan,
 )
 
+# Rate limiting runs inside CORS so 429 responses carry CORS headers
+app.add_middleware(RateLimitMiddleware, limiter=rate_limiter)
+
 # CORS middleware
 app.add_middleware(
     CORSMiddleware,
@@ -43,7 +123,25 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=[NEXT_CURSOR_HEADER, "Server-Timing"],
+)
+
+# Request timing is outermost so it covers rate limiting and CORS too
+app.add_middleware(
+    RequestTimingMiddleware,
+    metrics=request_metrics,
+    server_timing=settings.SERVER_TIMING_ENABLED,
 )
+# Attribute SQL statements of every engine to the request running them
+track_queries(Engine)
+
+
+@app.exception_handler(InvalidCursorError)
+async def invalid_cursor_handler(request: Request, exc: InvalidCursorError) -> Any:
+    return JSONResponse(
+        status_code=status.HTTP_400_BAD_REQUEST, content={"detail": exc.reason}
+    )
+
 
 # Include routers
 app.include_router(auth_router, prefix="/auth", tags=["Authentication"])
@@ -59,6 +157,10 @@ app.include_router(
     organizations_router, prefix="/super-admin/organizations", tags=["Organizations"]
 )
 app.include_router(stores_router, prefix="/super-admin/stores", tags=["Stores"])
+app.include_router(health_router, prefix="/super-admin/health", tags=["System Health"])
+app.include_router(search_router, prefix="/super-admin/search", tags=["Search"])
+app.include_router(iot_router, prefix="/iot", tags=["IoT"])
+app.include_router(internal_router, prefix="/internal", tags=["Internal"])
 
 
 @app.get("/")
@@ -69,3 +171,7 @@ async def root() -> dict:
 @app.get("/health")
 async def health_check() -> dict:
     return {"status": "healthy"}
+
+
+# After every route is added: time_endpoints wraps the routes that exist now
+time_endpoints(app.routes)
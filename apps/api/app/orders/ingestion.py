@@ -0,0 +1,191 @@
+"""Order construction shared by single and bulk order creation."""
+
+import secrets
+from datetime import datetime, timezone
+from typing import Any, List, Optional, Tuple
+
+from sqlalchemy import insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.models.address import Address
+from app.core.models.order import Order, OrderStatus
+from app.core.models.order_item import OrderItem
+from app.core.models.service import Service
+from app.core.schemas.order import OrderBulkResult, OrderCreate
+
+
+def generate_order_number() -> str:
+    """Generate an order number that stays unique within the same second."""
+    timestamp = int(datetime.now(timezone.utc).timestamp())
+    return f"ORD-{timestamp}-{secrets.token_hex(4).upper()}"
+
+
+def build_order_values(
+    payload: OrderCreate,
+) -> Tuple[dict[str, Any], List[dict[str, Any]]]:
+    """Build column values for an order and its items, with computed totals.
+
+    Args:
+        payload: Validated order request
+
+    Returns:
+        Tuple of (order values, item values); item values lack ``order_id``
+    """
+    items = []
+    total = 0.0
+    for item in payload.items:
+        item_total = item.unit_price * max(1, item.quantity)
+        total += item_total
+        items.append(
+            {
+                "service_id": item.service_id,
+                "item_name": item.item_name,
+                "item_type": item.item_type,
+                "quantity": item.quantity,
+                "unit_price": item.unit_price,
+                "total_price": item_total,
+                "weight": item.weight,
+                "special_instructions": item.special_instructions,
+                "fabric_type": item.fabric_type,
+                "color": item.color,
+            }
+        )
+
+    now = datetime.now(timezone.utc)
+    order = {
+        "order_number": generate_order_number(),
+        "customer_id": payload.customer_id,
+        "status": OrderStatus.PENDING,
+        "total_amount": total,
+        "tax_amount": 0.0,
+        "tip_amount": 0.0,
+        "final_amount": total + float(payload.rush_fee or 0.0),
+        "pickup_address_id": payload.pickup_address_id,
+        "pickup_date": payload.pickup_date,
+        "pickup_time_slot": payload.pickup_time_slot,
+        "pickup_instructions": payload.pickup_instructions,
+        "delivery_address_id": payload.delivery_address_id,
+        "delivery_date": payload.delivery_date,
+        "delivery_time_slot": payload.delivery_time_slot,
+        "delivery_instructions": payload.delivery_instructions,
+        "special_requests": payload.special_requests,
+        "is_rush_order": payload.is_rush_order,
+        "rush_fee": payload.rush_fee,
+        # OrderRead requires updated_at, which the column only sets on UPDATE
+        "updated_at": now,
+    }
+    for item_values in items:
+        item_values["updated_at"] = now
+    return order, items
+
+
+async def validate_orders(
+    db: AsyncSession, payloads: List[OrderCreate]
+) -> List[Optional[str]]:
+    """Check the addresses and services orders refer to.
+
+    Referenced addresses and services are each checked with a single query.
+
+    Args:
+        db: Async database session
+        payloads: Orders to check
+
+    Returns:
+        One error message per payload, in request order; None when it is valid
+    """
+    address_ids = {
+        address_id
+        for payload in payloads
+        for address_id in (payload.pickup_address_id, payload.delivery_address_id)
+    }
+    service_ids = {item.service_id for payload in payloads for item in payload.items}
+
+    address_owners: dict[int, int] = dict(
+        (
+            await db.execute(
+                select(Address.id, Address.customer_id).where(
+                    Address.id.in_(address_ids)
+                )
+            )
+        )
+        .tuples()
+        .all()
+    )
+    active_services = set(
+        await db.scalars(
+            select(Service.id).where(
+                Service.id.in_(service_ids), Service.is_active.is_(True)
+            )
+        )
+        if service_ids
+        else []
+    )
+
+    errors: List[Optional[str]] = []
+    for payload in payloads:
+        if (
+            address_owners.get(payload.pickup_address_id) != payload.customer_id
+            or address_owners.get(payload.delivery_address_id) != payload.customer_id
+        ):
+            errors.append("Addresses must belong to the customer")
+        elif any(item.service_id not in active_services for item in payload.items):
+            errors.append("Unknown or inactive service")
+        else:
+            errors.append(None)
+    return errors
+
+
+async def create_orders_bulk(
+    db: AsyncSession, payloads: List[OrderCreate]
+) -> List[OrderBulkResult]:
+    """Validate and insert many orders in one transaction.
+
+    Orders that fail :func:`validate_orders` are reported and skipped; the
+    rest are inserted with two multi-row INSERTs (orders, then items).
+
+    Args:
+        db: Async database session
+        payloads: Orders to create
+
+    Returns:
+        One result per payload, in request order
+    """
+    errors = await validate_orders(db, payloads)
+
+    results: List[OrderBulkResult] = []
+    order_rows: List[dict[str, Any]] = []
+    item_rows: List[List[dict[str, Any]]] = []
+    pending: List[OrderBulkResult] = []
+    for index, (payload, error) in enumerate(zip(payloads, errors)):
+        if error:
+            results.append(OrderBulkResult(index=index, success=False, error=error))
+            continue
+
+        order_values, items = build_order_values(payload)
+        order_rows.append(order_values)
+        item_rows.append(items)
+        result = OrderBulkResult(
+            index=index, success=True, order_number=order_values["order_number"]
+        )
+        results.append(result)
+        pending.append(result)
+
+    if not order_rows:
+        return results
+
+    order_ids = (
+        await db.scalars(
+            insert(Order).returning(Order.id, sort_by_parameter_order=True),
+            order_rows,
+        )
+    ).all()
+    items_to_insert = []
+    for order_id, result, items in zip(order_ids, pending, item_rows):
+        result.order_id = order_id
+        for item_values in items:
+            item_values["order_id"] = order_id
+            items_to_insert.append(item_values)
+    if items_to_insert:
+        await db.execute(insert(OrderItem), items_to_insert)
+    await db.commit()
+    return results
@@ -1,14 +1,35 @@
 from typing import Any, List
 
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.auth.decorators import require_auth
-from app.auth.security import get_current_user
-from app.core.database.session import get_db
+from app.auth.principal_cache import Principal
+from app.auth.security import get_current_principal
+from app.core.constants import (
+    CURSOR_DESCRIPTION,
+    DEFAULT_LIMIT,
+    DEFAULT_SKIP,
+    MAX_LIMIT,
+    MIN_LIMIT,
+)
+from app.core.database.session import get_async_db
 from app.core.models.order import Order
-from app.core.models.user import User
-from app.core.schemas.order import OrderCreate, OrderRead, OrderUpdate, OrderWithDetails
+from app.core.models.order_item import OrderItem
+from app.core.repositories.loaders import with_loader_options
+from app.core.repositories.pagination import build_page, paginate
+from app.core.repositories.rows import select_rows, validate_rows
+from app.core.schemas.order import (
+    OrderBulkCreate,
+    OrderBulkResponse,
+    OrderCreate,
+    OrderRead,
+    OrderUpdate,
+    OrderWithDetails,
+)
+from app.core.serialization import page_response
+from app.orders.ingestion import build_order_values, create_orders_bulk, validate_orders
 
 router = APIRouter()
 
@@ -16,23 +37,28 @@ router = APIRouter()
 @router.get("", response_model=List[OrderRead])
 @require_auth
 async def list_orders(
-    skip: int = 0,
-    limit: int = 50,
-    db: Session = Depends(get_db),
-    _current_user: User = Depends(get_current_user),
+    skip: int = Query(DEFAULT_SKIP, ge=DEFAULT_SKIP),
+    limit: int = Query(DEFAULT_LIMIT, ge=MIN_LIMIT, le=MAX_LIMIT),
+    cursor: str | None = Query(None, description=CURSOR_DESCRIPTION),
+    db: AsyncSession = Depends(get_async_db),
+    current_user: Principal = Depends(get_current_principal),
 ) -> Any:
-    orders = db.query(Order).offset(skip).limit(limit).all()
-    return orders
+    statement = paginate(
+        select_rows(Order, OrderRead), Order, limit, cursor=cursor, skip=skip
+    )
+    page = build_page((await db.execute(statement)).all(), limit)
+    page.items = validate_rows(OrderRead, page.items)
+    return page_response(OrderRead, page)
 
 
 @router.get("/{order_id}", response_model=OrderRead)
 @require_auth
 async def get_order(
     order_id: int,
-    db: Session = Depends(get_db),
-    _current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_async_db),
+    current_user: Principal = Depends(get_current_principal),
 ) -> OrderRead:
-    order = db.query(Order).filter(Order.id == order_id).first()
+    order = await db.get(Order, order_id)
     if not order:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -45,16 +71,17 @@ async def get_order(
 @require_auth
 async def get_order_detail(
     order_id: int,
-    db: Session = Depends(get_db),
-    _current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_async_db),
+    current_user: Principal = Depends(get_current_principal),
 ) -> OrderWithDetails:
-    order = db.query(Order).filter(Order.id == order_id).first()
+    order = await db.scalar(
+        with_loader_options(select(Order).where(Order.id == order_id), OrderWithDetails)
+    )
     if not order:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Order not found",
         )
-    # relationships will load lazily when accessed if configured; return as is
     return order
 
 
@@ -62,112 +89,57 @@ async def get_order_detail(
 @require_auth
 async def create_order(
     payload: OrderCreate,
-    db: Session = Depends(get_db),
-    _current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_async_db),
+    current_user: Principal = Depends(get_current_principal),
 ) -> OrderRead:
-    # Basic validation: addresses belong to the customer
-    from app.core.models.address import Address
-
-    pickup_addr = (
-        db.query(Address)
-        .filter(
-            Address.id == payload.pickup_address_id,
-            Address.customer_id == payload.customer_id,
-        )
-        .first()
-    )
-    delivery_addr = (
-        db.query(Address)
-        .filter(
-            Address.id == payload.delivery_address_id,
-            Address.customer_id == payload.customer_id,
-        )
-        .first()
-    )
-    if not pickup_addr or not delivery_addr:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Addresses must belong to the customer",
-        )
+    # Same checks as the bulk endpoint: addresses and active services
+    (error,) = await validate_orders(db, [payload])
+    if error:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=error)
 
-    # Create order number (simple placeholder)
-    from datetime import datetime as dt
-
-    order_number = f"ORD-{int(dt.utcnow().timestamp())}"
-
-    order = Order(
-        order_number=order_number,
-        customer_id=payload.customer_id,
-        status="pending",
-        total_amount=0.0,
-        tax_amount=0.0,
-        tip_amount=0.0,
-        final_amount=0.0,
-        pickup_address_id=payload.pickup_address_id,
-        pickup_date=payload.pickup_date,
-        pickup_time_slot=payload.pickup_time_slot,
-        pickup_instructions=payload.pickup_instructions,
-        delivery_address_id=payload.delivery_address_id,
-        delivery_date=payload.delivery_date,
-        delivery_time_slot=payload.delivery_time_slot,
-        delivery_instructions=payload.delivery_instructions,
-        special_requests=payload.special_requests,
-        is_rush_order=payload.is_rush_order,
-        rush_fee=payload.rush_fee,
-    )
+    order_values, item_values = build_order_values(payload)
+    order = Order(**order_values)
     db.add(order)
-    db.flush()
-
-    # Add items and compute totals
-    from app.core.models.order_item import OrderItem
-
-    total = 0.0
-    for item in payload.items:
-        item_total = item.unit_price * max(1, item.quantity)
-        total += item_total
-        db.add(
-            OrderItem(
-                order_id=order.id,
-                service_id=item.service_id,
-                item_name=item.item_name,
-                item_type=item.item_type,
-                quantity=item.quantity,
-                unit_price=item.unit_price,
-                total_price=item_total,
-                weight=item.weight,
-                special_instructions=item.special_instructions,
-                fabric_type=item.fabric_type,
-                color=item.color,
-            )
-        )
+    await db.flush()
+    db.add_all(OrderItem(order_id=order.id, **values) for values in item_values)
 
-    order.total_amount = total  # type: ignore
-    order.final_amount = float(
-        total + (float(order.tax_amount or 0.0)) + (float(order.rush_fee or 0.0))
-    )  # type: ignore[assignment]
-
-    db.commit()
-    db.refresh(order)
+    await db.commit()
+    await db.refresh(order)
     return order
 
 
+@router.post("/bulk", response_model=OrderBulkResponse)
+@require_auth
+async def create_orders_bulk_endpoint(
+    payload: OrderBulkCreate,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: Principal = Depends(get_current_principal),
+) -> OrderBulkResponse:
+    """Create many orders in one transaction, reporting a result per order."""
+    results = await create_orders_bulk(db, payload.orders)
+    created = sum(1 for result in results if result.success)
+    return OrderBulkResponse(
+        created=created, failed=len(results) - created, results=results
+    )
+
+
 @router.put("/{order_id}/status", response_model=OrderRead)
 @require_auth
 async def update_order_status(
     order_id: int,
     status_value: str,
-    db: Session = Depends(get_db),
-    _current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_async_db),
+    current_user: Principal = Depends(get_current_principal),
 ) -> OrderRead:
-    order = db.query(Order).filter(Order.id == order_id).first()
+    order = await db.get(Order, order_id)
     if not order:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Order not found",
         )
     order.status = status_value  # type: ignore
-    db.commit()
-    db.refresh(order)
+    await db.commit()
+    await db.refresh(order)
     return order
 
 
@@ -176,10 +148,10 @@ async def update_order_status(
 async def update_order(
     order_id: int,
     payload: OrderUpdate,
-    db: Session = Depends(get_db),
-    _current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_async_db),
+    current_user: Principal = Depends(get_current_principal),
 ) -> OrderRead:
-    order = db.query(Order).filter(Order.id == order_id).first()
+    order = await db.get(Order, order_id)
     if not order:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -189,6 +161,6 @@ async def update_order(
     update_data = payload.model_dump(exclude_unset=True)
     for field, value in update_data.items():
         setattr(order, field, value)
-    db.commit()
-    db.refresh(order)
+    await db.commit()
+    await db.refresh(order)
     return order
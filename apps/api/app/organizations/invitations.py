@@ -0,0 +1,100 @@
+"""Bulk organization-member invitations."""
+
+from datetime import datetime
+from typing import Callable, List, Tuple
+from uuid import UUID
+
+from sqlalchemy import insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.models.invitation import Invitation, InvitationStatus
+from app.core.schemas.invitation import InvitationBulkResult, InviteMemberRequest
+
+# (email, token, invitation id) of an invitation that still needs its email
+CreatedInvitation = Tuple[str, str, UUID]
+
+
+async def create_invitations_bulk(
+    db: AsyncSession,
+    organization_id: UUID,
+    requests: List[InviteMemberRequest],
+    invited_by: UUID,
+    generate_token: Callable[[], str],
+    expires_at: datetime,
+) -> Tuple[List[InvitationBulkResult], List[CreatedInvitation]]:
+    """Create invitations for many invitees in one transaction.
+
+    Emails with a pending invitation to the organization are found with a
+    single query and skipped, as are repeats within the request. The rest
+    are inserted with one multi-row INSERT.
+
+    Args:
+        db: Async database session
+        organization_id: Organization the invitees join
+        requests: Invitees, in request order
+        invited_by: User sending the invitations
+        generate_token: Returns a new invitation token
+        expires_at: Expiration shared by every invitation
+
+    Returns:
+        Tuple of (one result per request, created invitations to email)
+    """
+    emails = {request.email for request in requests}
+    already_invited = set(
+        await db.scalars(
+            select(Invitation.email).where(
+                Invitation.organization_id == organization_id,
+                Invitation.email.in_(emails),
+                Invitation.status == InvitationStatus.PENDING,
+            )
+        )
+    )
+
+    results: List[InvitationBulkResult] = []
+    rows: List[dict] = []
+    pending: List[InvitationBulkResult] = []
+    seen: set[str] = set()
+    for index, request in enumerate(requests):
+        if request.email in already_invited:
+            error = "An invitation has already been sent to this email"
+        elif request.email in seen:
+            error = "Duplicate email in request"
+        else:
+            error = None
+        seen.add(request.email)
+
+        result = InvitationBulkResult(
+            index=index, email=request.email, success=error is None, error=error
+        )
+        results.append(result)
+        if error:
+            continue
+        rows.append(
+            {
+                "email": request.email,
+                "organization_id": organization_id,
+                "organization_role": request.organization_role,
+                "token": generate_token(),
+                "invited_by": invited_by,
+                "expires_at": expires_at,
+                "status": InvitationStatus.PENDING,
+            }
+        )
+        pending.append(result)
+
+    if not rows:
+        return results, []
+
+    invitation_ids = (
+        await db.scalars(
+            insert(Invitation).returning(Invitation.id, sort_by_parameter_order=True),
+            rows,
+        )
+    ).all()
+    await db.commit()
+
+    created: List[CreatedInvitation] = []
+    for invitation_id, result, row in zip(invitation_ids, pending, rows):
+        result.invitation_id = invitation_id
+        created.append((row["email"], row["token"], invitation_id))
+    return results, created
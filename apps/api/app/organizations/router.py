@@ -2,17 +2,30 @@
 from typing import Any, List
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.auth.decorators import require_auth, require_super_admin
-from app.auth.security import get_current_user
-from app.core.constants import DEFAULT_LIMIT, DEFAULT_SKIP, MAX_LIMIT, MIN_LIMIT
-from app.core.database.session import get_db
+from app.auth.principal_cache import Principal
+from app.auth.security import get_current_principal
+from app.core.constants import (
+    CURSOR_DESCRIPTION,
+    DEFAULT_LIMIT,
+    DEFAULT_SKIP,
+    MAX_LIMIT,
+    MIN_LIMIT,
+    NEXT_CURSOR_HEADER,
+)
+from app.core.database.session import get_async_db
 from app.core.dependencies import get_email_service, get_invitation_service
-from app.core.models.user import User
-from app.core.repositories.organization_repository import OrganizationRepository
-from app.core.schemas.invitation import InvitationRead, InviteMemberRequest
+from app.core.repositories.organization_repository import AsyncOrganizationRepository
+from app.core.schemas.invitation import (
+    InvitationBulkResponse,
+    InvitationRead,
+    InviteMemberRequest,
+    InviteMembersBulkRequest,
+)
 from app.core.schemas.organization import (
     OrganizationCreate,
     OrganizationRead,
@@ -20,6 +33,8 @@ from app.core.schemas.organization import (
 )
 from app.core.services.email_service import EmailService
 from app.core.services.invitation_service import InvitationService
+from app.health.summary import HealthSummary, get_health_summary
+from app.organizations.invitations import create_invitations_bulk
 
 router = APIRouter()
 
@@ -28,15 +43,20 @@ router = APIRouter()
 @require_auth
 @require_super_admin
 async def list_organizations(
+    response: Response,
     skip: int = Query(DEFAULT_SKIP, ge=DEFAULT_SKIP),
     limit: int = Query(DEFAULT_LIMIT, ge=MIN_LIMIT, le=MAX_LIMIT),
+    cursor: str | None = Query(None, description=CURSOR_DESCRIPTION),
     status: str | None = Query(None, description="Filter by status"),
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_async_db),
+    current_user: Principal = Depends(get_current_principal),
 ) -> Any:
     """List all organizations with optional filtering and pagination."""
-    repo = OrganizationRepository(db)
-    return repo.list(skip=skip, limit=limit, status=status)
+    repo = AsyncOrganizationRepository(db)
+    page = await repo.list_page(cursor=cursor, limit=limit, status=status, skip=skip)
+    if page.next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = page.next_cursor
+    return page.items
 
 
 @router.get("/{organization_id}", response_model=OrganizationRead)
@@ -44,12 +64,12 @@ async def list_organizations(
 @require_super_admin
 async def get_organization(
     organization_id: UUID,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_async_db),
+    current_user: Principal = Depends(get_current_principal),
 ) -> OrganizationRead:
     """Get a specific organization by ID."""
-    repo = OrganizationRepository(db)
-    org = repo.get_by_id(organization_id)
+    repo = AsyncOrganizationRepository(db)
+    org = await repo.get_by_id(organization_id)
 
     if not org:
         raise HTTPException(
@@ -65,12 +85,12 @@ async def get_organization(
 @require_super_admin
 async def create_organization(
     org_data: OrganizationCreate,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_async_db),
+    current_user: Principal = Depends(get_current_principal),
 ) -> OrganizationRead:
     """Create a new organization."""
-    repo = OrganizationRepository(db)
-    return repo.create(org_data)
+    repo = AsyncOrganizationRepository(db)
+    return await repo.create(org_data)
 
 
 @router.put("/{organization_id}", response_model=OrganizationRead)
@@ -79,12 +99,15 @@ async def create_organization(
 async def update_organization(
     organization_id: UUID,
     org_data: OrganizationUpdate,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_async_db),
+    health: HealthSummary = Depends(get_health_summary),
+    current_user: Principal = Depends(get_current_principal),
 ) -> OrganizationRead:
     """Update an existing organization."""
-    repo = OrganizationRepository(db)
-    return repo.update(organization_id, org_data)
+    repo = AsyncOrganizationRepository(db)
+    organization = await repo.update(organization_id, org_data)
+    health.rename_organization(organization.id, organization.name)
+    return organization
 
 
 @router.delete("/{organization_id}", status_code=status.HTTP_204_NO_CONTENT)
@@ -92,18 +115,20 @@ async def update_organization(
 @require_super_admin
 async def delete_organization(
     organization_id: UUID,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_async_db),
+    health: HealthSummary = Depends(get_health_summary),
+    current_user: Principal = Depends(get_current_principal),
 ) -> None:
     """Delete an organization."""
-    repo = OrganizationRepository(db)
-    deleted = repo.delete(organization_id)
+    repo = AsyncOrganizationRepository(db)
+    deleted = await repo.delete(organization_id)
 
     if not deleted:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Organization not found",
         )
+    health.remove_organization(organization_id)
 
 
 @router.post(
@@ -116,44 +141,117 @@ async def delete_organization(
 async def invite_organization_member(
     organization_id: UUID,
     payload: InviteMemberRequest,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_async_db),
+    current_user: Principal = Depends(get_current_principal),
     invitation_service: InvitationService = Depends(get_invitation_service),
     email_service: EmailService = Depends(get_email_service),
 ) -> InvitationRead:
     """Invite an organization member via email."""
     # Verify organization exists
-    org_repo = OrganizationRepository(db)
-    org = org_repo.get_by_id(organization_id)
+    org_repo = AsyncOrganizationRepository(db)
+    org = await org_repo.get_by_id(organization_id)
     if not org:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Organization not found",
         )
 
-    # Create invitation using service
-    invitation = invitation_service.create_invitation(
+    # InvitationService is sync; run it off the event loop
+    invitation = await run_in_threadpool(
+        invitation_service.create_invitation,
         email=payload.email,
         organization_id=organization_id,
         organization_role=payload.organization_role,
         invited_by=current_user.id,
     )
 
-    # Send invitation email
+    # Queue invitation email; workers send it after the response
     try:
         expiration_days = invitation_service.get_expiration_days()
         # Email template uses store_name but we'll use organization name
         # TODO: Update email templates to be organization-focused
-        email_service.send_invitation_email(
+        queued = email_service.send_invitation_email(
             to_email=payload.email,
             store_name=org.name,  # Using org name as placeholder
             organization_name=org.name,
             invitation_token=invitation.token,
             expiration_days=expiration_days,
+            invitation_id=invitation.id,
         )
+        if not queued:
+            print(
+                f"Email queue full; invitation {invitation.id} will be emailed "
+                "by recovery"
+            )
     except Exception as e:
         # Log error but don't fail the request
         # The invitation is already created in the database
-        print(f"Failed to send invitation email: {e}")
+        print(f"Failed to queue invitation email: {e}")
 
     return invitation
+
+
+@router.post("/{organization_id}/invite-members", response_model=InvitationBulkResponse)
+@require_auth
+@require_super_admin
+async def invite_organization_members(
+    organization_id: UUID,
+    payload: InviteMembersBulkRequest,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: Principal = Depends(get_current_principal),
+    invitation_service: InvitationService = Depends(get_invitation_service),
+    email_service: EmailService = Depends(get_email_service),
+) -> InvitationBulkResponse:
+    """
+    Invite many organization members in one transaction.
+
+    Invitees that already have a pending invitation, or appear twice in the
+    request, are reported and skipped. Emails for the rest are queued as
+    SendGrid batch sends; any the queue cannot take are sent by recovery.
+    """
+    org_repo = AsyncOrganizationRepository(db)
+    org = await org_repo.get_by_id(organization_id)
+    if not org:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Organization not found",
+        )
+
+    results, created = await create_invitations_bulk(
+        db,
+        organization_id,
+        payload.invitations,
+        invited_by=current_user.id,
+        generate_token=invitation_service.generate_token,
+        expires_at=invitation_service.calculate_expiration(),
+    )
+
+    if created:
+        try:
+            queued = email_service.send_invitation_batch(
+                created,
+                store_name=org.name,
+                organization_name=org.name,
+                expiration_days=invitation_service.get_expiration_days(),
+            )
+        except Exception as e:
+            # The invitations are committed; recovery sends their emails
+            print(f"Failed to queue invitation emails: {e}")
+        else:
+            queued_ids = {
+                invitation_id
+                for (_, _, invitation_id), ok in zip(created, queued)
+                if ok
+            }
+            for result in results:
+                result.email_queued = result.invitation_id in queued_ids
+            if len(queued_ids) < len(created):
+                print(
+                    f"Email queue full; {len(created) - len(queued_ids)} "
+                    "invitations will be emailed by recovery"
+                )
+
+    invited = len(created)
+    return InvitationBulkResponse(
+        invited=invited, skipped=len(results) - invited, results=results
+    )
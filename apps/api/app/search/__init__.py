@@ -0,0 +1 @@
+"""Search across organizations, stores, users and IoT controllers."""
@@ -0,0 +1,51 @@
+"""Search router for Super-Admin Dashboard."""
+from typing import Any, List
+
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.auth.decorators import require_auth, require_support_agent
+from app.auth.principal_cache import Principal
+from app.auth.security import get_current_principal
+from app.core.constants import CURSOR_DESCRIPTION, DEFAULT_LIMIT, MAX_LIMIT, MIN_LIMIT
+from app.core.database.session import get_async_db
+from app.core.models.search import MIN_SEARCH_LENGTH, SearchType
+from app.core.models.store import StoreStatus
+from app.core.repositories.search_repository import AsyncSearchRepository
+from app.core.schemas.search import SearchResult
+from app.core.serialization import page_response
+
+router = APIRouter()
+
+
+@router.get("", response_model=List[SearchResult])
+@require_auth
+@require_support_agent
+async def search(
+    q: str = Query(
+        ...,
+        min_length=MIN_SEARCH_LENGTH,
+        max_length=255,
+        description="Text to find in names, emails, phones, locations, MACs or serials",
+    ),
+    types: List[SearchType]
+    | None = Query(
+        None,
+        alias="type",
+        description="Entity types to search; repeat for several, default all",
+    ),
+    store_status: StoreStatus | None = None,
+    limit: int = Query(DEFAULT_LIMIT, ge=MIN_LIMIT, le=MAX_LIMIT),
+    cursor: str | None = Query(None, description=CURSOR_DESCRIPTION),
+    db: AsyncSession = Depends(get_async_db),
+    current_user: Principal = Depends(get_current_principal),
+) -> Any:
+    """Find organizations, stores, users and controllers, best match first.
+
+    Matching is case-insensitive and finds the text anywhere in a field.
+    """
+    repo = AsyncSearchRepository(db)
+    page = await repo.search(
+        q, types=types, store_status=store_status, cursor=cursor, limit=limit
+    )
+    return page_response(SearchResult, page)
@@ -4,10 +4,10 @@ from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.orm import Session
 
 from app.auth.decorators import require_admin, require_auth
-from app.auth.security import get_current_user
+from app.auth.principal_cache import Principal
+from app.auth.security import get_current_principal
 from app.core.database.session import get_db
 from app.core.models.service import Service
-from app.core.models.user import User
 from app.core.schemas.service import ServiceCreate, ServiceRead, ServiceUpdate
 
 router = APIRouter()
@@ -20,7 +20,7 @@ async def list_services(
     limit: int = 100,
     active_only: bool = True,
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_principal),
 ) -> Any:
     """List all services with optional filtering"""
     query = db.query(Service)
@@ -37,7 +37,7 @@ async def list_services(
 async def get_service(
     service_id: int,
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_principal),
 ) -> ServiceRead:
     """Get a specific service by ID"""
     service = db.query(Service).filter(Service.id == service_id).first()
@@ -54,7 +54,7 @@ async def get_service(
 async def create_service(
     service_data: ServiceCreate,
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_principal),
 ) -> ServiceRead:
     """Create a new service (admin only)"""
     # Check if service name already exists
@@ -83,7 +83,7 @@ async def update_service(
     service_id: int,
     service_data: ServiceUpdate,
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_principal),
 ) -> ServiceRead:
     """Update a service (admin only)"""
 
@@ -120,7 +120,7 @@ async def update_service(
 async def delete_service(
     service_id: int,
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_principal),
 ) -> None:
     """Delete a service (admin only)"""
 
@@ -143,7 +143,7 @@ async def get_services_by_category(
     category: str,
     active_only: bool = True,
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_principal),
 ) -> Any:
     """Get services by category"""
     query = db.query(Service).filter(Service.category == category)
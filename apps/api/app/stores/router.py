@@ -3,16 +3,30 @@ from typing import Any, List
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.auth.decorators import require_auth, require_super_admin
-from app.auth.security import get_current_user
-from app.core.constants import DEFAULT_LIMIT, DEFAULT_SKIP, MAX_LIMIT, MIN_LIMIT
-from app.core.database.session import get_db
+from app.auth.principal_cache import Principal
+from app.auth.security import get_current_principal
+from app.core.constants import (
+    CURSOR_DESCRIPTION,
+    DEFAULT_LIMIT,
+    DEFAULT_SKIP,
+    MAX_LIMIT,
+    MIN_LIMIT,
+)
+from app.core.database.session import get_async_db
 from app.core.models.organization import Organization
-from app.core.models.user import User
-from app.core.repositories.store_repository import StoreRepository
-from app.core.schemas.store import StoreCreate, StoreRead, StoreUpdate
+from app.core.repositories.store_repository import AsyncStoreRepository
+from app.core.schemas.store import (
+    StoreConnectivity,
+    StoreCreate,
+    StoreRead,
+    StoreUpdate,
+)
+from app.core.serialization import page_response
+from app.health.summary import HealthSummary, get_health_summary
+from app.iot.fleet import FleetState, get_fleet_state
 
 router = APIRouter()
 
@@ -24,20 +38,24 @@ async def list_stores_by_organization(
     organization_id: UUID,
     skip: int = Query(DEFAULT_SKIP, ge=DEFAULT_SKIP),
     limit: int = Query(DEFAULT_LIMIT, ge=MIN_LIMIT, le=MAX_LIMIT),
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    cursor: str | None = Query(None, description=CURSOR_DESCRIPTION),
+    db: AsyncSession = Depends(get_async_db),
+    current_user: Principal = Depends(get_current_principal),
 ) -> Any:
     """List all stores for a specific organization."""
     # Verify organization exists
-    org = db.query(Organization).filter(Organization.id == organization_id).first()
+    org = await db.get(Organization, organization_id)
     if not org:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Organization not found",
         )
 
-    repo = StoreRepository(db)
-    return repo.list_by_organization(organization_id, skip=skip, limit=limit)
+    repo = AsyncStoreRepository(db)
+    page = await repo.list_by_organization_page(
+        organization_id, cursor=cursor, limit=limit, skip=skip
+    )
+    return page_response(StoreRead, page)
 
 
 @router.post(
@@ -50,12 +68,13 @@ async def list_stores_by_organization(
 async def create_store(
     organization_id: UUID,
     store_data: StoreCreate,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_async_db),
+    health: HealthSummary = Depends(get_health_summary),
+    current_user: Principal = Depends(get_current_principal),
 ) -> StoreRead:
     """Create a new store for an organization."""
     # Verify organization exists
-    org = db.query(Organization).filter(Organization.id == organization_id).first()
+    org = await db.get(Organization, organization_id)
     if not org:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -65,8 +84,10 @@ async def create_store(
     # Ensure store_data.organization_id matches the path parameter
     store_data.organization_id = organization_id
 
-    repo = StoreRepository(db)
-    return repo.create(store_data)
+    repo = AsyncStoreRepository(db)
+    store = await repo.create(store_data)
+    health.upsert_store(store, organization_name=str(org.name))
+    return store
 
 
 @router.get("/{store_id}", response_model=StoreRead)
@@ -74,12 +95,12 @@ async def create_store(
 @require_super_admin
 async def get_store(
     store_id: UUID,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_async_db),
+    current_user: Principal = Depends(get_current_principal),
 ) -> StoreRead:
     """Get a specific store by ID."""
-    repo = StoreRepository(db)
-    store = repo.get_by_id(store_id)
+    repo = AsyncStoreRepository(db)
+    store = await repo.get_by_id(store_id)
 
     if not store:
         raise HTTPException(
@@ -90,18 +111,37 @@ async def get_store(
     return store
 
 
+@router.get("/{store_id}/connectivity", response_model=StoreConnectivity)
+@require_auth
+@require_super_admin
+async def get_store_connectivity(
+    store_id: UUID,
+    fleet: FleetState = Depends(get_fleet_state),
+    current_user: Principal = Depends(get_current_principal),
+) -> StoreConnectivity:
+    """Get live online/offline controller counts for a store.
+
+    Served from the in-memory fleet table without querying the database;
+    stores without controllers report zeros.
+    """
+    return StoreConnectivity(store_id=store_id, **fleet.store_counts(store_id))
+
+
 @router.put("/{store_id}", response_model=StoreRead)
 @require_auth
 @require_super_admin
 async def update_store(
     store_id: UUID,
     store_data: StoreUpdate,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_async_db),
+    health: HealthSummary = Depends(get_health_summary),
+    current_user: Principal = Depends(get_current_principal),
 ) -> StoreRead:
     """Update an existing store."""
-    repo = StoreRepository(db)
-    return repo.update(store_id, store_data)
+    repo = AsyncStoreRepository(db)
+    store = await repo.update(store_id, store_data)
+    health.upsert_store(store)
+    return store
 
 
 @router.delete("/{store_id}", status_code=status.HTTP_204_NO_CONTENT)
@@ -109,15 +149,17 @@ async def update_store(
 @require_super_admin
 async def delete_store(
     store_id: UUID,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_async_db),
+    health: HealthSummary = Depends(get_health_summary),
+    current_user: Principal = Depends(get_current_principal),
 ) -> None:
     """Delete a store."""
-    repo = StoreRepository(db)
-    deleted = repo.delete(store_id)
+    repo = AsyncStoreRepository(db)
+    deleted = await repo.delete(store_id)
 
     if not deleted:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Store not found",
         )
+    health.remove_store(store_id)
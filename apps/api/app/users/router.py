@@ -1,19 +1,26 @@
 from typing import Any, List
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.auth.decorators import require_auth, require_super_admin
-from app.auth.security import get_current_user
-from app.core.database.session import get_db
+from app.auth.permission_versions import permission_versions
+from app.auth.principal_cache import Principal, principal_cache
+from app.auth.security import get_current_principal
+from app.core.constants import CURSOR_DESCRIPTION, DEFAULT_SKIP, MAX_LIMIT, MIN_LIMIT
+from app.core.database.session import get_async_db
 from app.core.models.user import User
+from app.core.repositories.pagination import build_page, paginate
+from app.core.repositories.rows import select_rows, validate_rows
 from app.core.schemas.user import (
     UserActivateRequest,
     UserCreateByAdmin,
     UserRead,
     UserUpdate,
 )
+from app.core.serialization import page_response
 
 router = APIRouter()
 
@@ -22,14 +29,29 @@ router = APIRouter()
 @require_auth
 @require_super_admin
 async def list_users(
-    skip: int = 0,
-    limit: int = 100,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    skip: int = Query(DEFAULT_SKIP, ge=DEFAULT_SKIP),
+    limit: int = Query(MAX_LIMIT, ge=MIN_LIMIT, le=MAX_LIMIT),
+    cursor: str | None = Query(None, description=CURSOR_DESCRIPTION),
+    db: AsyncSession = Depends(get_async_db),
+    current_user: Principal = Depends(get_current_principal),
 ) -> Any:
-    """List all users with pagination (super admin only)"""
-    users = db.query(User).offset(skip).limit(limit).all()
-    return users
+    """List all users with offset or cursor pagination (super admin only)"""
+    statement = paginate(
+        select_rows(User, UserRead), User, limit, cursor=cursor, skip=skip
+    )
+    page = build_page((await db.execute(statement)).all(), limit)
+    page.items = validate_rows(UserRead, page.items)
+    return page_response(UserRead, page)
+
+
+@router.get("/principal-cache/stats")
+@require_auth
+@require_super_admin
+async def get_principal_cache_stats(
+    current_user: Principal = Depends(get_current_principal),
+) -> dict:
+    """Get principal cache hit/miss counters (super admin only)"""
+    return principal_cache.stats()
 
 
 @router.get("/{user_id}", response_model=UserRead)
@@ -37,11 +59,11 @@ async def list_users(
 @require_super_admin
 async def get_user(
     user_id: UUID,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_async_db),
+    current_user: Principal = Depends(get_current_principal),
 ) -> UserRead:
     """Get a specific user by ID (super admin only)"""
-    user = db.query(User).filter(User.id == user_id).first()
+    user = await db.get(User, user_id)
     if not user:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="User not found"
@@ -54,12 +76,12 @@ async def get_user(
 @require_super_admin
 async def create_user(
     user_data: UserCreateByAdmin,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_async_db),
+    current_user: Principal = Depends(get_current_principal),
 ) -> UserRead:
     """Create a new user (super admin only)"""
     # Check if user with phone already exists
-    existing_user = db.query(User).filter(User.phone == user_data.phone).first()
+    existing_user = await db.scalar(select(User).where(User.phone == user_data.phone))
     if existing_user:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -68,8 +90,8 @@ async def create_user(
 
     # Check if user with email already exists (if email provided)
     if user_data.email:
-        existing_email_user = (
-            db.query(User).filter(User.email == user_data.email).first()
+        existing_email_user = await db.scalar(
+            select(User).where(User.email == user_data.email)
         )
         if existing_email_user:
             raise HTTPException(
@@ -80,8 +102,8 @@ async def create_user(
     # Create user
     user = User(**user_data.model_dump())
     db.add(user)
-    db.commit()
-    db.refresh(user)
+    await db.commit()
+    await db.refresh(user)
 
     return user
 
@@ -92,11 +114,11 @@ async def create_user(
 async def update_user(
     user_id: UUID,
     user_data: UserUpdate,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_async_db),
+    current_user: Principal = Depends(get_current_principal),
 ) -> UserRead:
     """Update a user (super admin only)"""
-    user = db.query(User).filter(User.id == user_id).first()
+    user = await db.get(User, user_id)
     if not user:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="User not found"
@@ -111,8 +133,8 @@ async def update_user(
 
     # Check for duplicate phone if phone is being updated
     if user_data.phone and user_data.phone != user.phone:
-        existing_phone_user = (
-            db.query(User).filter(User.phone == user_data.phone).first()
+        existing_phone_user = await db.scalar(
+            select(User).where(User.phone == user_data.phone)
         )
         if existing_phone_user:
             raise HTTPException(
@@ -122,8 +144,8 @@ async def update_user(
 
     # Check for duplicate email if email is being updated
     if user_data.email and user_data.email != user.email:
-        existing_email_user = (
-            db.query(User).filter(User.email == user_data.email).first()
+        existing_email_user = await db.scalar(
+            select(User).where(User.email == user_data.email)
         )
         if existing_email_user:
             raise HTTPException(
@@ -132,12 +154,20 @@ async def update_user(
             )
 
     # Update fields
+    before = Principal.from_user(user)
     update_data = user_data.model_dump(exclude_unset=True)
     for field, value in update_data.items():
         setattr(user, field, value)
 
-    db.commit()
-    db.refresh(user)
+    # Role or active state changed: revoke the user's stateless tokens
+    version = None
+    if Principal.from_user(user) != before:
+        version = await permission_versions.bump(db, user_id)
+    await db.commit()
+    principal_cache.invalidate(user_id)
+    if version is not None:
+        permission_versions.record(user_id, version)
+    await db.refresh(user)
     return user
 
 
@@ -146,13 +176,13 @@ async def update_user(
 @require_super_admin
 async def delete_user(
     user_id: UUID,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_async_db),
+    current_user: Principal = Depends(get_current_principal),
 ) -> None:
     """
     Delete/deactivate a user (super admin only) - soft delete by setting is_active=False
     """
-    user = db.query(User).filter(User.id == user_id).first()
+    user = await db.get(User, user_id)
     if not user:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="User not found"
@@ -166,7 +196,10 @@ async def delete_user(
 
     # Soft delete - set is_active to False
     user.is_active = False  # type: ignore
-    db.commit()
+    version = await permission_versions.bump(db, user_id)
+    await db.commit()
+    principal_cache.invalidate(user_id)
+    permission_versions.record(user_id, version)
     return None
 
 
@@ -176,17 +209,20 @@ async def delete_user(
 async def toggle_user_active(
     user_id: UUID,
     request: UserActivateRequest,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_async_db),
+    current_user: Principal = Depends(get_current_principal),
 ) -> UserRead:
     """Activate or deactivate a user (super admin only)"""
-    user = db.query(User).filter(User.id == user_id).first()
+    user = await db.get(User, user_id)
     if not user:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="User not found"
         )
 
     user.is_active = request.is_active  # type: ignore
-    db.commit()
-    db.refresh(user)
+    version = await permission_versions.bump(db, user_id)
+    await db.commit()
+    principal_cache.invalidate(user_id)
+    permission_versions.record(user_id, version)
+    await db.refresh(user)
     return user
@@ -0,0 +1,530 @@
+"""End-to-end API load test: throughput and tail latency per route.
+
+Drives the real API app in-process at a fixed concurrency with a mixed
+workload, then reports requests/sec and p50/p95/p99 latency for every route.
+The database points at a scratch SQLite file (or ``--database-url``, e.g. a
+local Postgres), which is reset and seeded before the run:
+
+* one super admin, whose bearer token is issued up front
+* ``--organizations`` organizations with ``--stores`` stores each
+* one customer with two addresses and a service, and ``--orders`` orders
+* ``--invitations`` pending invitations
+
+Each virtual user repeatedly picks a scenario by weight (``--weights``):
+
+==================== ==================================================
+``otp_login``        ``POST /auth/otp/request`` + ``POST /auth/otp/verify``
+``order_create``     ``POST /orders``
+``order_list``       ``GET /orders``
+``store_list``       ``GET /super-admin/stores/organizations/{id}/stores``
+``org_list``         ``GET /super-admin/organizations``
+``invitation``       ``GET /auth/invitations/{token}/validate``
+==================== ==================================================
+
+SMS delivery is mocked, so OTP codes are pinned to a known value. Rate
+limiting is switched off, since every virtual user shares one client IP.
+Responses with a status of 400 or above count as errors, not latencies.
+
+``--output`` writes the results as JSON. ``--baseline`` compares against a
+previous JSON file and prints the change in requests/sec and p95 per route.
+
+Usage:
+    python -m benchmarks.api_load --requests 2000 --concurrency 20
+    python -m benchmarks.api_load --output baseline.json
+    python -m benchmarks.api_load --baseline baseline.json --output current.json
+    python -m benchmarks.api_load --database-url postgresql://...
+"""
+
+import argparse
+import asyncio
+import contextlib
+import io
+import json
+import math
+import platform
+import random
+import secrets
+import time
+import uuid
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from typing import Any, AsyncGenerator, Awaitable, Callable, Generator
+from unittest import mock
+
+import httpx
+from sqlalchemy import ARRAY, Table, create_engine, insert
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+
+from app.auth.rate_limit import rate_limiter
+from app.auth.security import create_access_token
+from app.core.database.session import get_async_database_url, get_async_db, get_db
+from app.core.models import Base
+from app.core.models.address import Address
+from app.core.models.customer import Customer
+from app.core.models.invitation import Invitation
+from app.core.models.order import Order
+from app.core.models.organization import Organization
+from app.core.models.service import Service, ServiceCategory
+from app.core.models.store import Store
+from app.core.models.user import User
+from app.main import app
+
+DEFAULT_DATABASE_URL = "sqlite:///./benchmark_api_load.db"
+OTP_CODE = "123456"
+DEFAULT_WEIGHTS = {
+    "otp_login": 10,
+    "order_create": 15,
+    "order_list": 30,
+    "store_list": 20,
+    "org_list": 10,
+    "invitation": 15,
+}
+PERCENTILES = (50, 95, 99)
+
+
+@dataclass
+class Fixtures:
+    """Ids and credentials the scenarios draw from."""
+
+    admin_headers: dict[str, str]
+    organization_ids: list[str]
+    invitation_tokens: list[str]
+    customer_id: int
+    address_ids: list[int]
+    service_id: int
+
+
+@dataclass
+class RouteStats:
+    """Latencies of successful requests and the error count for one route."""
+
+    latencies: list[float] = field(default_factory=list)
+    errors: int = 0
+
+
+def schema_tables(database_url: str) -> list[Table]:
+    """All tables, minus those SQLite cannot create (ARRAY columns)."""
+    tables = list(Base.metadata.sorted_tables)
+    if not database_url.startswith("sqlite"):
+        return tables
+    return [
+        table
+        for table in tables
+        if not any(isinstance(column.type, ARRAY) for column in table.columns)
+    ]
+
+
+def seed(database_url: str, args: argparse.Namespace) -> Fixtures:
+    """Reset the schema and insert the data set described in the module doc."""
+    engine = create_engine(database_url)
+    tables = schema_tables(database_url)
+    Base.metadata.drop_all(engine, tables=tables)
+    Base.metadata.create_all(engine, tables=tables)
+    now = datetime.now(timezone.utc)
+    with Session(engine) as session:
+        admin = User(phone="+15550000000", is_super_admin=True)
+        customer_user = User(phone="+15550000001")
+        organizations = [
+            Organization(
+                name=f"Organization {index}",
+                billing_address=f"{index} Market St",
+                city="Springfield",
+                state="IL",
+                postal_code="62701",
+                country="US",
+            )
+            for index in range(args.organizations)
+        ]
+        session.add_all([admin, customer_user, *organizations])
+        session.flush()
+        customer = Customer(user_id=customer_user.id)
+        service = Service(
+            name="Wash & Fold",
+            category=ServiceCategory.WASH_FOLD,
+            base_price=10.0,
+            price_per_pound=1.5,
+            turnaround_hours=48,
+        )
+        session.add_all([customer, service])
+        session.flush()
+        addresses = [
+            Address(
+                customer_id=customer.id,
+                address_line_1=f"{index} Main St",
+                city="Springfield",
+                state="IL",
+                zip_code="62701",
+                address_type=address_type,
+            )
+            for index, address_type in enumerate(("home", "work"))
+        ]
+        session.add_all(addresses)
+        session.flush()
+
+        session.execute(
+            insert(Store),
+            [
+                {
+                    "id": uuid.uuid4(),
+                    "organization_id": organization.id,
+                    "name": f"Store {organization.name} {index}",
+                    "street_address": f"{index} Main St",
+                    "city": "Springfield",
+                    "state": "IL",
+                    "postal_code": "62701",
+                    "country": "US",
+                }
+                for organization in organizations
+                for index in range(args.stores)
+            ],
+        )
+        if args.orders:
+            session.execute(
+                insert(Order),
+                [
+                    {
+                        "order_number": f"SEED-{index:08d}",
+                        "customer_id": customer.id,
+                        "total_amount": 25.0,
+                        "tax_amount": 2.0,
+                        "final_amount": 27.0,
+                        "pickup_address_id": addresses[0].id,
+                        "pickup_date": now,
+                        "pickup_time_slot": "9:00 AM - 11:00 AM",
+                        "delivery_address_id": addresses[1].id,
+                        "delivery_date": now + timedelta(days=2),
+                        "delivery_time_slot": "9:00 AM - 11:00 AM",
+                        "created_at": now - timedelta(seconds=index),
+                        "updated_at": now,
+                    }
+                    for index in range(args.orders)
+                ],
+            )
+        tokens = [secrets.token_urlsafe(32) for _ in range(args.invitations)]
+        if tokens:
+            session.execute(
+                insert(Invitation),
+                [
+                    {
+                        "id": uuid.uuid4(),
+                        "token": token,
+                        "email": f"invitee{index}@example.com",
+                        "organization_id": organizations[index % len(organizations)].id,
+                        "invited_by": admin.id,
+                        "expires_at": now + timedelta(days=7),
+                    }
+                    for index, token in enumerate(tokens)
+                ],
+            )
+        session.commit()
+        fixtures = Fixtures(
+            admin_headers={
+                "Authorization": f"Bearer {create_access_token(str(admin.id))}"
+            },
+            organization_ids=[str(organization.id) for organization in organizations],
+            invitation_tokens=tokens,
+            customer_id=customer.id,  # type: ignore[arg-type]
+            address_ids=[address.id for address in addresses],  # type: ignore[misc]
+            service_id=service.id,  # type: ignore[arg-type]
+        )
+    engine.dispose()
+    return fixtures
+
+
+def order_payload(fixtures: Fixtures) -> dict[str, Any]:
+    pickup = datetime.now(timezone.utc) + timedelta(days=1)
+    return {
+        "customer_id": fixtures.customer_id,
+        "pickup_address_id": fixtures.address_ids[0],
+        "delivery_address_id": fixtures.address_ids[1],
+        "pickup_date": pickup.isoformat(),
+        "pickup_time_slot": "9:00 AM - 11:00 AM",
+        "delivery_date": (pickup + timedelta(days=1)).isoformat(),
+        "delivery_time_slot": "9:00 AM - 11:00 AM",
+        "items": [
+            {
+                "service_id": fixtures.service_id,
+                "item_name": "Shirt",
+                "item_type": "shirt",
+                "quantity": 3,
+                "unit_price": 5.0,
+            }
+        ],
+    }
+
+
+class LoadRun:
+    """Shared client, fixtures and per-route results of one run."""
+
+    def __init__(self, client: httpx.AsyncClient, fixtures: Fixtures) -> None:
+        self.client = client
+        self.fixtures = fixtures
+        self.routes: dict[str, RouteStats] = {}
+
+    async def call(self, route: str, method: str, url: str, **kwargs: Any) -> Any:
+        """Send one request and record it under ``route``."""
+        stats = self.routes.setdefault(route, RouteStats())
+        started = time.perf_counter()
+        response = await self.client.request(method, url, **kwargs)
+        elapsed = time.perf_counter() - started
+        if response.status_code >= 400:
+            stats.errors += 1
+            return None
+        stats.latencies.append(elapsed)
+        return response.json()
+
+    async def otp_login(self, rng: random.Random, worker: int) -> None:
+        phone = f"+1556{worker:07d}"
+        await self.call(
+            "POST /auth/otp/request", "POST", "/auth/otp/request", json={"phone": phone}
+        )
+        await self.call(
+            "POST /auth/otp/verify",
+            "POST",
+            "/auth/otp/verify",
+            json={"phone": phone, "code": OTP_CODE},
+        )
+
+    async def order_create(self, rng: random.Random, worker: int) -> None:
+        await self.call(
+            "POST /orders",
+            "POST",
+            "/orders",
+            json=order_payload(self.fixtures),
+            headers=self.fixtures.admin_headers,
+        )
+
+    async def order_list(self, rng: random.Random, worker: int) -> None:
+        await self.call(
+            "GET /orders",
+            "GET",
+            "/orders",
+            params={"limit": 100},
+            headers=self.fixtures.admin_headers,
+        )
+
+    async def store_list(self, rng: random.Random, worker: int) -> None:
+        organization_id = rng.choice(self.fixtures.organization_ids)
+        await self.call(
+            "GET /super-admin/stores/organizations/{id}/stores",
+            "GET",
+            f"/super-admin/stores/organizations/{organization_id}/stores",
+            params={"limit": 100},
+            headers=self.fixtures.admin_headers,
+        )
+
+    async def org_list(self, rng: random.Random, worker: int) -> None:
+        await self.call(
+            "GET /super-admin/organizations",
+            "GET",
+            "/super-admin/organizations",
+            params={"limit": 100},
+            headers=self.fixtures.admin_headers,
+        )
+
+    async def invitation(self, rng: random.Random, worker: int) -> None:
+        token = rng.choice(self.fixtures.invitation_tokens)
+        await self.call(
+            "GET /auth/invitations/{token}/validate",
+            "GET",
+            f"/auth/invitations/{token}/validate",
+        )
+
+    async def drive(
+        self, weights: dict[str, int], iterations: int, concurrency: int, seed: int
+    ) -> float:
+        """Run ``iterations`` scenarios over ``concurrency`` virtual users.
+
+        Returns:
+            Wall time of the run in seconds
+        """
+        scenarios: list[Callable[[random.Random, int], Awaitable[None]]] = [
+            getattr(self, name) for name in weights
+        ]
+        remaining = iterations
+
+        async def virtual_user(worker: int) -> None:
+            nonlocal remaining
+            rng = random.Random(seed + worker)
+            while remaining > 0:
+                remaining -= 1
+                scenario = rng.choices(scenarios, weights=list(weights.values()))[0]
+                await scenario(rng, worker)
+
+        started = time.perf_counter()
+        await asyncio.gather(*(virtual_user(worker) for worker in range(concurrency)))
+        return time.perf_counter() - started
+
+
+def percentile(ordered: list[float], pct: float) -> float:
+    """Nearest-rank percentile of an ascending list, in milliseconds."""
+    if not ordered:
+        return 0.0
+    rank = max(math.ceil(pct / 100 * len(ordered)), 1)
+    return ordered[rank - 1] * 1000
+
+
+def summarize(routes: dict[str, RouteStats], elapsed: float) -> dict[str, Any]:
+    """Requests/sec, error count and latency percentiles for each route."""
+    summary: dict[str, Any] = {}
+    for route, stats in sorted(routes.items()):
+        ordered = sorted(stats.latencies)
+        summary[route] = {
+            "requests": len(ordered) + stats.errors,
+            "errors": stats.errors,
+            "rps": round(len(ordered) / elapsed, 2),
+            **{f"p{pct}_ms": round(percentile(ordered, pct), 3) for pct in PERCENTILES},
+        }
+    return summary
+
+
+def parse_weights(spec: str | None) -> dict[str, int]:
+    """Parse ``name=weight,...``, starting from the default mix."""
+    weights = dict(DEFAULT_WEIGHTS)
+    for part in filter(None, (spec or "").split(",")):
+        name, _, weight = part.partition("=")
+        if name not in DEFAULT_WEIGHTS:
+            raise SystemExit(
+                f"Unknown scenario {name!r}; choose from {DEFAULT_WEIGHTS}"
+            )
+        weights[name] = int(weight)
+    return {name: weight for name, weight in weights.items() if weight > 0}
+
+
+def print_report(summary: dict[str, Any], baseline: dict[str, Any] | None) -> None:
+    header = f"{'route':<52} {'reqs':>6} {'err':>5} {'req/s':>8}"
+    header += "".join(f" {f'p{pct} ms':>9}" for pct in PERCENTILES)
+    if baseline:
+        header += f" {'d req/s':>8} {'d p95':>8}"
+    print(header)
+    for route, row in summary.items():
+        line = f"{route:<52} {row['requests']:>6} {row['errors']:>5} {row['rps']:>8.1f}"
+        line += "".join(f" {row[f'p{pct}_ms']:>9.2f}" for pct in PERCENTILES)
+        before = (baseline or {}).get(route)
+        if before:
+            line += f" {change(before['rps'], row['rps']):>8}"
+            line += f" {change(before['p95_ms'], row['p95_ms']):>8}"
+        print(line)
+
+
+def change(before: float, after: float) -> str:
+    return f"{(after - before) / before:+.1%}" if before else "n/a"
+
+
+@contextlib.contextmanager
+def quiet_app() -> Generator[None, None, None]:
+    """Pin OTP codes, disable rate limiting and swallow the mock SMS output."""
+    enabled = rate_limiter.enabled
+    rate_limiter.enabled = False
+    try:
+        with mock.patch("app.auth.router.generate_otp", return_value=OTP_CODE):
+            with contextlib.redirect_stdout(io.StringIO()):
+                yield
+    finally:
+        rate_limiter.enabled = enabled
+
+
+async def run(args: argparse.Namespace) -> dict[str, Any]:
+    fixtures = seed(args.database_url, args)
+    # One connection per virtual user, so requests never wait on the pool
+    sync_engine = create_engine(
+        args.database_url, poolclass=QueuePool, pool_size=args.concurrency
+    )
+    async_engine = create_async_engine(
+        get_async_database_url(args.database_url),
+        poolclass=AsyncAdaptedQueuePool,
+        pool_size=args.concurrency,
+    )
+    sync_session = sessionmaker(bind=sync_engine, autoflush=False)
+    async_session = async_sessionmaker(
+        bind=async_engine, autoflush=False, expire_on_commit=False
+    )
+
+    def override_get_db() -> Generator[Session, None, None]:
+        db = sync_session()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    async def override_get_async_db() -> AsyncGenerator[Any, None]:
+        async with async_session() as db:
+            yield db
+
+    app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_async_db] = override_get_async_db
+    transport = httpx.ASGITransport(app=app)  # type: ignore[arg-type]
+    weights = parse_weights(args.weights)
+    try:
+        with quiet_app():
+            async with httpx.AsyncClient(
+                transport=transport, base_url="http://bench"
+            ) as client:
+                # Warm up routing, dependency and token caches
+                await LoadRun(client, fixtures).drive(
+                    weights, args.warmup, args.concurrency, args.seed
+                )
+                load = LoadRun(client, fixtures)
+                elapsed = await load.drive(
+                    weights, args.requests, args.concurrency, args.seed
+                )
+    finally:
+        app.dependency_overrides.clear()
+        sync_engine.dispose()
+        await async_engine.dispose()
+
+    return {
+        "config": {
+            "database": sync_engine.dialect.name,
+            "python": platform.python_version(),
+            "requests": args.requests,
+            "concurrency": args.concurrency,
+            "seed": args.seed,
+            "weights": weights,
+            "organizations": args.organizations,
+            "stores": args.stores,
+            "orders": args.orders,
+            "invitations": args.invitations,
+        },
+        "elapsed_s": round(elapsed, 3),
+        "routes": summarize(load.routes, elapsed),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--database-url", default=DEFAULT_DATABASE_URL)
+    parser.add_argument("--requests", type=int, default=2_000, help="scenarios")
+    parser.add_argument("--warmup", type=int, default=100, help="scenarios")
+    parser.add_argument("--concurrency", type=int, default=20)
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--weights", help="e.g. order_list=50,otp_login=0")
+    parser.add_argument("--organizations", type=int, default=20)
+    parser.add_argument("--stores", type=int, default=50, help="per organization")
+    parser.add_argument("--orders", type=int, default=5_000)
+    parser.add_argument("--invitations", type=int, default=200)
+    parser.add_argument("--output", help="write results as JSON to this file")
+    parser.add_argument("--baseline", help="JSON results to compare against")
+    args = parser.parse_args()
+
+    results = asyncio.run(run(args))
+    baseline = None
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)["routes"]
+    config = results["config"]
+    print(
+        f"{config['requests']} scenarios, concurrency {config['concurrency']}, "
+        f"{config['database']}, {results['elapsed_s']:.1f}s"
+    )
+    print_report(results["routes"], baseline)
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=2, sort_keys=True)
+            f.write("\n")
+
+
+if __name__ == "__main__":
+    main()
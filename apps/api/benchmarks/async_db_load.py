@@ -0,0 +1,156 @@
+"""Concurrent-request load test: sync Session vs AsyncSession in async routes.
+
+Serves the same deliberately slow query from two ``async def`` routes, one
+backed by a sync ``Session`` (the pattern the routers used before the async
+database layer) and one backed by an ``AsyncSession``. Both are driven with the
+same number of concurrent requests and the throughput of each is reported.
+
+A blocking call inside an ``async def`` handler stalls the whole event loop,
+so the sync route serializes requests while the async route overlaps them.
+
+Usage:
+    python -m benchmarks.async_db_load --requests 200 --concurrency 50
+    python -m benchmarks.async_db_load --database-url postgresql://...
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+from typing import Any
+
+import httpx
+from fastapi import Depends, FastAPI
+from sqlalchemy import create_engine, event, text
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+
+from app.core.database.session import get_async_database_url
+
+DEFAULT_DATABASE_URL = "sqlite:///./benchmark_async_db.db"
+
+# pg_sleep gives a fixed server-side delay. SQLite has no sleep, so one is
+# registered per connection to stand in for a slow database round trip.
+POSTGRES_SLOW_QUERY = "SELECT pg_sleep(:delay)"
+SQLITE_SLOW_QUERY = "SELECT sleep(:delay)"
+
+
+def _register_sqlite_sleep(dbapi_connection: Any, connection_record: Any) -> None:
+    dbapi_connection.create_function("sleep", 1, time.sleep)
+
+
+def build_app(database_url: str, delay: float, pool_size: int) -> FastAPI:
+    """Build an app exposing the slow query via sync and async sessions.
+
+    Args:
+        database_url: Sync SQLAlchemy database URL
+        delay: Simulated query latency in seconds
+        pool_size: Connections per engine, so neither side waits on the pool
+
+    Returns:
+        FastAPI app with ``/sync`` and ``/async`` routes
+    """
+    is_sqlite = database_url.startswith("sqlite")
+    query = text(SQLITE_SLOW_QUERY if is_sqlite else POSTGRES_SLOW_QUERY)
+    params = {"delay": delay}
+
+    sync_engine = create_engine(database_url, poolclass=QueuePool, pool_size=pool_size)
+    async_engine = create_async_engine(
+        get_async_database_url(database_url),
+        poolclass=AsyncAdaptedQueuePool,
+        pool_size=pool_size,
+    )
+    if is_sqlite:
+        for engine in (sync_engine, async_engine.sync_engine):
+            event.listen(engine, "connect", _register_sqlite_sleep)
+    sync_session = sessionmaker(bind=sync_engine, autoflush=False)
+    async_session = async_sessionmaker(
+        bind=async_engine,
+        autoflush=False,
+        expire_on_commit=False,
+    )
+
+    def get_sync_db() -> Any:
+        db = sync_session()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    async def get_async_db() -> Any:
+        async with async_session() as db:
+            yield db
+
+    app = FastAPI()
+
+    @app.get("/sync")
+    async def sync_route(db: Session = Depends(get_sync_db)) -> dict:
+        db.execute(query, params)
+        return {"ok": True}
+
+    @app.get("/async")
+    async def async_route(db: AsyncSession = Depends(get_async_db)) -> dict:
+        await db.execute(query, params)
+        return {"ok": True}
+
+    return app
+
+
+async def drive(app: FastAPI, path: str, requests: int, concurrency: int) -> dict:
+    """Fire ``requests`` GETs at ``path`` with bounded concurrency.
+
+    Returns:
+        Dict with requests/sec and p50/p95 latency in milliseconds
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies: list[float] = []
+    transport = httpx.ASGITransport(app=app)
+
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as c:
+
+        async def one() -> None:
+            async with semaphore:
+                started = time.perf_counter()
+                response = await c.get(path)
+                response.raise_for_status()
+                latencies.append(time.perf_counter() - started)
+
+        await c.get(path)  # warm up connections
+        started = time.perf_counter()
+        await asyncio.gather(*(one() for _ in range(requests)))
+        elapsed = time.perf_counter() - started
+
+    latencies.sort()
+    return {
+        "rps": requests / elapsed,
+        "p50_ms": statistics.median(latencies) * 1000,
+        "p95_ms": latencies[int(len(latencies) * 0.95) - 1] * 1000,
+    }
+
+
+async def run(args: argparse.Namespace) -> None:
+    app = build_app(args.database_url, args.delay, pool_size=args.concurrency)
+    print(f"{args.requests} requests, concurrency {args.concurrency}")
+    for label, path in (
+        ("before (sync Session)", "/sync"),
+        ("after (AsyncSession)", "/async"),
+    ):
+        result = await drive(app, path, args.requests, args.concurrency)
+        print(
+            f"{label:<24} {result['rps']:8.1f} req/s  "
+            f"p50 {result['p50_ms']:7.1f} ms  p95 {result['p95_ms']:7.1f} ms"
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--database-url", default=DEFAULT_DATABASE_URL)
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--delay", type=float, default=0.02)
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
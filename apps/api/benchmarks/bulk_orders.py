@@ -0,0 +1,146 @@
+"""Single-order vs bulk order ingestion throughput.
+
+Drives the real API app in-process: ``--orders`` orders are posted one per
+request to ``POST /orders`` and then in batches to ``POST /orders/bulk``.
+Authentication is overridden with a fixed principal and the database points
+at a scratch SQLite file (or ``--database-url``).
+
+Usage:
+    python -m benchmarks.bulk_orders --orders 500 --batch-size 500
+"""
+
+import argparse
+import asyncio
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+from typing import Any, AsyncGenerator
+
+import httpx
+from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.orm import Session
+
+from app.auth.principal_cache import Principal
+from app.auth.security import get_current_principal
+from app.core.database.session import get_async_database_url, get_async_db
+from app.core.models import Base
+from app.core.models.address import Address
+from app.core.models.customer import Customer
+from app.core.models.order import Order
+from app.core.models.order_item import OrderItem
+from app.core.models.service import Service, ServiceCategory
+from app.core.models.user import User
+from app.main import app
+
+DEFAULT_DATABASE_URL = "sqlite:///./benchmark_bulk_orders.db"
+
+
+def seed(database_url: str) -> dict[str, Any]:
+    """Create a fresh schema with one customer, address and service."""
+    tables = [
+        model.__table__
+        for model in (User, Customer, Address, Service, Order, OrderItem)
+    ]
+    engine = create_engine(database_url)
+    Base.metadata.drop_all(engine, tables=tables)
+    Base.metadata.create_all(engine, tables=tables)
+    with Session(engine) as session:
+        user = User(phone=f"+1{uuid.uuid4().int % 10**10:010d}")
+        session.add(user)
+        session.flush()
+        customer = Customer(user_id=user.id)
+        service = Service(
+            name="Wash & Fold",
+            category=ServiceCategory.WASH_FOLD,
+            base_price=10.0,
+            price_per_pound=1.5,
+            turnaround_hours=48,
+        )
+        session.add_all([customer, service])
+        session.flush()
+        address = Address(
+            customer_id=customer.id,
+            address_line_1="1 Main St",
+            city="New York",
+            state="NY",
+            zip_code="10001",
+            address_type="home",
+        )
+        session.add(address)
+        session.commit()
+        ids = {"customer": customer.id, "address": address.id, "service": service.id}
+    engine.dispose()
+    return ids
+
+
+def order_payload(ids: dict[str, int], items: int) -> dict[str, Any]:
+    pickup = datetime.now(timezone.utc) + timedelta(days=1)
+    return {
+        "customer_id": ids["customer"],
+        "pickup_address_id": ids["address"],
+        "delivery_address_id": ids["address"],
+        "pickup_date": pickup.isoformat(),
+        "pickup_time_slot": "9:00 AM - 11:00 AM",
+        "delivery_date": (pickup + timedelta(days=1)).isoformat(),
+        "delivery_time_slot": "9:00 AM - 11:00 AM",
+        "items": [
+            {
+                "service_id": ids["service"],
+                "item_name": f"Item {index}",
+                "item_type": "shirt",
+                "quantity": 1,
+                "unit_price": 5.0,
+            }
+            for index in range(items)
+        ],
+    }
+
+
+async def run(args: argparse.Namespace) -> None:
+    ids = seed(args.database_url)
+    engine = create_async_engine(get_async_database_url(args.database_url))
+    session_factory = async_sessionmaker(bind=engine, expire_on_commit=False)
+
+    async def override_get_async_db() -> AsyncGenerator[Any, None]:
+        async with session_factory() as db:
+            yield db
+
+    principal = Principal(uuid.uuid4(), True, True, False, False, False)
+    app.dependency_overrides[get_async_db] = override_get_async_db
+    app.dependency_overrides[get_current_principal] = lambda: principal
+
+    payload = order_payload(ids, args.items)
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as c:
+        started = time.perf_counter()
+        for _ in range(args.orders):
+            (await c.post("/orders", json=payload)).raise_for_status()
+        single = args.orders / (time.perf_counter() - started)
+
+        started = time.perf_counter()
+        for offset in range(0, args.orders, args.batch_size):
+            batch = min(args.batch_size, args.orders - offset)
+            response = await c.post("/orders/bulk", json={"orders": [payload] * batch})
+            response.raise_for_status()
+            assert response.json()["failed"] == 0
+        bulk = args.orders / (time.perf_counter() - started)
+
+    app.dependency_overrides.clear()
+    await engine.dispose()
+    print(f"{args.orders} orders x {args.items} items")
+    print(f"POST /orders       {single:9.1f} orders/s")
+    print(f"POST /orders/bulk  {bulk:9.1f} orders/s  ({bulk / single:.1f}x)")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--database-url", default=DEFAULT_DATABASE_URL)
+    parser.add_argument("--orders", type=int, default=500)
+    parser.add_argument("--items", type=int, default=3)
+    parser.add_argument("--batch-size", type=int, default=500)
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+"""Per-render cost of invitation email templates.
+
+Compares three ways of rendering the invitation email (HTML and text):
+
+* ``read+format``: the previous approach, which stats and reads both
+  template files from disk and runs ``str.format`` on every render
+* ``compiled``: ``render_invitation_email`` using the cached, compiled
+  templates (mtime checked at most once a second)
+* ``batch``: ``render_invitation_emails`` over ``--batch`` recipients, which
+  also amortizes the per-call overhead across recipients
+
+Usage:
+    python -m benchmarks.email_templates --renders 20000 --batch 500
+"""
+
+import argparse
+import time
+from typing import Callable
+
+from app.core.emails.invitation_templates import (
+    INVITATION_EMAIL_HTML_TEMPLATE,
+    INVITATION_EMAIL_TEXT_TEMPLATE,
+    InvitationEmailContext,
+    InvitationTemplateRenderer,
+)
+
+
+def per_call_us(fn: Callable[[], object], calls: int) -> float:
+    started = time.perf_counter()
+    for _ in range(calls):
+        fn()
+    return (time.perf_counter() - started) / calls * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--renders", type=int, default=20_000)
+    parser.add_argument("--batch", type=int, default=500)
+    args = parser.parse_args()
+
+    renderer = InvitationTemplateRenderer()
+    context = InvitationEmailContext(
+        store_name="Main Street",
+        organization_name="Acme Laundry",
+        invitation_url="https://app.laundromate.com/auth/accept-invitation?token=abc",
+        expiration_days=7,
+    )
+    values = context._asdict()
+
+    def read_and_format() -> None:
+        for name in (INVITATION_EMAIL_HTML_TEMPLATE, INVITATION_EMAIL_TEXT_TEMPLATE):
+            path = renderer.template_dir / name
+            path.exists()
+            with open(path, "r", encoding="utf-8") as f:
+                f.read().format(**values)
+
+    recipients = [context] * args.batch
+    batches = max(1, args.renders // args.batch)
+
+    baseline = per_call_us(read_and_format, args.renders)
+    compiled = per_call_us(
+        lambda: renderer.render_invitation_email(*context), args.renders
+    )
+    batch = (
+        per_call_us(lambda: renderer.render_invitation_emails(recipients), batches)
+        / args.batch
+    )
+
+    print(f"{'mode':<14} {'us/render':>10} {'speedup':>8}")
+    for name, cost in (
+        ("read+format", baseline),
+        ("compiled", compiled),
+        (f"batch x{args.batch}", batch),
+    ):
+        print(f"{name:<14} {cost:>10.2f} {baseline / cost:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
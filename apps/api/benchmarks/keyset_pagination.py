@@ -0,0 +1,111 @@
+"""Offset vs keyset pagination latency at increasing page depth.
+
+Seeds the ``users`` table with enough rows to reach the deepest page, then
+times fetching single pages through ``UserRepository.list`` (``skip``) and
+``UserRepository.list_page`` (``cursor``). Offset cost grows with the page
+number because the database still walks every skipped row; keyset pages
+start from an index seek on ``(created_at, id)`` and stay flat.
+
+Usage:
+    python -m benchmarks.keyset_pagination --pages 1 100 1000 10000
+    python -m benchmarks.keyset_pagination --database-url postgresql://...
+"""
+
+import argparse
+import statistics
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+from functools import partial
+from typing import Callable
+
+from sqlalchemy import create_engine, func, select
+from sqlalchemy.orm import Session, sessionmaker
+
+from app.core.models import Base
+from app.core.models.user import User
+from app.core.repositories.pagination import encode_cursor
+from app.core.repositories.user_repository import UserRepository
+
+DEFAULT_DATABASE_URL = "sqlite:///./benchmark_pagination.db"
+
+
+def seed(session: Session, rows: int, batch_size: int = 10_000) -> None:
+    """Insert users until the table holds at least ``rows`` rows."""
+    existing = session.scalar(select(func.count()).select_from(User)) or 0
+    start = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    for offset in range(existing, rows, batch_size):
+        batch = range(offset, min(offset + batch_size, rows))
+        session.execute(
+            User.__table__.insert(),
+            [
+                {
+                    "id": uuid.uuid4(),
+                    "phone": f"+1{index:010d}",
+                    "is_active": True,
+                    "is_admin": False,
+                    "is_super_admin": False,
+                    "is_support_agent": False,
+                    "is_provisioning_specialist": False,
+                    # Pairs of equal timestamps exercise the id tie-breaker
+                    "created_at": start + timedelta(milliseconds=index // 2),
+                    "updated_at": start,
+                }
+                for index in batch
+            ],
+        )
+        session.commit()
+
+
+def cursor_before(session: Session, skip: int) -> str | None:
+    """Return the cursor a client would hold after reading ``skip`` rows."""
+    if skip == 0:
+        return None
+    last = session.execute(
+        select(User.created_at, User.id)
+        .order_by(User.created_at, User.id)
+        .offset(skip - 1)
+        .limit(1)
+    ).one()
+    return encode_cursor(last.created_at, last.id)
+
+
+def time_call(fn: Callable[[], object], repeat: int) -> float:
+    """Median wall time of ``fn`` in milliseconds."""
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - started)
+    return statistics.median(samples) * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--database-url", default=DEFAULT_DATABASE_URL)
+    parser.add_argument("--pages", type=int, nargs="+", default=[1, 100, 1000, 10000])
+    parser.add_argument("--page-size", type=int, default=50)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    engine = create_engine(args.database_url)
+    Base.metadata.create_all(engine, tables=[User.__table__])
+    session = sessionmaker(bind=engine)()
+    seed(session, max(args.pages) * args.page_size)
+    repo = UserRepository(session)
+
+    print(f"{'page':>8} {'offset ms':>10} {'keyset ms':>10}")
+    for page in args.pages:
+        skip = (page - 1) * args.page_size
+        cursor = cursor_before(session, skip)
+        offset_ms = time_call(
+            partial(repo.list, skip=skip, limit=args.page_size), args.repeat
+        )
+        keyset_ms = time_call(
+            partial(repo.list_page, cursor=cursor, limit=args.page_size), args.repeat
+        )
+        print(f"{page:>8} {offset_ms:>10.2f} {keyset_ms:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,190 @@
+"""Cost of one 100-row list page: ORM + FastAPI encoding vs the fast path.
+
+Seeds users, stores of one organization and orders, then times building the
+JSON body of one page of each, from query to bytes:
+
+* ``orm``: the previous path. Load ORM objects, convert stores one
+  ``model_validate`` at a time (users and orders were returned as ORM
+  objects), then let FastAPI validate the list against ``response_model``,
+  run ``jsonable_encoder`` and render a ``JSONResponse``.
+* ``rows``: :func:`~app.core.repositories.rows.select_rows` tuples validated
+  in one ``TypeAdapter(list[...])`` call and encoded by
+  :func:`~app.core.serialization.page_response`.
+
+Usage:
+    python -m benchmarks.list_serialization --rows 100 --repeat 200
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Any, Awaitable, Callable, List
+
+from fastapi.responses import JSONResponse
+from fastapi.routing import serialize_response
+from fastapi.utils import create_response_field
+from pydantic import BaseModel
+from sqlalchemy import create_engine, select
+from sqlalchemy.orm import Session, sessionmaker
+
+from app.core.models import Base
+from app.core.models.address import Address
+from app.core.models.customer import Customer
+from app.core.models.order import Order
+from app.core.models.organization import Organization
+from app.core.models.store import Store
+from app.core.models.user import User
+from app.core.repositories.pagination import build_page, paginate
+from app.core.repositories.rows import select_rows, validate_rows
+from app.core.schemas.order import OrderRead
+from app.core.schemas.store import StoreRead
+from app.core.schemas.user import UserRead
+from app.core.serialization import page_response
+
+DEFAULT_DATABASE_URL = "sqlite://"
+TABLES: list[Any] = [User, Organization, Store, Customer, Address, Order]
+
+
+def seed(session: Session, rows: int) -> None:
+    """Insert ``rows`` users, stores and orders."""
+    now = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    users = [
+        User(
+            phone=f"+1{index:010d}",
+            email=f"user{index}@example.com",
+            first_name="Bench",
+            last_name=f"User {index}",
+            created_at=now + timedelta(seconds=index),
+            updated_at=now,
+        )
+        for index in range(rows)
+    ]
+    organization = Organization(
+        name="Bench Org",
+        billing_address="1 Main St",
+        city="Springfield",
+        state="IL",
+        postal_code="62701",
+        country="US",
+    )
+    session.add_all([*users, organization])
+    session.flush()
+    session.add_all(
+        Store(
+            organization_id=organization.id,
+            name=f"Store {index}",
+            street_address=f"{index} Main St",
+            city="Springfield",
+            state="IL",
+            postal_code="62701",
+            country="US",
+        )
+        for index in range(rows)
+    )
+    customer = Customer(user_id=users[0].id)
+    session.add(customer)
+    session.flush()
+    address = Address(
+        customer_id=customer.id,
+        address_line_1="1 Main St",
+        city="Springfield",
+        state="IL",
+        zip_code="62701",
+        address_type="home",
+    )
+    session.add(address)
+    session.flush()
+    session.add_all(
+        Order(
+            order_number=f"ORD-{index:06d}",
+            customer_id=customer.id,
+            total_amount=25.0,
+            tax_amount=2.0,
+            final_amount=27.0,
+            pickup_address_id=address.id,
+            pickup_date=now,
+            pickup_time_slot="9:00 AM - 11:00 AM",
+            delivery_address_id=address.id,
+            delivery_date=now + timedelta(days=2),
+            delivery_time_slot="9:00 AM - 11:00 AM",
+            updated_at=now,
+        )
+        for index in range(rows)
+    )
+    session.commit()
+
+
+def orm_page(
+    session: Session, model: Any, schema: type[BaseModel], limit: int
+) -> Callable[[], Awaitable[bytes]]:
+    field = create_response_field(name="response", type_=List[schema])  # type: ignore
+    validate_each = model is Store
+
+    async def run() -> bytes:
+        statement = paginate(select(model), model, limit)
+        page = build_page(session.scalars(statement).all(), limit)
+        items = page.items
+        if validate_each:
+            items = [schema.model_validate(item) for item in items]
+        content = await serialize_response(
+            field=field, response_content=items, is_coroutine=True
+        )
+        return bytes(JSONResponse(content).body)
+
+    return run
+
+
+def rows_page(
+    session: Session, model: Any, schema: type[BaseModel], limit: int
+) -> Callable[[], Awaitable[bytes]]:
+    async def run() -> bytes:
+        statement = paginate(select_rows(model, schema), model, limit)
+        page = build_page(session.execute(statement).all(), limit)
+        page.items = validate_rows(schema, page.items)
+        return bytes(page_response(schema, page).body)
+
+    return run
+
+
+async def time_us(fn: Callable[[], Awaitable[bytes]], repeat: int) -> float:
+    """Median wall time of ``fn`` in microseconds."""
+    await fn()
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        await fn()
+        samples.append(time.perf_counter() - started)
+    return statistics.median(samples) * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--database-url", default=DEFAULT_DATABASE_URL)
+    parser.add_argument("--rows", type=int, default=100)
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args()
+
+    engine = create_engine(args.database_url)
+    Base.metadata.create_all(engine, tables=[model.__table__ for model in TABLES])
+    session = sessionmaker(bind=engine)()
+    seed(session, args.rows)
+
+    print(f"{'entity':<8} {'orm us':>9} {'rows us':>9} {'speedup':>8}")
+    for name, model, schema in (
+        ("users", User, UserRead),
+        ("stores", Store, StoreRead),
+        ("orders", Order, OrderRead),
+    ):
+        before = asyncio.run(
+            time_us(orm_page(session, model, schema, args.rows), args.repeat)
+        )
+        after = asyncio.run(
+            time_us(rows_page(session, model, schema, args.rows), args.repeat)
+        )
+        print(f"{name:<8} {before:>9.0f} {after:>9.0f} {before / after:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
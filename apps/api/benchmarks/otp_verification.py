@@ -0,0 +1,115 @@
+"""OTP verification latency as ``verification_codes`` grows.
+
+Seeds the table with mostly used and expired codes, the way it fills up
+when nothing deletes them, and keeps one live code per phone. At each table
+size it times the ``verify_otp`` lookup (phone, code, unused, unexpired)
+for random phones. The lookup is served by the partial index over unused
+codes, which only holds live codes, so latency should stay flat however many
+dead rows accumulate.
+
+Usage:
+    python -m benchmarks.otp_verification --rows 100000 1000000 10000000
+    python -m benchmarks.otp_verification --database-url postgresql://...
+"""
+
+import argparse
+import random
+import statistics
+import time
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import create_engine, func, select
+from sqlalchemy.engine import Connection
+
+from app.core.models import Base
+from app.core.models.verification_code import VerificationCode
+
+DEFAULT_DATABASE_URL = "sqlite:///./benchmark_otp.db"
+LIVE_CODE = "424242"
+
+
+def phone(index: int) -> str:
+    return f"+1{index:010d}"
+
+
+def seed(connection: Connection, rows: int, phones: int, batch_size: int) -> None:
+    """Insert dead codes until the table holds at least ``rows`` rows."""
+    table = VerificationCode.__table__
+    now = datetime.now(timezone.utc)
+    existing = connection.scalar(select(func.count()).select_from(table)) or 0
+    if existing == 0:
+        connection.execute(
+            table.insert(),
+            [
+                {
+                    "phone": phone(index),
+                    "code": LIVE_CODE,
+                    "expires_at": now + timedelta(days=1),
+                    "is_used": False,
+                }
+                for index in range(phones)
+            ],
+        )
+        existing = phones
+    for offset in range(existing, rows, batch_size):
+        connection.execute(
+            table.insert(),
+            [
+                {
+                    "phone": phone(index % phones),
+                    "code": f"{index % 1_000_000:06d}",
+                    "expires_at": now - timedelta(minutes=index % 10_000),
+                    "is_used": index % 3 != 0,
+                }
+                for index in range(offset, min(offset + batch_size, rows))
+            ],
+        )
+        connection.commit()
+
+
+def measure(connection: Connection, phones: int, repeat: int) -> tuple[float, float]:
+    """Return (p50, p99) verify lookup latency in milliseconds."""
+    rng = random.Random(0)
+    now = datetime.now(timezone.utc)
+    samples = []
+    for _ in range(repeat):
+        statement = select(VerificationCode.id).where(
+            VerificationCode.phone == phone(rng.randrange(phones)),
+            VerificationCode.code == LIVE_CODE,
+            VerificationCode.is_used == False,  # noqa: E712
+            VerificationCode.expires_at > now,
+        )
+        started = time.perf_counter()
+        assert connection.execute(statement).first() is not None
+        samples.append((time.perf_counter() - started) * 1000)
+    samples.sort()
+    return statistics.median(samples), samples[int(len(samples) * 0.99) - 1]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--database-url", default=DEFAULT_DATABASE_URL)
+    parser.add_argument(
+        "--rows", type=int, nargs="+", default=[100_000, 1_000_000, 10_000_000]
+    )
+    parser.add_argument("--phones", type=int, default=50_000)
+    parser.add_argument("--batch-size", type=int, default=50_000)
+    parser.add_argument("--repeat", type=int, default=500)
+    args = parser.parse_args()
+
+    engine = create_engine(args.database_url)
+    Base.metadata.create_all(engine, tables=[VerificationCode.__table__])
+    print(f"{'rows':>12} {'seed s':>8} {'p50 ms':>8} {'p99 ms':>8}")
+    with engine.connect() as connection:
+        for rows in sorted(args.rows):
+            started = time.perf_counter()
+            seed(connection, rows, args.phones, args.batch_size)
+            connection.commit()
+            seeded = time.perf_counter() - started
+            p50, p99 = measure(connection, args.phones, args.repeat)
+            print(f"{rows:>12} {seeded:>8.1f} {p50:>8.3f} {p99:>8.3f}")
+    engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,138 @@
+"""System health endpoint latency at fleet scale.
+
+Builds an in-memory fleet of ``--stores`` stores with ``--controllers`` IoT
+controllers each (no database), then drives ``GET /super-admin/health``
+through the real app in-process. Each scenario reports p50/p99 latency:
+
+* ``steady``: no connectivity changes, so cached views are reused
+* ``churn``: a controller flips online/offline before every request, so the
+  filtered, sorted view is rebuilt each time
+
+Usage:
+    python -m benchmarks.system_health --stores 10000 --controllers 8
+"""
+
+import argparse
+import asyncio
+import random
+import statistics
+import time
+import uuid
+from typing import Any, Callable
+
+import httpx
+
+from app.auth.principal_cache import Principal
+from app.auth.security import get_current_principal
+from app.core.models.iot_controller import ConnectivityStatus
+from app.core.models.store import StoreStatus
+from app.health.summary import HealthSummary, StoreEntry, get_health_summary
+from app.iot.fleet import FleetState
+from app.main import app
+
+CITIES = ["Austin", "Dallas", "Houston", "Denver", "Boston", "Seattle", "Miami"]
+
+
+def build_fleet(stores: int, controllers: int) -> tuple[HealthSummary, list[Any]]:
+    """Create a summary over ``stores`` stores with mixed connectivity."""
+    rng = random.Random(0)
+    fleet = FleetState(offline_after_seconds=90)
+    summary = HealthSummary(fleet)
+    organizations = [(uuid.uuid4(), f"Organization {index}") for index in range(500)]
+    entries = []
+    rows: list[tuple[uuid.UUID, uuid.UUID, None, None]] = []
+    for index in range(stores):
+        organization_id, organization_name = organizations[index % len(organizations)]
+        entry = StoreEntry(
+            store_id=uuid.uuid4(),
+            store_name=f"Store {index:05d}",
+            organization_id=organization_id,
+            organization_name=organization_name,
+            city=CITIES[index % len(CITIES)],
+            state="TX",
+            status=StoreStatus.ACTIVE,
+        )
+        entries.append(entry)
+        rows.extend(
+            (uuid.uuid4(), entry.store_id, None, None) for _ in range(controllers)
+        )
+    summary.load(entries)
+    fleet.load(rows)
+    fleet.record(
+        (row[0], ConnectivityStatus.ONLINE if rng.random() < 0.97 else OFFLINE)
+        for row in rows
+    )
+    return summary, [row[0] for row in rows]
+
+
+OFFLINE = ConnectivityStatus.OFFLINE
+SCENARIOS: dict[str, dict[str, Any]] = {
+    "first page": {},
+    "status=offline": {"status": "offline"},
+    "status=partial": {"status": "partial"},
+    "city+org filter": {"city": "austin", "q": "organization 7"},
+    "deep page": {"skip": 5000, "limit": 100},
+}
+
+
+async def measure(
+    client: httpx.AsyncClient,
+    params: dict[str, Any],
+    repeat: int,
+    before: Callable[[], None],
+) -> tuple[float, float]:
+    """Return (p50, p99) latency in milliseconds."""
+    samples = []
+    for _ in range(repeat):
+        before()
+        started = time.perf_counter()
+        response = await client.get("/super-admin/health", params=params)
+        samples.append((time.perf_counter() - started) * 1000)
+        response.raise_for_status()
+    samples.sort()
+    return statistics.median(samples), samples[int(len(samples) * 0.99) - 1]
+
+
+async def run(args: argparse.Namespace) -> None:
+    started = time.perf_counter()
+    summary, controller_ids = build_fleet(args.stores, args.controllers)
+    print(
+        f"{args.stores} stores x {args.controllers} controllers "
+        f"built in {time.perf_counter() - started:.1f}s"
+    )
+
+    principal = Principal(uuid.uuid4(), True, True, True, False, False)
+    app.dependency_overrides[get_current_principal] = lambda: principal
+    app.dependency_overrides[get_health_summary] = lambda: summary
+
+    rng = random.Random(1)
+    fleet = summary._fleet
+
+    def flip() -> None:
+        status = rng.choice([ConnectivityStatus.ONLINE, OFFLINE])
+        fleet.record([(rng.choice(controller_ids), status)])
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as c:
+        header = f"{'steady p50':>10} {'p99':>7} {'churn p50':>10} {'p99':>7}"
+        print(f"{'scenario':<18} {header}")
+        for name, params in SCENARIOS.items():
+            steady = await measure(c, params, args.repeat, lambda: None)
+            churn = await measure(c, params, args.repeat, flip)
+            print(
+                f"{name:<18} {steady[0]:>10.2f} {steady[1]:>7.2f} "
+                f"{churn[0]:>10.2f} {churn[1]:>7.2f}"
+            )
+    app.dependency_overrides.clear()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--stores", type=int, default=10_000)
+    parser.add_argument("--controllers", type=int, default=8)
+    parser.add_argument("--repeat", type=int, default=200)
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
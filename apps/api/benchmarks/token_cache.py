@@ -0,0 +1,92 @@
+"""Per-request CPU saved by the verified token cache.
+
+Two measurements, each with the token cache disabled and enabled:
+
+* ``decode``: ``decode_access_token`` on one token, repeated
+* ``request``: a full authenticated request (``GET
+  /users/principal-cache/stats``) through the ASGI app, repeated with the
+  same bearer token. The principal is pre-cached so neither mode touches
+  the database, leaving token handling as the only difference.
+
+CPU time is process time, so waiting on the event loop is not counted.
+
+Usage:
+    python -m benchmarks.token_cache --decodes 50000 --requests 2000
+"""
+
+import argparse
+import asyncio
+import time
+from typing import Callable
+from uuid import uuid4
+
+import httpx
+
+from app.auth.principal_cache import Principal, principal_cache
+from app.auth.security import create_access_token, decode_access_token
+from app.auth.token_cache import token_cache
+from app.main import app
+
+
+def cpu_us_per_call(fn: Callable[[], object], calls: int) -> float:
+    started = time.process_time()
+    for _ in range(calls):
+        fn()
+    return (time.process_time() - started) / calls * 1e6
+
+
+async def request_cpu_us(headers: dict[str, str], requests: int) -> float:
+    transport = httpx.ASGITransport(app=app)  # type: ignore[arg-type]
+    async with httpx.AsyncClient(transport=transport, base_url="http://api") as c:
+        # Warm up routing and dependency caches
+        response = await c.get("/users/principal-cache/stats", headers=headers)
+        response.raise_for_status()
+        started = time.process_time()
+        for _ in range(requests):
+            await c.get("/users/principal-cache/stats", headers=headers)
+        return (time.process_time() - started) / requests * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--decodes", type=int, default=50_000)
+    parser.add_argument("--requests", type=int, default=2_000)
+    args = parser.parse_args()
+
+    user_id = uuid4()
+    principal_cache.max_size = max(principal_cache.max_size, 1)
+    principal_cache.set(
+        Principal(
+            id=user_id,
+            is_active=True,
+            is_admin=False,
+            is_super_admin=True,
+            is_support_agent=False,
+            is_provisioning_specialist=False,
+        )
+    )
+    token = create_access_token(subject=str(user_id))
+    headers = {"Authorization": f"Bearer {token}"}
+
+    results = {}
+    for mode, max_size in (("uncached", 0), ("cached", 10_000)):
+        token_cache.clear()
+        token_cache.max_size = max_size
+        results[mode] = (
+            cpu_us_per_call(lambda: decode_access_token(token), args.decodes),
+            asyncio.run(request_cpu_us(headers, args.requests)),
+        )
+
+    print(f"{'mode':<10} {'decode us':>10} {'request us':>11}")
+    for mode, (decode, request) in results.items():
+        print(f"{mode:<10} {decode:>10.2f} {request:>11.2f}")
+    (decode_before, request_before), (decode_after, request_after) = results.values()
+    print(
+        f"saved: {decode_before - decode_after:.2f} us/decode, "
+        f"{request_before - request_after:.2f} us/request "
+        f"({(request_before - request_after) / request_before:.1%} of request CPU)"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,8 +1,15 @@
 # apps/api/cli.py
 import subprocess
+import time
+from datetime import datetime, timezone
 from pathlib import Path
+from typing import Optional
 
 import typer
+from sqlalchemy import create_engine
+
+from app.core.config.settings import settings
+from app.dev.synthetic_fleet import FleetSpec, generate_fleet
 
 app = typer.Typer(help="🧺 LaundroMate Database Migration CLI")
 
@@ -139,5 +146,77 @@ def fresh() -> None:
             raise typer.Exit(1)
 
 
+@app.command("generate-fleet")
+def generate_fleet_command(
+    organizations: int = typer.Option(100, help="Organizations to create"),
+    stores_per_organization: int = typer.Option(10, help="Stores per organization"),
+    controllers_per_store: int = typer.Option(8, help="IoT controllers per store"),
+    staff_per_store: int = typer.Option(2, help="Operators per store"),
+    customers: int = typer.Option(100_000, help="Customers to create"),
+    addresses_per_customer: int = typer.Option(2, help="Addresses per customer"),
+    orders: int = typer.Option(1_000_000, help="Orders to create"),
+    items_per_order: int = typer.Option(2, help="Items per order"),
+    notifications_per_order: int = typer.Option(1, help="Notifications per order"),
+    days: int = typer.Option(365, help="Days of order history before --until"),
+    until: Optional[datetime] = typer.Option(
+        None,
+        formats=["%Y-%m-%d"],
+        help="End of the generated history in UTC (default: start of today)",
+    ),
+    seed: int = typer.Option(0, help="Random seed; same seed, same data"),
+    batch_size: int = typer.Option(50_000, help="Rows per committed batch"),
+    workers: int = typer.Option(1, help="Processes writing orders (not SQLite)"),
+    database_url: Optional[str] = typer.Option(
+        None, help="Target database (default: DATABASE_URL)"
+    ),
+    yes: bool = typer.Option(False, "--yes", "-y", help="Skip the confirmation"),
+) -> None:
+    """Bulk-generate a synthetic fleet for capacity testing"""
+    spec = FleetSpec(
+        organizations=organizations,
+        stores_per_organization=stores_per_organization,
+        controllers_per_store=controllers_per_store,
+        staff_per_store=staff_per_store,
+        customers=customers,
+        addresses_per_customer=addresses_per_customer,
+        orders=orders,
+        items_per_order=items_per_order,
+        notifications_per_order=notifications_per_order,
+        days=days,
+        seed=seed,
+        batch_size=batch_size,
+    )
+    if until is None:
+        until = datetime.now(timezone.utc).replace(
+            hour=0, minute=0, second=0, microsecond=0
+        )
+    else:
+        until = until.replace(tzinfo=timezone.utc)
+    url = database_url or settings.DATABASE_URL
+
+    typer.echo("🏭 Synthetic fleet")
+    typer.echo("==================")
+    for table, count in spec.row_counts().items():
+        typer.echo(f"  {table:<20} {count:>14,}")
+    typer.echo(f"  into {url.rpartition('@')[2]}")
+
+    if not yes and not typer.confirm("Continue?"):
+        raise typer.Exit()
+
+    started = time.perf_counter()
+
+    def progress(phase: str, done: int, total: int) -> None:
+        elapsed = time.perf_counter() - started
+        typer.echo(f"  {phase:<14} {done:>12,}/{total:,}  ({elapsed:.0f}s)")
+
+    engine = create_engine(url)
+    try:
+        counts = generate_fleet(engine, spec, until, progress, workers)
+    finally:
+        engine.dispose()
+    elapsed = time.perf_counter() - started
+    typer.echo(f"✅ Wrote {sum(counts.values()):,} rows in {elapsed:.1f}s")
+
+
 if __name__ == "__main__":
     app()
@@ -6,16 +6,24 @@ and test data creation across all test modules.
 """
 
 import asyncio
-from typing import Generator
+import functools
+from collections import Counter
+from typing import Any, AsyncGenerator, Callable, Generator, Optional, Sequence, TypeVar
 
 import pytest
 from fastapi.testclient import TestClient
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Engine
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import Session, sessionmaker
-from sqlalchemy.pool import StaticPool
+from sqlalchemy.pool import NullPool, StaticPool
 
+from app.auth.permission_versions import permission_versions
+from app.auth.principal_cache import principal_cache
+from app.auth.rate_limit import rate_limiter
 from app.auth.security import create_access_token
-from app.core.database.session import get_db
+from app.auth.token_cache import token_cache
+from app.core.database.session import get_async_database_url, get_async_db, get_db
 from app.core.models import Base
 from app.core.models.address import Address  # noqa: F401
 from app.core.models.customer import Customer
@@ -25,6 +33,7 @@ from app.core.models.order_item import OrderItem  # noqa: F401
 from app.core.models.service import Service, ServiceCategory
 from app.core.models.user import User
 from app.core.models.verification_code import VerificationCode  # noqa: F401
+from app.core.request_metrics import RequestTiming, current_timing
 from app.main import app
 
 # Test database URL - using SQLite for tests
@@ -40,6 +49,108 @@ engine = create_engine(
 # Create test session factory
 TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# Async engine over the same database file for routes using get_async_db.
+# NullPool because each TestClient runs its own event loop.
+async_engine = create_async_engine(
+    get_async_database_url(TEST_DATABASE_URL), poolclass=NullPool
+)
+TestingAsyncSessionLocal = async_sessionmaker(
+    bind=async_engine, autoflush=False, expire_on_commit=False
+)
+
+
+TestFunction = TypeVar("TestFunction", bound=Callable[..., Any])
+
+
+class QueryBudget:
+    """
+    Fail when a request runs more SQL statements than its budget.
+
+    Statements are counted per request served while the budget is active.
+    Statements run outside a request, e.g. by fixtures through ``db_session``,
+    are not counted. A statement repeated more than ``max_repeats`` times in
+    one request (same SQL, any parameters) is reported as a likely N+1 and
+    fails the budget as well.
+
+    Use it around requests, or decorate a whole test with :func:`query_budget`::
+
+        with QueryBudget(2):
+            client.get("/orders", headers=auth_headers)
+    """
+
+    def __init__(
+        self,
+        max_statements: int,
+        max_repeats: int = 2,
+        engines: Optional[Sequence[Engine]] = None,
+    ) -> None:
+        self.max_statements = max_statements
+        self.max_repeats = max_repeats
+        self.engines = engines or (engine, async_engine.sync_engine)
+        self.requests: dict[RequestTiming, list[str]] = {}
+
+    def _record(self, conn: Any, cursor: Any, statement: str, *args: Any) -> None:
+        timing = current_timing()
+        if timing is not None:
+            self.requests.setdefault(timing, []).append(" ".join(statement.split()))
+
+    def __enter__(self) -> "QueryBudget":
+        for target in self.engines:
+            event.listen(target, "before_cursor_execute", self._record)
+        return self
+
+    def __exit__(self, exc_type: Any, *args: Any) -> None:
+        for target in self.engines:
+            event.remove(target, "before_cursor_execute", self._record)
+        problems = self.problems()
+        if exc_type is None and problems:
+            pytest.fail("\n\n".join(problems), pytrace=False)
+
+    def problems(self) -> list[str]:
+        """Describe every request over budget or repeating a statement."""
+        problems = []
+        for timing, statements in self.requests.items():
+            repeated = [
+                (statement, count)
+                for statement, count in Counter(statements).items()
+                if count > self.max_repeats
+            ]
+            if len(statements) <= self.max_statements and not repeated:
+                continue
+            lines = [
+                f"{timing.name}: {len(statements)} SQL statements "
+                f"(budget {self.max_statements})"
+            ]
+            lines += [
+                f"  likely N+1, run {count} times: {statement}"
+                for statement, count in repeated
+            ]
+            lines += [
+                f"  {number}. {statement}"
+                for number, statement in enumerate(statements, 1)
+            ]
+            problems.append("\n".join(lines))
+        return problems
+
+
+def query_budget(
+    max_statements: int, max_repeats: int = 2
+) -> Callable[[TestFunction], TestFunction]:
+    """Decorate a test so every request it makes stays within a query budget.
+
+    The budget is per request and includes authentication lookups.
+    """
+
+    def decorate(test: TestFunction) -> TestFunction:
+        @functools.wraps(test)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            with QueryBudget(max_statements, max_repeats):
+                return test(*args, **kwargs)
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorate
+
 
 @pytest.fixture(scope="session")
 def event_loop() -> Generator[asyncio.AbstractEventLoop, None, None]:
@@ -49,6 +160,32 @@ def event_loop() -> Generator[asyncio.AbstractEventLoop, None, None]:
     loop.close()
 
 
+@pytest.fixture(autouse=True)
+def clear_principal_cache() -> Generator[None, None, None]:
+    """Start every test with empty principal and token caches."""
+    principal_cache.clear()
+    token_cache.clear()
+    yield
+    principal_cache.clear()
+    token_cache.clear()
+
+
+@pytest.fixture(autouse=True)
+def clear_permission_versions() -> Generator[None, None, None]:
+    """Start every test with no recorded permissions versions."""
+    permission_versions.clear()
+    yield
+    permission_versions.clear()
+
+
+@pytest.fixture(autouse=True)
+def clear_rate_limits() -> Generator[None, None, None]:
+    """Start every test with full rate limit buckets."""
+    rate_limiter.clear()
+    yield
+    rate_limiter.clear()
+
+
 @pytest.fixture(scope="function")
 def db_session() -> Generator[Session, None, None]:
     """
@@ -72,7 +209,7 @@ def db_session() -> Generator[Session, None, None]:
 @pytest.fixture(scope="function")
 def client(db_session: Session) -> Generator[TestClient, None, None]:
     """
-    Create a test client with overridden database dependency.
+    Create a test client with overridden sync and async database dependencies.
     """
 
     def override_get_db() -> Generator[Session, None, None]:
@@ -81,7 +218,12 @@ def client(db_session: Session) -> Generator[TestClient, None, None]:
         finally:
             pass
 
+    async def override_get_async_db() -> AsyncGenerator[AsyncSession, None]:
+        async with TestingAsyncSessionLocal() as async_session:
+            yield async_session
+
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_async_db] = override_get_async_db
 
     with TestClient(app) as test_client:
         yield test_client
@@ -201,6 +343,30 @@ def super_admin_auth_headers(super_admin_user: User) -> dict:
     return {"Authorization": f"Bearer {access_token}"}
 
 
+@pytest.fixture
+def provisioning_specialist_user(db_session: Session) -> User:
+    """Create a test provisioning specialist (device credential) user."""
+    user = User(
+        email="provisioning@example.com",
+        first_name="Provisioning",
+        last_name="Specialist",
+        phone="+1234567893",
+        is_active=True,
+        is_provisioning_specialist=True,
+    )
+    db_session.add(user)
+    db_session.commit()
+    db_session.refresh(user)
+    return user
+
+
+@pytest.fixture
+def provisioning_auth_headers(provisioning_specialist_user: User) -> dict:
+    """Create authentication headers for provisioning specialist requests."""
+    access_token = create_access_token(subject=str(provisioning_specialist_user.id))
+    return {"Authorization": f"Bearer {access_token}"}
+
+
 # Test data fixtures
 @pytest.fixture
 def sample_user_data() -> dict:
@@ -3,11 +3,19 @@ Integration tests for authentication routes.
 """
 
 from datetime import datetime, timedelta, timezone
+from typing import Generator
 
+import pytest
 from fastapi.testclient import TestClient
 from sqlalchemy.orm import Session
 
+from app.auth.principal_cache import ROLE_ACTIVE
+from app.auth.rate_limit import rate_limiter
+from app.auth.security import decode_access_token
+from app.core.config.settings import settings
+from app.core.database.session import get_db
 from app.core.models.verification_code import VerificationCode
+from app.main import app
 
 
 class TestAuthRoutes:
@@ -86,3 +94,136 @@ class TestAuthRoutes:
 
         assert response.status_code == 400
         assert "Invalid or expired OTP" in response.json()["detail"]
+
+
+class TestRateLimiting:
+    """Test rate limits on the unauthenticated auth endpoints."""
+
+    def test_otp_request_limited_per_phone(
+        self, client: TestClient, db_session: Session
+    ) -> None:
+        """Test that a phone over its limit gets 429 without a DB session."""
+        sessions = []
+
+        def counting_get_db() -> Generator[Session, None, None]:
+            sessions.append(db_session)
+            yield db_session
+
+        app.dependency_overrides[get_db] = counting_get_db
+        payload = {"phone": "+1234567890"}
+        burst = rate_limiter.rules[0].capacity
+
+        statuses = [
+            client.post("/auth/otp/request", json=payload).status_code
+            for _ in range(burst)
+        ]
+        response = client.post("/auth/otp/request", json=payload)
+
+        assert statuses == [200] * burst
+        assert response.status_code == 429
+        assert int(response.headers["Retry-After"]) > 0
+        assert len(sessions) == burst
+        assert db_session.query(VerificationCode).count() == burst
+
+        # Another phone from the same client is still served
+        other = client.post("/auth/otp/request", json={"phone": "+1234567891"})
+        assert other.status_code == 200
+
+    def test_otp_verify_limited_per_phone(self, client: TestClient) -> None:
+        """Test that guessing codes for one phone is cut off."""
+        burst = rate_limiter.rules[1].capacity
+        payload = {"phone": "+1234567890", "code": "000000"}
+
+        statuses = [
+            client.post("/auth/otp/verify", json=payload).status_code
+            for _ in range(burst + 1)
+        ]
+
+        assert statuses == [400] * burst + [429]
+
+    def test_requests_limited_per_ip(
+        self, client: TestClient, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that one client is limited across phones and endpoints."""
+        monkeypatch.setattr(rate_limiter, "ip_capacity", 2)
+
+        first = client.post("/auth/otp/request", json={"phone": "+1234567890"})
+        second = client.post("/auth/otp/request", json={"phone": "+1234567891"})
+        third = client.get("/auth/invitations/some-token/validate")
+
+        assert [first.status_code, second.status_code] == [200, 200]
+        assert third.status_code == 429
+
+    def test_invitation_validation_limited_per_token(self, client: TestClient) -> None:
+        """Test that one invitation token is limited."""
+        burst = rate_limiter.rules[2].capacity
+
+        statuses = {
+            client.get("/auth/invitations/unknown-token/validate").status_code
+            for _ in range(burst)
+        }
+        response = client.get("/auth/invitations/unknown-token/validate")
+
+        assert 429 not in statuses
+        assert response.status_code == 429
+
+    def test_unlimited_routes_are_not_counted(
+        self, client: TestClient, auth_headers: dict
+    ) -> None:
+        """Test that routes without a rule do not touch the limiter."""
+        for _ in range(3):
+            client.get("/auth/me", headers=auth_headers)
+
+        assert rate_limiter.stats()["allowed"] == 0
+        assert rate_limiter.stats()["rejected"] == 0
+
+
+class TestStatelessTokenIssue:
+    """Test the claims put into tokens issued at login."""
+
+    def test_verify_otp_issues_role_claims(
+        self,
+        client: TestClient,
+        db_session: Session,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Test that logins carry the role bitmask and permissions version."""
+        monkeypatch.setattr(settings, "AUTH_STATELESS_TOKENS", True)
+        db_session.add(
+            VerificationCode(
+                phone="+1234567890",
+                code="123456",
+                expires_at=datetime.now(timezone.utc) + timedelta(minutes=10),
+                is_used=False,
+            )
+        )
+        db_session.commit()
+
+        response = client.post(
+            "/auth/otp/verify", json={"phone": "+1234567890", "code": "123456"}
+        )
+
+        payload = decode_access_token(response.json()["access_token"])
+        assert payload["rol"] == ROLE_ACTIVE
+        assert payload["pv"] == 0
+
+    def test_claims_are_off_by_default(
+        self, client: TestClient, db_session: Session
+    ) -> None:
+        """Test that tokens only carry sub and exp unless enabled."""
+        db_session.add(
+            VerificationCode(
+                phone="+1234567890",
+                code="123456",
+                expires_at=datetime.now(timezone.utc) + timedelta(minutes=10),
+                is_used=False,
+            )
+        )
+        db_session.commit()
+
+        response = client.post(
+            "/auth/otp/verify", json={"phone": "+1234567890", "code": "123456"}
+        )
+
+        payload = decode_access_token(response.json()["access_token"])
+        assert set(payload) == {"sub", "exp"}
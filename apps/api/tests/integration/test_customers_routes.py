@@ -0,0 +1,75 @@
+"""Integration tests for customer routes."""
+from datetime import datetime, timezone
+
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+
+from app.core.models.address import Address
+from app.core.models.customer import Customer
+from app.core.models.user import User
+from tests.conftest import query_budget
+
+
+class TestGetCurrentCustomer:
+    """Test GET /customers/me endpoint."""
+
+    @query_budget(3)
+    def test_get_current_customer_with_addresses(
+        self,
+        client: TestClient,
+        auth_headers: dict,
+        test_customer: Customer,
+        db_session: Session,
+    ) -> None:
+        """Test that the current customer is returned with user and addresses."""
+        now = datetime.now(timezone.utc)
+        test_customer.updated_at = now  # type: ignore
+        for zip_code in ("10001", "10002"):
+            db_session.add(
+                Address(
+                    customer_id=test_customer.id,
+                    address_line_1="123 Main St",
+                    city="New York",
+                    state="NY",
+                    zip_code=zip_code,
+                    address_type="home",
+                    updated_at=now,
+                )
+            )
+        db_session.commit()
+
+        response = client.get("/customers/me", headers=auth_headers)
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["id"] == test_customer.id
+        assert data["user"]["phone"] == "+1234567890"
+        assert sorted(a["zip_code"] for a in data["addresses"]) == ["10001", "10002"]
+
+    def test_get_current_customer_not_found(
+        self, client: TestClient, auth_headers: dict, test_user: User
+    ) -> None:
+        """Test that a user without a customer profile gets 404."""
+        response = client.get("/customers/me", headers=auth_headers)
+
+        assert response.status_code == 404
+
+
+class TestUpdateCustomer:
+    """Test PUT /customers/{id} endpoint."""
+
+    def test_update_customer_success(
+        self, client: TestClient, admin_auth_headers: dict, test_customer: Customer
+    ) -> None:
+        """Test updating a customer profile as admin."""
+        response = client.put(
+            f"/customers/{test_customer.id}",
+            json={"loyalty_points": 250, "is_vip": True},
+            headers=admin_auth_headers,
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["loyalty_points"] == 250
+        assert data["is_vip"] is True
+        assert data["user"]["id"] == str(test_customer.user_id)
@@ -0,0 +1,145 @@
+"""Integration tests for system health routes."""
+import asyncio
+from typing import Generator
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+
+from app.core.models.iot_controller import DeviceType, IoTController
+from app.core.models.organization import Organization
+from app.core.models.store import Store
+from app.health.summary import HealthSummary, get_health_summary
+from app.iot.fleet import FleetState, get_fleet_state
+from app.main import app
+from tests.conftest import TestingAsyncSessionLocal
+
+
+@pytest.fixture
+def organization(db_session: Session) -> Organization:
+    """Create an organization with two stores; only Downtown has a controller."""
+    org = Organization(
+        name="Sunny Laundromat LLC",
+        billing_address="123 Main St",
+        city="Austin",
+        state="TX",
+        postal_code="73301",
+        country="US",
+    )
+    db_session.add(org)
+    db_session.flush()
+    for name, city in [("Downtown", "Austin"), ("Uptown", "Dallas")]:
+        db_session.add(
+            Store(
+                organization_id=org.id,
+                name=name,
+                street_address="1 Store Ave",
+                city=city,
+                state="TX",
+                postal_code="73301",
+                country="US",
+            )
+        )
+    db_session.flush()
+    downtown = db_session.query(Store).filter(Store.name == "Downtown").one()
+    db_session.add(
+        IoTController(
+            store_id=downtown.id,
+            mac_address="AA:BB:CC:DD:EE:01",
+            machine_label="Washer 1",
+            device_type=DeviceType.WASHER,
+        )
+    )
+    db_session.commit()
+    return org
+
+
+@pytest.fixture
+def summary(organization: Organization) -> Generator[HealthSummary, None, None]:
+    """Serve health from a summary rebuilt from the test database."""
+    fleet = FleetState(offline_after_seconds=60)
+    test_summary = HealthSummary(fleet)
+    asyncio.run(fleet.rebuild(TestingAsyncSessionLocal))
+    asyncio.run(test_summary.rebuild(TestingAsyncSessionLocal))
+    app.dependency_overrides[get_fleet_state] = lambda: fleet
+    app.dependency_overrides[get_health_summary] = lambda: test_summary
+    yield test_summary
+    app.dependency_overrides.pop(get_fleet_state, None)
+    app.dependency_overrides.pop(get_health_summary, None)
+
+
+class TestGetSystemHealth:
+    """Test GET /super-admin/health endpoint."""
+
+    def test_system_health_success(
+        self,
+        client: TestClient,
+        super_admin_auth_headers: dict,
+        summary: HealthSummary,
+    ) -> None:
+        """Test listing health for every store."""
+        response = client.get("/super-admin/health", headers=super_admin_auth_headers)
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["total"] == 2
+        downtown = next(i for i in data["items"] if i["store_name"] == "Downtown")
+        assert downtown["organization_name"] == "Sunny Laundromat LLC"
+        assert downtown["connectivity_status"] == "unknown"
+        assert downtown["total_controllers"] == 1
+        assert downtown["last_heartbeat"] is None
+
+    def test_system_health_filters(
+        self,
+        client: TestClient,
+        super_admin_auth_headers: dict,
+        summary: HealthSummary,
+    ) -> None:
+        """Test filtering by location and name."""
+        response = client.get(
+            "/super-admin/health",
+            params={"city": "dallas", "q": "up"},
+            headers=super_admin_auth_headers,
+        )
+
+        assert response.status_code == 200
+        assert [item["store_name"] for item in response.json()["items"]] == ["Uptown"]
+
+    def test_store_provisioning_updates_summary(
+        self,
+        client: TestClient,
+        super_admin_auth_headers: dict,
+        organization: Organization,
+        summary: HealthSummary,
+    ) -> None:
+        """Test that creating a store adds it without waiting for a resync."""
+        response = client.post(
+            f"/super-admin/stores/organizations/{organization.id}/stores",
+            json={
+                "organization_id": str(organization.id),
+                "name": "Midtown",
+                "street_address": "3 Store Ave",
+                "city": "Houston",
+                "state": "TX",
+                "postal_code": "77001",
+                "country": "US",
+            },
+            headers=super_admin_auth_headers,
+        )
+        assert response.status_code == 201
+
+        health = client.get(
+            "/super-admin/health",
+            params={"city": "Houston"},
+            headers=super_admin_auth_headers,
+        ).json()
+        assert health["total"] == 1
+        assert health["items"][0]["organization_name"] == "Sunny Laundromat LLC"
+
+    def test_system_health_requires_super_admin(
+        self, client: TestClient, auth_headers: dict
+    ) -> None:
+        """Test that system health requires super admin privileges."""
+        response = client.get("/super-admin/health", headers=auth_headers)
+
+        assert response.status_code == 403
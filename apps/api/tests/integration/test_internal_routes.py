@@ -0,0 +1,52 @@
+"""Integration tests for internal diagnostics routes."""
+from fastapi.testclient import TestClient
+
+
+class TestDbPoolMetrics:
+    """Test GET /internal/db-pool endpoint."""
+
+    def test_db_pool_metrics_success(
+        self, client: TestClient, super_admin_auth_headers: dict
+    ) -> None:
+        """Test that super admins can read pool telemetry."""
+        response = client.get("/internal/db-pool", headers=super_admin_auth_headers)
+
+        assert response.status_code == 200
+        data = response.json()
+        assert "pid" in data
+        assert [pool["name"] for pool in data["pools"]] == ["sync", "async"]
+        assert "wait_time_avg_ms" in data["pools"][0]
+
+    def test_db_pool_metrics_requires_super_admin(
+        self, client: TestClient, auth_headers: dict
+    ) -> None:
+        """Test that pool telemetry requires super admin privileges."""
+        response = client.get("/internal/db-pool", headers=auth_headers)
+
+        assert response.status_code == 403
+
+
+class TestRateLimitMetrics:
+    """Test GET /internal/rate-limits endpoint."""
+
+    def test_rate_limit_metrics_success(
+        self, client: TestClient, super_admin_auth_headers: dict
+    ) -> None:
+        """Test that super admins can read rate limiter counters."""
+        client.post("/auth/otp/request", json={"phone": "+1234567890"})
+
+        response = client.get("/internal/rate-limits", headers=super_admin_auth_headers)
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["backend"] == "MemoryRateLimitBackend"
+        assert data["allowed"] == 1
+        assert data["rejected"] == 0
+
+    def test_rate_limit_metrics_requires_super_admin(
+        self, client: TestClient, auth_headers: dict
+    ) -> None:
+        """Test that rate limiter counters require super admin privileges."""
+        response = client.get("/internal/rate-limits", headers=auth_headers)
+
+        assert response.status_code == 403
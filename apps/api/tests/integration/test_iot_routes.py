@@ -0,0 +1,294 @@
+"""Integration tests for IoT heartbeat ingestion routes."""
+import asyncio
+from datetime import datetime, timedelta, timezone
+from typing import Generator
+from uuid import uuid4
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+
+from app.core.models.iot_controller import ConnectivityStatus, DeviceType, IoTController
+from app.core.models.organization import Organization
+from app.core.models.store import Store
+from app.iot.fleet import FleetState, get_fleet_state
+from app.iot.heartbeats import HeartbeatBuffer, get_heartbeat_buffer
+from app.main import app
+from tests.conftest import TestingAsyncSessionLocal, query_budget
+
+
+@pytest.fixture
+def controllers(db_session: Session) -> list[IoTController]:
+    """Create a store with a washer and a dryer."""
+    org = Organization(
+        name="Heartbeat Org",
+        billing_address="1 Org St",
+        city="New York",
+        state="NY",
+        postal_code="10001",
+        country="US",
+    )
+    db_session.add(org)
+    db_session.flush()
+    store = Store(
+        organization_id=org.id,
+        name="Heartbeat Store",
+        street_address="2 Store Ave",
+        city="New York",
+        state="NY",
+        postal_code="10002",
+        country="US",
+    )
+    db_session.add(store)
+    db_session.flush()
+    created = [
+        IoTController(
+            store_id=store.id,
+            mac_address=f"AA:BB:CC:DD:EE:0{index}",
+            machine_label=f"Machine {index}",
+            device_type=device_type,
+        )
+        for index, device_type in enumerate([DeviceType.WASHER, DeviceType.DRYER])
+    ]
+    db_session.add_all(created)
+    db_session.commit()
+    return created
+
+
+@pytest.fixture
+def buffer() -> Generator[HeartbeatBuffer, None, None]:
+    """Route heartbeats into a small buffer owned by the test."""
+    test_buffer = HeartbeatBuffer(max_controllers=2)
+    app.dependency_overrides[get_heartbeat_buffer] = lambda: test_buffer
+    yield test_buffer
+    app.dependency_overrides.pop(get_heartbeat_buffer, None)
+
+
+@pytest.fixture
+def fleet() -> Generator[FleetState, None, None]:
+    """Route fleet lookups to a table owned by the test."""
+    test_fleet = FleetState(offline_after_seconds=60)
+    app.dependency_overrides[get_fleet_state] = lambda: test_fleet
+    yield test_fleet
+    app.dependency_overrides.pop(get_fleet_state, None)
+
+
+class TestIngestHeartbeats:
+    """Test POST /iot/heartbeats endpoint."""
+
+    def test_heartbeats_are_coalesced_and_flushed(
+        self,
+        client: TestClient,
+        provisioning_auth_headers: dict,
+        db_session: Session,
+        controllers: list[IoTController],
+        buffer: HeartbeatBuffer,
+        fleet: FleetState,
+    ) -> None:
+        """Test that repeats coalesce and one flush updates every controller."""
+        washer, dryer = controllers
+        asyncio.run(fleet.rebuild(TestingAsyncSessionLocal))
+        for status in ["online", "offline"]:
+            response = client.post(
+                "/iot/heartbeats",
+                json={
+                    "heartbeats": [
+                        {"controller_id": str(washer.id)},
+                        {"controller_id": str(dryer.id), "connectivity_status": status},
+                    ]
+                },
+                headers=provisioning_auth_headers,
+            )
+            assert response.status_code == 202
+            assert response.json() == {"accepted": 2, "rejected": 0, "unknown": 0}
+
+        assert len(buffer) == 2
+        assert buffer.coalesced == 2
+        assert asyncio.run(buffer.flush(TestingAsyncSessionLocal)) == 2
+        assert len(buffer) == 0
+
+        db_session.expire_all()
+        assert washer.connectivity_status == ConnectivityStatus.ONLINE
+        assert dryer.connectivity_status == ConnectivityStatus.OFFLINE
+        assert washer.last_heartbeat is not None
+        assert buffer.stats()["flushed_rows"] == 2
+
+    def test_full_buffer_sheds_new_controllers(
+        self,
+        client: TestClient,
+        provisioning_auth_headers: dict,
+        controllers: list[IoTController],
+        buffer: HeartbeatBuffer,
+        fleet: FleetState,
+    ) -> None:
+        """Test that a full buffer returns 503 and only records what it kept."""
+        washer, dryer = controllers
+        asyncio.run(fleet.rebuild(TestingAsyncSessionLocal))
+        buffer.max_controllers = 1
+        response = client.post(
+            "/iot/heartbeats",
+            json={
+                "heartbeats": [
+                    {"controller_id": str(controller.id)} for controller in controllers
+                ]
+            },
+            headers=provisioning_auth_headers,
+        )
+
+        assert response.status_code == 503
+        assert response.headers["Retry-After"]
+        assert response.json() == {"accepted": 1, "rejected": 1, "unknown": 0}
+        assert buffer.stats()["rejected"] == 1
+        assert fleet.status_of(washer.id) == ConnectivityStatus.ONLINE  # type: ignore
+        assert fleet.status_of(dryer.id) == ConnectivityStatus.UNKNOWN  # type: ignore
+
+    def test_unknown_controllers_never_reach_the_buffer(
+        self,
+        client: TestClient,
+        provisioning_auth_headers: dict,
+        controllers: list[IoTController],
+        buffer: HeartbeatBuffer,
+        fleet: FleetState,
+    ) -> None:
+        """Test that ids missing from the fleet table are dropped up front."""
+        washer, _ = controllers
+        asyncio.run(fleet.rebuild(TestingAsyncSessionLocal))
+
+        response = client.post(
+            "/iot/heartbeats",
+            json={
+                "heartbeats": [
+                    {"controller_id": str(uuid4())},
+                    {"controller_id": str(uuid4())},
+                    {"controller_id": str(washer.id)},
+                ]
+            },
+            headers=provisioning_auth_headers,
+        )
+
+        assert response.status_code == 202
+        assert response.json() == {"accepted": 1, "rejected": 0, "unknown": 2}
+        assert len(buffer) == 1
+        assert buffer.received == 1
+
+    def test_customer_token_is_forbidden(
+        self,
+        client: TestClient,
+        auth_headers: dict,
+        controllers: list[IoTController],
+        buffer: HeartbeatBuffer,
+        fleet: FleetState,
+    ) -> None:
+        """Test that non-provisioning users cannot submit heartbeats."""
+        asyncio.run(fleet.rebuild(TestingAsyncSessionLocal))
+
+        response = client.post(
+            "/iot/heartbeats",
+            json={"heartbeats": [{"controller_id": str(controllers[0].id)}]},
+            headers=auth_headers,
+        )
+
+        assert response.status_code == 403
+        assert len(buffer) == 0
+
+    def test_heartbeats_require_authentication(
+        self, client: TestClient, buffer: HeartbeatBuffer
+    ) -> None:
+        """Test that heartbeat ingestion requires a bearer token."""
+        response = client.post(
+            "/iot/heartbeats",
+            json={"heartbeats": [{"controller_id": str(uuid4())}]},
+        )
+
+        assert response.status_code in (401, 403)
+        assert len(buffer) == 0
+
+
+class TestFleetConnectivity:
+    """Test the fleet table against the database and the connectivity route."""
+
+    @query_budget(1)
+    def test_heartbeats_update_store_connectivity(
+        self,
+        client: TestClient,
+        provisioning_auth_headers: dict,
+        super_admin_auth_headers: dict,
+        controllers: list[IoTController],
+        buffer: HeartbeatBuffer,
+        fleet: FleetState,
+    ) -> None:
+        """Test that ingested heartbeats show up in the store's counts."""
+        washer, dryer = controllers
+        asyncio.run(fleet.rebuild(TestingAsyncSessionLocal))
+        url = f"/super-admin/stores/{washer.store_id}/connectivity"
+        assert client.get(url, headers=super_admin_auth_headers).json()["unknown"] == 2
+
+        client.post(
+            "/iot/heartbeats",
+            json={"heartbeats": [{"controller_id": str(washer.id)}]},
+            headers=provisioning_auth_headers,
+        )
+
+        response = client.get(url, headers=super_admin_auth_headers)
+        assert response.status_code == 200
+        assert response.json() == {
+            "store_id": str(washer.store_id),
+            "online": 1,
+            "offline": 0,
+            "unknown": 1,
+            "total": 2,
+        }
+
+    def test_connectivity_requires_super_admin(
+        self, client: TestClient, auth_headers: dict, fleet: FleetState
+    ) -> None:
+        """Test that store connectivity requires super admin privileges."""
+        response = client.get(
+            f"/super-admin/stores/{uuid4()}/connectivity", headers=auth_headers
+        )
+
+        assert response.status_code == 403
+
+    def test_offline_flips_skip_fresh_rows(
+        self,
+        db_session: Session,
+        controllers: list[IoTController],
+        fleet: FleetState,
+    ) -> None:
+        """Test that persisting offline flips leaves fresh heartbeats alone."""
+        washer, dryer = controllers
+        now = datetime.now(timezone.utc)
+        washer.last_heartbeat = now - timedelta(minutes=5)  # type: ignore
+        dryer.last_heartbeat = now  # type: ignore
+        for controller in controllers:
+            controller.connectivity_status = ConnectivityStatus.ONLINE  # type: ignore
+        db_session.commit()
+
+        controller_ids = [washer.id, dryer.id]
+        asyncio.run(
+            fleet.persist_offline(
+                TestingAsyncSessionLocal, controller_ids  # type: ignore[arg-type]
+            )
+        )
+
+        db_session.expire_all()
+        assert washer.connectivity_status == ConnectivityStatus.OFFLINE
+        assert dryer.connectivity_status == ConnectivityStatus.ONLINE
+
+
+class TestHeartbeatMetrics:
+    """Test GET /internal/heartbeats endpoint."""
+
+    def test_heartbeat_metrics_success(
+        self,
+        client: TestClient,
+        super_admin_auth_headers: dict,
+        buffer: HeartbeatBuffer,
+    ) -> None:
+        """Test that super admins can read heartbeat buffer metrics."""
+        response = client.get("/internal/heartbeats", headers=super_admin_auth_headers)
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["max_controllers"] == 2
+        assert {"pending", "rejected", "avg_flush_ms", "max_staleness_ms"} <= set(data)
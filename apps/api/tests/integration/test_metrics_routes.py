@@ -0,0 +1,52 @@
+"""Integration tests for request timing and the metrics endpoint."""
+import re
+
+from fastapi.testclient import TestClient
+
+from app.core.models.customer import Customer
+
+
+class TestMetricsEndpoint:
+    """Test GET /internal/metrics and the Server-Timing header."""
+
+    def test_database_statements_are_reported(
+        self, client: TestClient, auth_headers: dict, test_customer: Customer
+    ) -> None:
+        """Test that a route querying the database reports its statements."""
+        response = client.get("/orders", headers=auth_headers)
+
+        assert response.status_code == 200
+        match = re.search(
+            r'db;dur=[\d.]+;desc="(\d+) queries"', response.headers["Server-Timing"]
+        )
+        assert match is not None
+        assert int(match.group(1)) > 0
+
+    def test_metrics_are_in_prometheus_format(
+        self, client: TestClient, super_admin_auth_headers: dict
+    ) -> None:
+        """Test that requests show up under their route template."""
+        client.get("/health")
+        response = client.get("/internal/metrics", headers=super_admin_auth_headers)
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+        assert "# TYPE http_request_duration_seconds histogram" in response.text
+        assert (
+            'http_request_duration_seconds_bucket{method="GET",route="/health",'
+            'status="200",le="+Inf"}'
+        ) in response.text
+        for name in (
+            "http_request_db_seconds",
+            "http_request_db_statements",
+            "http_request_serialization_seconds",
+        ):
+            assert f"# TYPE {name} histogram" in response.text
+
+    def test_metrics_require_super_admin(
+        self, client: TestClient, auth_headers: dict
+    ) -> None:
+        """Test that metrics are not served anonymously or to regular users."""
+        assert client.get("/internal/metrics").status_code == 403
+        assert client.get("/internal/metrics", headers=auth_headers).status_code == 403
+        assert client.get("/metrics").status_code == 404
@@ -0,0 +1,302 @@
+"""Integration tests for order routes."""
+from datetime import datetime, timedelta, timezone
+from typing import Any
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from app.core.models.address import Address
+from app.core.models.customer import Customer
+from app.core.models.order import Order, OrderStatus
+from app.core.models.order_item import OrderItem
+from app.core.models.service import Service
+from tests.conftest import async_engine, query_budget
+
+
+@pytest.fixture
+def test_address(db_session: Session, test_customer: Customer) -> Address:
+    """Create an address for the test customer."""
+    address = Address(
+        customer_id=test_customer.id,
+        address_line_1="123 Main St",
+        city="New York",
+        state="NY",
+        zip_code="10001",
+        address_type="home",
+        updated_at=datetime.now(timezone.utc),
+    )
+    db_session.add(address)
+    db_session.commit()
+    db_session.refresh(address)
+    return address
+
+
+@pytest.fixture
+def test_order(
+    db_session: Session,
+    test_customer: Customer,
+    test_address: Address,
+    test_service: Service,
+) -> Order:
+    """Create an order with three items for the test customer."""
+    now = datetime.now(timezone.utc)
+    test_customer.updated_at = now  # type: ignore
+    order = Order(
+        order_number="ORD-TEST-1",
+        customer_id=test_customer.id,
+        status=OrderStatus.PENDING,
+        total_amount=45.0,
+        final_amount=45.0,
+        pickup_address_id=test_address.id,
+        pickup_date=now + timedelta(days=1),
+        pickup_time_slot="9:00 AM - 11:00 AM",
+        delivery_address_id=test_address.id,
+        delivery_date=now + timedelta(days=2),
+        delivery_time_slot="9:00 AM - 11:00 AM",
+        updated_at=now,
+    )
+    db_session.add(order)
+    db_session.flush()
+    for index in range(3):
+        db_session.add(
+            OrderItem(
+                order_id=order.id,
+                service_id=test_service.id,
+                item_name=f"Shirt {index}",
+                item_type="shirt",
+                quantity=1,
+                unit_price=15.0,
+                total_price=15.0,
+                updated_at=now,
+            )
+        )
+    db_session.commit()
+    db_session.refresh(order)
+    return order
+
+
+class TestGetOrder:
+    """Test GET /orders/{id} and GET /orders/{id}/detail endpoints."""
+
+    @query_budget(2)
+    def test_get_order_success(
+        self, client: TestClient, auth_headers: dict, test_order: Order
+    ) -> None:
+        """Test getting an order by ID."""
+        response = client.get(f"/orders/{test_order.id}", headers=auth_headers)
+
+        assert response.status_code == 200
+        assert response.json()["order_number"] == "ORD-TEST-1"
+
+    def test_get_order_not_found(self, client: TestClient, auth_headers: dict) -> None:
+        """Test getting a non-existent order."""
+        response = client.get("/orders/999999", headers=auth_headers)
+
+        assert response.status_code == 404
+
+    @query_budget(3)
+    def test_get_order_detail_includes_relationships(
+        self, client: TestClient, auth_headers: dict, test_order: Order
+    ) -> None:
+        """Test that order detail serializes customer, addresses and items."""
+        response = client.get(f"/orders/{test_order.id}/detail", headers=auth_headers)
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["customer"]["id"] == test_order.customer_id
+        assert data["customer"]["user"]["phone"] == "+1234567890"
+        assert data["pickup_address"]["id"] == test_order.pickup_address_id
+        assert data["delivery_address"]["id"] == test_order.delivery_address_id
+        assert len(data["items"]) == 3
+
+
+class TestListOrders:
+    """Test GET /orders endpoint."""
+
+    @query_budget(2)
+    def test_list_orders_success(
+        self, client: TestClient, auth_headers: dict, test_order: Order
+    ) -> None:
+        """Test listing orders."""
+        response = client.get("/orders", headers=auth_headers)
+
+        assert response.status_code == 200
+        assert [order["id"] for order in response.json()] == [test_order.id]
+
+    @pytest.mark.parametrize("params", [{"limit": 0}, {"limit": 101}, {"skip": -1}])
+    def test_list_orders_rejects_out_of_range_paging(
+        self, client: TestClient, auth_headers: dict, params: dict
+    ) -> None:
+        """Test that limit and skip are bounded like the other list routes."""
+        response = client.get("/orders", headers=auth_headers, params=params)
+
+        assert response.status_code == 422
+
+
+def order_payload(
+    customer: Customer, address: Address, service: Service, items: int = 2
+) -> dict:
+    """Build an order creation payload."""
+    pickup = datetime.now(timezone.utc) + timedelta(days=1)
+    return {
+        "customer_id": customer.id,
+        "pickup_address_id": address.id,
+        "delivery_address_id": address.id,
+        "pickup_date": pickup.isoformat(),
+        "pickup_time_slot": "9:00 AM - 11:00 AM",
+        "delivery_date": (pickup + timedelta(days=1)).isoformat(),
+        "delivery_time_slot": "9:00 AM - 11:00 AM",
+        "items": [
+            {
+                "service_id": service.id,
+                "item_name": f"Shirt {index}",
+                "item_type": "shirt",
+                "quantity": 2,
+                "unit_price": 5.0,
+            }
+            for index in range(items)
+        ],
+    }
+
+
+class TestCreateOrder:
+    """Test POST /orders and POST /orders/bulk endpoints."""
+
+    @query_budget(7)
+    def test_create_order_success(
+        self,
+        client: TestClient,
+        auth_headers: dict,
+        test_customer: Customer,
+        test_address: Address,
+        test_service: Service,
+    ) -> None:
+        """Test creating a single order computes totals."""
+        response = client.post(
+            "/orders",
+            json=order_payload(test_customer, test_address, test_service),
+            headers=auth_headers,
+        )
+
+        assert response.status_code == 201
+        data = response.json()
+        assert data["total_amount"] == 20.0
+        assert data["order_number"].startswith("ORD-")
+
+    def test_create_order_rejects_unknown_service(
+        self,
+        client: TestClient,
+        auth_headers: dict,
+        test_customer: Customer,
+        test_address: Address,
+        test_service: Service,
+    ) -> None:
+        """Test that a single order is checked like the orders of a bulk batch."""
+        payload = order_payload(test_customer, test_address, test_service)
+        payload["items"][0]["service_id"] = 999999
+
+        response = client.post("/orders", json=payload, headers=auth_headers)
+
+        assert response.status_code == 400
+        assert response.json()["detail"] == "Unknown or inactive service"
+
+    def test_bulk_create_reports_per_order_results(
+        self,
+        client: TestClient,
+        auth_headers: dict,
+        db_session: Session,
+        test_customer: Customer,
+        test_address: Address,
+        test_service: Service,
+    ) -> None:
+        """Test that valid orders are inserted and invalid ones reported."""
+        valid = order_payload(test_customer, test_address, test_service)
+        bad_address = {**valid, "pickup_address_id": 999999}
+        bad_service = order_payload(test_customer, test_address, test_service)
+        bad_service["items"][0]["service_id"] = 999999
+
+        response = client.post(
+            "/orders/bulk",
+            json={"orders": [valid, bad_address, valid, bad_service]},
+            headers=auth_headers,
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["created"] == 2
+        assert data["failed"] == 2
+        assert [r["success"] for r in data["results"]] == [True, False, True, False]
+        assert data["results"][1]["error"] == "Addresses must belong to the customer"
+        assert data["results"][3]["error"] == "Unknown or inactive service"
+
+        order_ids = [r["order_id"] for r in data["results"] if r["success"]]
+        orders = db_session.query(Order).filter(Order.id.in_(order_ids)).all()
+        assert len(orders) == 2
+        assert all(order.total_amount == 20.0 for order in orders)
+        assert (
+            db_session.query(OrderItem)
+            .filter(OrderItem.order_id.in_(order_ids))
+            .count()
+            == 4
+        )
+
+    def test_bulk_create_rejects_empty_batch(
+        self, client: TestClient, auth_headers: dict
+    ) -> None:
+        """Test that an empty batch is a validation error."""
+        response = client.post(
+            "/orders/bulk", json={"orders": []}, headers=auth_headers
+        )
+
+        assert response.status_code == 422
+
+
+class TestOrderDetailQueries:
+    """Test that order detail loads its nested graph in constant queries."""
+
+    def test_detail_with_50_items_uses_constant_queries(
+        self,
+        client: TestClient,
+        auth_headers: dict,
+        db_session: Session,
+        test_order: Order,
+        test_service: Service,
+    ) -> None:
+        """Test that serializing 50 items does not issue a query per item."""
+        now = datetime.now(timezone.utc)
+        db_session.add_all(
+            OrderItem(
+                order_id=test_order.id,
+                service_id=test_service.id,
+                item_name=f"Towel {index}",
+                item_type="towel",
+                quantity=1,
+                unit_price=2.0,
+                total_price=2.0,
+                updated_at=now,
+            )
+            for index in range(47)
+        )
+        db_session.commit()
+        # Warm the principal cache so only the detail query is counted
+        client.get(f"/orders/{test_order.id}", headers=auth_headers)
+
+        statements: list[str] = []
+
+        def record(*args: Any) -> None:
+            statements.append(args[2])
+
+        event.listen(async_engine.sync_engine, "before_cursor_execute", record)
+        try:
+            response = client.get(
+                f"/orders/{test_order.id}/detail", headers=auth_headers
+            )
+        finally:
+            event.remove(async_engine.sync_engine, "before_cursor_execute", record)
+
+        assert response.status_code == 200
+        assert len(response.json()["items"]) == 50
+        # One joined SELECT for order, customer, user and addresses, one for items
+        assert len(statements) == 2
@@ -1,8 +1,21 @@
 """Integration tests for organization routes."""
+import asyncio
+from typing import Generator
+from uuid import UUID
+
+import pytest
 from fastapi.testclient import TestClient
 from sqlalchemy.orm import Session
 
+from app.core.config.email_config import EmailConfig
+from app.core.dependencies import get_email_service
+from app.core.emails.invitation_templates import InvitationTemplateRenderer
+from app.core.models.invitation import Invitation
 from app.core.models.organization import Organization, OrganizationStatus
+from app.core.services.email_queue import EmailQueue
+from app.core.services.email_service import EmailService
+from app.main import app
+from tests.conftest import TestingAsyncSessionLocal, query_budget
 
 
 class TestCreateOrganization:
@@ -117,6 +130,7 @@ class TestCreateOrganization:
 class TestListOrganizations:
     """Test GET /super-admin/organizations endpoint."""
 
+    @query_budget(2)
     def test_list_organizations_success(
         self, client: TestClient, super_admin_auth_headers: dict, db_session: Session
     ) -> None:
@@ -232,3 +246,179 @@ class TestListOrganizations:
         response = client.get("/super-admin/organizations", headers=auth_headers)
 
         assert response.status_code == 403
+
+
+ORGANIZATION_PAYLOAD = {
+    "billing_address": "123 Main St",
+    "city": "New York",
+    "state": "NY",
+    "postal_code": "10001",
+    "country": "US",
+}
+
+
+def _email_service(queue: EmailQueue) -> EmailService:
+    config = EmailConfig(
+        sendgrid_api_key="test-api-key",
+        from_email="noreply@laundromate.com",
+        frontend_url="https://app.laundromate.com",
+    )
+    return EmailService(config, InvitationTemplateRenderer(), queue)
+
+
+@pytest.fixture
+def email_queue() -> Generator[EmailQueue, None, None]:
+    """Capture invitation emails in a queue with no running workers."""
+    test_queue = EmailQueue(api_key="test-api-key", max_size=1)
+    app.dependency_overrides[get_email_service] = lambda: _email_service(test_queue)
+    yield test_queue
+    app.dependency_overrides.pop(get_email_service, None)
+
+
+class TestInviteOrganizationMember:
+    """Test POST /super-admin/organizations/{id}/invite-member endpoint."""
+
+    def _invite(self, client: TestClient, headers: dict, email: str) -> dict:
+        organization = client.post(
+            "/super-admin/organizations",
+            json={**ORGANIZATION_PAYLOAD, "name": f"Org for {email}"},
+            headers=headers,
+        ).json()
+        response = client.post(
+            f"/super-admin/organizations/{organization['id']}/invite-member",
+            json={"email": email},
+            headers=headers,
+        )
+        assert response.status_code == 201
+        invitation: dict = response.json()
+        return invitation
+
+    def test_invite_queues_email(
+        self,
+        client: TestClient,
+        super_admin_auth_headers: dict,
+        email_queue: EmailQueue,
+    ) -> None:
+        """Test that inviting a member queues the email instead of sending it."""
+        invitation = self._invite(
+            client, super_admin_auth_headers, "new.owner@example.com"
+        )
+
+        assert invitation["email"] == "new.owner@example.com"
+        assert len(email_queue) == 1
+        assert email_queue.tracks(UUID(invitation["id"]))
+
+    def test_full_queue_email_is_recovered(
+        self,
+        client: TestClient,
+        db_session: Session,
+        super_admin_auth_headers: dict,
+        email_queue: EmailQueue,
+    ) -> None:
+        """Test that an email refused by a full queue is re-queued later."""
+        self._invite(client, super_admin_auth_headers, "first@example.com")
+        invitation = self._invite(client, super_admin_auth_headers, "busy@example.com")
+        invitation_id = UUID(invitation["id"])
+
+        assert email_queue.stats()["dropped"] == 1
+        assert not email_queue.tracks(invitation_id)
+        row = db_session.get(Invitation, invitation_id)
+        assert row is not None and row.email_sent_at is None
+
+        # A fresh process (empty queue) re-queues both unsent invitations
+        restarted = EmailQueue(api_key="test-api-key")
+        requeued = asyncio.run(
+            _email_service(restarted).requeue_unsent_invitations(
+                TestingAsyncSessionLocal, older_than_seconds=-60, expiration_days=7
+            )
+        )
+
+        assert requeued == 2
+        assert restarted.tracks(invitation_id)
+
+
+class TestInviteOrganizationMembers:
+    """Test POST /super-admin/organizations/{id}/invite-members endpoint."""
+
+    def _organization(self, client: TestClient, headers: dict) -> str:
+        response = client.post(
+            "/super-admin/organizations",
+            json={**ORGANIZATION_PAYLOAD, "name": "Chain Org"},
+            headers=headers,
+        )
+        organization_id: str = response.json()["id"]
+        return organization_id
+
+    def test_bulk_invite_reports_per_recipient(
+        self,
+        client: TestClient,
+        db_session: Session,
+        super_admin_auth_headers: dict,
+        email_queue: EmailQueue,
+    ) -> None:
+        """Test dedupe, one batched email and a result per invitee."""
+        organization_id = self._organization(client, super_admin_auth_headers)
+        client.post(
+            f"/super-admin/organizations/{organization_id}/invite-member",
+            json={"email": "existing@example.com"},
+            headers=super_admin_auth_headers,
+        )
+        email_queue._queue.get_nowait()
+        email_queue._queue.task_done()
+
+        response = client.post(
+            f"/super-admin/organizations/{organization_id}/invite-members",
+            json={
+                "invitations": [
+                    {"email": "a@example.com"},
+                    {"email": "existing@example.com"},
+                    {"email": "b@example.com", "organization_role": "employee"},
+                    {"email": "a@example.com"},
+                ]
+            },
+            headers=super_admin_auth_headers,
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert (data["invited"], data["skipped"]) == (2, 2)
+        assert [r["success"] for r in data["results"]] == [True, False, True, False]
+        assert all(r["email_queued"] for r in data["results"] if r["success"])
+        assert data["results"][3]["error"] == "Duplicate email in request"
+
+        # Both invitees share one SendGrid request, each with their own link
+        assert len(email_queue) == 1
+        payload, invitation_ids = email_queue._queue.get_nowait()
+        personalizations = payload["personalizations"]
+        assert [p["to"][0]["email"] for p in personalizations] == [
+            "a@example.com",
+            "b@example.com",
+        ]
+        invitations: dict[str, Invitation] = {
+            str(row.email): row
+            for row in db_session.query(Invitation).filter(
+                Invitation.id.in_(invitation_ids)
+            )
+        }
+        for personalization in personalizations:
+            invitation = invitations[personalization["to"][0]["email"]]
+            link = personalization["substitutions"]["-invitation_url-"]
+            assert link.endswith(f"token={invitation.token}")
+        assert invitations["b@example.com"].organization_role.value == "employee"
+
+    def test_bulk_invite_unknown_organization(
+        self,
+        client: TestClient,
+        super_admin_auth_headers: dict,
+        email_queue: EmailQueue,
+    ) -> None:
+        """Test that inviting into a missing organization returns 404."""
+        response = client.post(
+            "/super-admin/organizations/00000000-0000-0000-0000-000000000000"
+            "/invite-members",
+            json={"invitations": [{"email": "a@example.com"}]},
+            headers=super_admin_auth_headers,
+        )
+
+        assert response.status_code == 404
+        assert len(email_queue) == 0
@@ -0,0 +1,282 @@
+"""Integration tests for the super-admin search route."""
+from typing import Any
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+
+from app.auth.security import create_access_token
+from app.core.constants import NEXT_CURSOR_HEADER
+from app.core.models.iot_controller import DeviceType, IoTController
+from app.core.models.organization import Organization
+from app.core.models.store import Store, StoreStatus
+from app.core.models.user import User
+from tests.conftest import query_budget
+
+
+@pytest.fixture
+def fleet(db_session: Session) -> dict:
+    """Create two organizations with stores, a controller and a support agent."""
+    sunny = Organization(
+        name="Sunny Suds Holdings",
+        billing_address="1 Org St",
+        city="Austin",
+        state="TX",
+        postal_code="78701",
+        country="US",
+    )
+    fresh = Organization(
+        name="Fresh Fold Group",
+        billing_address="2 Org St",
+        city="Denver",
+        state="CO",
+        postal_code="80202",
+        country="US",
+    )
+    db_session.add_all([sunny, fresh])
+    db_session.flush()
+    downtown = Store(
+        organization_id=sunny.id,
+        name="Downtown",
+        street_address="10 Congress Ave",
+        city="Austin",
+        state="TX",
+        postal_code="78701",
+        country="US",
+    )
+    closed = Store(
+        organization_id=sunny.id,
+        name="Riverside",
+        street_address="20 Riverside Dr",
+        city="Austin",
+        state="TX",
+        postal_code="78704",
+        country="US",
+        status=StoreStatus.INACTIVE,
+    )
+    uptown = Store(
+        organization_id=fresh.id,
+        name="Uptown Suds",
+        street_address="30 Colfax Ave",
+        city="Denver",
+        state="CO",
+        postal_code="80203",
+        country="US",
+    )
+    db_session.add_all([downtown, closed, uptown])
+    db_session.flush()
+    washer = IoTController(
+        store_id=downtown.id,
+        mac_address="AA:BB:CC:DD:EE:42",
+        serial_number="SN-WASH-0042",
+        machine_label="Washer 1",
+        device_type=DeviceType.WASHER,
+    )
+    agent = User(
+        email="agent@example.com",
+        first_name="Sam",
+        last_name="Helper",
+        phone="+15125550100",
+        is_support_agent=True,
+    )
+    db_session.add_all([washer, agent])
+    db_session.commit()
+    return {
+        "sunny": sunny,
+        "downtown": downtown,
+        "closed": closed,
+        "uptown": uptown,
+        "washer": washer,
+        "agent": agent,
+    }
+
+
+@pytest.fixture
+def agent_headers(fleet: dict) -> dict:
+    """Authentication headers for the support agent."""
+    return {"Authorization": f"Bearer {create_access_token(str(fleet['agent'].id))}"}
+
+
+def found(response: object) -> list[tuple[str, str]]:
+    """(type, title) of every result, in order."""
+    return [(item["type"], item["title"]) for item in response.json()]  # type: ignore
+
+
+class TestSearch:
+    """Test GET /super-admin/search endpoint."""
+
+    @query_budget(3)
+    def test_finds_stores_by_own_and_organization_name(
+        self, client: TestClient, agent_headers: dict, fleet: dict
+    ) -> None:
+        """Test that stores match their name and their organization's name."""
+        response = client.get(
+            "/super-admin/search",
+            params={"q": "suds", "type": "store"},
+            headers=agent_headers,
+        )
+
+        assert response.status_code == 200
+        assert sorted(found(response)) == [
+            ("store", "Downtown"),
+            ("store", "Riverside"),
+            ("store", "Uptown Suds"),
+        ]
+        # A store's own name outranks its organization's
+        assert found(response)[0] == ("store", "Uptown Suds")
+        downtown = next(i for i in response.json() if i["title"] == "Downtown")
+        assert downtown["subtitle"] == "Sunny Suds Holdings, Austin, TX"
+        assert downtown["parent_id"] == str(fleet["sunny"].id)
+
+    def test_searches_every_type_by_default(
+        self, client: TestClient, agent_headers: dict, fleet: dict
+    ) -> None:
+        """Test that organizations and stores are returned together."""
+        response = client.get(
+            "/super-admin/search", params={"q": "SUNNY"}, headers=agent_headers
+        )
+
+        assert sorted(found(response)) == [
+            ("organization", "Sunny Suds Holdings"),
+            ("store", "Downtown"),
+            ("store", "Riverside"),
+        ]
+
+    def test_finds_stores_by_location_and_status(
+        self, client: TestClient, agent_headers: dict, fleet: dict
+    ) -> None:
+        """Test that stores match their address and can be filtered by status."""
+        response = client.get(
+            "/super-admin/search",
+            params={"q": "7870", "type": "store", "store_status": "inactive"},
+            headers=agent_headers,
+        )
+
+        assert found(response) == [("store", "Riverside")]
+        assert response.json()[0]["status"] == "inactive"
+
+    def test_finds_users_by_email_and_phone(
+        self, client: TestClient, agent_headers: dict, fleet: dict
+    ) -> None:
+        """Test that users match a part of their email or phone number."""
+        for term in ("agent@exa", "5550100"):
+            response = client.get(
+                "/super-admin/search",
+                params={"q": term, "type": "user"},
+                headers=agent_headers,
+            )
+
+            assert found(response) == [("user", "Sam Helper")]
+            assert response.json()[0]["subtitle"] == "agent@example.com, +15125550100"
+
+    def test_finds_controllers_by_mac_and_serial(
+        self, client: TestClient, agent_headers: dict, fleet: dict
+    ) -> None:
+        """Test that controllers match their MAC address or serial number."""
+        for term in ("dd:ee:42", "WASH-0042"):
+            response = client.get(
+                "/super-admin/search",
+                params={"q": term, "type": "controller"},
+                headers=agent_headers,
+            )
+
+            assert found(response) == [("controller", "Washer 1")]
+            assert response.json()[0]["parent_id"] == str(fleet["downtown"].id)
+
+    def test_pages_follow_the_ranking(
+        self, client: TestClient, agent_headers: dict, fleet: dict
+    ) -> None:
+        """Test that cursor pages return every match once, in rank order."""
+        everything = client.get(
+            "/super-admin/search", params={"q": "austin"}, headers=agent_headers
+        )
+        pages = []
+        params: dict[str, Any] = {"q": "austin", "limit": 1}
+        while True:
+            response = client.get(
+                "/super-admin/search", params=params, headers=agent_headers
+            )
+            pages.extend(found(response))
+            cursor = response.headers.get(NEXT_CURSOR_HEADER)
+            if cursor is None:
+                break
+            params["cursor"] = cursor
+
+        assert len(pages) == 3
+        assert pages == found(everything)
+
+    def test_reflects_changes(
+        self, client: TestClient, agent_headers: dict, fleet: dict, db_session: Session
+    ) -> None:
+        """Test that renames and deletes are searchable immediately."""
+        fleet["sunny"].name = "Bright Wash Holdings"
+        db_session.delete(fleet["closed"])
+        db_session.commit()
+
+        response = client.get(
+            "/super-admin/search", params={"q": "bright"}, headers=agent_headers
+        )
+
+        assert sorted(found(response)) == [
+            ("organization", "Bright Wash Holdings"),
+            ("store", "Downtown"),
+        ]
+
+    def test_special_characters_match_literally(
+        self, client: TestClient, agent_headers: dict, fleet: dict
+    ) -> None:
+        """Test that wildcards and quotes in the term are plain text."""
+        for term in ('%"_', "Sunny%Suds"):
+            response = client.get(
+                "/super-admin/search", params={"q": term}, headers=agent_headers
+            )
+
+            assert response.status_code == 200
+            assert response.json() == []
+
+    def test_short_term_is_rejected(
+        self, client: TestClient, agent_headers: dict
+    ) -> None:
+        """Test that terms shorter than a trigram are rejected."""
+        response = client.get(
+            "/super-admin/search", params={"q": "su"}, headers=agent_headers
+        )
+
+        assert response.status_code == 422
+
+    def test_invalid_cursor_is_rejected(
+        self, client: TestClient, agent_headers: dict
+    ) -> None:
+        """Test that a malformed cursor is a 400."""
+        response = client.get(
+            "/super-admin/search",
+            params={"q": "suds", "cursor": "not-a-cursor"},
+            headers=agent_headers,
+        )
+
+        assert response.status_code == 400
+
+    def test_requires_support_agent(
+        self, client: TestClient, auth_headers: dict
+    ) -> None:
+        """Test that regular users cannot search."""
+        response = client.get(
+            "/super-admin/search", params={"q": "suds"}, headers=auth_headers
+        )
+
+        assert response.status_code == 403
+
+    def test_super_admin_can_search(
+        self, client: TestClient, super_admin_auth_headers: dict, fleet: dict
+    ) -> None:
+        """Test that super admins can search."""
+        response = client.get(
+            "/super-admin/search",
+            params={"q": "fresh fold"},
+            headers=super_admin_auth_headers,
+        )
+
+        assert sorted(found(response)) == [
+            ("organization", "Fresh Fold Group"),
+            ("store", "Uptown Suds"),
+        ]
@@ -0,0 +1,333 @@
+"""Integration tests for user routes."""
+import uuid
+from dataclasses import replace
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+
+from app.auth.permission_versions import permission_versions
+from app.auth.principal_cache import Principal, principal_cache
+from app.auth.security import create_access_token, principal_claims
+from app.core.config.settings import settings
+from app.core.models.user import User
+from tests.conftest import query_budget
+
+
+class TestListUsers:
+    """Test GET /users endpoint."""
+
+    @query_budget(2)
+    def test_list_users_success(
+        self, client: TestClient, super_admin_auth_headers: dict, test_user: User
+    ) -> None:
+        """Test listing users as super admin."""
+        response = client.get("/users", headers=super_admin_auth_headers)
+
+        assert response.status_code == 200
+        phones = {user["phone"] for user in response.json()}
+        assert test_user.phone in phones
+
+    def test_list_users_requires_super_admin(
+        self, client: TestClient, auth_headers: dict
+    ) -> None:
+        """Test that listing users requires super admin privileges."""
+        response = client.get("/users", headers=auth_headers)
+
+        assert response.status_code == 403
+
+
+class TestGetUser:
+    """Test GET /users/{id} endpoint."""
+
+    def test_get_user_success(
+        self, client: TestClient, super_admin_auth_headers: dict, test_user: User
+    ) -> None:
+        """Test getting a user by ID."""
+        response = client.get(
+            f"/users/{test_user.id}", headers=super_admin_auth_headers
+        )
+
+        assert response.status_code == 200
+        assert response.json()["id"] == str(test_user.id)
+
+    def test_get_user_not_found(
+        self, client: TestClient, super_admin_auth_headers: dict
+    ) -> None:
+        """Test getting a non-existent user."""
+        response = client.get(
+            f"/users/{uuid.uuid4()}", headers=super_admin_auth_headers
+        )
+
+        assert response.status_code == 404
+
+
+class TestUpdateUser:
+    """Test PUT /users/{id} and PATCH /users/{id}/activate endpoints."""
+
+    def test_update_user_success(
+        self, client: TestClient, super_admin_auth_headers: dict, test_user: User
+    ) -> None:
+        """Test updating a user."""
+        response = client.put(
+            f"/users/{test_user.id}",
+            json={"first_name": "Renamed", "is_support_agent": True},
+            headers=super_admin_auth_headers,
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["first_name"] == "Renamed"
+        assert data["is_support_agent"] is True
+
+    def test_update_user_duplicate_phone(
+        self,
+        client: TestClient,
+        super_admin_auth_headers: dict,
+        test_user: User,
+        admin_user: User,
+    ) -> None:
+        """Test updating a user to a phone number that is already taken."""
+        response = client.put(
+            f"/users/{test_user.id}",
+            json={"phone": admin_user.phone},
+            headers=super_admin_auth_headers,
+        )
+
+        assert response.status_code == 400
+
+    def test_deactivate_user(
+        self,
+        client: TestClient,
+        super_admin_auth_headers: dict,
+        test_user: User,
+        db_session: Session,
+    ) -> None:
+        """Test deactivating a user."""
+        response = client.patch(
+            f"/users/{test_user.id}/activate",
+            json={"is_active": False},
+            headers=super_admin_auth_headers,
+        )
+
+        assert response.status_code == 200
+        assert response.json()["is_active"] is False
+        db_session.refresh(test_user)
+        assert test_user.is_active is False
+
+
+class TestPrincipalCache:
+    """Test principal caching in get_current_user."""
+
+    def test_repeat_requests_hit_cache(
+        self, client: TestClient, super_admin_auth_headers: dict
+    ) -> None:
+        """Test that the second request is authenticated from the cache."""
+        client.get("/users", headers=super_admin_auth_headers)
+        response = client.get(
+            "/users/principal-cache/stats", headers=super_admin_auth_headers
+        )
+
+        assert response.status_code == 200
+        stats = response.json()
+        assert stats["misses"] == 1
+        assert stats["hits"] == 1
+
+    def test_update_invalidates_cached_principal(
+        self,
+        client: TestClient,
+        super_admin_auth_headers: dict,
+        test_user: User,
+        auth_headers: dict,
+    ) -> None:
+        """Test that role changes take effect on the user's next request."""
+        assert client.get("/users", headers=auth_headers).status_code == 403
+
+        client.put(
+            f"/users/{test_user.id}",
+            json={"is_super_admin": True},
+            headers=super_admin_auth_headers,
+        )
+
+        assert client.get("/users", headers=auth_headers).status_code == 200
+
+    def test_deactivated_user_is_refused(
+        self,
+        client: TestClient,
+        super_admin_auth_headers: dict,
+        test_user: User,
+        auth_headers: dict,
+    ) -> None:
+        """Test that deactivation locks out a user whose principal was cached."""
+        assert client.get("/auth/me", headers=auth_headers).status_code == 200
+
+        client.patch(
+            f"/users/{test_user.id}/activate",
+            json={"is_active": False},
+            headers=super_admin_auth_headers,
+        )
+
+        response = client.get("/auth/me", headers=auth_headers)
+        assert response.status_code == 403
+        assert response.json()["detail"] == "Inactive user"
+
+    def test_cached_inactive_principal_is_refused(
+        self, client: TestClient, test_user: User, auth_headers: dict
+    ) -> None:
+        """Test that an inactive principal served from the cache is refused."""
+        principal_cache.set(replace(Principal.from_user(test_user), is_active=False))
+
+        assert client.get("/auth/me", headers=auth_headers).status_code == 403
+
+
+@pytest.fixture
+def stateless_tokens(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Enable stateless tokens on a worker that has synced its versions."""
+    monkeypatch.setattr(settings, "AUTH_STATELESS_TOKENS", True)
+    permission_versions.synced_at = 0.0
+
+
+def _stateless_headers(user: User) -> dict:
+    token = create_access_token(subject=str(user.id), claims=principal_claims(user))
+    return {"Authorization": f"Bearer {token}"}
+
+
+@pytest.mark.usefixtures("stateless_tokens")
+class TestStatelessTokens:
+    """Test authorization from role claims in the access token."""
+
+    def test_claims_authorize_without_user_row(
+        self, client: TestClient, db_session: Session, super_admin_user: User
+    ) -> None:
+        """Test that the role claims alone grant access."""
+        headers = _stateless_headers(super_admin_user)
+        db_session.delete(super_admin_user)
+        db_session.commit()
+
+        response = client.get("/users/principal-cache/stats", headers=headers)
+
+        assert response.status_code == 200
+        # Authorized from the token, not from the database or the cache
+        assert response.json()["misses"] == 0
+
+    def test_claims_deny_missing_role(
+        self, client: TestClient, test_user: User
+    ) -> None:
+        """Test that a token without the super admin bit is refused."""
+        response = client.get("/users", headers=_stateless_headers(test_user))
+
+        assert response.status_code == 403
+
+    def test_role_change_revokes_token(
+        self,
+        client: TestClient,
+        super_admin_auth_headers: dict,
+        admin_user: User,
+    ) -> None:
+        """Test that changing a user's roles revokes their earlier tokens."""
+        headers = _stateless_headers(admin_user)
+        assert client.get("/auth/me", headers=headers).status_code == 200
+
+        client.put(
+            f"/users/{admin_user.id}",
+            json={"is_admin": False},
+            headers=super_admin_auth_headers,
+        )
+
+        response = client.get("/auth/me", headers=headers)
+        assert response.status_code == 401
+        assert response.json()["detail"] == "Token has been revoked"
+
+    def test_profile_change_keeps_token(
+        self,
+        client: TestClient,
+        super_admin_auth_headers: dict,
+        test_user: User,
+    ) -> None:
+        """Test that edits to non-role fields leave tokens valid."""
+        headers = _stateless_headers(test_user)
+
+        client.put(
+            f"/users/{test_user.id}",
+            json={"first_name": "Renamed"},
+            headers=super_admin_auth_headers,
+        )
+
+        assert client.get("/auth/me", headers=headers).status_code == 200
+
+    def test_deactivation_revokes_token(
+        self,
+        client: TestClient,
+        super_admin_auth_headers: dict,
+        test_user: User,
+    ) -> None:
+        """Test that deactivating a user revokes their earlier tokens."""
+        headers = _stateless_headers(test_user)
+
+        client.patch(
+            f"/users/{test_user.id}/activate",
+            json={"is_active": False},
+            headers=super_admin_auth_headers,
+        )
+
+        assert client.get("/auth/me", headers=headers).status_code == 401
+
+    def test_token_without_claims_uses_database(
+        self, client: TestClient, auth_headers: dict
+    ) -> None:
+        """Test that tokens issued without claims still work."""
+        assert client.get("/auth/me", headers=auth_headers).status_code == 200
+        assert principal_cache.stats()["misses"] == 1
+
+    def test_unsynced_worker_uses_database(
+        self, client: TestClient, db_session: Session, super_admin_user: User
+    ) -> None:
+        """Test that claims are ignored until versions have been loaded."""
+        headers = _stateless_headers(super_admin_user)
+        db_session.delete(super_admin_user)
+        db_session.commit()
+        permission_versions.synced_at = None
+
+        response = client.get("/users/principal-cache/stats", headers=headers)
+
+        assert response.status_code == 401
+
+
+class TestListUsersCursor:
+    """Test cursor pagination on GET /users."""
+
+    def test_follow_next_cursor(
+        self,
+        client: TestClient,
+        super_admin_auth_headers: dict,
+        test_user: User,
+        admin_user: User,
+    ) -> None:
+        """Test that X-Next-Cursor walks through every user once."""
+        seen: list[str] = []
+        params: dict = {"limit": 1}
+        while True:
+            response = client.get(
+                "/users", params=params, headers=super_admin_auth_headers
+            )
+            assert response.status_code == 200
+            seen.extend(user["id"] for user in response.json())
+            next_cursor = response.headers.get("X-Next-Cursor")
+            if next_cursor is None:
+                break
+            params["cursor"] = next_cursor
+
+        assert len(seen) == 3
+        assert len(set(seen)) == 3
+
+    def test_invalid_cursor(
+        self, client: TestClient, super_admin_auth_headers: dict
+    ) -> None:
+        """Test that a malformed cursor is rejected with 400."""
+        response = client.get(
+            "/users",
+            params={"cursor": "not-a-cursor"},
+            headers=super_admin_auth_headers,
+        )
+
+        assert response.status_code == 400
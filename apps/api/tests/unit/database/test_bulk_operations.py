@@ -0,0 +1,201 @@
+"""Unit tests for set-based bulk repository operations."""
+import asyncio
+from typing import Any, Generator
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from app.core.models.organization import Organization
+from app.core.models.store import StoreStatus
+from app.core.repositories.store_repository import AsyncStoreRepository
+from app.core.repositories.user_repository import UserRepository
+from app.core.schemas.store import StoreCreate, StoreUpdate
+from app.core.schemas.user import UserCreate, UserUpdate
+from tests.conftest import TestingAsyncSessionLocal, engine
+
+
+@pytest.fixture
+def statements() -> Generator[list[str], None, None]:
+    """Collect the first keyword of every statement sent to the test engine."""
+    keywords: list[str] = []
+
+    def before_cursor_execute(*args: Any) -> None:
+        keywords.append(args[2].split(None, 1)[0].upper())
+
+    event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    yield keywords
+    event.remove(engine, "before_cursor_execute", before_cursor_execute)
+
+
+def create_users(repo: UserRepository, count: int) -> list[Any]:
+    return repo.create_many(
+        [UserCreate(phone=f"+1555000{index:04d}") for index in range(count)]
+    )
+
+
+class TestBulkOperations:
+    """Test create_many, get_many, update_many, update_each and delete_many."""
+
+    def test_create_many_is_one_insert(
+        self, db_session: Session, statements: list[str]
+    ) -> None:
+        """Test that all rows are inserted by one statement, in order."""
+        repo = UserRepository(db_session)
+        statements.clear()
+
+        users = create_users(repo, 5)
+
+        assert [user.phone for user in users] == [
+            f"+1555000{index:04d}" for index in range(5)
+        ]
+        assert all(user.created_at for user in users)
+        assert statements.count("INSERT") == 1
+
+    def test_get_many_keeps_requested_order(self, db_session: Session) -> None:
+        """Test that rows come back in id order and missing ids are skipped."""
+        repo = UserRepository(db_session)
+        users = create_users(repo, 3)
+        ids = [users[2].id, uuid4(), users[0].id]
+
+        found: list[Any] = repo.get_many(ids)
+
+        assert [user.id for user in found] == [users[2].id, users[0].id]
+        assert repo.get_many([]) == []
+
+    def test_update_many_is_one_update(
+        self, db_session: Session, statements: list[str]
+    ) -> None:
+        """Test that the same change is applied to every row at once."""
+        repo = UserRepository(db_session)
+        users = create_users(repo, 4)
+        ids = [user.id for user in users[:3]]
+        statements.clear()
+
+        updated: list[Any] = repo.update_many(ids, UserUpdate(is_active=False))
+
+        assert statements.count("UPDATE") == 1
+        assert [user.id for user in updated] == ids
+        assert not any(user.is_active for user in updated)
+        assert repo.get_by_id(users[3].id).is_active  # type: ignore[union-attr]
+
+    def test_update_each_is_one_update(
+        self, db_session: Session, statements: list[str]
+    ) -> None:
+        """Test that every row gets its own changes from one statement."""
+        repo = UserRepository(db_session)
+        users = create_users(repo, 4)
+        statements.clear()
+
+        updated: list[Any] = repo.update_each(
+            [
+                (users[2].id, UserUpdate(first_name="Cleo")),
+                (users[0].id, UserUpdate(first_name="Ada", is_active=False)),
+                (users[1].id, UserUpdate()),
+                (uuid4(), UserUpdate(first_name="Nobody")),
+            ]
+        )
+
+        assert statements.count("UPDATE") == 1
+        assert [(user.id, user.first_name, user.is_active) for user in updated] == [
+            (users[2].id, "Cleo", True),
+            (users[0].id, "Ada", False),
+        ]
+        unchanged: Any = repo.get_by_id(users[1].id)
+        assert (unchanged.first_name, unchanged.is_active) == (None, True)
+        assert repo.update_each([(users[3].id, UserUpdate())]) == []
+
+    def test_create_many_uses_the_create_row_hook(self, db_session: Session) -> None:
+        """Test that create and create_many write rows from _row_for_create."""
+
+        class NamingUserRepository(UserRepository):
+            def _row_for_create(self, entity: Any) -> dict[str, Any]:
+                return {**super()._row_for_create(entity), "first_name": "Derived"}
+
+        repo = NamingUserRepository(db_session)
+
+        created: list[Any] = [
+            repo.create(UserCreate(phone="+15550009000")),
+            *repo.create_many([UserCreate(phone="+15550009001")]),
+        ]
+
+        assert [user.first_name for user in created] == ["Derived", "Derived"]
+
+    def test_delete_many_is_one_delete(
+        self, db_session: Session, statements: list[str]
+    ) -> None:
+        """Test that rows are deleted by one statement and counted."""
+        repo = UserRepository(db_session)
+        users = create_users(repo, 3)
+        statements.clear()
+
+        deleted = repo.delete_many([users[0].id, users[1].id, uuid4()])
+
+        remaining: list[Any] = repo.get_many([user.id for user in users])
+        assert deleted == 2
+        assert statements.count("DELETE") == 1
+        assert [user.id for user in remaining] == [users[2].id]
+
+
+class TestAsyncBulkOperations:
+    """Test the async bulk operations."""
+
+    def test_round_trip(self, db_session: Session) -> None:
+        """Test create, update, get and delete of several stores."""
+        org = Organization(
+            name="Bulk Org",
+            billing_address="1 Main St",
+            city="Springfield",
+            state="IL",
+            postal_code="62701",
+            country="US",
+        )
+        db_session.add(org)
+        db_session.commit()
+        organization_id = org.id
+
+        async def scenario() -> tuple[list[str], list[StoreStatus], int, int]:
+            async with TestingAsyncSessionLocal() as session:
+                repo = AsyncStoreRepository(session)
+                stores = await repo.create_many(
+                    [
+                        StoreCreate(
+                            organization_id=organization_id,  # type: ignore[arg-type]
+                            name=f"Store {index}",
+                            street_address=f"{index} Main St",
+                            city="Springfield",
+                            state="IL",
+                            postal_code="62701",
+                            country="US",
+                        )
+                        for index in range(3)
+                    ]
+                )
+                ids = [store.id for store in stores]
+                await repo.update_many(
+                    ids[:2], StoreUpdate(status=StoreStatus.INACTIVE)
+                )
+                await repo.update_each(
+                    [(ids[0], StoreUpdate(name="Renamed")), (ids[2], StoreUpdate())]
+                )
+                found = await repo.get_many(ids)
+                deleted = await repo.delete_many(ids)
+                remaining = len(await repo.get_many(ids))
+            return (
+                [store.name for store in found],
+                [store.status for store in found],
+                deleted,
+                remaining,
+            )
+
+        names, statuses, deleted, remaining = asyncio.run(scenario())
+
+        assert names == ["Renamed", "Store 1", "Store 2"]
+        assert statuses == [
+            StoreStatus.INACTIVE,
+            StoreStatus.INACTIVE,
+            StoreStatus.ACTIVE,
+        ]
+        assert deleted == 3
+        assert remaining == 0
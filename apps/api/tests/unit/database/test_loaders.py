@@ -0,0 +1,46 @@
+"""Unit tests for the eager-loading options registry."""
+from pydantic import BaseModel
+from sqlalchemy import select
+from sqlalchemy.orm import joinedload
+
+from app.core.models.customer import Customer
+from app.core.repositories.loaders import (
+    loader_options,
+    register_loader_options,
+    with_loader_options,
+)
+from app.core.schemas.customer import CustomerRead, CustomerWithAddresses
+from app.core.schemas.user import UserRead
+
+
+class TestLoaderOptions:
+    """Test loader option registration and lookup."""
+
+    def test_flat_schema_has_no_options(self) -> None:
+        """Test that schemas without relationships need no loader options."""
+        statement = select(Customer)
+
+        assert loader_options(UserRead) == ()
+        assert with_loader_options(statement, UserRead) is statement
+
+    def test_subclass_inherits_base_options(self) -> None:
+        """Test that a derived schema includes its base schema's options."""
+        base = loader_options(CustomerRead)
+        derived = loader_options(CustomerWithAddresses)
+
+        assert len(base) == 1
+        assert derived[: len(base)] == base
+        assert len(derived) == 2
+
+    def test_register_custom_schema(self) -> None:
+        """Test registering options for a new schema."""
+
+        class CustomerWithUser(BaseModel):
+            pass
+
+        option = joinedload(Customer.user)
+        register_loader_options(CustomerWithUser, option)
+
+        assert loader_options(CustomerWithUser) == (option,)
+        statement = with_loader_options(select(Customer), CustomerWithUser)
+        assert statement._with_options == (option,)
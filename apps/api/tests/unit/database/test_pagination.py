@@ -0,0 +1,117 @@
+"""Unit tests for keyset pagination helpers and BaseRepository.list_page."""
+from datetime import datetime, timezone
+from uuid import UUID, uuid4
+
+import pytest
+from sqlalchemy.orm import Session
+
+from app.core.models.user import User
+from app.core.repositories.base import BaseRepository
+from app.core.repositories.exceptions import InvalidCursorError
+from app.core.repositories.pagination import decode_cursor, encode_cursor
+from app.core.repositories.user_repository import UserRepository
+
+
+@pytest.fixture
+def users(db_session: Session) -> list[User]:
+    """Create five users; server defaults give most of them equal created_at."""
+    created = [User(phone=f"+1555000000{index}") for index in range(5)]
+    db_session.add_all(created)
+    db_session.commit()
+    return created
+
+
+class TestCursorEncoding:
+    """Test cursor encoding and decoding."""
+
+    def test_round_trip(self) -> None:
+        """Test that a cursor decodes to the values it was built from."""
+        created_at = datetime(2024, 1, 2, 3, 4, 5, 678, tzinfo=timezone.utc)
+        entity_id = uuid4()
+
+        cursor = encode_cursor(created_at, entity_id)
+
+        assert decode_cursor(cursor, User) == (created_at, entity_id)
+        assert "=" not in cursor
+
+    @pytest.mark.parametrize("cursor", ["garbage", "", "W10", "WyJ4IiwgIjEiXQ"])
+    def test_invalid_cursor(self, cursor: str) -> None:
+        """Test that malformed cursors raise InvalidCursorError."""
+        with pytest.raises(InvalidCursorError):
+            decode_cursor(cursor, User)
+
+
+class TestListPage:
+    """Test BaseRepository.list_page keyset pagination."""
+
+    def test_walks_all_rows_without_gaps(
+        self, db_session: Session, users: list[User]
+    ) -> None:
+        """Test that following cursors visits every row exactly once."""
+        repo = UserRepository(db_session)
+        seen: list[UUID] = []
+        cursor = None
+        while True:
+            page = repo.list_page(cursor=cursor, limit=2)
+            assert len(page.items) <= 2
+            seen.extend(user.id for user in page.items)
+            if page.next_cursor is None:
+                break
+            cursor = page.next_cursor
+
+        assert sorted(seen) == sorted(user.id for user in users)
+        assert len(seen) == len(set(seen))
+
+    def test_matches_offset_order(self, db_session: Session, users: list[User]) -> None:
+        """Test that cursor and offset pagination return the same order."""
+        repo = UserRepository(db_session)
+        first = repo.list_page(limit=2)
+        second = repo.list_page(cursor=first.next_cursor, limit=2)
+
+        assert [u.id for u in first.items + second.items] == [
+            u.id for u in repo.list(limit=4)
+        ]
+        assert [u.id for u in second.items] == [
+            u.id for u in repo.list(skip=2, limit=2)
+        ]
+
+    def test_last_page_has_no_cursor(
+        self, db_session: Session, users: list[User]
+    ) -> None:
+        """Test that next_cursor is None once all rows are returned."""
+        page = UserRepository(db_session).list_page(limit=5)
+
+        assert len(page.items) == 5
+        assert page.next_cursor is None
+
+    def test_cursor_with_skip_rejected(
+        self, db_session: Session, users: list[User]
+    ) -> None:
+        """Test that combining cursor and skip is rejected."""
+        repo = UserRepository(db_session)
+        cursor = repo.list_page(limit=1).next_cursor
+
+        with pytest.raises(InvalidCursorError):
+            repo._page(db_session.query(User), cursor=cursor, skip=1, limit=1)
+
+
+class TestRepositoryDeclaration:
+    """Test that repositories must declare model and read_schema."""
+
+    def test_missing_model_fails_at_definition(self) -> None:
+        """Test that a repository without model is rejected when defined."""
+        with pytest.raises(TypeError, match="must set model and read_schema"):
+
+            class IncompleteRepository(BaseRepository):
+                pass
+
+    def test_abstract_base_may_omit_model(self) -> None:
+        """Test that intermediate bases can opt out with abstract=True."""
+
+        class IntermediateRepository(BaseRepository, abstract=True):
+            pass
+
+        with pytest.raises(TypeError, match="must set read_schema"):
+
+            class PartialRepository(IntermediateRepository):
+                model = User
@@ -0,0 +1,84 @@
+"""Unit tests for connection pool telemetry."""
+from pathlib import Path
+from typing import cast
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy import exc as sa_exc
+from sqlalchemy import text
+from sqlalchemy.engine import Engine
+
+from app.core.database.pool_metrics import (
+    InstrumentedQueuePool,
+    PoolMetrics,
+    get_pool_report,
+)
+
+
+@pytest.fixture
+def instrumented_engine(tmp_path: Path) -> Engine:
+    """Create a one-connection SQLite engine reporting to PoolMetrics."""
+    engine = create_engine(
+        f"sqlite:///{tmp_path}/pool.db",
+        poolclass=InstrumentedQueuePool,
+        pool_size=1,
+        max_overflow=0,
+        pool_timeout=0.05,
+    )
+    PoolMetrics("test").instrument(engine)
+    return engine
+
+
+def pool_metrics(engine: Engine) -> PoolMetrics:
+    """Return the metrics object bound to the engine's current pool."""
+    metrics = cast(InstrumentedQueuePool, engine.pool).metrics
+    assert metrics is not None
+    return metrics
+
+
+class TestPoolMetrics:
+    """Test PoolMetrics counters and snapshots."""
+
+    def test_counts_checkouts_and_checkins(self, instrumented_engine: Engine) -> None:
+        """Test that each connection use is counted once."""
+        metrics = pool_metrics(instrumented_engine)
+        for _ in range(3):
+            with instrumented_engine.connect() as conn:
+                conn.execute(text("SELECT 1"))
+
+        snapshot = metrics.snapshot()
+        assert snapshot["checkouts"] == 3
+        assert snapshot["checkins"] == 3
+        assert snapshot["connects"] == 1
+        assert snapshot["checked_out"] == 0
+        assert snapshot["peak_checked_out"] == 1
+        assert snapshot["wait_time_max_ms"] >= 0
+
+    def test_records_checkout_timeout(self, instrumented_engine: Engine) -> None:
+        """Test that pool exhaustion is recorded as a timeout."""
+        metrics = pool_metrics(instrumented_engine)
+        with instrumented_engine.connect():
+            with pytest.raises(sa_exc.TimeoutError):
+                instrumented_engine.connect()
+
+        snapshot = metrics.snapshot()
+        assert snapshot["timeouts"] == 1
+        assert snapshot["wait_time_max_ms"] >= 50
+
+    def test_metrics_survive_dispose(self, instrumented_engine: Engine) -> None:
+        """Test that the recreated pool keeps reporting to the same metrics."""
+        metrics = pool_metrics(instrumented_engine)
+        instrumented_engine.dispose()
+
+        assert pool_metrics(instrumented_engine) is metrics
+        with instrumented_engine.connect():
+            pass
+        assert metrics.snapshot()["checkouts"] == 1
+
+    def test_pool_report_includes_pid(self, instrumented_engine: Engine) -> None:
+        """Test the combined report payload."""
+        report = get_pool_report(pool_metrics(instrumented_engine))
+
+        assert isinstance(report["pid"], int)
+        assert report["pools"][0]["name"] == "test"
+        assert report["pools"][0]["pool_class"] == "InstrumentedQueuePool"
@@ -0,0 +1,94 @@
+"""Unit tests for page-at-a-time row validation and page responses."""
+import json
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.core.constants import NEXT_CURSOR_HEADER
+from app.core.models.order import Order
+from app.core.models.user import User
+from app.core.repositories.pagination import build_page, paginate
+from app.core.repositories.rows import (
+    list_adapter,
+    select_rows,
+    validate_objects,
+    validate_rows,
+)
+from app.core.schemas.order import OrderWithDetails
+from app.core.schemas.user import UserRead
+from app.core.serialization import page_response
+
+
+@pytest.fixture
+def users(db_session: Session) -> list[User]:
+    """Create three users."""
+    created = [
+        User(phone=f"+1555000000{index}", first_name=f"User {index}")
+        for index in range(3)
+    ]
+    db_session.add_all(created)
+    db_session.commit()
+    return created
+
+
+class TestSelectRows:
+    """Test column selection and validation of row tuples."""
+
+    def test_selects_schema_columns_only(self) -> None:
+        """Test that the select reads exactly the schema's fields."""
+        statement = select_rows(User, UserRead)
+
+        assert [column.name for column in statement.selected_columns] == list(
+            UserRead.model_fields
+        )
+
+    def test_nested_schema_is_rejected(self) -> None:
+        """Test that relation fields cannot be read from row tuples."""
+        with pytest.raises(TypeError, match="customer"):
+            select_rows(Order, OrderWithDetails)
+
+    def test_rows_match_orm_objects(
+        self, db_session: Session, users: list[User]
+    ) -> None:
+        """Test that the row path produces the same schemas as the ORM path."""
+        rows = db_session.execute(
+            paginate(select_rows(User, UserRead), User, limit=10)
+        ).all()
+        objects = db_session.scalars(paginate(select(User), User, limit=10)).all()
+
+        assert len(rows) == 3
+        assert validate_rows(UserRead, rows) == validate_objects(UserRead, objects)
+
+    def test_adapter_is_shared(self) -> None:
+        """Test that each schema gets one list adapter."""
+        assert list_adapter(UserRead) is list_adapter(UserRead)
+
+
+class TestPageResponse:
+    """Test JSON encoding of validated pages."""
+
+    def test_body_and_cursor_header(
+        self, db_session: Session, users: list[User]
+    ) -> None:
+        """Test that the body matches pydantic's JSON and the cursor is sent."""
+        rows = db_session.execute(
+            paginate(select_rows(User, UserRead), User, limit=2)
+        ).all()
+        page = build_page(rows, limit=2)
+        page.items = validate_rows(UserRead, page.items)
+
+        response = page_response(UserRead, page)
+
+        assert response.media_type == "application/json"
+        assert json.loads(response.body) == json.loads(
+            list_adapter(UserRead).dump_json(page.items)
+        )
+        assert response.headers[NEXT_CURSOR_HEADER] == page.next_cursor
+
+    def test_last_page_has_no_cursor_header(self) -> None:
+        """Test that an empty final page sends no cursor."""
+        response = page_response(UserRead, build_page([], limit=2))
+
+        assert response.body == b"[]"
+        assert NEXT_CURSOR_HEADER not in response.headers
@@ -0,0 +1,109 @@
+"""Unit tests for the search indexes and search cursors."""
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.orm import Session
+from sqlalchemy.schema import CreateIndex
+
+from app.core.models import Base
+from app.core.models.organization import Organization
+from app.core.models.search import SearchType
+from app.core.repositories.exceptions import InvalidCursorError
+from app.core.repositories.search_repository import (
+    decode_search_cursor,
+    encode_search_cursor,
+)
+from tests.conftest import engine
+
+
+def trigram_indexes() -> list:
+    return [
+        index
+        for table in Base.metadata.sorted_tables
+        for index in table.indexes
+        if index.name and index.name.endswith("_trgm")
+    ]
+
+
+class TestTrigramIndexes:
+    """Test the PostgreSQL trigram indexes."""
+
+    def test_every_searched_column_has_a_gin_index(self) -> None:
+        """Test the DDL of the trigram indexes."""
+        ddl = {
+            str(CreateIndex(index).compile(dialect=postgresql.dialect()))
+            for index in trigram_indexes()
+        }
+
+        assert len(ddl) == 15
+        assert (
+            "CREATE INDEX ix_organizations_name_trgm ON organizations "
+            "USING gin (name gin_trgm_ops)"
+        ) in ddl
+
+    def test_are_not_created_on_sqlite(self, db_session: Session) -> None:
+        """Test that SQLite gets FTS5 tables instead of trigram indexes."""
+        names = set(db_session.scalars(text("SELECT name FROM sqlite_master")).all())
+
+        assert not names & {index.name for index in trigram_indexes()}
+        assert {
+            "organizations_search",
+            "stores_search",
+            "users_search",
+            "iot_controllers_search",
+        } <= names
+
+
+class TestFtsTables:
+    """Test the SQLite FTS5 tables."""
+
+    def test_rows_created_before_the_index_are_indexed(
+        self, db_session: Session
+    ) -> None:
+        """Test that creating a missing FTS5 table fills it from its table."""
+        db_session.add(
+            Organization(
+                name="Backfill Laundry",
+                billing_address="1 Org St",
+                city="Austin",
+                state="TX",
+                postal_code="78701",
+                country="US",
+            )
+        )
+        db_session.commit()
+        db_session.execute(text("DROP TABLE organizations_search"))
+        db_session.commit()
+
+        Base.metadata.create_all(bind=engine)
+        Base.metadata.create_all(bind=engine)
+
+        matches = db_session.scalars(
+            text(
+                "SELECT name FROM organizations_search "
+                "WHERE organizations_search MATCH '\"backfill\"'"
+            )
+        ).all()
+        assert matches == ["Backfill Laundry"]
+
+
+class TestSearchCursor:
+    """Test encoding and decoding of search cursors."""
+
+    def test_round_trips(self) -> None:
+        """Test that a cursor decodes to the position it encodes."""
+        entity_id = uuid4()
+        cursor = encode_search_cursor(0.1 + 0.2, SearchType.STORE, entity_id)
+
+        assert decode_search_cursor(cursor) == (0.1 + 0.2, SearchType.STORE, entity_id)
+
+    @pytest.mark.parametrize(
+        "cursor",
+        ["not-a-cursor", encode_search_cursor(1.0, SearchType.USER, "x")],
+    )
+    def test_rejects_malformed_cursors(self, cursor: str) -> None:
+        """Test that malformed cursors raise InvalidCursorError."""
+        with pytest.raises(InvalidCursorError):
+            decode_search_cursor(cursor)
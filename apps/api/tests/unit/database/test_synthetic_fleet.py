@@ -0,0 +1,207 @@
+"""Unit tests for the synthetic fleet generator."""
+from datetime import datetime, timezone
+from typing import Any, Sequence
+from uuid import UUID
+
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+
+from app.core.models import Base
+from app.core.models.address import Address
+from app.core.models.iot_controller import IoTController
+from app.core.models.order import Order, OrderStatus
+from app.core.models.order_item import OrderItem
+from app.core.models.user import User
+from app.core.models.user_store import UserStore
+from app.dev.synthetic_fleet import FleetSpec, OrderBatch, _copy_value, generate_fleet
+from tests.conftest import engine
+
+UNTIL = datetime(2026, 1, 1, tzinfo=timezone.utc)
+SPEC = FleetSpec(
+    organizations=2,
+    stores_per_organization=3,
+    controllers_per_store=4,
+    staff_per_store=2,
+    customers=20,
+    addresses_per_customer=2,
+    orders=150,
+    items_per_order=2,
+    notifications_per_order=1,
+    days=30,
+    seed=7,
+    batch_size=100,
+)
+
+
+def count(session: Session, model: Any) -> int:
+    return session.scalar(select(func.count()).select_from(model)) or 0
+
+
+def order_rows(session: Session) -> Sequence[Any]:
+    return session.execute(select(Order.__table__).order_by(Order.id)).all()
+
+
+class TestGenerateFleet:
+    """Test generate_fleet against the SQLite test database."""
+
+    def test_writes_the_rows_of_the_spec(self, db_session: Session) -> None:
+        """Test that every table gets the number of rows the spec describes."""
+        counts = generate_fleet(engine, SPEC, UNTIL)
+
+        assert counts == SPEC.row_counts()
+        for table in Base.metadata.sorted_tables:
+            if table.name in counts:
+                assert count(db_session, table) == counts[table.name]
+
+    def test_orders_reference_their_customers_addresses(
+        self, db_session: Session
+    ) -> None:
+        """Test that pickup and delivery addresses belong to the customer."""
+        generate_fleet(engine, SPEC, UNTIL)
+
+        owners = dict(
+            db_session.execute(select(Address.id, Address.customer_id)).tuples().all()
+        )
+        for order in order_rows(db_session):
+            assert owners[order.pickup_address_id] == order.customer_id
+            assert owners[order.delivery_address_id] == order.customer_id
+
+    def test_order_totals_match_items(self, db_session: Session) -> None:
+        """Test that order totals are the sum of their items."""
+        generate_fleet(engine, SPEC, UNTIL)
+
+        item_totals = dict(
+            db_session.execute(
+                select(OrderItem.order_id, func.sum(OrderItem.total_price)).group_by(
+                    OrderItem.order_id
+                )
+            )
+            .tuples()
+            .all()
+        )
+        for order in order_rows(db_session):
+            assert order.total_amount == round(item_totals[order.id], 2)
+
+    def test_orders_are_created_oldest_first(self, db_session: Session) -> None:
+        """Test that order ids follow creation time within the window."""
+        generate_fleet(engine, SPEC, UNTIL)
+
+        created = [order.created_at for order in order_rows(db_session)]
+        assert created == sorted(created)
+        assert created[0] >= datetime(2025, 12, 2)
+        assert created[-1] < datetime(2026, 1, 1)
+
+    def test_only_recent_orders_are_open(self, db_session: Session) -> None:
+        """Test that orders older than a few days are delivered or cancelled."""
+        generate_fleet(engine, SPEC, UNTIL)
+
+        for order in order_rows(db_session):
+            if order.created_at < datetime(2025, 12, 28):
+                assert order.status in (OrderStatus.DELIVERED, OrderStatus.CANCELLED)
+
+    def test_staff_and_controllers_are_linked_to_stores(
+        self, db_session: Session
+    ) -> None:
+        """Test that each store has its owner, operators and controllers."""
+        generate_fleet(engine, SPEC, UNTIL)
+
+        links = db_session.execute(
+            select(UserStore.store_id, func.count()).group_by(UserStore.store_id)
+        ).all()
+        controllers = db_session.execute(
+            select(IoTController.store_id, func.count()).group_by(
+                IoTController.store_id
+            )
+        ).all()
+        assert len(links) == 6
+        assert {links_count for _, links_count in links} == {1 + SPEC.staff_per_store}
+        assert {n for _, n in controllers} == {SPEC.controllers_per_store}
+
+    def test_same_seed_generates_the_same_rows(self, db_session: Session) -> None:
+        """Test that a fleet is reproducible from its seed."""
+        generate_fleet(engine, SPEC, UNTIL)
+        first = order_rows(db_session)
+        first_users = db_session.scalars(select(User.id).order_by(User.phone)).all()
+
+        Base.metadata.drop_all(bind=engine)
+        Base.metadata.create_all(bind=engine)
+        generate_fleet(engine, SPEC, UNTIL)
+
+        assert order_rows(db_session) == first
+        assert db_session.scalars(select(User.id).order_by(User.phone)).all() == (
+            first_users
+        )
+
+    def test_second_fleet_is_added_after_the_first(self, db_session: Session) -> None:
+        """Test that generating into a populated database does not collide."""
+        generate_fleet(engine, SPEC, UNTIL)
+        generate_fleet(engine, FleetSpec(**{**SPEC.__dict__, "seed": 8}), UNTIL)
+
+        assert count(db_session, Order) == 2 * SPEC.orders
+        assert count(db_session, User) == 2 * SPEC.row_counts()["users"]
+
+    def test_empty_spec_writes_nothing(self, db_session: Session) -> None:
+        """Test that a spec of zeros only seeds the service catalog."""
+        counts = generate_fleet(
+            engine, FleetSpec(organizations=0, customers=0, orders=0), UNTIL
+        )
+
+        assert counts == {}
+        assert count(db_session, User) == 0
+
+
+class TestOrderBatch:
+    """Test order batch generation without a database."""
+
+    def batch(self, start: int, stop: int) -> OrderBatch:
+        return OrderBatch(
+            spec=SPEC,
+            until=UNTIL,
+            customer_base=1,
+            address_base=1,
+            order_base=1,
+            item_base=1,
+            notification_base=1,
+            services=((1, 12.0), (2, 8.5)),
+            indexes=range(start, stop),
+        )
+
+    def test_batches_do_not_depend_on_each_other(self) -> None:
+        """Test that a batch generates the same rows on its own."""
+        assert self.batch(100, 150).rows() == self.batch(100, 150).rows()
+        assert self.batch(0, 50).rows() != self.batch(50, 100).rows()
+
+    def test_ids_are_contiguous(self) -> None:
+        """Test that item and notification ids follow the order index."""
+        orders, items, notifications = self.batch(10, 20).rows()
+
+        assert [row[0] for row in orders] == list(range(11, 21))
+        assert [row[0] for row in items] == list(range(21, 41))
+        assert [row[0] for row in notifications] == list(range(11, 21))
+
+
+class TestCopyValue:
+    """Test rendering of values in PostgreSQL's COPY text format."""
+
+    def test_renders_null_and_booleans(self) -> None:
+        """Test NULL and boolean values."""
+        assert _copy_value(None) == "\\N"
+        assert _copy_value(True) == "t"
+        assert _copy_value(False) == "f"
+
+    def test_renders_enum_names(self) -> None:
+        """Test that enums are written by member name, as SQLAlchemy stores them."""
+        assert _copy_value(OrderStatus.OUT_FOR_DELIVERY) == "OUT_FOR_DELIVERY"
+
+    def test_renders_uuids_numbers_and_datetimes(self) -> None:
+        """Test UUID, number and datetime values."""
+        value = UUID("12345678-1234-5678-1234-567812345678")
+        assert _copy_value(value) == "12345678-1234-5678-1234-567812345678"
+        assert _copy_value(42) == "42"
+        assert _copy_value(12.5) == "12.5"
+        assert _copy_value(UNTIL) == "2026-01-01T00:00:00+00:00"
+
+    def test_escapes_special_characters(self) -> None:
+        """Test that backslashes, tabs and newlines are escaped."""
+        assert _copy_value("a\\b\tc\nd\re") == "a\\\\b\\tc\\nd\\re"
+        assert _copy_value("plain") == "plain"
@@ -0,0 +1,147 @@
+"""Unit tests for units of work spanning repository calls."""
+import asyncio
+
+import pytest
+from sqlalchemy import event, func, select
+from sqlalchemy.orm import Session
+
+from app.core.models.organization import Organization
+from app.core.models.user import User
+from app.core.repositories.organization_repository import AsyncOrganizationRepository
+from app.core.repositories.unit_of_work import (
+    AsyncUnitOfWork,
+    UnitOfWork,
+    in_unit_of_work,
+)
+from app.core.repositories.user_repository import UserRepository
+from app.core.schemas.organization import OrganizationCreate
+from app.core.schemas.user import UserCreate, UserUpdate
+from tests.conftest import TestingAsyncSessionLocal
+
+
+def count_commits(session: Session) -> list[int]:
+    commits: list[int] = []
+    event.listen(session, "after_commit", lambda _: commits.append(1))
+    return commits
+
+
+def user_count(session: Session) -> int:
+    return session.scalar(select(func.count()).select_from(User)) or 0
+
+
+class TestUnitOfWork:
+    """Test deferred commits on a sync session."""
+
+    def test_repositories_commit_on_their_own_outside(
+        self, db_session: Session
+    ) -> None:
+        """Test that each write commits when no unit is open."""
+        commits = count_commits(db_session)
+        repo = UserRepository(db_session)
+
+        user = repo.create(UserCreate(phone="+15550000001"))
+        repo.update(user.id, UserUpdate(first_name="Ada"))
+
+        assert len(commits) == 2
+
+    def test_writes_commit_once_on_exit(self, db_session: Session) -> None:
+        """Test that writes inside a unit share one commit."""
+        commits = count_commits(db_session)
+        repo = UserRepository(db_session)
+
+        with UnitOfWork(db_session):
+            user = repo.create(UserCreate(phone="+15550000001"))
+            updated = repo.update(user.id, UserUpdate(first_name="Ada"))
+            repo.create(UserCreate(phone="+15550000002"))
+            assert commits == []
+
+        assert len(commits) == 1
+        assert updated.first_name == "Ada"
+        assert updated.created_at is not None
+        assert user_count(db_session) == 2
+
+    def test_exception_rolls_back_every_write(self, db_session: Session) -> None:
+        """Test that a failure discards all writes in the unit."""
+        repo = UserRepository(db_session)
+
+        with pytest.raises(RuntimeError):
+            with UnitOfWork(db_session):
+                repo.create(UserCreate(phone="+15550000001"))
+                raise RuntimeError("step failed")
+
+        assert user_count(db_session) == 0
+        assert not in_unit_of_work(db_session)
+
+    def test_nested_unit_joins_outer(self, db_session: Session) -> None:
+        """Test that only the outermost unit commits."""
+        commits = count_commits(db_session)
+        repo = UserRepository(db_session)
+
+        with UnitOfWork(db_session):
+            with UnitOfWork(db_session):
+                repo.create(UserCreate(phone="+15550000001"))
+            assert commits == []
+            assert in_unit_of_work(db_session)
+
+        assert len(commits) == 1
+        assert not in_unit_of_work(db_session)
+
+    def test_reentered_unit_commits_on_outer_exit(self, db_session: Session) -> None:
+        """Test that entering the same unit again leaves the commit to the outer."""
+        commits = count_commits(db_session)
+        repo = UserRepository(db_session)
+        unit = UnitOfWork(db_session)
+
+        with unit:
+            with unit:
+                repo.create(UserCreate(phone="+15550000001"))
+            assert commits == []
+            repo.create(UserCreate(phone="+15550000002"))
+
+        assert len(commits) == 1
+        assert user_count(db_session) == 2
+        assert not in_unit_of_work(db_session)
+
+        with unit:
+            repo.create(UserCreate(phone="+15550000003"))
+
+        assert len(commits) == 2
+
+
+class TestAsyncUnitOfWork:
+    """Test deferred commits on an async session."""
+
+    def organization(self, name: str) -> OrganizationCreate:
+        return OrganizationCreate(
+            name=name,
+            billing_address="1 Main St",
+            city="Springfield",
+            state="IL",
+            postal_code="62701",
+            country="US",
+        )
+
+    def test_commit_and_rollback(self, db_session: Session) -> None:
+        """Test one commit on success and no rows after a failure."""
+
+        async def scenario() -> tuple[int, str]:
+            async with TestingAsyncSessionLocal() as session:
+                commits = count_commits(session.sync_session)
+                repo = AsyncOrganizationRepository(session)
+                async with AsyncUnitOfWork(session):
+                    first = await repo.create(self.organization("First"))
+                    await repo.create(self.organization("Second"))
+                try:
+                    async with AsyncUnitOfWork(session):
+                        await repo.create(self.organization("Third"))
+                        raise RuntimeError("step failed")
+                except RuntimeError:
+                    pass
+                return len(commits), first.name
+
+        commits, name = asyncio.run(scenario())
+
+        assert commits == 1
+        assert name == "First"
+        names = db_session.scalars(select(Organization.name)).all()
+        assert sorted(names) == ["First", "Second"]
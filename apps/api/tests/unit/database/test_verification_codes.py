@@ -0,0 +1,158 @@
+"""Unit tests for verification code consumption, retention and indexing."""
+import asyncio
+from datetime import datetime, timedelta, timezone
+from typing import Any
+
+from sqlalchemy import event, text
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.orm import Session
+
+from app.auth.verification_codes import (
+    purge_expired_codes,
+    upsert_user_statement,
+    verify_code,
+)
+from app.core.models.user import User
+from app.core.models.verification_code import VerificationCode
+from tests.conftest import TestingAsyncSessionLocal, engine
+
+
+def _code(phone: str, expires_in: timedelta, is_used: bool = False) -> VerificationCode:
+    return VerificationCode(
+        phone=phone,
+        code="123456",
+        expires_at=datetime.now(timezone.utc) + expires_in,
+        is_used=is_used,
+    )
+
+
+class TestVerifyCode:
+    """Test consuming a code and upserting its user in one transaction."""
+
+    def test_new_phone_creates_user_in_two_statements(
+        self, db_session: Session
+    ) -> None:
+        """Test that a first login is one UPDATE and one INSERT."""
+        db_session.add(_code("+15550001111", timedelta(minutes=5)))
+        db_session.commit()
+        statements: list[str] = []
+
+        def record(*args: Any) -> None:
+            statements.append(args[2].split()[0])
+
+        event.listen(engine, "before_cursor_execute", record)
+        try:
+            user = verify_code(db_session, "+15550001111", "123456")
+        finally:
+            event.remove(engine, "before_cursor_execute", record)
+
+        assert user is not None
+        assert user.phone == "+15550001111"
+        assert user.is_active is True
+        assert statements == ["UPDATE", "INSERT"]
+        assert db_session.query(VerificationCode).one().is_used is True
+
+    def test_existing_user_is_returned(self, db_session: Session) -> None:
+        """Test that a returning user gets their own row back, unchanged."""
+        existing = User(phone="+15550001111", first_name="Ada", is_admin=True)
+        db_session.add_all([existing, _code("+15550001111", timedelta(minutes=5))])
+        db_session.commit()
+
+        user = verify_code(db_session, "+15550001111", "123456")
+
+        assert user is not None
+        assert user.id == existing.id
+        assert user.first_name == "Ada"
+        assert user.is_admin is True
+        assert db_session.query(User).count() == 1
+
+    def test_code_can_only_be_used_once(self, db_session: Session) -> None:
+        """Test that a second verify of the same code fails."""
+        db_session.add(_code("+15550001111", timedelta(minutes=5)))
+        db_session.commit()
+
+        first = verify_code(db_session, "+15550001111", "123456")
+        second = verify_code(db_session, "+15550001111", "123456")
+
+        assert first is not None
+        assert second is None
+
+    def test_invalid_codes_create_no_user(self, db_session: Session) -> None:
+        """Test that wrong, expired and used codes are rejected."""
+        db_session.add_all(
+            [
+                _code("+15550001111", timedelta(minutes=-1)),
+                _code("+15550002222", timedelta(minutes=5), is_used=True),
+                _code("+15550003333", timedelta(minutes=5)),
+            ]
+        )
+        db_session.commit()
+
+        assert verify_code(db_session, "+15550001111", "123456") is None
+        assert verify_code(db_session, "+15550002222", "123456") is None
+        assert verify_code(db_session, "+15550003333", "000000") is None
+        assert db_session.query(User).count() == 0
+
+    def test_postgresql_upsert(self) -> None:
+        """Test the upsert SQL on PostgreSQL."""
+        sql = str(
+            upsert_user_statement("postgresql", "+15550001111").compile(
+                dialect=postgresql.dialect()
+            )
+        )
+
+        assert "ON CONFLICT (phone) DO UPDATE SET phone = excluded.phone" in sql
+        assert "RETURNING users.id" in sql
+
+
+class TestVerificationCodeRetention:
+    """Test batched deletion of expired verification codes."""
+
+    def test_purge_deletes_only_codes_past_retention(self, db_session: Session) -> None:
+        """Test that old codes go in batches and recent ones stay."""
+        old = [_code(f"+1555000{i:04d}", timedelta(days=-2)) for i in range(5)]
+        old.append(_code("+15550009999", timedelta(days=-2), is_used=True))
+        recently_expired = _code("+15551110000", timedelta(minutes=-5))
+        active = _code("+15552220000", timedelta(minutes=5))
+        db_session.add_all([*old, recently_expired, active])
+        db_session.commit()
+
+        deleted = asyncio.run(
+            purge_expired_codes(
+                TestingAsyncSessionLocal, retention_seconds=3600, batch_size=4
+            )
+        )
+
+        assert deleted == 6
+        db_session.expire_all()
+        remaining = {code.phone for code in db_session.query(VerificationCode)}
+        assert remaining == {"+15551110000", "+15552220000"}
+
+    def test_purge_with_nothing_to_delete(self, db_session: Session) -> None:
+        """Test that a sweep over fresh codes deletes nothing."""
+        db_session.add(_code("+15552220000", timedelta(minutes=5)))
+        db_session.commit()
+
+        deleted = asyncio.run(
+            purge_expired_codes(
+                TestingAsyncSessionLocal, retention_seconds=3600, batch_size=100
+            )
+        )
+
+        assert deleted == 0
+
+
+class TestVerificationCodeIndexes:
+    """Test that OTP lookups use the partial index on unused codes."""
+
+    def test_verify_lookup_uses_active_index(self, db_session: Session) -> None:
+        """Test the query plan of the verify_otp lookup."""
+        plan = db_session.execute(
+            text(
+                "EXPLAIN QUERY PLAN SELECT id FROM verification_codes "
+                "WHERE phone = '+15550000000' AND code = '123456' "
+                "AND is_used = 0 AND expires_at > '2024-01-01'"
+            )
+        ).all()
+
+        assert "ix_verification_codes_active" in str(plan)
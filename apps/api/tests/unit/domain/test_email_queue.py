@@ -0,0 +1,217 @@
+"""Unit tests for the outbound email queue against a fake SendGrid server."""
+import asyncio
+from contextlib import suppress
+from typing import Any
+from uuid import uuid4
+
+import httpx
+import pytest
+from fastapi import FastAPI, Request, Response
+from sendgrid.helpers.mail import Mail  # type: ignore[import-untyped]
+
+from app.core.services.email_queue import EmailQueue
+
+
+class RecordingSession:
+    """Async session stand-in that records executed statements."""
+
+    statements: list[Any] = []
+
+    async def __aenter__(self) -> "RecordingSession":
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        return None
+
+    async def execute(self, statement: Any) -> None:
+        self.statements.append(statement)
+
+    async def commit(self) -> None:
+        return None
+
+
+class FakeSendGrid:
+    """Local SendGrid v3 stand-in replying with scripted status codes."""
+
+    def __init__(self, statuses: list[int] | None = None) -> None:
+        self.statuses = list(statuses or [])
+        self.requests: list[dict[str, Any]] = []
+        self.app = FastAPI()
+        self.app.post("/v3/mail/send")(self.send)
+
+    async def send(self, request: Request) -> Response:
+        self.requests.append(
+            {
+                "authorization": request.headers.get("authorization"),
+                "body": await request.json(),
+            }
+        )
+        status_code = self.statuses.pop(0) if self.statuses else 202
+        headers = {"Retry-After": "0"} if status_code == 429 else None
+        return Response(status_code=status_code, headers=headers)
+
+    def queue(self, **kwargs: Any) -> EmailQueue:
+        kwargs.setdefault("retry_base_delay", 0.0)
+        return EmailQueue(
+            api_key="test-api-key",
+            host="http://sendgrid.test",
+            transport=httpx.ASGITransport(app=self.app),
+            **kwargs,
+        )
+
+
+def _message(index: int = 0) -> Mail:
+    return Mail(
+        from_email="noreply@laundromate.com",
+        to_emails=f"owner{index}@example.com",
+        subject="Invitation",
+        html_content="<p>Hello</p>",
+        plain_text_content="Hello",
+    )
+
+
+def _run_workers(queue: EmailQueue, session_factory: Any = None) -> None:
+    """Run the worker pool until the queue is empty."""
+
+    async def scenario() -> None:
+        workers = asyncio.create_task(queue.run(session_factory))
+        # Let run() rebind the queue to this loop before joining it
+        await asyncio.sleep(0)
+        await queue.join()
+        workers.cancel()
+        with suppress(asyncio.CancelledError):
+            await workers
+
+    asyncio.run(scenario())
+
+
+class TestEmailQueue:
+    """Test queued delivery, retries and backpressure."""
+
+    def test_queued_messages_are_delivered(self) -> None:
+        """Test that workers post every queued message with the API key."""
+        sendgrid = FakeSendGrid()
+        queue = sendgrid.queue(workers=2)
+        for index in range(5):
+            assert queue.enqueue(_message(index)) is True
+
+        _run_workers(queue)
+
+        assert len(sendgrid.requests) == 5
+        assert {
+            r["body"]["personalizations"][0]["to"][0]["email"]
+            for r in sendgrid.requests
+        } == {f"owner{index}@example.com" for index in range(5)}
+        assert all(
+            r["authorization"] == "Bearer test-api-key" for r in sendgrid.requests
+        )
+        assert queue.stats()["sent"] == 5
+        assert len(queue) == 0
+
+    def test_transient_failures_are_retried(self) -> None:
+        """Test that 5xx and 429 responses are retried until accepted."""
+        sendgrid = FakeSendGrid(statuses=[503, 429, 202])
+        queue = sendgrid.queue(workers=1)
+        queue.enqueue(_message())
+
+        _run_workers(queue)
+
+        stats = queue.stats()
+        assert len(sendgrid.requests) == 3
+        assert stats["sent"] == 1
+        assert stats["retries"] == 2
+        assert stats["failed"] == 0
+
+    def test_gives_up_after_max_attempts(self) -> None:
+        """Test that a message failing every attempt is counted as failed."""
+        sendgrid = FakeSendGrid(statuses=[500, 500, 500])
+        queue = sendgrid.queue(workers=1, max_attempts=3)
+        queue.enqueue(_message())
+
+        _run_workers(queue)
+
+        assert len(sendgrid.requests) == 3
+        assert queue.stats()["failed"] == 1
+        assert queue.stats()["sent"] == 0
+
+    def test_client_errors_are_not_retried(self) -> None:
+        """Test that a 4xx other than 429 fails without retrying."""
+        sendgrid = FakeSendGrid(statuses=[400])
+        queue = sendgrid.queue(workers=1)
+        queue.enqueue(_message())
+
+        _run_workers(queue)
+
+        assert len(sendgrid.requests) == 1
+        assert queue.stats()["failed"] == 1
+        assert queue.stats()["retries"] == 0
+
+    def test_full_queue_drops_message(self) -> None:
+        """Test that enqueue reports a full queue instead of blocking."""
+        queue = FakeSendGrid().queue(max_size=1)
+
+        assert queue.enqueue(_message(0)) is True
+        assert queue.enqueue(_message(1)) is False
+        assert queue.stats()["dropped"] == 1
+
+    def test_missing_api_key_raises(self) -> None:
+        """Test that enqueue fails fast without a SendGrid API key."""
+        queue = EmailQueue(api_key="")
+
+        with pytest.raises(RuntimeError, match="SENDGRID_API_KEY"):
+            queue.enqueue(_message())
+
+    def test_shutdown_sends_remaining_messages(self) -> None:
+        """Test that cancelling the workers still delivers queued messages."""
+        sendgrid = FakeSendGrid(statuses=[503])
+        queue = sendgrid.queue(workers=1, retry_base_delay=60.0)
+
+        async def scenario() -> None:
+            workers = asyncio.create_task(queue.run())
+            for index in range(3):
+                queue.enqueue(_message(index))
+            # First message is now waiting out its retry delay
+            while not sendgrid.requests:
+                await asyncio.sleep(0)
+            workers.cancel()
+            with suppress(asyncio.CancelledError):
+                await workers
+
+        asyncio.run(scenario())
+
+        delivered = [
+            r["body"]["personalizations"][0]["to"][0]["email"]
+            for r in sendgrid.requests
+        ]
+        assert sorted(set(delivered)) == [f"owner{i}@example.com" for i in range(3)]
+        assert queue.stats()["sent"] == 3
+
+    def test_sent_invitation_is_recorded(self) -> None:
+        """Test that a delivered invitation email marks the invitation sent."""
+        RecordingSession.statements = []
+        sendgrid = FakeSendGrid()
+        queue = sendgrid.queue(workers=1)
+        invitation_id = uuid4()
+        queue.enqueue(_message(), invitation_ids=[invitation_id])
+        assert queue.tracks(invitation_id)
+
+        _run_workers(queue, RecordingSession)
+
+        assert len(RecordingSession.statements) == 1
+        statement = RecordingSession.statements[0]
+        assert statement.table.name == "invitations"
+        assert "email_sent_at" in str(statement)
+        assert not queue.tracks(invitation_id)
+
+    def test_rejected_invitation_is_not_recovered_again(self) -> None:
+        """Test that invitations SendGrid refuses are not re-queued forever."""
+        RecordingSession.statements = []
+        sendgrid = FakeSendGrid(statuses=[400])
+        queue = sendgrid.queue(workers=1)
+        invitation_id = uuid4()
+        queue.enqueue(_message(), invitation_ids=[invitation_id])
+
+        _run_workers(queue, RecordingSession)
+
+        assert RecordingSession.statements == []
+        assert queue.tracks(invitation_id)
@@ -1,5 +1,6 @@
 """Unit tests for email service."""
-from unittest.mock import MagicMock, patch
+from typing import Sequence
+from uuid import UUID
 
 import pytest
 from sendgrid.helpers.mail import Mail
@@ -11,6 +12,21 @@ from app.core.models.store import Store
 from app.core.services.email_service import EmailService
 
 
+class CapturingQueue:
+    """Outbound queue stand-in that keeps queued messages."""
+
+    def __init__(self, accept: bool = True) -> None:
+        self.accept = accept
+        self.messages: list[Mail] = []
+        self.invitation_ids: list[tuple[UUID, ...]] = []
+
+    def enqueue(self, message: Mail, invitation_ids: Sequence[UUID] = ()) -> bool:
+        if self.accept:
+            self.messages.append(message)
+            self.invitation_ids.append(tuple(invitation_ids))
+        return self.accept
+
+
 class TestEmailService:
     """Test email service functionality."""
 
@@ -28,26 +44,8 @@ class TestEmailService:
         """Create test template renderer for EmailService."""
         return InvitationTemplateRenderer()
 
-    @patch("app.core.services.email_service.SendGridAPIClient")
-    @patch.dict(
-        "os.environ",
-        {
-            "SENDGRID_API_KEY": "test-api-key",
-            "FROM_EMAIL": "noreply@laundromate.com",
-            "FRONTEND_URL": "https://app.laundromate.com",
-        },
-    )
-    def test_send_invitation_email_success(
-        self, mock_sendgrid_client_class: MagicMock, db_session
-    ) -> None:
-        """Test successfully sending an invitation email."""
-        # Setup mock
-        mock_sendgrid_client = MagicMock()
-        mock_sendgrid_client_class.return_value = mock_sendgrid_client
-        mock_response = MagicMock()
-        mock_response.status_code = 202
-        mock_sendgrid_client.send.return_value = mock_response
-
+    def test_send_invitation_email_success(self, db_session) -> None:
+        """Test successfully queueing an invitation email."""
         # Create test data
         org = Organization(
             name="Email Org",
@@ -73,8 +71,11 @@ class TestEmailService:
         db_session.commit()
 
         # Send email
+        queue = CapturingQueue()
         email_service = EmailService(
-            self._create_test_config(), self._create_test_template_renderer()
+            self._create_test_config(),
+            self._create_test_template_renderer(),
+            queue,  # type: ignore[arg-type]
         )
         result = email_service.send_invitation_email(
             to_email="owner@example.com",
@@ -85,34 +86,20 @@ class TestEmailService:
         )
 
         assert result is True
-        mock_sendgrid_client.send.assert_called_once()
-        call_args = mock_sendgrid_client.send.call_args[0][0]
+        assert len(queue.messages) == 1
+        call_args = queue.messages[0]
         assert isinstance(call_args, Mail)
         assert call_args.to[0]["email"] == "owner@example.com"
         assert "Email Store" in call_args.subject
         assert "test-token-12345" in call_args.contents[0].value
 
-    @patch("app.core.services.email_service.SendGridAPIClient")
-    @patch.dict(
-        "os.environ",
-        {
-            "SENDGRID_API_KEY": "test-api-key",
-            "FROM_EMAIL": "noreply@laundromate.com",
-            "FRONTEND_URL": "https://app.laundromate.com",
-        },
-    )
-    def test_send_invitation_email_includes_store_name(
-        self, mock_sendgrid_client_class: MagicMock
-    ) -> None:
+    def test_send_invitation_email_includes_store_name(self) -> None:
         """Test that invitation email includes store name."""
-        mock_sendgrid_client = MagicMock()
-        mock_sendgrid_client_class.return_value = mock_sendgrid_client
-        mock_response = MagicMock()
-        mock_response.status_code = 202
-        mock_sendgrid_client.send.return_value = mock_response
-
+        queue = CapturingQueue()
         email_service = EmailService(
-            self._create_test_config(), self._create_test_template_renderer()
+            self._create_test_config(),
+            self._create_test_template_renderer(),
+            queue,  # type: ignore[arg-type]
         )
         email_service.send_invitation_email(
             to_email="owner@example.com",
@@ -122,32 +109,18 @@ class TestEmailService:
             expiration_days=7,
         )
 
-        call_args = mock_sendgrid_client.send.call_args[0][0]
+        call_args = queue.messages[0]
         assert "Test Store" in call_args.subject
         assert "Test Store" in call_args.contents[0].value
 
-    @patch("app.core.services.email_service.SendGridAPIClient")
-    @patch.dict(
-        "os.environ",
-        {
-            "SENDGRID_API_KEY": "test-api-key",
-            "FROM_EMAIL": "noreply@laundromate.com",
-            "FRONTEND_URL": "https://app.laundromate.com",
-        },
-    )
-    def test_send_invitation_email_includes_invitation_link(
-        self, mock_sendgrid_client_class: MagicMock
-    ) -> None:
+    def test_send_invitation_email_includes_invitation_link(self) -> None:
         """Test that invitation email includes invitation link."""
-        mock_sendgrid_client = MagicMock()
-        mock_sendgrid_client_class.return_value = mock_sendgrid_client
-        mock_response = MagicMock()
-        mock_response.status_code = 202
-        mock_sendgrid_client.send.return_value = mock_response
-
         token = "test-token-abc123"
+        queue = CapturingQueue()
         email_service = EmailService(
-            self._create_test_config(), self._create_test_template_renderer()
+            self._create_test_config(),
+            self._create_test_template_renderer(),
+            queue,  # type: ignore[arg-type]
         )
         email_service.send_invitation_email(
             to_email="owner@example.com",
@@ -157,32 +130,18 @@ class TestEmailService:
             expiration_days=7,
         )
 
-        call_args = mock_sendgrid_client.send.call_args[0][0]
+        call_args = queue.messages[0]
         email_content = call_args.contents[0].value
         assert token in email_content
         assert "https://app.laundromate.com/auth/accept-invitation" in email_content
 
-    @patch("app.core.services.email_service.SendGridAPIClient")
-    @patch.dict(
-        "os.environ",
-        {
-            "SENDGRID_API_KEY": "test-api-key",
-            "FROM_EMAIL": "noreply@laundromate.com",
-            "FRONTEND_URL": "https://app.laundromate.com",
-        },
-    )
-    def test_send_invitation_email_includes_expiration_notice(
-        self, mock_sendgrid_client_class: MagicMock
-    ) -> None:
+    def test_send_invitation_email_includes_expiration_notice(self) -> None:
         """Test that invitation email includes expiration notice."""
-        mock_sendgrid_client = MagicMock()
-        mock_sendgrid_client_class.return_value = mock_sendgrid_client
-        mock_response = MagicMock()
-        mock_response.status_code = 202
-        mock_sendgrid_client.send.return_value = mock_response
-
+        queue = CapturingQueue()
         email_service = EmailService(
-            self._create_test_config(), self._create_test_template_renderer()
+            self._create_test_config(),
+            self._create_test_template_renderer(),
+            queue,  # type: ignore[arg-type]
         )
         email_service.send_invitation_email(
             to_email="owner@example.com",
@@ -192,59 +151,93 @@ class TestEmailService:
             expiration_days=7,
         )
 
-        call_args = mock_sendgrid_client.send.call_args[0][0]
+        call_args = queue.messages[0]
         email_content = call_args.contents[0].value
         assert "7 days" in email_content or "expires" in email_content.lower()
 
-    @patch("app.core.services.email_service.SendGridAPIClient")
-    @patch.dict(
-        "os.environ",
-        {
-            "SENDGRID_API_KEY": "test-api-key",
-            "FROM_EMAIL": "noreply@laundromate.com",
-            "FRONTEND_URL": "https://app.laundromate.com",
-        },
-    )
-    def test_send_invitation_email_handles_sendgrid_error(
-        self, mock_sendgrid_client_class: MagicMock
-    ) -> None:
-        """Test that email service handles SendGrid errors gracefully."""
-        mock_sendgrid_client = MagicMock()
-        mock_sendgrid_client_class.return_value = mock_sendgrid_client
-        mock_sendgrid_client.send.side_effect = RuntimeError("SendGrid API error")
+    def test_send_invitation_email_reports_full_queue(self) -> None:
+        """Test that a full outbound queue is reported instead of raising."""
+        queue = CapturingQueue(accept=False)
+        email_service = EmailService(
+            self._create_test_config(),
+            self._create_test_template_renderer(),
+            queue,  # type: ignore[arg-type]
+        )
+
+        result = email_service.send_invitation_email(
+            to_email="owner@example.com",
+            store_name="Test Store",
+            organization_name="Test Org",
+            invitation_token="token-123",
+            expiration_days=7,
+        )
+
+        assert result is False
 
-        # Should raise exception when SendGrid API fails
+    def test_send_invitation_email_passes_invitation_id(self) -> None:
+        """Test that the invitation id travels with the queued message."""
+        queue = CapturingQueue()
         email_service = EmailService(
-            self._create_test_config(), self._create_test_template_renderer()
+            self._create_test_config(),
+            self._create_test_template_renderer(),
+            queue,  # type: ignore[arg-type]
         )
-        with pytest.raises(RuntimeError):
-            email_service.send_invitation_email(
-                to_email="owner@example.com",
-                store_name="Test Store",
-                organization_name="Test Org",
-                invitation_token="token-123",
-                expiration_days=7,
-            )
+        invitation_id = UUID("00000000-0000-0000-0000-000000000001")
+
+        email_service.send_invitation_email(
+            to_email="owner@example.com",
+            store_name="Test Store",
+            organization_name="Test Org",
+            invitation_token="token-123",
+            invitation_id=invitation_id,
+        )
+
+        assert queue.invitation_ids == [(invitation_id,)]
 
-    @patch("app.core.services.email_service.SendGridAPIClient")
-    @patch.dict(
-        "os.environ",
-        {
-            "SENDGRID_API_KEY": "",
-            "FROM_EMAIL": "noreply@laundromate.com",
-            "FRONTEND_URL": "https://app.laundromate.com",
-        },
-    )
-    def test_send_invitation_email_missing_api_key(
-        self, mock_sendgrid_client_class: MagicMock
+    def test_send_invitation_batch_splits_personalizations(
+        self, monkeypatch: pytest.MonkeyPatch
     ) -> None:
+        """Test that batches are chunked and each recipient gets its own link."""
+        monkeypatch.setattr("app.core.services.email_service.MAX_PERSONALIZATIONS", 2)
+        queue = CapturingQueue()
+        email_service = EmailService(
+            self._create_test_config(),
+            self._create_test_template_renderer(),
+            queue,  # type: ignore[arg-type]
+        )
+        invitations = [
+            (f"owner{index}@example.com", f"token-{index}", UUID(int=index))
+            for index in range(3)
+        ]
+
+        queued = email_service.send_invitation_batch(
+            invitations, store_name="Test Org", organization_name="Test Org"
+        )
+
+        assert queued == [True, True, True]
+        assert queue.invitation_ids == [(UUID(int=0), UUID(int=1)), (UUID(int=2),)]
+        personalizations = queue.messages[0].get()["personalizations"]
+        assert [p["to"][0]["email"] for p in personalizations] == [
+            "owner0@example.com",
+            "owner1@example.com",
+        ]
+        assert personalizations[1]["substitutions"]["-invitation_url-"] == (
+            "https://app.laundromate.com/auth/accept-invitation?token=token-1"
+        )
+
+    def test_send_invitation_email_missing_api_key(self) -> None:
         """Test that email service handles missing API key."""
         test_config = EmailConfig(
             sendgrid_api_key="",
             from_email="noreply@laundromate.com",
             frontend_url="https://app.laundromate.com",
         )
-        email_service = EmailService(test_config, self._create_test_template_renderer())
+        queue = CapturingQueue()
+        email_service = EmailService(
+            test_config,
+            self._create_test_template_renderer(),
+            queue,  # type: ignore[arg-type]
+        )
         # Should raise exception when API key is missing
         with pytest.raises(RuntimeError):
             email_service.send_invitation_email(
@@ -254,6 +247,7 @@ class TestEmailService:
                 invitation_token="token-123",
                 expiration_days=7,
             )
+        assert queue.messages == []
 
     def test_send_invitation_email_uses_html_template(self) -> None:
         """Test that email service uses HTML template."""
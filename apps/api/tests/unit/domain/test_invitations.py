@@ -1,19 +1,25 @@
 """Unit tests for invitation domain logic."""
 from datetime import datetime, timedelta, timezone
+from uuid import UUID
 
 import pytest
 from fastapi import HTTPException
+from sqlalchemy import event
+from sqlalchemy.orm import Session
 
 from app.core.models.invitation import Invitation, InvitationStatus
 from app.core.models.organization import Organization
 from app.core.models.user import User
 from app.core.models.user_organization import UserOrganizationRole
 from app.core.repositories.invitation_repository import InvitationRepository
+from app.core.repositories.organization_repository import OrganizationRepository
+from app.core.repositories.unit_of_work import UnitOfWork
 from app.core.repositories.user_organization_repository import (
     UserOrganizationRepository,
 )
 from app.core.repositories.user_repository import UserRepository
 from app.core.repositories.user_store_repository import UserStoreRepository
+from app.core.schemas.invitation import InvitationRead
 from app.core.services.invitation_service import InvitationService
 
 
@@ -23,7 +29,15 @@ def create_invitation_service(db_session):
     user_repo = UserRepository(db_session)
     user_org_repo = UserOrganizationRepository(db_session)
     user_store_repo = UserStoreRepository(db_session)
-    return InvitationService(invitation_repo, user_repo, user_org_repo, user_store_repo)
+    org_repo = OrganizationRepository(db_session)
+    return InvitationService(
+        invitation_repo,
+        user_repo,
+        user_org_repo,
+        user_store_repo,
+        org_repo,
+        UnitOfWork(db_session),
+    )
 
 
 class TestInvitationTokenGeneration:
@@ -321,3 +335,70 @@ class TestInvitationTokenValidation:
             service.accept_invitation(invalid_token, "Password123!")
         assert exc_info.value.status_code == 400
         assert "Invalid invitation token format" in exc_info.value.detail
+
+
+class TestAcceptInvitationTransaction:
+    """Test that accepting an invitation commits once, or not at all."""
+
+    def create_invitation(
+        self, db_session: Session, service: InvitationService
+    ) -> Invitation:
+        org = Organization(
+            name="Atomic Org",
+            billing_address="1 Atomic St",
+            city="Denver",
+            state="CO",
+            postal_code="80201",
+            country="US",
+        )
+        inviter = User(phone="+1234567899", is_super_admin=True)
+        db_session.add_all([org, inviter])
+        db_session.commit()
+        invitation = Invitation(
+            token=service.generate_token(),
+            email="atomic@example.com",
+            organization_id=org.id,
+            organization_role=UserOrganizationRole.OWNER,
+            invited_by=inviter.id,
+            expires_at=datetime.now(timezone.utc) + timedelta(days=7),
+        )
+        db_session.add(invitation)
+        db_session.commit()
+        # SQLite drops the UTC offset of expires_at; expiry is tested above
+        service.is_valid = lambda invitation: True  # type: ignore[method-assign]
+        return invitation
+
+    def test_accept_commits_once(self, db_session: Session) -> None:
+        """Test that the user, membership and acceptance share one commit."""
+        service = create_invitation_service(db_session)
+        invitation = self.create_invitation(db_session, service)
+        commits: list[int] = []
+        event.listen(db_session, "after_commit", lambda session: commits.append(1))
+
+        result = service.accept_invitation(invitation.token, "Password123!")
+
+        assert len(commits) == 1
+        db_session.refresh(invitation)
+        assert invitation.status == InvitationStatus.ACCEPTED
+        memberships = UserOrganizationRepository(db_session)
+        organization_id: UUID = invitation.organization_id  # type: ignore[assignment]
+        assert memberships.find_by_user_and_organization(
+            result.user.id, organization_id
+        )
+
+    def test_failure_rolls_back_every_step(self, db_session: Session) -> None:
+        """Test that a failing step leaves no user and a pending invitation."""
+        service = create_invitation_service(db_session)
+        invitation = self.create_invitation(db_session, service)
+
+        def fail(invitation_id: UUID, accepted_at: datetime) -> InvitationRead:
+            raise RuntimeError("database went away")
+
+        service.invitation_repo.mark_as_accepted = fail  # type: ignore[method-assign]
+
+        with pytest.raises(RuntimeError):
+            service.accept_invitation(invitation.token, "Password123!")
+
+        assert UserRepository(db_session).get_by_email("atomic@example.com") is None
+        db_session.refresh(invitation)
+        assert invitation.status == InvitationStatus.PENDING
@@ -0,0 +1,223 @@
+"""Unit tests for the in-memory fleet connectivity table."""
+from datetime import datetime, timezone
+from uuid import UUID, uuid4
+
+import pytest
+
+from app.core.models.iot_controller import ConnectivityStatus
+from app.iot.fleet import FleetState
+
+ONLINE = ConnectivityStatus.ONLINE
+OFFLINE = ConnectivityStatus.OFFLINE
+UNKNOWN = ConnectivityStatus.UNKNOWN
+START = 1_700_000_000.0
+
+
+class FakeClock:
+    """Manually advanced epoch clock."""
+
+    def __init__(self) -> None:
+        self.now = START
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def at(seconds: float) -> datetime:
+    """Datetime ``seconds`` after the fake clock's start."""
+    return datetime.fromtimestamp(START + seconds, tz=timezone.utc)
+
+
+@pytest.fixture
+def clock() -> FakeClock:
+    return FakeClock()
+
+
+@pytest.fixture
+def store_id() -> UUID:
+    return uuid4()
+
+
+@pytest.fixture
+def fleet(clock: FakeClock) -> FleetState:
+    return FleetState(offline_after_seconds=60, clock=clock)
+
+
+class TestFleetLoad:
+    """Test rebuilding the table from database rows."""
+
+    def test_load_derives_status_from_last_heartbeat(
+        self, fleet: FleetState, clock: FakeClock, store_id: UUID
+    ) -> None:
+        """Test fresh, lapsed and missing heartbeats on load."""
+        clock.now = START + 100
+        fleet.load(
+            [
+                (uuid4(), store_id, ONLINE, at(90)),  # fresh
+                (uuid4(), store_id, ONLINE, at(10)),  # lapsed
+                (uuid4(), store_id, UNKNOWN, None),  # never checked in
+                (uuid4(), uuid4(), ONLINE, at(95)),  # other store
+            ]
+        )
+
+        assert len(fleet) == 4
+        assert fleet.store_counts(store_id) == {
+            "online": 1,
+            "offline": 1,
+            "unknown": 1,
+            "total": 3,
+        }
+        assert fleet.store_counts(uuid4())["total"] == 0
+
+    def test_naive_heartbeats_are_utc(
+        self, fleet: FleetState, clock: FakeClock, store_id: UUID
+    ) -> None:
+        """Test that timezone-naive heartbeats (SQLite) are read as UTC."""
+        controller_id = uuid4()
+        clock.now = START + 30
+
+        fleet.load([(controller_id, store_id, ONLINE, at(0).replace(tzinfo=None))])
+
+        assert fleet.status_of(controller_id) == ONLINE
+        assert fleet.next_deadline() == START + 60
+
+
+class TestFleetDeadlines:
+    """Test heartbeats and deadline-driven expiry."""
+
+    def test_lapsed_controllers_go_offline(
+        self, fleet: FleetState, clock: FakeClock, store_id: UUID
+    ) -> None:
+        """Test that controllers flip offline once their deadline passes."""
+        early, late = uuid4(), uuid4()
+        fleet.load([(early, store_id, UNKNOWN, None), (late, store_id, UNKNOWN, None)])
+
+        fleet.record([(early, ONLINE)])
+        clock.now = START + 30
+        fleet.record([(late, ONLINE)])
+        assert fleet.store_counts(store_id)["online"] == 2
+
+        assert fleet.expire(START + 60) == [early]
+        assert fleet.status_of(early) == OFFLINE
+        assert fleet.store_counts(store_id)["online"] == 1
+        assert fleet.expire(START + 89) == []
+        assert fleet.expire(START + 90) == [late]
+        assert fleet.expired == 2
+
+    def test_later_heartbeat_supersedes_deadline(
+        self, fleet: FleetState, clock: FakeClock, store_id: UUID
+    ) -> None:
+        """Test that a fresh heartbeat defers the pending offline flip."""
+        controller_id = uuid4()
+        fleet.load([(controller_id, store_id, UNKNOWN, None)])
+
+        fleet.record([(controller_id, ONLINE)])
+        clock.now = START + 50
+        fleet.record([(controller_id, ONLINE)])
+
+        assert fleet.expire(START + 60) == []
+        assert fleet.expire(START + 110) == [controller_id]
+
+    def test_reported_offline_has_no_deadline(
+        self, fleet: FleetState, store_id: UUID
+    ) -> None:
+        """Test that a device reporting offline is not expired again."""
+        controller_id = uuid4()
+        fleet.load([(controller_id, store_id, UNKNOWN, None)])
+
+        fleet.record([(controller_id, ONLINE)])
+        fleet.record([(controller_id, OFFLINE)])
+
+        assert fleet.store_counts(store_id)["offline"] == 1
+        assert fleet.expire(START + 1000) == []
+        assert fleet.expired == 0
+
+    def test_unknown_controllers_are_ignored(self, fleet: FleetState) -> None:
+        """Test that heartbeats for untracked controllers wait for a resync."""
+        assert fleet.record([(uuid4(), ONLINE)]) == 0
+        assert len(fleet) == 0
+
+    def test_knows_only_loaded_controllers(
+        self, fleet: FleetState, store_id: UUID
+    ) -> None:
+        """Test that knows() reflects the controllers loaded into the table."""
+        controller_id = uuid4()
+        fleet.load([(controller_id, store_id, None, None)])
+
+        assert fleet.knows(controller_id)
+        assert not fleet.knows(uuid4())
+
+    def test_heap_is_compacted(
+        self, fleet: FleetState, clock: FakeClock, store_id: UUID
+    ) -> None:
+        """Test that superseded heap entries do not accumulate."""
+        controller_id = uuid4()
+        fleet.load([(controller_id, store_id, UNKNOWN, None)])
+
+        for step in range(5000):
+            clock.now = START + step
+            fleet.record([(controller_id, ONLINE)])
+
+        assert fleet.stats()["heap_entries"] <= 2 * len(fleet) + 1024
+        assert fleet.expire(START + 5058) == []
+        assert fleet.expire(START + 5059) == [controller_id]
+
+
+class TestFleetAlerts:
+    """Test alert escalation for controllers that stay offline."""
+
+    @pytest.fixture
+    def fleet(self, clock: FakeClock) -> FleetState:
+        return FleetState(
+            offline_after_seconds=60,
+            alert_after_seconds=120,
+            critical_after_seconds=300,
+            clock=clock,
+        )
+
+    def test_offline_controller_escalates(
+        self, fleet: FleetState, store_id: UUID
+    ) -> None:
+        """Test alert and critical thresholds measured from going offline."""
+        controller_id = uuid4()
+        fleet.load([(controller_id, store_id, UNKNOWN, None)])
+        fleet.record([(controller_id, ONLINE)])
+
+        fleet.expire(START + 60)  # offline since START + 60
+        assert fleet.store_alerts(store_id)[:2] == (0, 0)
+        fleet.expire(START + 180)
+        assert fleet.store_alerts(store_id)[:2] == (1, 0)
+        fleet.expire(START + 360)
+        assert fleet.store_alerts(store_id)[:2] == (1, 1)
+
+    def test_heartbeat_clears_alerts(
+        self, fleet: FleetState, clock: FakeClock, store_id: UUID
+    ) -> None:
+        """Test that coming back online clears alerts and stale escalations."""
+        controller_id = uuid4()
+        fleet.load([(controller_id, store_id, ONLINE, at(-1000))])
+        assert fleet.store_alerts(store_id)[:2] == (1, 1)
+
+        fleet.record([(controller_id, ONLINE)])
+        alerts, critical, last_heartbeat = fleet.store_alerts(store_id)
+
+        assert (alerts, critical) == (0, 0)
+        assert last_heartbeat == at(0)
+        assert fleet.expire(START + 59) == []
+        assert fleet.store_alerts(store_id)[:2] == (0, 0)
+
+    def test_version_tracks_count_changes(
+        self, fleet: FleetState, clock: FakeClock, store_id: UUID
+    ) -> None:
+        """Test that repeat heartbeats do not bump the version."""
+        controller_id = uuid4()
+        fleet.load([(controller_id, store_id, UNKNOWN, None)])
+        fleet.record([(controller_id, ONLINE)])
+        version = fleet.version
+
+        clock.now = START + 10
+        fleet.record([(controller_id, ONLINE)])
+        assert fleet.version == version
+
+        fleet.expire(START + 100)
+        assert fleet.version > version
@@ -0,0 +1,177 @@
+"""Unit tests for the maintained system health summary."""
+from types import SimpleNamespace
+from uuid import UUID, uuid4
+
+import pytest
+
+from app.core.models.iot_controller import ConnectivityStatus
+from app.core.models.store import StoreStatus
+from app.core.schemas.health import StoreConnectivityStatus
+from app.health.summary import HealthSummary, StoreEntry, connectivity_status
+from app.iot.fleet import FleetState
+
+ONLINE = ConnectivityStatus.ONLINE
+OFFLINE = ConnectivityStatus.OFFLINE
+
+
+def store_entry(name: str, organization_id: UUID, city: str = "Austin") -> StoreEntry:
+    """Build a directory entry for an active store."""
+    return StoreEntry(
+        store_id=uuid4(),
+        store_name=name,
+        organization_id=organization_id,
+        organization_name="Sunny Laundromat LLC",
+        city=city,
+        state="TX",
+        status=StoreStatus.ACTIVE,
+    )
+
+
+@pytest.fixture
+def fleet() -> FleetState:
+    return FleetState(offline_after_seconds=60)
+
+
+@pytest.fixture
+def summary(fleet: FleetState) -> HealthSummary:
+    return HealthSummary(fleet)
+
+
+class TestConnectivityStatus:
+    """Test store connectivity derivation rules."""
+
+    @pytest.mark.parametrize(
+        ("online", "offline", "unknown", "expected"),
+        [
+            (2, 0, 0, StoreConnectivityStatus.ONLINE),
+            (1, 1, 0, StoreConnectivityStatus.PARTIAL),
+            (1, 0, 1, StoreConnectivityStatus.PARTIAL),
+            (0, 2, 1, StoreConnectivityStatus.OFFLINE),
+            (0, 0, 1, StoreConnectivityStatus.UNKNOWN),
+            (0, 0, 0, StoreConnectivityStatus.UNKNOWN),
+        ],
+    )
+    def test_rules(
+        self,
+        online: int,
+        offline: int,
+        unknown: int,
+        expected: StoreConnectivityStatus,
+    ) -> None:
+        """Test each combination of controller counts."""
+        counts = {
+            "online": online,
+            "offline": offline,
+            "unknown": unknown,
+            "total": online + offline + unknown,
+        }
+        assert connectivity_status(counts) == expected
+
+
+class TestHealthSummaryQuery:
+    """Test filtering, ordering and cache invalidation."""
+
+    def test_offline_stores_sort_first(
+        self, summary: HealthSummary, fleet: FleetState
+    ) -> None:
+        """Test that stores are ordered by severity, then name."""
+        org_id = uuid4()
+        healthy, down, empty = (
+            store_entry("A Healthy", org_id),
+            store_entry("B Down", org_id),
+            store_entry("C Empty", org_id),
+        )
+        summary.load([healthy, down, empty])
+        up_id, down_id = uuid4(), uuid4()
+        fleet.load(
+            [
+                (up_id, healthy.store_id, None, None),
+                (down_id, down.store_id, None, None),
+            ]
+        )
+        fleet.record([(up_id, ONLINE), (down_id, OFFLINE)])
+
+        items, total = summary.query()
+
+        assert total == 3
+        assert [item.store_name for item in items] == ["B Down", "C Empty", "A Healthy"]
+        assert items[0].connectivity_status == StoreConnectivityStatus.OFFLINE
+        assert items[2].online_controllers == 1
+        assert items[2].last_heartbeat is not None
+
+    def test_filters(self, summary: HealthSummary) -> None:
+        """Test organization, location, status and name filters."""
+        org_id, other_org_id = uuid4(), uuid4()
+        summary.load(
+            [
+                store_entry("Downtown", org_id, city="Austin"),
+                store_entry("Uptown", org_id, city="Dallas"),
+                store_entry("Elsewhere", other_org_id, city="Austin"),
+            ]
+        )
+
+        assert summary.query(organization_id=org_id)[1] == 2
+        assert summary.query(city="austin")[1] == 2
+        assert summary.query(search="TOWN")[1] == 2
+        assert summary.query(search="sunny")[1] == 3
+        assert summary.query(status=StoreConnectivityStatus.UNKNOWN)[1] == 3
+        assert summary.query(status=StoreConnectivityStatus.ONLINE)[1] == 0
+        items, total = summary.query(skip=1, limit=1)
+        assert (len(items), total) == (1, 3)
+
+    def test_cached_view_invalidated_by_changes(
+        self, summary: HealthSummary, fleet: FleetState
+    ) -> None:
+        """Test that views are reused until the directory or counts change."""
+        org_id = uuid4()
+        entry = store_entry("Downtown", org_id)
+        summary.load([entry])
+        controller_id = uuid4()
+        fleet.load([(controller_id, entry.store_id, None, None)])
+
+        summary.query()
+        summary.query()
+        assert (summary.cache_hits, summary.cache_misses) == (1, 1)
+
+        fleet.record([(controller_id, ONLINE)])
+        items, _ = summary.query(status=StoreConnectivityStatus.ONLINE)
+        assert [item.store_id for item in items] == [entry.store_id]
+
+        summary.rename_organization(org_id, "Renamed LLC")
+        assert summary.query()[0][0].organization_name == "Renamed LLC"
+        assert summary.cache_misses == 3
+
+
+class TestHealthSummaryProvisioning:
+    """Test directory updates from provisioning events."""
+
+    def test_upsert_keeps_organization_name(self, summary: HealthSummary) -> None:
+        """Test that a store edit keeps the known organization name."""
+        store = SimpleNamespace(
+            id=uuid4(),
+            name="Downtown",
+            organization_id=uuid4(),
+            city="Austin",
+            state="TX",
+            status=StoreStatus.ACTIVE,
+        )
+        summary.upsert_store(store, organization_name="Sunny Laundromat LLC")
+        store.name = "Downtown East"
+        summary.upsert_store(store)
+
+        item = summary.entry(store.id)
+        assert item is not None
+        assert item.store_name == "Downtown East"
+        assert item.organization_name == "Sunny Laundromat LLC"
+
+    def test_remove_store_and_organization(self, summary: HealthSummary) -> None:
+        """Test that deleted stores and organizations leave the summary."""
+        org_id = uuid4()
+        first, second = store_entry("One", org_id), store_entry("Two", org_id)
+        summary.load([first, second, store_entry("Other", uuid4())])
+
+        summary.remove_store(first.store_id)
+        assert len(summary) == 2
+        summary.remove_organization(org_id)
+        assert len(summary) == 1
+        assert summary.entry(second.store_id) is None
@@ -0,0 +1,107 @@
+"""Unit tests for the heartbeat coalescing buffer."""
+import asyncio
+from datetime import datetime, timedelta, timezone
+from typing import Any
+from uuid import uuid4
+
+import pytest
+
+from app.core.models.iot_controller import ConnectivityStatus
+from app.iot.heartbeats import HeartbeatBuffer
+
+ONLINE = ConnectivityStatus.ONLINE
+OFFLINE = ConnectivityStatus.OFFLINE
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class FailingSession:
+    """Async session stand-in whose execute always fails."""
+
+    async def __aenter__(self) -> "FailingSession":
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        return None
+
+    async def execute(self, *args: Any) -> None:
+        raise RuntimeError("database unavailable")
+
+
+class TestHeartbeatBuffer:
+    """Test HeartbeatBuffer coalescing, backpressure and flush failure."""
+
+    def test_repeats_coalesce_to_latest(self) -> None:
+        """Test that a controller keeps only its most recent heartbeat."""
+        buffer = HeartbeatBuffer(max_controllers=10)
+        controller_id = uuid4()
+        first = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+        buffer.submit([(controller_id, ONLINE)], received_at=first)
+        buffer.submit(
+            [(controller_id, OFFLINE)], received_at=first + timedelta(seconds=5)
+        )
+
+        pending, _ = buffer.drain()
+        assert pending == {controller_id: (first + timedelta(seconds=5), OFFLINE)}
+        assert (buffer.received, buffer.coalesced) == (2, 1)
+        assert len(buffer) == 0
+
+    def test_full_buffer_rejects_only_new_controllers(self) -> None:
+        """Test that backpressure never drops updates for pending controllers."""
+        buffer = HeartbeatBuffer(max_controllers=1)
+        known, unknown = uuid4(), uuid4()
+
+        assert buffer.submit([(known, ONLINE)]) == ([(known, ONLINE)], 0)
+        assert buffer.submit([(unknown, ONLINE), (known, OFFLINE)]) == (
+            [(known, OFFLINE)],
+            1,
+        )
+        assert buffer.rejected == 1
+        assert len(buffer) == 1
+
+    def test_oldest_pending_age(self) -> None:
+        """Test that staleness is measured from the first buffered heartbeat."""
+        clock = FakeClock()
+        buffer = HeartbeatBuffer(max_controllers=10, clock=clock)
+
+        buffer.submit([(uuid4(), ONLINE)])
+        clock.now = 1.5
+        buffer.submit([(uuid4(), ONLINE)])
+        clock.now = 2.0
+
+        assert buffer.stats()["oldest_pending_ms"] == 2000.0
+        assert buffer.drain()[1] == 2000.0
+        assert buffer.stats()["oldest_pending_ms"] == 0.0
+
+    def test_restore_keeps_newer_entries(self) -> None:
+        """Test that restored entries do not overwrite heartbeats received since."""
+        buffer = HeartbeatBuffer(max_controllers=10)
+        controller_id = uuid4()
+        buffer.submit([(controller_id, ONLINE)])
+        pending, _ = buffer.drain()
+
+        buffer.submit([(controller_id, OFFLINE)])
+        buffer.restore(pending)
+
+        assert buffer.drain()[0][controller_id][1] == OFFLINE
+
+    def test_failed_flush_restores_entries(self) -> None:
+        """Test that a failed flush keeps heartbeats for the next attempt."""
+        buffer = HeartbeatBuffer(max_controllers=10)
+        controller_id = uuid4()
+        buffer.submit([(controller_id, ONLINE)])
+
+        with pytest.raises(RuntimeError):
+            asyncio.run(buffer.flush(FailingSession))  # type: ignore[arg-type]
+
+        assert controller_id in buffer.drain()[0]
+        assert (buffer.flushes, buffer.flush_failures) == (0, 1)
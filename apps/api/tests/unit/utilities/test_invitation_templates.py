@@ -0,0 +1,132 @@
+"""Unit tests for compiled invitation email templates."""
+import os
+from pathlib import Path
+
+import pytest
+
+from app.core.emails.invitation_templates import (
+    INVITATION_EMAIL_HTML_TEMPLATE,
+    INVITATION_EMAIL_TEXT_TEMPLATE,
+    CompiledTemplate,
+    InvitationEmailContext,
+    InvitationTemplateRenderer,
+)
+
+DEFAULT_TEMPLATE_DIR = Path(__file__).parents[3] / "app" / "core" / "templates"
+
+
+def _write_templates(template_dir: Path, text: str) -> None:
+    (template_dir / INVITATION_EMAIL_HTML_TEMPLATE).write_text(
+        "<p>{organization_name}</p>", encoding="utf-8"
+    )
+    (template_dir / INVITATION_EMAIL_TEXT_TEMPLATE).write_text(text, encoding="utf-8")
+
+
+class TestCompiledTemplate:
+    """Test template compilation and rendering."""
+
+    def test_render_matches_str_format(self) -> None:
+        """Test that compiled templates render exactly like str.format."""
+        values = {
+            "store_name": "Main St",
+            "organization_name": "Acme {Laundry}",
+            "invitation_url": "https://app.test/accept?token=abc",
+            "expiration_days": 7,
+        }
+        for name in (INVITATION_EMAIL_HTML_TEMPLATE, INVITATION_EMAIL_TEXT_TEMPLATE):
+            source = (DEFAULT_TEMPLATE_DIR / name).read_text(encoding="utf-8")
+
+            assert CompiledTemplate.compile(source).render(values) == source.format(
+                **values
+            )
+
+    def test_escaped_braces_are_literal(self) -> None:
+        """Test that doubled braces render as single braces."""
+        template = CompiledTemplate.compile("a {{ b }} {name}")
+
+        assert template.render({"name": "x"}) == "a { b } x"
+
+    def test_missing_value_raises(self) -> None:
+        """Test that rendering without a placeholder value fails loudly."""
+        with pytest.raises(KeyError):
+            CompiledTemplate.compile("{name}").render({})
+
+    def test_unsupported_placeholder_raises(self) -> None:
+        """Test that format specs and attribute access are rejected."""
+        for source in ("{count:>5}", "{user.name}", "{name!r}"):
+            with pytest.raises(ValueError):
+                CompiledTemplate.compile(source)
+
+
+class TestInvitationTemplateRenderer:
+    """Test template caching and batch rendering."""
+
+    def test_batch_render_preserves_order(self) -> None:
+        """Test that batch rendering returns one email per recipient in order."""
+        renderer = InvitationTemplateRenderer()
+        recipients = [
+            InvitationEmailContext(
+                store_name=f"Store {i}",
+                organization_name=f"Org {i}",
+                invitation_url=f"https://app.test/accept?token={i}",
+                expiration_days=i,
+            )
+            for i in range(1, 4)
+        ]
+
+        emails = renderer.render_invitation_emails(recipients)
+
+        assert len(emails) == 3
+        for i, email in enumerate(emails, start=1):
+            assert f"Org {i}" in email.subject
+            assert f"token={i}" in email.html_content
+            assert f"expires in {i} days" in email.text_content
+            assert email == renderer.render_invitation_email(*recipients[i - 1])
+
+    def test_template_reloaded_when_mtime_changes(self, tmp_path: Path) -> None:
+        """Test that edits are picked up and unchanged files are reused."""
+        _write_templates(tmp_path, "v1 {invitation_url}")
+        renderer = InvitationTemplateRenderer(
+            template_dir=tmp_path, reload_check_interval=0
+        )
+        context = InvitationEmailContext("Store", "Org", "https://u")
+
+        first = renderer._load_template(INVITATION_EMAIL_TEXT_TEMPLATE)
+        assert renderer._load_template(INVITATION_EMAIL_TEXT_TEMPLATE).chunks is (
+            first.chunks
+        )
+        assert renderer.render_invitation_emails([context])[0].text_content == (
+            "v1 https://u"
+        )
+
+        text_path = tmp_path / INVITATION_EMAIL_TEXT_TEMPLATE
+        text_path.write_text("v2 {invitation_url}", encoding="utf-8")
+        stat = text_path.stat()
+        os.utime(text_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        assert renderer.render_invitation_emails([context])[0].text_content == (
+            "v2 https://u"
+        )
+
+    def test_mtime_checked_once_per_interval(self, tmp_path: Path) -> None:
+        """Test that edits within the check interval serve the cached template."""
+        _write_templates(tmp_path, "v1")
+        renderer = InvitationTemplateRenderer(
+            template_dir=tmp_path, reload_check_interval=3600
+        )
+        context = InvitationEmailContext("Store", "Org", "https://u")
+        renderer.render_invitation_emails([context])
+
+        text_path = tmp_path / INVITATION_EMAIL_TEXT_TEMPLATE
+        text_path.write_text("v2", encoding="utf-8")
+        stat = text_path.stat()
+        os.utime(text_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        assert renderer.render_invitation_emails([context])[0].text_content == "v1"
+
+    def test_missing_template_raises(self, tmp_path: Path) -> None:
+        """Test that a missing template file raises FileNotFoundError."""
+        renderer = InvitationTemplateRenderer(template_dir=tmp_path)
+
+        with pytest.raises(FileNotFoundError, match="Template file not found"):
+            renderer.render_invitation_email("Store", "Org", "https://u")
@@ -0,0 +1,60 @@
+"""Unit tests for permissions version tracking."""
+import asyncio
+from uuid import UUID, uuid4
+
+from sqlalchemy.orm import Session
+
+from app.auth.permission_versions import PermissionVersions
+from app.core.models.user import User
+from tests.conftest import TestingAsyncSessionLocal
+
+
+class TestPermissionVersions:
+    """Test revocation of stale stateless tokens."""
+
+    def test_versions_only_increase(self) -> None:
+        """Test that recording an older version keeps the newer one."""
+        versions = PermissionVersions()
+        user_id = uuid4()
+
+        versions.record(user_id, 3)
+        versions.record(user_id, 2)
+
+        assert versions.current(user_id) == 3
+        assert versions.current(uuid4()) == 0
+
+    def test_is_stale(self) -> None:
+        """Test that only tokens below the current version are stale."""
+        versions = PermissionVersions()
+        user_id = uuid4()
+        versions.record(user_id, 2)
+
+        assert versions.is_stale(user_id, 1) is True
+        assert versions.is_stale(user_id, 2) is False
+        assert versions.is_stale(uuid4(), 0) is False
+        assert versions.stats()["revoked"] == 1
+
+    def test_bump_and_sync(self, db_session: Session) -> None:
+        """Test that a bump is committed and picked up by another worker."""
+        user = User(phone="+15550001111")
+        db_session.add(user)
+        db_session.commit()
+        user_id: UUID = user.id  # type: ignore[assignment]
+        this_worker, other_worker = PermissionVersions(), PermissionVersions()
+
+        async def scenario() -> int:
+            async with TestingAsyncSessionLocal() as session:
+                version = await this_worker.bump(session, user_id)
+                await session.commit()
+            this_worker.record(user_id, version)
+            await other_worker.sync(TestingAsyncSessionLocal)
+            return version
+
+        version = asyncio.run(scenario())
+
+        assert version == 1
+        assert this_worker.current(user_id) == 1
+        assert other_worker.current(user_id) == 1
+        assert other_worker.synced_at is not None
+        db_session.expire_all()
+        assert db_session.get(User, user_id).permissions_version == 1  # type: ignore
@@ -0,0 +1,118 @@
+"""Unit tests for the principal TTL cache."""
+import dataclasses
+from uuid import uuid4
+
+import pytest
+
+from app.auth.principal_cache import Principal, PrincipalCache
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def make_principal(**overrides: object) -> Principal:
+    fields = {
+        "id": uuid4(),
+        "is_active": True,
+        "is_admin": False,
+        "is_super_admin": False,
+        "is_support_agent": False,
+        "is_provisioning_specialist": False,
+    }
+    fields.update(overrides)
+    return Principal(**fields)  # type: ignore[arg-type]
+
+
+class TestPrincipalCache:
+    """Test PrincipalCache behaviour."""
+
+    def test_hit_and_miss_counters(self) -> None:
+        """Test that lookups are counted as hits or misses."""
+        cache = PrincipalCache(ttl_seconds=30, max_size=10)
+        principal = make_principal()
+
+        assert cache.get(principal.id) is None
+        cache.set(principal)
+        assert cache.get(principal.id) is principal
+
+        stats = cache.stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+        assert stats["size"] == 1
+
+    def test_entry_expires_after_ttl(self) -> None:
+        """Test that entries are dropped once the TTL has elapsed."""
+        clock = FakeClock()
+        cache = PrincipalCache(ttl_seconds=30, max_size=10, clock=clock)
+        principal = make_principal()
+        cache.set(principal)
+
+        clock.now = 29.9
+        assert cache.get(principal.id) is principal
+        clock.now = 30.0
+        assert cache.get(principal.id) is None
+        assert cache.stats()["size"] == 0
+
+    def test_evicts_least_recently_used(self) -> None:
+        """Test that the cache stays bounded by evicting LRU entries."""
+        cache = PrincipalCache(ttl_seconds=30, max_size=2)
+        first, second, third = make_principal(), make_principal(), make_principal()
+        cache.set(first)
+        cache.set(second)
+        cache.get(first.id)
+        cache.set(third)
+
+        assert cache.get(second.id) is None
+        assert cache.get(first.id) is first
+        assert cache.get(third.id) is third
+
+    def test_invalidate(self) -> None:
+        """Test that invalidate drops a single entry."""
+        cache = PrincipalCache(ttl_seconds=30, max_size=10)
+        principal = make_principal()
+        cache.set(principal)
+
+        cache.invalidate(principal.id)
+        cache.invalidate(uuid4())  # unknown ids are ignored
+
+        assert cache.get(principal.id) is None
+
+    def test_zero_max_size_disables_cache(self) -> None:
+        """Test that max_size=0 never stores entries."""
+        cache = PrincipalCache(ttl_seconds=30, max_size=0)
+        principal = make_principal()
+        cache.set(principal)
+
+        assert cache.get(principal.id) is None
+
+    def test_principal_is_immutable(self) -> None:
+        """Test that cached principals cannot be mutated."""
+        principal = make_principal()
+
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            principal.is_super_admin = True  # type: ignore[misc]
+
+    @pytest.mark.parametrize(
+        "flags",
+        [
+            {},
+            {"is_active": False},
+            {"is_admin": True},
+            {"is_super_admin": True, "is_support_agent": True},
+            {"is_provisioning_specialist": True},
+        ],
+    )
+    def test_role_mask_round_trip(self, flags: dict) -> None:
+        """Test that a principal survives encoding as a token role bitmask."""
+        principal = make_principal(**flags)
+
+        decoded = Principal.from_role_mask(principal.id, principal.role_mask())
+
+        assert decoded == principal
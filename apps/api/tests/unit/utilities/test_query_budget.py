@@ -0,0 +1,96 @@
+"""Unit tests for the per-request query budget used by the test suite."""
+from typing import Generator
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, text
+from sqlalchemy.engine import Engine
+from sqlalchemy.pool import StaticPool
+
+from app.core.request_metrics import RequestMetrics, RequestTimingMiddleware
+from tests.conftest import QueryBudget
+
+
+@pytest.fixture
+def memory_engine() -> Generator[Engine, None, None]:
+    """In-memory SQLite engine."""
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def budget_client(memory_engine: Engine) -> TestClient:
+    """Client for an app whose route runs one statement per item."""
+    app = FastAPI()
+
+    @app.get("/items")
+    def list_items(count: int = 1) -> list:
+        with memory_engine.connect() as connection:
+            connection.execute(text("SELECT 1"))
+            for item_id in range(count):
+                connection.execute(text("SELECT :id"), {"id": item_id})
+        return []
+
+    app.add_middleware(RequestTimingMiddleware, metrics=RequestMetrics())
+    return TestClient(app)
+
+
+class TestQueryBudget:
+    """Test statement counting per request."""
+
+    def test_passes_within_budget(
+        self, budget_client: TestClient, memory_engine: Engine
+    ) -> None:
+        """Test that requests within the budget pass and are recorded."""
+        with QueryBudget(3, engines=[memory_engine]) as budget:
+            budget_client.get("/items", params={"count": 2})
+            budget_client.get("/items", params={"count": 1})
+
+        assert [len(statements) for statements in budget.requests.values()] == [3, 2]
+
+    def test_fails_over_budget(
+        self, budget_client: TestClient, memory_engine: Engine
+    ) -> None:
+        """Test that a request over budget fails with its statements listed."""
+        with pytest.raises(pytest.fail.Exception) as exc_info:
+            with QueryBudget(2, max_repeats=5, engines=[memory_engine]):
+                budget_client.get("/items", params={"count": 2})
+
+        message = str(exc_info.value)
+        assert "GET /items: 3 SQL statements (budget 2)" in message
+        assert "  1. SELECT 1" in message
+        assert "likely N+1" not in message
+
+    def test_reports_repeated_statements(
+        self, budget_client: TestClient, memory_engine: Engine
+    ) -> None:
+        """Test that a statement repeated with other parameters is an N+1."""
+        with pytest.raises(pytest.fail.Exception) as exc_info:
+            with QueryBudget(10, engines=[memory_engine]):
+                budget_client.get("/items", params={"count": 3})
+
+        assert "likely N+1, run 3 times: SELECT ?" in str(exc_info.value)
+
+    def test_ignores_statements_outside_requests(self, memory_engine: Engine) -> None:
+        """Test that fixture and setup statements are not counted."""
+        with QueryBudget(0, engines=[memory_engine]) as budget:
+            with memory_engine.connect() as connection:
+                connection.execute(text("SELECT 1"))
+
+        assert budget.requests == {}
+
+    def test_stops_listening_on_exit(
+        self, budget_client: TestClient, memory_engine: Engine
+    ) -> None:
+        """Test that requests after the block are not counted."""
+        with QueryBudget(5, engines=[memory_engine]) as budget:
+            pass
+        budget_client.get("/items", params={"count": 10})
+
+        assert budget.requests == {}
@@ -0,0 +1,198 @@
+"""Unit tests for token-bucket rate limiting."""
+import asyncio
+import re
+from typing import Any, Sequence
+from uuid import uuid4
+
+import pytest
+
+from app.auth.rate_limit import (
+    Bucket,
+    MemoryRateLimitBackend,
+    RateLimiter,
+    RateLimitRule,
+    RedisRateLimitBackend,
+)
+from app.core.config.settings import settings
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class FailingBackend(MemoryRateLimitBackend):
+    """Backend whose storage is unreachable."""
+
+    async def acquire(self, buckets: Sequence[Bucket]) -> float:
+        raise ConnectionError("backend down")
+
+
+RULE = RateLimitRule(
+    name="otp-request",
+    method="POST",
+    path=re.compile(r"/auth/otp/request"),
+    subject="phone",
+    subject_in_body=True,
+    capacity=2,
+    per_minute=60.0,
+)
+
+
+def acquire(backend: Any, buckets: Sequence[Bucket]) -> float:
+    return float(asyncio.run(backend.acquire(buckets)))
+
+
+class TestMemoryRateLimitBackend:
+    """Test in-process token buckets."""
+
+    def test_burst_then_refill(self) -> None:
+        """Test that a bucket allows its capacity, then refills over time."""
+        clock = FakeClock()
+        backend = MemoryRateLimitBackend(clock=clock)
+        bucket = [("ip:1.2.3.4", 3, 1.0)]
+
+        assert [acquire(backend, bucket) for _ in range(3)] == [0.0, 0.0, 0.0]
+        assert acquire(backend, bucket) == pytest.approx(1.0)
+
+        clock.now = 1.0
+        assert acquire(backend, bucket) == 0.0
+        assert acquire(backend, bucket) > 0
+
+    def test_refill_is_capped_at_capacity(self) -> None:
+        """Test that an idle bucket holds no more than its capacity."""
+        clock = FakeClock()
+        backend = MemoryRateLimitBackend(clock=clock)
+        bucket = [("ip:1.2.3.4", 2, 1.0)]
+        acquire(backend, bucket)
+
+        clock.now = 3600.0
+        assert [acquire(backend, bucket) for _ in range(3)][-1] > 0
+
+    def test_rejected_request_takes_no_tokens(self) -> None:
+        """Test that tokens are taken from every bucket or from none."""
+        clock = FakeClock()
+        backend = MemoryRateLimitBackend(clock=clock)
+        ip = ("ip:1.2.3.4", 10, 1.0)
+        phone = ("otp-request:abc", 1, 1.0)
+
+        assert acquire(backend, [ip, phone]) == 0.0
+        assert acquire(backend, [ip, phone]) > 0
+
+        # The IP bucket lost one token, not two
+        assert [acquire(backend, [ip]) for _ in range(9)] == [0.0] * 9
+        assert acquire(backend, [ip]) > 0
+
+    def test_least_recently_used_keys_are_evicted(self) -> None:
+        """Test that the backend holds at most max_keys buckets."""
+        backend = MemoryRateLimitBackend(max_keys=2, clock=FakeClock())
+        for key in ("a", "b", "c"):
+            acquire(backend, [(key, 1, 1.0)])
+
+        assert len(backend) == 2
+        # "a" was evicted, so it starts full again
+        assert acquire(backend, [("a", 1, 1.0)]) == 0.0
+
+
+class TestRateLimiter:
+    """Test rule matching, bucket keys and failure handling."""
+
+    def limiter(self, backend: Any = None) -> RateLimiter:
+        if backend is None:
+            backend = MemoryRateLimitBackend(clock=FakeClock())
+        return RateLimiter(
+            backend=backend,
+            rules=[RULE],
+            ip_capacity=100,
+            ip_per_minute=60.0,
+        )
+
+    def test_match(self) -> None:
+        """Test that only the rule's method and exact path match."""
+        limiter = self.limiter()
+
+        assert limiter.match("POST", "/auth/otp/request") == (RULE, {})
+        assert limiter.match("GET", "/auth/otp/request") is None
+        assert limiter.match("POST", "/auth/otp/request/extra") is None
+
+    def test_disabled_limiter_matches_nothing(self) -> None:
+        """Test that a disabled limiter lets every request through."""
+        limiter = self.limiter()
+        limiter.enabled = False
+
+        assert limiter.match("POST", "/auth/otp/request") is None
+
+    def test_subject_is_hashed(self) -> None:
+        """Test that phone numbers and tokens never appear in bucket keys."""
+        buckets = self.limiter().buckets(RULE, "1.2.3.4", "+15550001111")
+
+        assert [key for key, _, _ in buckets][0] == "ip:1.2.3.4"
+        assert buckets[1][0].startswith("otp-request:")
+        assert "+15550001111" not in buckets[1][0]
+        assert buckets[1][1:] == (2, 1.0)
+
+    def test_subject_limit_is_enforced(self) -> None:
+        """Test that one phone is limited even across client IPs."""
+        limiter = self.limiter()
+
+        waits = [
+            asyncio.run(limiter.check(RULE, f"10.0.0.{i}", "+15550001111"))
+            for i in range(3)
+        ]
+
+        assert waits[:2] == [0.0, 0.0]
+        assert waits[2] > 0
+        assert limiter.stats()["allowed"] == 2
+        assert limiter.stats()["rejected"] == 1
+
+    def test_backend_failure_lets_requests_through(self) -> None:
+        """Test that the limiter fails open when its backend is down."""
+        limiter = self.limiter(FailingBackend())
+
+        assert asyncio.run(limiter.check(RULE, "1.2.3.4", "+15550001111")) == 0.0
+        assert limiter.stats()["backend_errors"] == 1
+
+
+class TestRedisRateLimitBackend:
+    """Test the Redis backend against the server at REDIS_URL."""
+
+    def test_buckets_are_shared_and_atomic(self) -> None:
+        """Test the Lua token bucket: burst, rejection and all-or-nothing."""
+
+        async def scenario() -> list[float]:
+            backend = RedisRateLimitBackend.from_url(settings.REDIS_URL)
+            try:
+                await backend.client.ping()
+            except Exception:
+                await backend.close()
+                pytest.skip("Redis is not reachable at REDIS_URL")
+            ip = (f"test-ip:{uuid4()}", 10, 0.001)
+            phone = (f"test-phone:{uuid4()}", 2, 0.001)
+            keys = [backend.prefix + key for key, _, _ in (ip, phone)]
+            # A second worker sharing the same Redis
+            other = RedisRateLimitBackend(backend.client)
+            try:
+                waits = [
+                    await backend.acquire([ip, phone]),
+                    await other.acquire([ip, phone]),
+                    await backend.acquire([ip, phone]),
+                ]
+                remaining = [await other.acquire([ip]) for _ in range(9)]
+                ttl = await backend.client.pttl(keys[0])
+                await backend.client.delete(*keys)
+            finally:
+                await backend.close()
+            return waits + [max(remaining), float(ttl > 0)]
+
+        waits = asyncio.run(scenario())
+
+        assert waits[:2] == [0.0, 0.0]
+        assert waits[2] > 0
+        # Eight IP tokens were left; the ninth request is rejected
+        assert waits[3] > 0
+        assert waits[4] == 1.0
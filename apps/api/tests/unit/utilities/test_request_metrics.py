@@ -0,0 +1,181 @@
+"""Unit tests for per-route request timing and SQL statement counts."""
+import re
+from typing import Generator
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, text
+from sqlalchemy.engine import Engine
+from sqlalchemy.pool import StaticPool
+
+from app.core.request_metrics import (
+    Histogram,
+    RequestMetrics,
+    RequestTiming,
+    RequestTimingMiddleware,
+    record_serialization,
+    time_endpoints,
+    track_queries,
+)
+
+
+@pytest.fixture
+def memory_engine() -> Generator[Engine, None, None]:
+    """In-memory SQLite engine with query tracking."""
+    engine = create_engine("sqlite://", poolclass=StaticPool)
+    track_queries(engine)
+    yield engine
+    engine.dispose()
+
+
+def build_app(
+    engine: Engine, metrics: RequestMetrics, server_timing: bool = True
+) -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/items/{item_id}")
+    def read_item(item_id: int) -> dict:
+        with engine.connect() as connection:
+            connection.execute(text("SELECT 1"))
+            connection.execute(text("SELECT 2"))
+        return {"id": item_id}
+
+    @app.get("/encoded")
+    async def read_encoded() -> list:
+        record_serialization(0.25)
+        return []
+
+    app.add_middleware(
+        RequestTimingMiddleware, metrics=metrics, server_timing=server_timing
+    )
+    time_endpoints(app.routes)
+    return app
+
+
+def server_timing(value: str) -> dict[str, float]:
+    return {
+        name: float(duration)
+        for name, duration in re.findall(r"(\w+);dur=([\d.]+)", value)
+    }
+
+
+class TestHistogram:
+    """Test Prometheus histogram rendering."""
+
+    def test_buckets_are_cumulative(self) -> None:
+        """Test that each bucket counts every observation at or below it."""
+        histogram = Histogram("latency", "Latency.", ("route",), (0.1, 1.0))
+        for value in (0.05, 0.1, 0.5, 3.0):
+            histogram.observe(("/a",), value)
+
+        assert histogram.render() == [
+            "# HELP latency Latency.",
+            "# TYPE latency histogram",
+            'latency_bucket{route="/a",le="0.1"} 2',
+            'latency_bucket{route="/a",le="1.0"} 3',
+            'latency_bucket{route="/a",le="+Inf"} 4',
+            'latency_sum{route="/a"} 3.65',
+            'latency_count{route="/a"} 4',
+        ]
+
+    def test_label_values_are_escaped(self) -> None:
+        """Test that quotes and backslashes in labels are escaped."""
+        histogram = Histogram("latency", "Latency.", ("route",), (1.0,))
+        histogram.observe(('/a"b\\c',), 0.5)
+
+        assert 'route="/a\\"b\\\\c"' in histogram.render()[2]
+
+    def test_clear(self) -> None:
+        """Test that clear drops every series."""
+        histogram = Histogram("latency", "Latency.", ("route",), (1.0,))
+        histogram.observe(("/a",), 0.5)
+        histogram.clear()
+
+        assert len(histogram.render()) == 2
+
+
+class TestRequestTiming:
+    """Test the per-request timing record."""
+
+    def test_time_after_the_endpoint_counts_as_serialization(self) -> None:
+        """Test that the gap between endpoint and response start is counted."""
+        timing = RequestTiming(started=10.0)
+        timing.endpoint_finished = 10.5
+        timing.response_started(10.75)
+
+        assert timing.serialization_seconds == 0.25
+        assert timing.endpoint_finished is None
+
+    def test_server_timing_splits_the_total(self) -> None:
+        """Test the Server-Timing header value."""
+        timing = RequestTiming(started=10.0)
+        timing.db_seconds = 0.2
+        timing.statements = 3
+        timing.serialization_seconds = 0.1
+
+        assert timing.server_timing(11.0) == (
+            'db;dur=200.0;desc="3 queries", serialize;dur=100.0, '
+            "app;dur=700.0, total;dur=1000.0"
+        )
+
+
+class TestRequestTimingMiddleware:
+    """Test request timing through an ASGI app."""
+
+    def test_queries_are_counted_per_request(self, memory_engine: Engine) -> None:
+        """Test that statements run by a sync endpoint reach the header."""
+        metrics = RequestMetrics()
+        with TestClient(build_app(memory_engine, metrics)) as client:
+            response = client.get("/items/1")
+
+        assert response.status_code == 200
+        header = response.headers["Server-Timing"]
+        assert 'desc="2 queries"' in header
+        assert set(server_timing(header)) == {"db", "serialize", "app", "total"}
+
+    def test_histograms_are_labelled_by_route_template(
+        self, memory_engine: Engine
+    ) -> None:
+        """Test that metrics use the route template, not the raw path."""
+        metrics = RequestMetrics()
+        with TestClient(build_app(memory_engine, metrics)) as client:
+            client.get("/items/1")
+            client.get("/items/2")
+            client.get("/missing")
+
+        rendered = metrics.render()
+        assert (
+            'http_request_duration_seconds_count{method="GET",'
+            'route="/items/{item_id}",status="200"} 2'
+        ) in rendered
+        assert (
+            'http_request_db_statements_sum{method="GET",route="/items/{item_id}"} 4.0'
+        ) in rendered
+        assert 'route="unmatched",status="404"' in rendered
+
+    def test_recorded_serialization_is_included(self, memory_engine: Engine) -> None:
+        """Test that encoding reported by an endpoint is counted."""
+        metrics = RequestMetrics()
+        with TestClient(build_app(memory_engine, metrics)) as client:
+            response = client.get("/encoded")
+
+        assert server_timing(response.headers["Server-Timing"])["serialize"] >= 250
+        assert 'desc="0 queries"' in response.headers["Server-Timing"]
+
+    def test_header_can_be_disabled(self, memory_engine: Engine) -> None:
+        """Test that metrics are kept without the Server-Timing header."""
+        metrics = RequestMetrics()
+        app = build_app(memory_engine, metrics, server_timing=False)
+        with TestClient(app) as client:
+            response = client.get("/items/1")
+
+        assert "Server-Timing" not in response.headers
+        assert "http_request_duration_seconds_count" in metrics.render()
+
+    def test_queries_outside_requests_are_ignored(self, memory_engine: Engine) -> None:
+        """Test that statements with no current request are not recorded."""
+        with memory_engine.connect() as connection:
+            connection.execute(text("SELECT 1"))
+
+            assert "request_metrics_query_started" not in connection.info
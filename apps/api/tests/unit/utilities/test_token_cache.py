@@ -0,0 +1,96 @@
+"""Unit tests for the verified token payload cache."""
+from uuid import uuid4
+
+import pytest
+from jose import JWTError
+
+from app.auth.security import create_access_token, decode_access_token
+from app.auth.token_cache import TokenCache, token_cache
+
+
+class FakeClock:
+    """Manually advanced wall clock."""
+
+    def __init__(self) -> None:
+        self.now = 1_000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestTokenCache:
+    """Test TokenCache behaviour."""
+
+    def test_payload_is_cached_until_exp(self) -> None:
+        """Test that an entry is served until the token's exp passes."""
+        clock = FakeClock()
+        cache = TokenCache(max_size=10, clock=clock)
+        cache.set("token", {"sub": "user", "exp": 1_060})
+
+        assert cache.get("token") == {"sub": "user", "exp": 1_060}
+        clock.now = 1_060.0
+        assert cache.get("token") is None
+        assert cache.stats()["size"] == 0
+        assert cache.stats()["hits"] == 1
+        assert cache.stats()["misses"] == 1
+
+    def test_payload_without_exp_is_not_cached(self) -> None:
+        """Test that tokens that never expire are always verified."""
+        cache = TokenCache(max_size=10, clock=FakeClock())
+        cache.set("token", {"sub": "user"})
+
+        assert cache.get("token") is None
+
+    def test_evicts_least_recently_used(self) -> None:
+        """Test that the oldest unused entry is evicted when full."""
+        cache = TokenCache(max_size=2, clock=FakeClock())
+        cache.set("a", {"exp": 2_000})
+        cache.set("b", {"exp": 2_000})
+        cache.get("a")
+        cache.set("c", {"exp": 2_000})
+
+        assert cache.get("b") is None
+        assert cache.get("a") is not None
+        assert cache.get("c") is not None
+
+    def test_returned_payload_is_a_copy(self) -> None:
+        """Test that callers cannot change the cached payload."""
+        cache = TokenCache(max_size=10, clock=FakeClock())
+        cache.set("token", {"sub": "user", "exp": 2_000})
+
+        cache.get("token")["sub"] = "someone-else"  # type: ignore[index]
+
+        assert cache.get("token") == {"sub": "user", "exp": 2_000}
+
+    def test_zero_max_size_disables_cache(self) -> None:
+        """Test that max_size=0 caches nothing."""
+        cache = TokenCache(max_size=0, clock=FakeClock())
+        cache.set("token", {"exp": 2_000})
+
+        assert cache.get("token") is None
+
+
+class TestDecodeAccessTokenCache:
+    """Test that decode_access_token verifies each token once."""
+
+    def test_repeat_decode_hits_cache(self) -> None:
+        """Test that the second decode of a token skips verification."""
+        user_id = str(uuid4())
+        token = create_access_token(subject=user_id)
+
+        first = decode_access_token(token)
+        second = decode_access_token(token)
+
+        assert first == second
+        assert second["sub"] == user_id
+        assert token_cache.stats()["hits"] == 1
+
+    def test_tampered_token_is_verified(self) -> None:
+        """Test that a token differing from a cached one is still rejected."""
+        token = create_access_token(subject=str(uuid4()))
+        decode_access_token(token)
+        header, payload, signature = token.split(".")
+        tampered = ".".join([header, payload, signature[::-1]])
+
+        with pytest.raises(JWTError):
+            decode_access_token(tampered)